@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import partial
+
 from core.bayesian_update import bayesian_multiplier
-from core.model_stats import load_model_stats
+from core.weight_provider import get_weight_provider
 
 
 def _safe_int(value) -> int:
@@ -58,39 +60,42 @@ def _combined_weight(
 
 
 def sport_weight(sport: str) -> float:
-    stats = load_model_stats()
-    item = stats.get("by_sport", {}).get(sport)
-
-    return _combined_weight(
-        item,
-        min_samples=30,
-        bayes_min=0.90,
-        bayes_max=1.10,
-        yield_scale=400.0,
+    return get_weight_provider().weight(
+        "by_sport",
+        sport,
+        partial(
+            _combined_weight,
+            min_samples=30,
+            bayes_min=0.90,
+            bayes_max=1.10,
+            yield_scale=400.0,
+        ),
     )
 
 
 def bookmaker_weight(bookmaker: str) -> float:
-    stats = load_model_stats()
-    item = stats.get("by_bookmaker", {}).get(bookmaker)
-
-    return _combined_weight(
-        item,
-        min_samples=25,
-        bayes_min=0.95,
-        bayes_max=1.05,
-        yield_scale=500.0,
+    return get_weight_provider().weight(
+        "by_bookmaker",
+        bookmaker,
+        partial(
+            _combined_weight,
+            min_samples=25,
+            bayes_min=0.95,
+            bayes_max=1.05,
+            yield_scale=500.0,
+        ),
     )
 
 
 def league_weight(league: str) -> float:
-    stats = load_model_stats()
-    item = stats.get("by_league", {}).get(league)
-
-    return _combined_weight(
-        item,
-        min_samples=30,
-        bayes_min=0.92,
-        bayes_max=1.08,
-        yield_scale=450.0,
+    return get_weight_provider().weight(
+        "by_league",
+        league,
+        partial(
+            _combined_weight,
+            min_samples=30,
+            bayes_min=0.92,
+            bayes_max=1.08,
+            yield_scale=450.0,
+        ),
     )
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import csv
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Hashable, Iterator, Mapping
+
+Row = Mapping[str, Any]
+KeyFunction = Callable[[Row], Hashable]
+
+
+def _normalized(column: str) -> KeyFunction:
+    return lambda row: (row.get(column) or "").strip().lower()
+
+
+# Join keys most resolvers and diagnostics look rows up by.
+STANDARD_INDEXES: dict[str, KeyFunction] = {
+    "source_hash": lambda row: row.get("source_hash") or "",
+    "event": _normalized("event"),
+    "selection": _normalized("selection"),
+    "event_selection": lambda row: (
+        (row.get("event") or "").strip().lower(),
+        (row.get("selection") or "").strip().lower(),
+    ),
+}
+
+
+def cache_budget_bytes() -> int:
+    """EXPORT_TABLE_CACHE_MB: CSV megabytes kept parsed (0 disables caching)."""
+    try:
+        megabytes = float(os.getenv("EXPORT_TABLE_CACHE_MB", "256"))
+    except ValueError:
+        megabytes = 256.0
+    return max(0, int(megabytes * 1024 * 1024))
+
+
+class ExportTable:
+    """
+    One parsed export CSV, shared between every caller in the process.
+
+    ``rows`` are read-only views; use ``records()`` for private dicts a
+    caller may change or return. Indexes map a key to the positions of the
+    rows having it, in file order, and are built on first use.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: tuple[str, ...],
+        rows: tuple[Row, ...],
+        mtime_ns: int = 0,
+        size: int = 0,
+        exists: bool = True,
+    ) -> None:
+        self.path = path
+        self.fieldnames = fieldnames
+        self.rows = rows
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.exists = exists
+        self._indexes: dict[str, dict[Hashable, tuple[int, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self.rows)
+
+    def records(self) -> list[dict[str, Any]]:
+        return [dict(row) for row in self.rows]
+
+    def index(
+        self,
+        name: str,
+        key: KeyFunction | None = None,
+    ) -> dict[Hashable, tuple[int, ...]]:
+        """
+        Positions per key for a standard index, or for ``key`` stored under
+        ``name``. Callers must use one key function per name.
+        """
+        cached = self._indexes.get(name)
+        if cached is not None:
+            return cached
+
+        key = key or STANDARD_INDEXES[name]
+
+        with self._lock:
+            cached = self._indexes.get(name)
+            if cached is not None:
+                return cached
+
+            positions: dict[Hashable, list[int]] = {}
+            for position, row in enumerate(self.rows):
+                positions.setdefault(key(row), []).append(position)
+
+            built = {value: tuple(items) for value, items in positions.items()}
+            self._indexes[name] = built
+
+        return built
+
+    def lookup(
+        self,
+        name: str,
+        value: Hashable,
+        key: KeyFunction | None = None,
+    ) -> tuple[Row, ...]:
+        return tuple(
+            self.rows[position]
+            for position in self.index(name, key).get(value, ())
+        )
+
+    def first(
+        self,
+        name: str,
+        value: Hashable,
+        key: KeyFunction | None = None,
+    ) -> Row | None:
+        positions = self.index(name, key).get(value)
+        return self.rows[positions[0]] if positions else None
+
+    def last(
+        self,
+        name: str,
+        value: Hashable,
+        key: KeyFunction | None = None,
+    ) -> Row | None:
+        positions = self.index(name, key).get(value)
+        return self.rows[positions[-1]] if positions else None
+
+
+@dataclass
+class ExportTableStats:
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+    evictions: int = 0
+    uncached: int = 0
+
+
+_TABLES: OrderedDict[str, ExportTable] = OrderedDict()
+_CACHED_BYTES = 0
+_LOCK = threading.RLock()
+_STATS = ExportTableStats()
+
+
+def _parse(path: Path, mtime_ns: int, size: int) -> ExportTable:
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        rows = tuple(MappingProxyType(row) for row in reader)
+        fieldnames = tuple(reader.fieldnames or ())
+
+    return ExportTable(path, fieldnames, rows, mtime_ns, size)
+
+
+def _drop(key: str) -> None:
+    global _CACHED_BYTES
+
+    table = _TABLES.pop(key, None)
+    if table is not None:
+        _CACHED_BYTES -= table.size
+
+
+def export_table(path: str | Path) -> ExportTable:
+    """
+    Parsed rows of an export CSV, read once per file version.
+
+    A cached table is reused while the file's (mtime, size) is unchanged,
+    so a stage that rewrites an export makes the next reader parse it
+    again. Least recently used tables are evicted once the cached files
+    exceed EXPORT_TABLE_CACHE_MB. A missing file gives an empty table.
+    """
+    global _CACHED_BYTES
+
+    path = Path(path)
+    key = os.path.abspath(path)
+
+    try:
+        stat = path.stat()
+    except OSError:
+        with _LOCK:
+            _drop(key)
+        return ExportTable(path, (), (), exists=False)
+
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _LOCK:
+        cached = _TABLES.get(key)
+
+        if cached is not None:
+            if (cached.mtime_ns, cached.size) == version:
+                _TABLES.move_to_end(key)
+                _STATS.hits += 1
+                return cached
+
+            _drop(key)
+            _STATS.reloads += 1
+
+        _STATS.misses += 1
+
+    # Parsing happens outside the lock; two first readers may both parse.
+    table = _parse(path, *version)
+    budget = cache_budget_bytes()
+
+    with _LOCK:
+        if table.size > budget:
+            _STATS.uncached += 1
+            return table
+
+        _drop(key)
+        _TABLES[key] = table
+        _CACHED_BYTES += table.size
+
+        while _CACHED_BYTES > budget and len(_TABLES) > 1:
+            oldest = next(iter(_TABLES))
+            _drop(oldest)
+            _STATS.evictions += 1
+
+    return table
+
+
+def export_table_counters() -> dict[str, int]:
+    with _LOCK:
+        return {
+            **asdict(_STATS),
+            "tables": len(_TABLES),
+            "cached_bytes": _CACHED_BYTES,
+        }
+
+
+def clear_export_tables() -> None:
+    global _CACHED_BYTES, _STATS
+
+    with _LOCK:
+        _TABLES.clear()
+        _CACHED_BYTES = 0
+        _STATS = ExportTableStats()
@@ -1,41 +1,34 @@
 from __future__ import annotations
 
-import csv
-from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
+    return export_table(path).records()
 
 
 def run_closing_features_bridge_v15_48(opening_rows):
 
-    feature_rows = load_rows(
+    features = export_table(
         "exports/history_football_features.csv"
     )
 
-    closing_map = {
-        row.get("source_hash"): row.get("odds")
-        for row in feature_rows
-        if row.get("source_hash")
-    }
-
     output = []
 
     for row in opening_rows:
         item = dict(row)
-        item["closing_odds"] = closing_map.get(
-            row.get("source_hash")
+        source_hash = row.get("source_hash")
+        # Last feature row per hash, as the old dict comprehension kept.
+        feature = (
+            features.last("source_hash", source_hash) if source_hash else None
         )
+        item["closing_odds"] = feature.get("odds") if feature else None
         output.append(item)
 
     return {
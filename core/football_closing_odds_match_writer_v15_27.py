@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import csv
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def _now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -13,13 +14,7 @@ def _now():
 def load_postmatch_dataset(
     source="exports/history_football_postmatch_dataset_v14.csv"
 ):
-    path = Path(source)
-
-    if not path.exists():
-        return []
-
-    with path.open("r", encoding="utf-8", newline="") as file:
-        return list(csv.DictReader(file))
+    return export_table(source).records()
 
 
 def run_closing_odds_match_writer_v15_27(
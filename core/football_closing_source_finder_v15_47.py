@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import csv
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -13,8 +14,7 @@ def now():
 def read_rows(path):
     try:
         if path.suffix.lower() == ".csv":
-            with path.open("r", encoding="utf-8-sig", newline="") as f:
-                return list(csv.DictReader(f))
+            return list(export_table(path).rows)
 
         if path.suffix.lower() == ".json":
             data = json.loads(path.read_text(encoding="utf-8"))
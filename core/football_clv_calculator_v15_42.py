@@ -4,6 +4,8 @@ import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 OUTPUT = Path("exports/football_closing_clv_v15_42.csv")
 
 
@@ -52,8 +54,8 @@ def run_clv_calculator_v15_42(source="exports/football_closing_records_v15_41.cs
             "status": "BUILDING",
         }
 
-    with path.open("r", encoding="utf-8-sig", newline="") as file:
-        rows = list(csv.DictReader(file))
+    # calculate_clv copies every row, so the shared views are enough.
+    rows = export_table(path).rows
 
     calculated = calculate_clv(rows)
 
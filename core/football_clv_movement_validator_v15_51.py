@@ -1,29 +1,16 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def run_clv_movement_validator_v15_51(
-    source="exports/history_football_clv_results_v15_49.csv"
-):
-    path = Path(source)
-
-    if not path.exists():
-        return {
-            "version": "v15.51",
-            "records_checked": 0,
-            "status": "BUILDING",
-        }
-
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        rows = list(csv.DictReader(f))
-
+def validate_clv_movement(rows):
     moved_up = 0
     moved_down = 0
     unchanged = 0
@@ -52,3 +39,18 @@ def run_clv_movement_validator_v15_51(
         "unchanged": unchanged,
         "status": "READY",
     }
+
+
+def run_clv_movement_validator_v15_51(
+    source="exports/history_football_clv_results_v15_49.csv"
+):
+    path = Path(source)
+
+    if not path.exists():
+        return {
+            "version": "v15.51",
+            "records_checked": 0,
+            "status": "BUILDING",
+        }
+
+    return validate_clv_movement(load_rows(path))
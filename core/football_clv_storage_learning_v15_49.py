@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import write_rows
+
 OUTPUT = Path("exports/history_football_clv_results_v15_49.csv")
 
 
@@ -11,10 +12,7 @@ def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def run_clv_storage_learning_v15_49(clv_rows):
-
-    OUTPUT.parent.mkdir(exist_ok=True)
-
+def build_clv_results(clv_rows):
     rows = []
 
     for row in clv_rows:
@@ -30,15 +28,6 @@ def run_clv_storage_learning_v15_49(clv_rows):
         }
         rows.append(item)
 
-    if rows:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=rows[0].keys()
-            )
-            writer.writeheader()
-            writer.writerows(rows)
-
     return {
         "version": "v15.49",
         "created_at": now(),
@@ -46,4 +35,14 @@ def run_clv_storage_learning_v15_49(clv_rows):
         "learning_rows_added": len(rows),
         "output": str(OUTPUT),
         "status": "READY" if rows else "BUILDING",
-    }
+    }, rows
+
+
+def run_clv_storage_learning_v15_49(clv_rows):
+
+    OUTPUT.parent.mkdir(exist_ok=True)
+
+    report, rows = build_clv_results(clv_rows)
+    write_rows(OUTPUT, rows)
+
+    return report
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import csv
-from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -12,13 +12,7 @@ def now():
 def load_correct_dataset(
     source="exports/history_football_dataset_v15.csv"
 ):
-    path = Path(source)
-
-    if not path.exists():
-        return []
-
-    with path.open("r", encoding="utf-8-sig", newline="") as file:
-        return list(csv.DictReader(file))
+    return export_table(source).records()
 
 
 def run_correct_snapshot_source_loader_v15_39():
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import csv
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def _now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -13,20 +14,7 @@ def _now():
 def load_csv_snapshots_v15_26(
     source="exports/history_football_market_snapshots_v14.csv"
 ):
-    path = Path(source)
-
-    if not path.exists():
-        return []
-
-    rows = []
-
-    with path.open("r", encoding="utf-8", newline="") as file:
-        reader = csv.DictReader(file)
-
-        for row in reader:
-            rows.append(dict(row))
-
-    return rows
+    return export_table(source).records()
 
 
 def run_csv_snapshot_loader_v15_26(
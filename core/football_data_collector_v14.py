@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.schema_registry import table_exists
 
 
 def now_utc() -> str:
@@ -111,16 +112,7 @@ class FootballDataCollectorV14:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        row = conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone()
-
-        return row is not None
+        return table_exists(conn, table_name)
 
     def init_tables(self) -> None:
         self.db_file.parent.mkdir(parents=True, exist_ok=True)
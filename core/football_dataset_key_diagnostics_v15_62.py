@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import csv
-from pathlib import Path
 from datetime import datetime, timezone
+from pathlib import Path
+
+from core.export_tables import export_table
 
 
 def now():
@@ -10,11 +11,7 @@ def now():
 
 
 def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
+    return list(export_table(path).rows)
 
 
 def normalize(v):
@@ -34,10 +31,17 @@ def overlap(rows_a, rows_b, key_fields):
 
 
 def run_dataset_key_diagnostics_v15_62(
-    learning="exports/history_football_learning_dataset_v15_58.csv",
+    learning="exports/history_football_learning_dataset_v15_61.csv",
     snapshots="exports/history_football_market_snapshots_v14.csv",
 ):
-    learning_rows = load_rows(learning)
+    # The learning dataflow only stores its final (v15.61) table, which
+    # keeps every key column of v15.58. In-memory rows, e.g.
+    # DataflowResult.tables["v15.58"], can be passed instead of a path.
+    learning_rows = (
+        load_rows(learning)
+        if isinstance(learning, (str, Path))
+        else list(learning)
+    )
     snapshot_rows = load_rows(snapshots)
 
     tests = {
@@ -2,13 +2,23 @@ from __future__ import annotations
 
 import hashlib
 import math
+import os
 import sqlite3
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.football_enrichment import (
+    ELO_SOURCES,
+    FORM_SOURCES,
+    ensure_enrichment_indexes,
+    load_closing_snapshots,
+    load_team_values,
+    load_xg_rows,
+)
+from core.schema_registry import schema_once, table_columns, table_exists
 
 
 def now_utc() -> str:
@@ -140,6 +150,9 @@ class FootballDatasetV15Summary:
     with_form: int
     training_ready: int
     total_rows: int
+    incremental: bool = False
+    # Rows enriched by this run; the coverage counts above are table totals.
+    ready_rebuilt: int = 0
 
 
 class FootballDatasetV15:
@@ -155,6 +168,12 @@ class FootballDatasetV15:
     - target label and data-quality flags.
 
     No synthetic xG or fake closing price is generated.
+
+    Rebuilds are incremental by default: only feature rows added or
+    settled since the stored high-water mark, plus matches that started
+    within FOOTBALL_DATASET_V15_RECHECK_DAYS (late settlements and late
+    xG), are enriched again. ``rebuild(full=True)`` processes every
+    settled row.
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -173,26 +192,14 @@ class FootballDatasetV15:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        return conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone() is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
     @staticmethod
     def _pick(
@@ -207,6 +214,7 @@ class FootballDatasetV15:
 
         return default
 
+    @schema_once("football_dataset_v15")
     def init_db(self) -> None:
         validate_insert_shape()
         self.db_file.parent.mkdir(parents=True, exist_ok=True)
@@ -335,8 +343,194 @@ class FootballDatasetV15:
                 """
             )
 
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS football_dataset_v15_state (
+                    name TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+
             conn.commit()
 
+    @staticmethod
+    def _recheck_days() -> int:
+        try:
+            return max(
+                0,
+                int(os.getenv("FOOTBALL_DATASET_V15_RECHECK_DAYS", "7")),
+            )
+        except ValueError:
+            return 7
+
+    def _watermark(
+        self,
+        conn: sqlite3.Connection,
+    ) -> tuple[int, str] | None:
+        state = {
+            str(row["name"]): str(row["value"])
+            for row in conn.execute(
+                """
+                SELECT name, value
+                FROM football_dataset_v15_state
+                """
+            ).fetchall()
+        }
+
+        if "last_feature_id" not in state:
+            return None
+
+        return (
+            safe_int(state["last_feature_id"], 0) or 0,
+            state.get("last_settled_at", ""),
+        )
+
+    def _save_watermark(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        last_feature_id: int,
+        last_settled_at: str,
+    ) -> None:
+        timestamp = now_utc()
+
+        conn.executemany(
+            """
+            INSERT INTO football_dataset_v15_state (
+                name,
+                value,
+                updated_at
+            )
+            VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                value=excluded.value,
+                updated_at=excluded.updated_at
+            """,
+            [
+                ("last_feature_id", str(last_feature_id), timestamp),
+                ("last_settled_at", last_settled_at, timestamp),
+            ],
+        )
+
+    def _settled_rows(
+        self,
+        conn: sqlite3.Connection,
+        columns: set[str],
+        *,
+        full: bool,
+    ) -> tuple[list[sqlite3.Row], bool]:
+        """
+        Feature rows to enrich in this run and whether the run is incremental.
+
+        The high-water mark is the largest feature row id and settled_at
+        seen by the previous run. settled_at comes from the score feed and
+        is not strictly monotonic, so matches that started recently are
+        always included as well; the upsert makes re-processing harmless.
+        """
+        settled = (
+            "UPPER(COALESCE(result, 'OPEN')) IN ('WON', 'LOST')"
+        )
+        max_id = (
+            conn.execute(
+                """
+                SELECT MAX(id)
+                FROM football_feature_history
+                """
+            ).fetchone()[0]
+            if "id" in columns
+            else None
+        )
+        watermark = None if full else self._watermark(conn)
+        has_rows = conn.execute(
+            """
+            SELECT 1
+            FROM football_dataset_v15
+            LIMIT 1
+            """
+        ).fetchone() is not None
+
+        incremental = (
+            watermark is not None
+            and max_id is not None
+            and has_rows
+            # A smaller id means the feature table was recreated.
+            and int(max_id) >= watermark[0]
+        )
+
+        if not incremental:
+            rows = conn.execute(
+                f"""
+                SELECT *
+                FROM football_feature_history
+                WHERE {settled}
+                """
+            ).fetchall()
+        else:
+            last_feature_id, last_settled_at = watermark
+            conditions = ["id > ?"]
+            params: list[Any] = [last_feature_id]
+
+            if "settled_at" in columns and last_settled_at:
+                conditions.append("settled_at > ?")
+                params.append(last_settled_at)
+
+            if "commence_time" in columns:
+                conditions.append("commence_time >= ?")
+                params.append(
+                    (
+                        datetime.now(timezone.utc)
+                        - timedelta(days=self._recheck_days())
+                    ).isoformat(timespec="seconds")
+                )
+
+            rows = conn.execute(
+                f"""
+                SELECT *
+                FROM football_feature_history
+                WHERE {settled}
+                  AND ({" OR ".join(conditions)})
+                """,
+                params,
+            ).fetchall()
+
+        if max_id is not None:
+            last_settled_at = (
+                conn.execute(
+                    f"""
+                    SELECT MAX(settled_at)
+                    FROM football_feature_history
+                    WHERE {settled}
+                    """
+                ).fetchone()[0]
+                if "settled_at" in columns
+                else None
+            )
+            self._save_watermark(
+                conn,
+                last_feature_id=int(max_id),
+                last_settled_at=str(last_settled_at or ""),
+            )
+
+        return rows, incremental
+
+    @staticmethod
+    def _ensure_feature_indexes(
+        conn: sqlite3.Connection,
+        columns: set[str],
+    ) -> None:
+        # Let the incremental OR-filter use index lookups per branch.
+        for column in ("settled_at", "commence_time"):
+            if column in columns:
+                conn.execute(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS
+                        ix_football_feature_history_{column}
+                    ON football_feature_history ({column})
+                    """
+                )
+
     def _closing_snapshot(
         self,
         conn: sqlite3.Connection,
@@ -602,6 +796,48 @@ class FootballDatasetV15:
 
         return 1.0 / odds
 
+    @classmethod
+    def _identity(
+        cls,
+        row: sqlite3.Row,
+        columns: set[str],
+    ) -> tuple[str, str, str, str, str, str, str]:
+        """
+        Normalized (sport_key, league, event, selection, commence_time,
+        home_team, away_team) of a feature row.
+        """
+        sport_key, league, event, selection, commence_time = (
+            normalize_text(
+                cls._pick(row, columns, name, default="")
+            )
+            for name in (
+                "sport_key",
+                "league",
+                "event",
+                "selection",
+                "commence_time",
+            )
+        )
+        home_team = normalize_text(
+            cls._pick(row, columns, "home_team", default="")
+        )
+        away_team = normalize_text(
+            cls._pick(row, columns, "away_team", default="")
+        )
+
+        if not home_team or not away_team:
+            home_team, away_team = cls._split_event(event)
+
+        return (
+            sport_key,
+            league,
+            event,
+            selection,
+            commence_time,
+            home_team,
+            away_team,
+        )
+
     @staticmethod
     def _split_event(
         event: str,
@@ -619,7 +855,11 @@ class FootballDatasetV15:
 
         return "", ""
 
-    def rebuild(self) -> FootballDatasetV15Summary:
+    def rebuild(
+        self,
+        *,
+        full: bool = False,
+    ) -> FootballDatasetV15Summary:
         with self.connect() as conn:
             if not self._table_exists(
                 conn,
@@ -644,59 +884,56 @@ class FootballDatasetV15:
                 conn,
                 "football_feature_history",
             )
-            rows = conn.execute(
-                """
-                SELECT *
-                FROM football_feature_history
-                WHERE UPPER(COALESCE(result, 'OPEN'))
-                    IN ('WON', 'LOST')
-                """
-            ).fetchall()
+            self._ensure_feature_indexes(conn, columns)
+            rows, incremental = self._settled_rows(
+                conn,
+                columns,
+                full=full,
+            )
+
+            identities = [
+                self._identity(row, columns)
+                for row in rows
+            ]
+
+            # One set-based pass per source instead of probes per row.
+            ensure_enrichment_indexes(conn)
+            closing_by_key = load_closing_snapshots(
+                conn,
+                (
+                    (sport_key, event, selection, commence_time)
+                    for sport_key, _, event, selection, commence_time, _, _
+                    in identities
+                ),
+            )
+            xg_by_key = load_xg_rows(
+                conn,
+                (
+                    (league, home_team, away_team, commence_time)
+                    for _, league, _, _, commence_time, home_team, away_team
+                    in identities
+                ),
+            )
+            elo_by_team = load_team_values(conn, ELO_SOURCES)
+            form_by_team = load_team_values(conn, FORM_SOURCES)
 
             inserted = 0
             updated = 0
             missing_model_probability = 0
             missing_market_probability = 0
             missing_opening_odds = 0
-            with_closing = 0
-            with_xg = 0
-            with_elo = 0
-            with_form = 0
             ready_count = 0
 
-            for row in rows:
-                sport_key = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "sport_key",
-                        default="",
-                    )
-                )
-                league = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "league",
-                        default="",
-                    )
-                )
-                event = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "event",
-                        default="",
-                    )
-                )
-                selection = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "selection",
-                        default="",
-                    )
-                )
+            for row, identity in zip(rows, identities):
+                (
+                    sport_key,
+                    league,
+                    event,
+                    selection,
+                    commence_time,
+                    home_team,
+                    away_team,
+                ) = identity
                 bookmaker = normalize_text(
                     self._pick(
                         row,
@@ -705,14 +942,6 @@ class FootballDatasetV15:
                         default="",
                     )
                 )
-                commence_time = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "commence_time",
-                        default="",
-                    )
-                )
                 result = normalize_text(
                     self._pick(
                         row,
@@ -722,28 +951,6 @@ class FootballDatasetV15:
                     )
                 ).upper()
 
-                home_team = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "home_team",
-                        default="",
-                    )
-                )
-                away_team = normalize_text(
-                    self._pick(
-                        row,
-                        columns,
-                        "away_team",
-                        default="",
-                    )
-                )
-
-                if not home_team or not away_team:
-                    home_team, away_team = (
-                        self._split_event(event)
-                    )
-
                 source_hash = normalize_text(
                     self._pick(
                         row,
@@ -816,12 +1023,8 @@ class FootballDatasetV15:
                 ):
                     market_probability = opening_probability
 
-                closing = self._closing_snapshot(
-                    conn,
-                    sport_key=sport_key,
-                    event=event,
-                    selection=selection,
-                    commence_time=commence_time,
+                closing = closing_by_key.get(
+                    (sport_key, event, selection, commence_time)
                 )
 
                 closing_probability = (
@@ -845,15 +1048,8 @@ class FootballDatasetV15:
                     and closing_odds is not None
                 )
 
-                if has_closing:
-                    with_closing += 1
-
-                xg = self._xg_row(
-                    conn,
-                    league=league,
-                    home_team=home_team,
-                    away_team=away_team,
-                    commence_time=commence_time,
+                xg = xg_by_key.get(
+                    (league, home_team, away_team, commence_time)
                 )
 
                 xg_home = (
@@ -871,39 +1067,20 @@ class FootballDatasetV15:
                     and xg_away is not None
                 )
 
-                if has_xg:
-                    with_xg += 1
-
-                elo_home, elo_away = self._elo_context(
-                    conn,
-                    league=league,
-                    home_team=home_team,
-                    away_team=away_team,
-                )
+                elo_home = elo_by_team.get((home_team, league))
+                elo_away = elo_by_team.get((away_team, league))
                 has_elo = int(
                     elo_home is not None
                     and elo_away is not None
                 )
 
-                if has_elo:
-                    with_elo += 1
-
-                form_home, form_away = (
-                    self._form_context(
-                        conn,
-                        league=league,
-                        home_team=home_team,
-                        away_team=away_team,
-                    )
-                )
+                form_home = form_by_team.get((home_team, league))
+                form_away = form_by_team.get((away_team, league))
                 has_form = int(
                     form_home is not None
                     and form_away is not None
                 )
 
-                if has_form:
-                    with_form += 1
-
                 clv_probability = (
                     closing_probability - opening_probability
                     if closing_probability is not None
@@ -1268,12 +1445,25 @@ class FootballDatasetV15:
 
             conn.commit()
 
-            total_rows = conn.execute(
+            (
+                total_rows,
+                total_closing,
+                total_xg,
+                total_elo,
+                total_form,
+                total_ready,
+            ) = conn.execute(
                 """
-                SELECT COUNT(*)
+                SELECT
+                    COUNT(*),
+                    COALESCE(SUM(has_closing_line), 0),
+                    COALESCE(SUM(has_xg), 0),
+                    COALESCE(SUM(has_elo), 0),
+                    COALESCE(SUM(has_form), 0),
+                    COALESCE(SUM(training_ready), 0)
                 FROM football_dataset_v15
                 """
-            ).fetchone()[0]
+            ).fetchone()
 
         return FootballDatasetV15Summary(
             discovered=len(rows),
@@ -1282,24 +1472,33 @@ class FootballDatasetV15:
             missing_model_probability=missing_model_probability,
             missing_market_probability=missing_market_probability,
             missing_opening_odds=missing_opening_odds,
-            with_closing=with_closing,
-            with_xg=with_xg,
-            with_elo=with_elo,
-            with_form=with_form,
-            training_ready=ready_count,
+            with_closing=int(total_closing),
+            with_xg=int(total_xg),
+            with_elo=int(total_elo),
+            with_form=int(total_form),
+            training_ready=int(total_ready),
             total_rows=int(total_rows),
+            incremental=incremental,
+            ready_rebuilt=ready_count,
         )
 
 
 def rebuild_football_dataset_v15(
     settings: Settings,
+    *,
+    full: bool = False,
 ) -> FootballDatasetV15Summary:
-    return FootballDatasetV15(settings).rebuild()
+    return FootballDatasetV15(settings).rebuild(full=full)
 
 
 if __name__ == "__main__":
+    import sys
+
     settings = Settings.from_env()
-    summary = rebuild_football_dataset_v15(settings)
+    summary = rebuild_football_dataset_v15(
+        settings,
+        full="--full" in sys.argv[1:],
+    )
 
     print(
         "Football Dataset v15: "
@@ -1317,6 +1516,8 @@ if __name__ == "__main__":
         f"with_elo={summary.with_elo}, "
         f"with_form={summary.with_form}, "
         f"training_ready={summary.training_ready}, "
-        f"total={summary.total_rows}"
+        f"ready_rebuilt={summary.ready_rebuilt}, "
+        f"total={summary.total_rows}, "
+        f"mode={'incremental' if summary.incremental else 'full'}"
     )
 
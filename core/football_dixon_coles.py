@@ -8,9 +8,9 @@ from core.football_poisson import (
     MAX_XG,
     MIN_XG,
     FootballPoissonModel,
-    PoissonMarkets,
     clamp,
 )
+from core.football_score_grid import score_grid
 
 
 DEFAULT_RHO = -0.08
@@ -163,50 +163,12 @@ class FootballDixonColesModel:
             MAX_RHO,
         )
 
-        base_matrix = self.poisson.score_matrix(home_xg, away_xg)
-
-        corrected: Dict[Tuple[int, int], float] = {}
-        total = 0.0
-
-        for (home_goals, away_goals), probability in base_matrix.items():
-            tau = dixon_coles_tau(
-                home_goals,
-                away_goals,
-                home_xg,
-                away_xg,
-                active_rho,
-            )
-
-            adjusted_probability = max(
-                0.0,
-                probability * tau,
-            )
-
-            corrected[(home_goals, away_goals)] = adjusted_probability
-            total += adjusted_probability
-
-        if total <= 0:
-            return base_matrix
-
-        return {
-            score: probability / total
-            for score, probability in corrected.items()
-        }
-
-    @staticmethod
-    def _probability(
-        matrix: Dict[Tuple[int, int], float],
-        predicate,
-    ) -> float:
-        return clamp(
-            sum(
-                probability
-                for score, probability in matrix.items()
-                if predicate(*score)
-            ),
-            0.0,
-            1.0,
-        )
+        return score_grid(
+            home_xg,
+            away_xg,
+            rho=active_rho,
+            max_goals=self.max_goals,
+        ).dixon_coles.score_matrix()
 
     def calculate(
         self,
@@ -222,96 +184,20 @@ class FootballDixonColesModel:
             MAX_RHO,
         )
 
-        poisson_result: PoissonMarkets = self.poisson.calculate(
-            expected_home_goals,
-            expected_away_goals,
-            top_scores=top_scores,
-        )
-
-        matrix = self.corrected_matrix(
+        grid = score_grid(
             expected_home_goals,
             expected_away_goals,
             rho=active_rho,
+            max_goals=self.max_goals,
         )
+        markets = grid.dixon_coles
+        poisson_markets = grid.poisson
 
-        home_win = self._probability(
-            matrix,
-            lambda h, a: h > a,
-        )
-        draw = self._probability(
-            matrix,
-            lambda h, a: h == a,
-        )
-        away_win = self._probability(
-            matrix,
-            lambda h, a: h < a,
-        )
-
-        def over_line(line: float) -> float:
-            return self._probability(
-                matrix,
-                lambda h, a: h + a > line,
-            )
-
-        over_05 = over_line(0.5)
-        over_15 = over_line(1.5)
-        over_25 = over_line(2.5)
-        over_35 = over_line(3.5)
-        over_45 = over_line(4.5)
-
-        btts_yes = self._probability(
-            matrix,
-            lambda h, a: h > 0 and a > 0,
-        )
-
-        home_over_05 = self._probability(
-            matrix,
-            lambda h, a: h >= 1,
-        )
-        home_over_15 = self._probability(
-            matrix,
-            lambda h, a: h >= 2,
-        )
-        home_over_25 = self._probability(
-            matrix,
-            lambda h, a: h >= 3,
-        )
-
-        away_over_05 = self._probability(
-            matrix,
-            lambda h, a: a >= 1,
-        )
-        away_over_15 = self._probability(
-            matrix,
-            lambda h, a: a >= 2,
-        )
-        away_over_25 = self._probability(
-            matrix,
-            lambda h, a: a >= 3,
-        )
-
-        total_1x2 = home_win + draw + away_win
-
-        if total_1x2 > 0:
-            home_win /= total_1x2
-            draw /= total_1x2
-            away_win /= total_1x2
-
-        ordered = sorted(
-            matrix.items(),
-            key=lambda item: item[1],
-            reverse=True,
-        )[:max(1, int(top_scores))]
-
-        top_correct_scores = {
-            f"{home_goals}-{away_goals}": round(
-                probability,
-                6,
-            )
-            for (home_goals, away_goals), probability in ordered
-        }
+        home_win = markets.home_win
+        draw = markets.draw
+        away_win = markets.away_win
 
-        draw_adjustment = draw - poisson_result.draw
+        draw_adjustment = draw - poisson_markets.draw
 
         reason = (
             f"Dixon-Coles: rho={active_rho:.3f}; "
@@ -326,27 +212,27 @@ class FootballDixonColesModel:
             draw=draw,
             away_win=away_win,
 
-            over_05=over_05,
-            under_05=1.0 - over_05,
-            over_15=over_15,
-            under_15=1.0 - over_15,
-            over_25=over_25,
-            under_25=1.0 - over_25,
-            over_35=over_35,
-            under_35=1.0 - over_35,
-            over_45=over_45,
-            under_45=1.0 - over_45,
+            over_05=markets.over_line(0.5),
+            under_05=1.0 - markets.over_line(0.5),
+            over_15=markets.over_line(1.5),
+            under_15=1.0 - markets.over_line(1.5),
+            over_25=markets.over_line(2.5),
+            under_25=1.0 - markets.over_line(2.5),
+            over_35=markets.over_line(3.5),
+            under_35=1.0 - markets.over_line(3.5),
+            over_45=markets.over_line(4.5),
+            under_45=1.0 - markets.over_line(4.5),
 
-            btts_yes=btts_yes,
-            btts_no=1.0 - btts_yes,
+            btts_yes=markets.btts_yes,
+            btts_no=1.0 - markets.btts_yes,
 
-            home_over_05=home_over_05,
-            home_over_15=home_over_15,
-            home_over_25=home_over_25,
+            home_over_05=markets.home_over[1],
+            home_over_15=markets.home_over[2],
+            home_over_25=markets.home_over[3],
 
-            away_over_05=away_over_05,
-            away_over_15=away_over_15,
-            away_over_25=away_over_25,
+            away_over_05=markets.away_over[1],
+            away_over_15=markets.away_over[2],
+            away_over_25=markets.away_over[3],
 
             expected_home_goals=clamp(
                 float(expected_home_goals),
@@ -360,12 +246,12 @@ class FootballDixonColesModel:
             ),
 
             rho=active_rho,
-            score_matrix=matrix,
-            top_correct_scores=top_correct_scores,
+            score_matrix=markets.score_matrix(),
+            top_correct_scores=markets.top_correct_scores(top_scores),
 
-            poisson_home_win=poisson_result.home_win,
-            poisson_draw=poisson_result.draw,
-            poisson_away_win=poisson_result.away_win,
+            poisson_home_win=poisson_markets.home_win,
+            poisson_draw=poisson_markets.draw,
+            poisson_away_win=poisson_markets.away_win,
 
             draw_adjustment=draw_adjustment,
             reason=reason,
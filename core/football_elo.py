@@ -7,9 +7,15 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from core.config import Settings
+from core.football_rating_replay import RatingReplay
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+)
+from core.schema_registry import schema_once, table_columns
 
 
 DEFAULT_ELO = 1500.0
@@ -19,6 +25,73 @@ MIN_ELO = 800.0
 MAX_ELO = 2400.0
 
 
+ELO_RATING_UPSERT_SQL = """
+    INSERT INTO football_elo_ratings (
+        team,
+        league,
+        overall_elo,
+        home_elo,
+        away_elo,
+        form_elo,
+        matches,
+        home_matches,
+        away_matches,
+        wins,
+        draws,
+        losses,
+        goals_for,
+        goals_against,
+        last_result,
+        last_updated
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(team, league) DO UPDATE SET
+        overall_elo=excluded.overall_elo,
+        home_elo=excluded.home_elo,
+        away_elo=excluded.away_elo,
+        form_elo=excluded.form_elo,
+        matches=excluded.matches,
+        home_matches=excluded.home_matches,
+        away_matches=excluded.away_matches,
+        wins=excluded.wins,
+        draws=excluded.draws,
+        losses=excluded.losses,
+        goals_for=excluded.goals_for,
+        goals_against=excluded.goals_against,
+        last_result=excluded.last_result,
+        last_updated=excluded.last_updated
+"""
+
+
+ELO_HISTORY_INSERT_SQL = """
+    INSERT OR IGNORE INTO football_elo_history (
+        played_at,
+        league,
+        home_team,
+        away_team,
+        home_goals,
+        away_goals,
+        home_elo_before,
+        away_elo_before,
+        home_elo_after,
+        away_elo_after,
+        home_delta,
+        away_delta,
+        expected_home_score,
+        actual_home_score,
+        k_factor,
+        margin_multiplier,
+        importance,
+        source,
+        source_hash,
+        created_at
+    )
+    VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+"""
+
+
 def now_utc() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -202,6 +275,7 @@ class FootballEloDatabase:
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
 
+    @schema_once("football_elo")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -294,15 +368,8 @@ class FootballEloDatabase:
             ).fetchone()[0] or 0)
             dataset_samples = 0
             dataset_total = 0
-            if conn.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' "
-                "AND name='football_dataset_v15'"
-            ).fetchone() is not None:
-                columns = {
-                    str(row[1]) for row in conn.execute(
-                        "PRAGMA table_info(football_dataset_v15)"
-                    ).fetchall()
-                }
+            columns = table_columns(conn, "football_dataset_v15")
+            if columns:
                 dataset_total = int(conn.execute(
                     "SELECT COUNT(*) FROM football_dataset_v15"
                 ).fetchone()[0] or 0)
@@ -318,20 +385,25 @@ class FootballEloDatabase:
         )
 
     def load_team(self, team: str, league: str = "UNKNOWN") -> TeamElo:
-        self.init_db()
-
         team = normalize_team_name(team)
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
 
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT *
-                FROM football_elo_ratings
-                WHERE team=? AND league=?
-                """,
-                (team, league),
-            ).fetchone()
+        snapshot = active_rating_snapshot(self.db_file)
+
+        if snapshot is not None and snapshot.covers("football_elo_ratings"):
+            row = snapshot.row("football_elo_ratings", team, league)
+        else:
+            self.init_db()
+
+            with self.connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT *
+                    FROM football_elo_ratings
+                    WHERE team=? AND league=?
+                    """,
+                    (team, league),
+                ).fetchone()
 
         if row is None:
             return TeamElo(
@@ -343,68 +415,35 @@ class FootballEloDatabase:
         return TeamElo(**dict(row)).normalized()
 
     def save_team(self, rating: TeamElo) -> None:
+        invalidate_rating_snapshot(self.db_file)
         self.init_db()
         rating = rating.normalized()
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_elo_ratings (
-                    team,
-                    league,
-                    overall_elo,
-                    home_elo,
-                    away_elo,
-                    form_elo,
-                    matches,
-                    home_matches,
-                    away_matches,
-                    wins,
-                    draws,
-                    losses,
-                    goals_for,
-                    goals_against,
-                    last_result,
-                    last_updated
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(team, league) DO UPDATE SET
-                    overall_elo=excluded.overall_elo,
-                    home_elo=excluded.home_elo,
-                    away_elo=excluded.away_elo,
-                    form_elo=excluded.form_elo,
-                    matches=excluded.matches,
-                    home_matches=excluded.home_matches,
-                    away_matches=excluded.away_matches,
-                    wins=excluded.wins,
-                    draws=excluded.draws,
-                    losses=excluded.losses,
-                    goals_for=excluded.goals_for,
-                    goals_against=excluded.goals_against,
-                    last_result=excluded.last_result,
-                    last_updated=excluded.last_updated
-                """,
-                (
-                    rating.team,
-                    rating.league,
-                    rating.overall_elo,
-                    rating.home_elo,
-                    rating.away_elo,
-                    rating.form_elo,
-                    rating.matches,
-                    rating.home_matches,
-                    rating.away_matches,
-                    rating.wins,
-                    rating.draws,
-                    rating.losses,
-                    rating.goals_for,
-                    rating.goals_against,
-                    rating.last_result,
-                    rating.last_updated,
-                ),
-            )
+            conn.execute(ELO_RATING_UPSERT_SQL, self.rating_row(rating))
             conn.commit()
 
+    @staticmethod
+    def rating_row(rating: TeamElo) -> tuple[Any, ...]:
+        return (
+            rating.team,
+            rating.league,
+            rating.overall_elo,
+            rating.home_elo,
+            rating.away_elo,
+            rating.form_elo,
+            rating.matches,
+            rating.home_matches,
+            rating.away_matches,
+            rating.wins,
+            rating.draws,
+            rating.losses,
+            rating.goals_for,
+            rating.goals_against,
+            rating.last_result,
+            rating.last_updated,
+        )
+
     @staticmethod
     def expected_score(rating_a: float, rating_b: float) -> float:
         rating_a = safe_float(rating_a, DEFAULT_ELO)
@@ -628,6 +667,48 @@ class FootballEloDatabase:
                 inserted=False,
             )
 
+        result, history_row = self._apply_match(
+            home,
+            away,
+            league=league,
+            home_team=home_team,
+            away_team=away_team,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            played_at=played_at,
+            importance=importance,
+            home_advantage_elo=home_advantage_elo,
+            source=source,
+            source_hash=source_hash,
+            base_k=base_k,
+        )
+
+        self.save_team(home)
+        self.save_team(away)
+
+        with self.connect() as conn:
+            conn.execute(ELO_HISTORY_INSERT_SQL, history_row)
+            conn.commit()
+
+        return result
+
+    def _apply_match(
+        self,
+        home: TeamElo,
+        away: TeamElo,
+        *,
+        league: str,
+        home_team: str,
+        away_team: str,
+        home_goals: int,
+        away_goals: int,
+        played_at: str,
+        importance: float,
+        home_advantage_elo: float,
+        source: str,
+        source_hash: str,
+        base_k: float,
+    ) -> tuple[EloUpdateResult, tuple[Any, ...]]:
         home_before = home.overall_elo
         away_before = away.overall_elo
 
@@ -736,64 +817,30 @@ class FootballEloDatabase:
         home.last_updated = now_utc()
         away.last_updated = now_utc()
 
-        self.save_team(home)
-        self.save_team(away)
-
-        with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO football_elo_history (
-                    played_at,
-                    league,
-                    home_team,
-                    away_team,
-                    home_goals,
-                    away_goals,
-                    home_elo_before,
-                    away_elo_before,
-                    home_elo_after,
-                    away_elo_after,
-                    home_delta,
-                    away_delta,
-                    expected_home_score,
-                    actual_home_score,
-                    k_factor,
-                    margin_multiplier,
-                    importance,
-                    source,
-                    source_hash,
-                    created_at
-                )
-                VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                """,
-                (
-                    played_at,
-                    league,
-                    home_team,
-                    away_team,
-                    home_goals,
-                    away_goals,
-                    home_before,
-                    away_before,
-                    home.overall_elo,
-                    away.overall_elo,
-                    home_delta,
-                    away_delta,
-                    expected_home,
-                    actual_home,
-                    k_factor,
-                    margin,
-                    importance,
-                    source,
-                    source_hash,
-                    now_utc(),
-                ),
-            )
-            conn.commit()
+        history_row = (
+            played_at,
+            league,
+            home_team,
+            away_team,
+            home_goals,
+            away_goals,
+            home_before,
+            away_before,
+            home.overall_elo,
+            away.overall_elo,
+            home_delta,
+            away_delta,
+            expected_home,
+            actual_home,
+            k_factor,
+            margin,
+            importance,
+            source,
+            source_hash,
+            now_utc(),
+        )
 
-        return EloUpdateResult(
+        result = EloUpdateResult(
             home_team=home_team,
             away_team=away_team,
             league=league,
@@ -810,6 +857,78 @@ class FootballEloDatabase:
             inserted=True,
         )
 
+        return result, history_row
+
+    def replay_matches(self, matches: Iterable[dict[str, Any]]) -> int:
+        """
+        Apply ``update_after_match`` keyword dicts in order with one read
+        of the ratings and one bulk write. Returns inserted matches.
+        """
+        self.init_db()
+
+        with self.connect() as conn:
+            replay = RatingReplay.from_db(
+                conn,
+                TeamElo,
+                ratings_table="football_elo_ratings",
+                history_table="football_elo_history",
+            )
+
+            for match in matches:
+                league = str(match.get("league") or "UNKNOWN").strip() or "UNKNOWN"
+                home_team = normalize_team_name(match["home_team"])
+                away_team = normalize_team_name(match["away_team"])
+                home_goals = max(0, safe_int(match["home_goals"]))
+                away_goals = max(0, safe_int(match["away_goals"]))
+                played_at = match.get("played_at") or now_utc()
+
+                source_hash = match.get("source_hash") or make_source_hash(
+                    league,
+                    home_team,
+                    away_team,
+                    played_at,
+                    home_goals,
+                    away_goals,
+                )
+
+                if replay.is_duplicate(source_hash):
+                    continue
+
+                home, away = replay.pair(home_team, away_team, league)
+
+                _, history_row = self._apply_match(
+                    home,
+                    away,
+                    league=league,
+                    home_team=home_team,
+                    away_team=away_team,
+                    home_goals=home_goals,
+                    away_goals=away_goals,
+                    played_at=played_at,
+                    importance=match.get("importance", 1.0),
+                    home_advantage_elo=match.get(
+                        "home_advantage_elo",
+                        DEFAULT_HOME_ADVANTAGE_ELO,
+                    ),
+                    source=match.get("source", "manual"),
+                    source_hash=source_hash,
+                    base_k=match.get("base_k", DEFAULT_K_FACTOR),
+                )
+
+                replay.record(
+                    history_row,
+                    source_hash=source_hash,
+                    teams=(home, away),
+                )
+
+            return replay.write(
+                conn,
+                self.db_file,
+                ratings_sql=ELO_RATING_UPSERT_SQL,
+                rating_row=self.rating_row,
+                history_sql=ELO_HISTORY_INSERT_SQL,
+            )
+
     def league_table(self, league: str) -> list[TeamElo]:
         self.init_db()
 
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+from typing import Any, Iterable
+
+from core.schema_registry import table_columns, table_exists
+
+
+# (sport_key, event, selection, commence_time)
+MarketKey = tuple[str, str, str, str]
+
+# (league, home_team, away_team, commence_time)
+MatchKey = tuple[str, str, str, str]
+
+# Rating sources in preference order: (table, candidate value columns).
+ELO_SOURCES = (
+    ("football_team_elo_v14", ("overall_elo", "rating", "elo")),
+    ("football_elo_ratings", ("overall_elo", "rating", "elo")),
+)
+FORM_SOURCES = (
+    ("football_team_form", ("form_score", "recent_form", "rating")),
+)
+
+# Covering indexes for the set-based lookups below.
+ENRICHMENT_INDEXES = (
+    (
+        "ix_football_market_closing_enrichment",
+        "football_market_closing",
+        (
+            "sport_key",
+            "event",
+            "selection",
+            "commence_time",
+            "captured_at",
+            "id",
+            "closing_odds",
+            "closing_probability",
+            "bookmaker",
+        ),
+    ),
+    (
+        "ix_football_market_snapshots_v14_enrichment",
+        "football_market_snapshots_v14",
+        (
+            "sport_key",
+            "event",
+            "selection",
+            "commence_time",
+            "is_closing_window",
+            "captured_at",
+            "selected_odds",
+            "market_selection_probability",
+            "bookmaker",
+        ),
+    ),
+    (
+        "ix_football_xg_history_v14_enrichment",
+        "football_xg_history_v14",
+        (
+            "league",
+            "home_team",
+            "away_team",
+            "played_at",
+            "home_xg",
+            "away_xg",
+        ),
+    ),
+    (
+        "ix_football_xg_history_enrichment",
+        "football_xg_history",
+        (
+            "league",
+            "home_team",
+            "away_team",
+            "played_at",
+            "home_xg",
+            "away_xg",
+        ),
+    ),
+)
+
+
+def _safe_float(value: Any) -> float | None:
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+
+    if math.isnan(result) or math.isinf(result):
+        return None
+
+    return result
+
+
+def _table_exists(
+    conn: sqlite3.Connection,
+    table_name: str,
+) -> bool:
+    return table_exists(conn, table_name)
+
+
+def _columns(
+    conn: sqlite3.Connection,
+    table_name: str,
+) -> set[str]:
+    return set(table_columns(conn, table_name))
+
+
+def ensure_enrichment_indexes(conn: sqlite3.Connection) -> None:
+    for index_name, table_name, index_columns in ENRICHMENT_INDEXES:
+        if not _table_exists(conn, table_name):
+            continue
+
+        if not set(index_columns).issubset(_columns(conn, table_name)):
+            continue
+
+        conn.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS {index_name}
+            ON {table_name} ({", ".join(index_columns)})
+            """
+        )
+
+
+def load_key_table(
+    conn: sqlite3.Connection,
+    table_name: str,
+    key_columns: tuple[str, ...],
+    keys: Iterable[tuple[str, ...]],
+) -> None:
+    """(Re)fill ``temp.<table_name>`` with distinct lookup keys."""
+    conn.execute(
+        f"""
+        CREATE TEMP TABLE IF NOT EXISTS {table_name} (
+            {", ".join(f"{column} TEXT NOT NULL" for column in key_columns)},
+            PRIMARY KEY ({", ".join(key_columns)})
+        )
+        """
+    )
+    conn.execute(f"DELETE FROM temp.{table_name}")
+    conn.executemany(
+        f"""
+        INSERT OR IGNORE INTO temp.{table_name}
+        VALUES ({", ".join("?" for _ in key_columns)})
+        """,
+        keys,
+    )
+
+
+def load_closing_snapshots(
+    conn: sqlite3.Connection,
+    keys: Iterable[MarketKey],
+) -> dict[MarketKey, dict[str, Any]]:
+    """
+    Closing price for every (sport_key, event, selection, commence_time).
+
+    The last pre-kickoff row of ``football_market_closing`` wins; keys
+    without one fall back to the best ``football_market_snapshots_v14``
+    row (closing window first, then newest, then highest odds).
+    """
+    load_key_table(
+        conn,
+        "football_enrichment_market_keys",
+        ("sport_key", "event", "selection", "commence_time"),
+        keys,
+    )
+    snapshots: dict[MarketKey, dict[str, Any]] = {}
+
+    if _table_exists(conn, "football_market_closing"):
+        rows = conn.execute(
+            """
+            WITH ranked AS (
+                SELECT
+                    k.sport_key,
+                    k.event,
+                    k.selection,
+                    k.commence_time,
+                    c.closing_odds AS selected_odds,
+                    c.closing_probability AS market_selection_probability,
+                    1 AS is_closing_window,
+                    c.captured_at,
+                    c.bookmaker,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY
+                            k.sport_key,
+                            k.event,
+                            k.selection,
+                            k.commence_time
+                        ORDER BY c.captured_at DESC, c.id DESC
+                    ) AS position
+                FROM temp.football_enrichment_market_keys AS k
+                JOIN football_market_closing AS c
+                  ON c.sport_key=k.sport_key
+                 AND c.event=k.event
+                 AND c.selection=k.selection
+                 AND c.commence_time=k.commence_time
+                WHERE c.captured_at <= c.commence_time
+            )
+            SELECT *
+            FROM ranked
+            WHERE position=1
+            """
+        ).fetchall()
+
+        for row in rows:
+            snapshots[tuple(row[:4])] = dict(zip(
+                (
+                    "selected_odds",
+                    "market_selection_probability",
+                    "is_closing_window",
+                    "captured_at",
+                    "bookmaker",
+                ),
+                row[4:9],
+            ))
+
+    if _table_exists(conn, "football_market_snapshots_v14"):
+        rows = conn.execute(
+            """
+            WITH ranked AS (
+                SELECT
+                    k.sport_key,
+                    k.event,
+                    k.selection,
+                    k.commence_time,
+                    s.selected_odds,
+                    s.market_selection_probability,
+                    s.is_closing_window,
+                    s.captured_at,
+                    s.bookmaker,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY
+                            k.sport_key,
+                            k.event,
+                            k.selection,
+                            k.commence_time
+                        ORDER BY
+                            s.is_closing_window DESC,
+                            s.captured_at DESC,
+                            s.selected_odds DESC
+                    ) AS position
+                FROM temp.football_enrichment_market_keys AS k
+                JOIN football_market_snapshots_v14 AS s
+                  ON s.sport_key=k.sport_key
+                 AND s.event=k.event
+                 AND s.selection=k.selection
+                 AND s.commence_time=k.commence_time
+            )
+            SELECT *
+            FROM ranked
+            WHERE position=1
+            """
+        ).fetchall()
+
+        for row in rows:
+            snapshots.setdefault(tuple(row[:4]), dict(zip(
+                (
+                    "selected_odds",
+                    "market_selection_probability",
+                    "is_closing_window",
+                    "captured_at",
+                    "bookmaker",
+                ),
+                row[4:9],
+            )))
+
+    return snapshots
+
+
+def load_xg_rows(
+    conn: sqlite3.Connection,
+    keys: Iterable[MatchKey],
+) -> dict[MatchKey, dict[str, Any]]:
+    """Post-match xG played within two days of each fixture, nearest first."""
+    table_name = next(
+        (
+            name
+            for name in ("football_xg_history_v14", "football_xg_history")
+            if _table_exists(conn, name)
+        ),
+        "",
+    )
+
+    if not table_name:
+        return {}
+
+    columns = _columns(conn, table_name)
+    played_column = next(
+        (
+            name
+            for name in ("played_at", "created_at")
+            if name in columns
+        ),
+        "",
+    )
+
+    if not played_column:
+        return {}
+
+    load_key_table(
+        conn,
+        "football_enrichment_match_keys",
+        ("league", "home_team", "away_team", "commence_time"),
+        keys,
+    )
+
+    rows = conn.execute(
+        f"""
+        WITH ranked AS (
+            SELECT
+                k.league,
+                k.home_team,
+                k.away_team,
+                k.commence_time,
+                x.home_xg,
+                x.away_xg,
+                ROW_NUMBER() OVER (
+                    PARTITION BY
+                        k.league,
+                        k.home_team,
+                        k.away_team,
+                        k.commence_time
+                    ORDER BY ABS(
+                        julianday(x.{played_column})
+                        - julianday(k.commence_time)
+                    ) ASC
+                ) AS position
+            FROM temp.football_enrichment_match_keys AS k
+            JOIN {table_name} AS x
+              ON x.league=k.league
+             AND x.home_team=k.home_team
+             AND x.away_team=k.away_team
+            WHERE ABS(
+                julianday(x.{played_column})
+                - julianday(k.commence_time)
+            ) <= 2.0
+        )
+        SELECT *
+        FROM ranked
+        WHERE position=1
+        """
+    ).fetchall()
+
+    return {
+        tuple(row[:4]): {"home_xg": row[4], "away_xg": row[5]}
+        for row in rows
+    }
+
+
+def load_team_values(
+    conn: sqlite3.Connection,
+    sources: tuple[tuple[str, tuple[str, ...]], ...],
+) -> dict[tuple[str, str], float | None]:
+    """(team, league) -> value from the first available rating source."""
+    for table_name, candidates in sources:
+        if not _table_exists(conn, table_name):
+            continue
+
+        columns = _columns(conn, table_name)
+        value_column = next(
+            (name for name in candidates if name in columns),
+            "",
+        )
+
+        if not value_column:
+            return {}
+
+        values: dict[tuple[str, str], float | None] = {}
+
+        for team, league, value in conn.execute(
+            f"""
+            SELECT team, league, {value_column}
+            FROM {table_name}
+            """
+        ):
+            values.setdefault((team, league), _safe_float(value))
+
+        return values
+
+    return {}
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.schema_registry import table_exists
 
 
 DEFAULT_JSON_PATH = "exports/football_evaluation_dashboard_v15.json"
@@ -73,14 +74,7 @@ class FootballEvaluationDashboardV15:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        return conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone() is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _metrics(
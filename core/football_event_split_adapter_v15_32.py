@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import csv
 import json
 import re
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def _now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -36,23 +37,15 @@ def split_event(event: str):
 def enrich_postmatch_dataset(
     source="exports/history_football_postmatch_dataset_v14.csv"
 ):
-    path = Path(source)
-
-    if not path.exists():
-        return []
-
     output = []
 
-    with path.open("r", encoding="utf-8-sig", newline="") as file:
-        rows = csv.DictReader(file)
-
-        for row in rows:
-            home, away = split_event(row.get("event", ""))
+    for row in export_table(source).records():
+        home, away = split_event(row.get("event", ""))
 
-            row["home_team"] = home
-            row["away_team"] = away
+        row["home_team"] = home
+        row["away_team"] = away
 
-            output.append(row)
+        output.append(row)
 
     return output
 
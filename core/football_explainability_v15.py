@@ -10,6 +10,8 @@ from typing import Any
 from core.config import Settings
 from core.football_features import FootballFeatures
 from core.football_meta import FootballMetaPrediction
+from core.football_scan_session import FootballScanSession
+from core.schema_registry import schema_once
 
 
 def now_utc() -> str:
@@ -42,6 +44,50 @@ class FootballExplanationV15:
     summary: str
 
 
+EXPLANATION_UPSERT_SQL = """
+    INSERT INTO football_explainability_v15 (
+        source_hash,
+        sport_key,
+        league,
+        event,
+        selection,
+        bookmaker,
+        commence_time,
+        decision,
+        verdict,
+        final_probability,
+        market_probability,
+        raw_edge,
+        adjusted_edge,
+        confidence,
+        risk,
+        positive_signals,
+        negative_signals,
+        neutral_signals,
+        summary,
+        created_at,
+        updated_at
+    )
+    VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(source_hash) DO UPDATE SET
+        decision=excluded.decision,
+        verdict=excluded.verdict,
+        final_probability=excluded.final_probability,
+        market_probability=excluded.market_probability,
+        raw_edge=excluded.raw_edge,
+        adjusted_edge=excluded.adjusted_edge,
+        confidence=excluded.confidence,
+        risk=excluded.risk,
+        positive_signals=excluded.positive_signals,
+        negative_signals=excluded.negative_signals,
+        neutral_signals=excluded.neutral_signals,
+        summary=excluded.summary,
+        updated_at=excluded.updated_at
+"""
+
+
 class FootballExplainabilityV15:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
@@ -54,6 +100,7 @@ class FootballExplainabilityV15:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    @schema_once("football_explainability_v15")
     def init_db(self) -> None:
         self.db_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -347,6 +394,49 @@ class FootballExplainabilityV15:
             summary=summary,
         )
 
+    @staticmethod
+    def row(
+        *,
+        explanation: FootballExplanationV15,
+        features: FootballFeatures,
+        meta_prediction: FootballMetaPrediction,
+        adjusted_edge: float,
+    ) -> tuple[Any, ...]:
+        timestamp = now_utc()
+
+        return (
+            explanation.source_hash,
+            features.sport_key,
+            features.league,
+            features.event,
+            features.selection,
+            features.bookmaker,
+            features.commence_time,
+            explanation.decision,
+            explanation.verdict,
+            meta_prediction.probability,
+            features.market_selection_probability,
+            features.raw_edge,
+            adjusted_edge,
+            explanation.confidence,
+            explanation.risk,
+            json.dumps(
+                explanation.positive_signals,
+                ensure_ascii=False,
+            ),
+            json.dumps(
+                explanation.negative_signals,
+                ensure_ascii=False,
+            ),
+            json.dumps(
+                explanation.neutral_signals,
+                ensure_ascii=False,
+            ),
+            explanation.summary,
+            timestamp,
+            timestamp,
+        )
+
     def save(
         self,
         *,
@@ -355,85 +445,15 @@ class FootballExplainabilityV15:
         meta_prediction: FootballMetaPrediction,
         adjusted_edge: float,
     ) -> None:
-        timestamp = now_utc()
+        row = self.row(
+            explanation=explanation,
+            features=features,
+            meta_prediction=meta_prediction,
+            adjusted_edge=adjusted_edge,
+        )
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_explainability_v15 (
-                    source_hash,
-                    sport_key,
-                    league,
-                    event,
-                    selection,
-                    bookmaker,
-                    commence_time,
-                    decision,
-                    verdict,
-                    final_probability,
-                    market_probability,
-                    raw_edge,
-                    adjusted_edge,
-                    confidence,
-                    risk,
-                    positive_signals,
-                    negative_signals,
-                    neutral_signals,
-                    summary,
-                    created_at,
-                    updated_at
-                )
-                VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                ON CONFLICT(source_hash) DO UPDATE SET
-                    decision=excluded.decision,
-                    verdict=excluded.verdict,
-                    final_probability=excluded.final_probability,
-                    market_probability=excluded.market_probability,
-                    raw_edge=excluded.raw_edge,
-                    adjusted_edge=excluded.adjusted_edge,
-                    confidence=excluded.confidence,
-                    risk=excluded.risk,
-                    positive_signals=excluded.positive_signals,
-                    negative_signals=excluded.negative_signals,
-                    neutral_signals=excluded.neutral_signals,
-                    summary=excluded.summary,
-                    updated_at=excluded.updated_at
-                """,
-                (
-                    explanation.source_hash,
-                    features.sport_key,
-                    features.league,
-                    features.event,
-                    features.selection,
-                    features.bookmaker,
-                    features.commence_time,
-                    explanation.decision,
-                    explanation.verdict,
-                    meta_prediction.probability,
-                    features.market_selection_probability,
-                    features.raw_edge,
-                    adjusted_edge,
-                    explanation.confidence,
-                    explanation.risk,
-                    json.dumps(
-                        explanation.positive_signals,
-                        ensure_ascii=False,
-                    ),
-                    json.dumps(
-                        explanation.negative_signals,
-                        ensure_ascii=False,
-                    ),
-                    json.dumps(
-                        explanation.neutral_signals,
-                        ensure_ascii=False,
-                    ),
-                    explanation.summary,
-                    timestamp,
-                    timestamp,
-                ),
-            )
+            conn.execute(EXPLANATION_UPSERT_SQL, row)
             conn.commit()
 
 
@@ -448,9 +468,9 @@ def explain_and_save_football_decision_v15(
     confidence: float,
     risk: str,
     rejection_reason: str = "",
+    session: FootballScanSession | None = None,
 ) -> FootballExplanationV15:
-    engine = FootballExplainabilityV15(settings)
-    explanation = engine.build(
+    explanation = FootballExplainabilityV15.build(
         source_hash=source_hash,
         features=features,
         meta_prediction=meta_prediction,
@@ -460,6 +480,21 @@ def explain_and_save_football_decision_v15(
         risk=risk,
         rejection_reason=rejection_reason,
     )
+
+    if session is not None:
+        session.add(
+            "football_explainability_v15",
+            EXPLANATION_UPSERT_SQL,
+            FootballExplainabilityV15.row(
+                explanation=explanation,
+                features=features,
+                meta_prediction=meta_prediction,
+                adjusted_edge=adjusted_edge,
+            ),
+        )
+        return explanation
+
+    engine = FootballExplainabilityV15(settings)
     engine.save(
         explanation=explanation,
         features=features,
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows, write_rows
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_57.csv")
 
 FEATURES = [
@@ -22,19 +23,7 @@ def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def run_feature_enrichment_v15_57(
-    source="exports/history_football_learning_dataset_v15_56.csv"
-):
-    rows = load_rows(source)
-
+def enrich_features(rows):
     enriched = []
     added = set()
 
@@ -49,12 +38,6 @@ def run_feature_enrichment_v15_57(
 
         enriched.append(item)
 
-    if enriched:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=enriched[0].keys())
-            writer.writeheader()
-            writer.writerows(enriched)
-
     return {
         "version": "v15.57",
         "created_at": now(),
@@ -64,3 +47,12 @@ def run_feature_enrichment_v15_57(
         "output": str(OUTPUT),
         "status": "READY" if enriched else "BUILDING",
     }, enriched
+
+
+def run_feature_enrichment_v15_57(
+    source="exports/history_football_learning_dataset_v15_56.csv"
+):
+    report, enriched = enrich_features(load_rows(source))
+    write_rows(OUTPUT, enriched)
+
+    return report, enriched
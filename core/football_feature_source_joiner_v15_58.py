@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows, write_rows
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_58.csv")
+FEATURE_SOURCE = Path("exports/history_football_features.csv")
 
 FEATURES = [
     "elo_difference",
@@ -22,20 +24,7 @@ def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def run_feature_source_joiner_v15_58(
-    source="exports/history_football_learning_dataset_v15_56.csv"
-):
-    base = load_rows(source)
-    features = load_rows("exports/history_football_features.csv")
-
+def join_feature_sources(base, features):
     feature_map = {
         row.get("source_hash"): row
         for row in features
@@ -56,12 +45,6 @@ def run_feature_source_joiner_v15_58(
 
         output.append(item)
 
-    if output:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=output[0].keys())
-            writer.writeheader()
-            writer.writerows(output)
-
     return {
         "version": "v15.58",
         "created_at": now(),
@@ -70,4 +53,16 @@ def run_feature_source_joiner_v15_58(
         "missing_features": [x for x in FEATURES if x not in found],
         "output": str(OUTPUT),
         "status": "READY" if output else "BUILDING",
-    }
+    }, output
+
+
+def run_feature_source_joiner_v15_58(
+    source="exports/history_football_learning_dataset_v15_56.csv"
+):
+    report, output = join_feature_sources(
+        load_rows(source),
+        load_rows(FEATURE_SOURCE),
+    )
+    write_rows(OUTPUT, output)
+
+    return report
@@ -216,6 +216,64 @@ class FootballModelBundle:
     dixon_coles: DixonColesMarkets
 
 
+class FootballModelBundleCache:
+    """
+    Scan-scoped memo of build_model_bundle.
+
+    The bundle only depends on the fixture and the league parameters, so
+    HOME/DRAW/AWAY and every bookmaker candidate of one fixture share it.
+    """
+
+    def __init__(self) -> None:
+        self._bundles: dict[tuple[Any, ...], FootballModelBundle] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._bundles)
+
+    def get_or_build(
+        self,
+        settings: Settings,
+        *,
+        market: FootballMarketSnapshot,
+        league_average_xg: float,
+        home_advantage_xg: float,
+        home_advantage_elo: float,
+        dixon_rho: float,
+    ) -> FootballModelBundle:
+        key = (
+            market.league,
+            market.home_team,
+            market.away_team,
+            league_average_xg,
+            home_advantage_xg,
+            home_advantage_elo,
+            dixon_rho,
+        )
+
+        bundle = self._bundles.get(key)
+
+        if bundle is not None:
+            self.hits += 1
+            return bundle
+
+        self.misses += 1
+        bundle = build_model_bundle(
+            settings,
+            market=market,
+            league_average_xg=league_average_xg,
+            home_advantage_xg=home_advantage_xg,
+            home_advantage_elo=home_advantage_elo,
+            dixon_rho=dixon_rho,
+        )
+        self._bundles[key] = bundle
+        return bundle
+
+    def summary(self) -> str:
+        return f"{self.misses} built, {self.hits} reused"
+
+
 def _selection_probability(
     *,
     selection_type: str,
@@ -465,6 +523,7 @@ def build_football_features(
     home_advantage_xg: float = 1.08,
     home_advantage_elo: float = 65.0,
     dixon_rho: float = -0.08,
+    bundle_cache: FootballModelBundleCache | None = None,
 ) -> FootballFeatures:
     selection_type = normalize_selection(
         selection,
@@ -472,7 +531,12 @@ def build_football_features(
         market.away_team,
     )
 
-    bundle = build_model_bundle(
+    build_bundle = (
+        bundle_cache.get_or_build
+        if bundle_cache is not None
+        else build_model_bundle
+    )
+    bundle = build_bundle(
         settings,
         market=market,
         league_average_xg=league_average_xg,
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.schema_registry import schema_once
 
 
 DEFAULT_HOME_ADVANTAGE_XG = 1.08
@@ -158,6 +159,7 @@ class FootballLeagueCalibrationDatabase:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    @schema_once("football_league_calibration")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
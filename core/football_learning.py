@@ -14,6 +14,7 @@ from core.football_trainer import (
     ensure_feature_history_table,
     train,
 )
+from core.schema_registry import table_columns, table_exists
 
 
 def now_utc() -> str:
@@ -70,28 +71,14 @@ class FootballLearningManager:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        row = conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone()
-
-        return row is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
     def sync_feature_results(self) -> int:
         """
@@ -1,29 +1,16 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def run_learning_analyzer_v15_50(
-    source="exports/history_football_clv_results_v15_49.csv"
-):
-    path = Path(source)
-
-    if not path.exists():
-        return {
-            "version": "v15.50",
-            "records": 0,
-            "status": "BUILDING",
-        }
-
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        rows = list(csv.DictReader(f))
-
+def analyze_clv_results(rows):
     clvs = []
 
     for row in rows:
@@ -46,3 +33,18 @@ def run_learning_analyzer_v15_50(
         "recommendations_ready": bool(clvs),
         "status": "READY" if clvs else "BUILDING",
     }
+
+
+def run_learning_analyzer_v15_50(
+    source="exports/history_football_clv_results_v15_49.csv"
+):
+    path = Path(source)
+
+    if not path.exists():
+        return {
+            "version": "v15.50",
+            "records": 0,
+            "status": "BUILDING",
+        }
+
+    return analyze_clv_results(load_rows(path))
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+from core.football_clv_movement_validator_v15_51 import validate_clv_movement
+from core.football_clv_storage_learning_v15_49 import build_clv_results
+from core.football_feature_enrichment_v15_57 import enrich_features
+from core.football_feature_source_joiner_v15_58 import join_feature_sources
+from core.football_learning_analyzer_v15_50 import analyze_clv_results
+from core.football_learning_dataset_builder_v15_56 import build_learning_dataset
+from core.football_learning_tables import Row, SnapshotIndex, load_rows, write_rows
+from core.football_learning_weight_optimizer_v15_55 import optimize_learning_weights
+from core.football_market_probability_joiner_v15_59 import join_market_probability
+from core.football_real_closing_snapshot_finder_v15_52 import find_closing_snapshots
+from core.football_smart_market_probability_resolver_v15_60 import (
+    resolve_smart_market_probability,
+)
+from core.football_universal_market_probability_resolver_v15_61 import (
+    resolve_universal_market_probability,
+)
+
+log = logging.getLogger("football-learning-dataflow")
+
+
+CLV_RESULTS_FILE = "history_football_clv_results_v15_49.csv"
+SNAPSHOTS_FILE = "history_football_market_snapshots_v14.csv"
+FEATURES_FILE = "history_football_features.csv"
+
+# Table holding the caller's CLV rows before v15.49 turns them into results.
+INPUT_TABLE = "input"
+
+
+def debug_csv_enabled() -> bool:
+    return os.getenv("FOOTBALL_DATAFLOW_DEBUG_CSV", "0") == "1"
+
+
+@dataclass
+class DataflowContext:
+    """Inputs shared by all stages of one run, loaded once."""
+
+    snapshots: SnapshotIndex
+    features: list[Row]
+
+
+StageRun = Callable[[list[Row], DataflowContext], tuple[dict[str, Any], list[Row] | None]]
+
+
+@dataclass(frozen=True)
+class DataflowStage:
+    """
+    One step of the learning dataset chain.
+
+    ``run`` gets the table produced by ``source`` and returns its report
+    and, for table-producing stages, the new table (stored under ``name``).
+    ``output`` is the CSV the old stage wrote; it is written only for the
+    final table, or for every table when debug CSVs are on.
+    """
+
+    name: str
+    source: str
+    run: StageRun
+    output: str | None = None
+
+
+@dataclass
+class DataflowResult:
+    final_stage: str
+    reports: dict[str, dict[str, Any]] = field(default_factory=dict)
+    tables: dict[str, list[Row]] = field(default_factory=dict)
+    seconds: dict[str, float] = field(default_factory=dict)
+    written: list[str] = field(default_factory=list)
+
+    @property
+    def rows(self) -> list[Row]:
+        return self.tables.get(self.final_stage, [])
+
+
+def _report_only(function: Callable[[list[Row]], dict[str, Any]]) -> StageRun:
+    return lambda rows, context: (function(rows), None)
+
+
+LEARNING_DATAFLOW: tuple[DataflowStage, ...] = (
+    DataflowStage(
+        "v15.49",
+        INPUT_TABLE,
+        lambda rows, context: build_clv_results(rows),
+        CLV_RESULTS_FILE,
+    ),
+    DataflowStage("v15.50", "v15.49", _report_only(analyze_clv_results)),
+    DataflowStage("v15.51", "v15.49", _report_only(validate_clv_movement)),
+    DataflowStage(
+        "v15.52",
+        "v15.49",
+        lambda rows, context: find_closing_snapshots(context.snapshots),
+    ),
+    DataflowStage("v15.55", "v15.49", _report_only(optimize_learning_weights)),
+    DataflowStage(
+        "v15.56",
+        "v15.49",
+        lambda rows, context: build_learning_dataset(rows),
+        "history_football_learning_dataset_v15_56.csv",
+    ),
+    DataflowStage(
+        "v15.57",
+        "v15.56",
+        lambda rows, context: enrich_features(rows),
+        "history_football_learning_dataset_v15_57.csv",
+    ),
+    DataflowStage(
+        "v15.58",
+        "v15.56",
+        lambda rows, context: join_feature_sources(rows, context.features),
+        "history_football_learning_dataset_v15_58.csv",
+    ),
+    DataflowStage(
+        "v15.59",
+        "v15.58",
+        lambda rows, context: join_market_probability(rows, context.snapshots),
+        "history_football_learning_dataset_v15_59.csv",
+    ),
+    DataflowStage(
+        "v15.60",
+        "v15.58",
+        lambda rows, context: resolve_smart_market_probability(rows, context.snapshots),
+        "history_football_learning_dataset_v15_60.csv",
+    ),
+    DataflowStage(
+        "v15.61",
+        "v15.58",
+        lambda rows, context: resolve_universal_market_probability(rows, context.snapshots),
+        "history_football_learning_dataset_v15_61.csv",
+    ),
+)
+
+
+def run_learning_dataflow(
+    clv_rows: Iterable[Row] | None = None,
+    *,
+    stages: Sequence[DataflowStage] = LEARNING_DATAFLOW,
+    export_dir: str | Path | None = None,
+    snapshots: Iterable[Row] | SnapshotIndex | None = None,
+    features: Iterable[Row] | None = None,
+    final_stage: str | None = None,
+    debug_csv: bool | None = None,
+) -> DataflowResult:
+    """
+    Run the v15.49-v15.61 chain in memory.
+
+    Without ``clv_rows`` the chain starts from the stored v15.49 CSV.
+    Snapshots and features default to their history exports and are read
+    once per run. Only ``final_stage`` (the last stage with an output)
+    is written to disk unless debug CSVs are enabled.
+    """
+    export_dir = Path(export_dir or os.getenv("EXPORT_DIR", "exports"))
+    debug_csv = debug_csv_enabled() if debug_csv is None else debug_csv
+
+    if final_stage is None:
+        final_stage = next(
+            (stage.name for stage in reversed(stages) if stage.output),
+            stages[-1].name if stages else "",
+        )
+
+    if not isinstance(snapshots, SnapshotIndex):
+        snapshots = SnapshotIndex(
+            load_rows(export_dir / SNAPSHOTS_FILE)
+            if snapshots is None
+            else snapshots
+        )
+
+    context = DataflowContext(
+        snapshots=snapshots,
+        features=(
+            load_rows(export_dir / FEATURES_FILE)
+            if features is None
+            else list(features)
+        ),
+    )
+    result = DataflowResult(final_stage=final_stage)
+
+    if clv_rows is None:
+        result.tables["v15.49"] = load_rows(export_dir / CLV_RESULTS_FILE)
+    else:
+        result.tables[INPUT_TABLE] = list(clv_rows)
+
+    for stage in stages:
+        if stage.source not in result.tables:
+            continue
+
+        started = time.perf_counter()
+        report, table = stage.run(result.tables[stage.source], context)
+
+        if table is not None:
+            result.tables[stage.name] = table
+
+            written = None
+
+            if stage.output and (debug_csv or stage.name == final_stage):
+                path = export_dir / stage.output
+                if write_rows(path, table):
+                    written = str(path)
+                    result.written.append(written)
+
+            if "output" in report:
+                report = {**report, "output": written}
+
+        result.reports[stage.name] = report
+        result.seconds[stage.name] = time.perf_counter() - started
+
+    log.info(
+        "Learning dataflow finished: %s rows in %s, %s snapshots indexed (%s)",
+        len(result.rows),
+        final_stage,
+        len(snapshots),
+        ", ".join(
+            f"{name}={seconds:.3f}s"
+            for name, seconds in result.seconds.items()
+        ),
+    )
+
+    return result
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows, write_rows
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_56.csv")
 
 
@@ -11,21 +12,7 @@ def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def run_learning_dataset_builder_v15_56(
-    source="exports/history_football_clv_results_v15_49.csv"
-):
-    path = Path(source)
-
-    if not path.exists():
-        return {
-            "version": "v15.56",
-            "records": 0,
-            "status": "BUILDING",
-        }
-
-    with path.open("r", encoding="utf-8-sig", newline="") as f:
-        rows = list(csv.DictReader(f))
-
+def build_learning_dataset(rows):
     dataset = []
 
     for row in rows:
@@ -40,19 +27,28 @@ def run_learning_dataset_builder_v15_56(
             "target": row.get("target"),
         })
 
-    if dataset:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=dataset[0].keys()
-            )
-            writer.writeheader()
-            writer.writerows(dataset)
-
     return {
         "version": "v15.56",
         "created_at": now(),
         "records": len(dataset),
         "output": str(OUTPUT),
         "status": "READY" if dataset else "BUILDING",
-    }
+    }, dataset
+
+
+def run_learning_dataset_builder_v15_56(
+    source="exports/history_football_clv_results_v15_49.csv"
+):
+    path = Path(source)
+
+    if not path.exists():
+        return {
+            "version": "v15.56",
+            "records": 0,
+            "status": "BUILDING",
+        }
+
+    report, dataset = build_learning_dataset(load_rows(path))
+    write_rows(OUTPUT, dataset)
+
+    return report
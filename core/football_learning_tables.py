@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Any, Iterable
+
+from core.export_tables import export_table
+
+Row = dict[str, Any]
+
+
+def load_rows(path: str | Path) -> list[Row]:
+    return export_table(path).records()
+
+
+def write_rows(path: str | Path, rows: list[Row]) -> bool:
+    """Write rows with the first row's keys as header; nothing when empty."""
+    if not rows:
+        return False
+
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    with p.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return True
+
+
+def normalize(value: Any) -> str:
+    return (value or "").strip().lower()
+
+
+class SnapshotIndex:
+    """
+    Lookups over the football market snapshot export, built once and shared
+    by every stage that joins against it.
+
+    ``by_hash`` keeps the last row per source_hash and ``by_event_selection``
+    the first row per normalized (event, selection), which is what the
+    stages did with their own dict comprehensions.
+    """
+
+    def __init__(self, rows: Iterable[Row]) -> None:
+        self.rows = list(rows)
+        self.by_hash: dict[str, Row] = {}
+        self.by_event_selection: dict[tuple[str, str], Row] = {}
+
+        for row in self.rows:
+            source_hash = row.get("source_hash")
+
+            if source_hash:
+                self.by_hash[source_hash] = row
+
+            self.by_event_selection.setdefault(
+                (normalize(row.get("event")), normalize(row.get("selection"))),
+                row,
+            )
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> "SnapshotIndex":
+        return cls(load_rows(path))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def latest_by_hash(self) -> list[Row]:
+        """Latest snapshot (max captured_at, first in file on ties) per hash."""
+        latest: dict[str, Row] = {}
+
+        for row in self.rows:
+            source_hash = row.get("source_hash")
+            if not source_hash:
+                continue
+
+            current = latest.get(source_hash)
+            captured_at = row.get("captured_at") or ""
+
+            if current is None or captured_at > (current.get("captured_at") or ""):
+                latest[source_hash] = row
+
+        return list(latest.values())
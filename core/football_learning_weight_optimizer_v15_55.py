@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import load_rows
+
 
 CURRENT_WEIGHTS = {
     "ELO": 0.25,
@@ -18,16 +19,8 @@ def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def run_learning_weight_optimizer_v15_55(
-    source="exports/history_football_clv_results_v15_49.csv"
-):
-    path = Path(source)
-
-    records = 0
-
-    if path.exists():
-        with path.open("r", encoding="utf-8-sig", newline="") as f:
-            records = len(list(csv.DictReader(f)))
+def optimize_learning_weights(rows):
+    records = len(rows)
 
     action = "HOLD"
 
@@ -43,3 +36,9 @@ def run_learning_weight_optimizer_v15_55(
         "action": action,
         "status": "READY",
     }
+
+
+def run_learning_weight_optimizer_v15_55(
+    source="exports/history_football_clv_results_v15_49.csv"
+):
+    return optimize_learning_weights(load_rows(Path(source)))
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.schema_registry import table_columns, table_exists
 
 
 DEFAULT_REPORT_PATH = "exports/football_model_health_v14.json"
@@ -103,26 +104,14 @@ class FootballMaintenanceV14:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        return conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone() is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
     def cleanup_old_rows(self) -> int:
         """
@@ -12,6 +12,10 @@ from typing import Any, Dict, Iterable
 from core.config import Settings
 from core.market import consensus_h2h
 from core.event_time import is_closing_window
+from core.football_enrichment import load_key_table
+from core.football_scan_session import FootballScanSession
+from core.odds_delta_store import changes_only_enabled, get_odds_delta_store
+from core.schema_registry import schema_once
 
 
 def now_utc() -> str:
@@ -125,6 +129,17 @@ class LineMovement:
     steam_move: bool
 
 
+@dataclass
+class MarketPrices:
+    opening_odds: float | None = None
+    latest_odds: float | None = None
+    closing_odds: float | None = None
+
+
+# (sport_key, event, selection)
+PriceLookupKey = tuple[str, str, str]
+
+
 @dataclass
 class CLVResult:
     selection: str
@@ -162,6 +177,162 @@ class FootballMarketMetrics:
         return self.live_snapshots or self.legacy_snapshots
 
 
+EVENT_SNAPSHOT_INSERT_SQL = """
+    INSERT OR IGNORE INTO football_market_snapshots (
+        sport_key,
+        league,
+        event,
+        home_team,
+        away_team,
+        commence_time,
+        captured_at,
+        bookmaker,
+        market,
+        selection,
+        odds,
+        implied_probability,
+        source_hash,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Opening and latest h2h price plus the last closing capture for every key
+# in temp.football_price_keys, in one statement. Each price is an index
+# seek: ix_football_market_prices ends in captured_at and the implicit
+# rowid, so ``ORDER BY captured_at, id LIMIT 1`` reads one index entry.
+MARKET_PRICES_SQL = """
+    SELECT
+        k.sport_key,
+        k.event,
+        k.selection,
+        (
+            SELECT s.odds
+            FROM football_market_snapshots AS s
+            WHERE s.sport_key=k.sport_key
+              AND s.event=k.event
+              AND s.selection=k.selection
+              AND s.market='h2h'
+            ORDER BY s.captured_at ASC, s.id ASC
+            LIMIT 1
+        ) AS opening_odds,
+        (
+            SELECT s.odds
+            FROM football_market_snapshots AS s
+            WHERE s.sport_key=k.sport_key
+              AND s.event=k.event
+              AND s.selection=k.selection
+              AND s.market='h2h'
+            ORDER BY s.captured_at DESC, s.id DESC
+            LIMIT 1
+        ) AS latest_odds,
+        (
+            SELECT c.closing_odds
+            FROM football_market_closing AS c
+            WHERE c.sport_key=k.sport_key
+              AND c.event=k.event
+              AND c.selection=k.selection
+            ORDER BY c.captured_at DESC, c.id DESC
+            LIMIT 1
+        ) AS closing_odds
+    FROM temp.football_price_keys AS k
+"""
+
+CLOSING_SNAPSHOT_INSERT_SQL = """
+    INSERT OR IGNORE INTO football_market_closing (
+        sport_key,
+        league,
+        event,
+        home_team,
+        away_team,
+        commence_time,
+        external_event_id,
+        selection,
+        bookmaker,
+        closing_odds,
+        closing_probability,
+        captured_at,
+        source_hash,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def build_line_movement(
+    selection: str,
+    prices: MarketPrices,
+    *,
+    steam_threshold: float = 0.05,
+) -> LineMovement | None:
+    opening = prices.opening_odds
+    latest = prices.latest_odds
+    closing = prices.closing_odds
+
+    if opening is None or latest is None:
+        return None
+
+    opening_probability = implied_probability(opening)
+    latest_probability = implied_probability(latest)
+    closing_probability = (
+        implied_probability(closing)
+        if closing is not None
+        else None
+    )
+
+    price_change_pct = (
+        (latest - opening) / opening
+        if opening > 0
+        else 0.0
+    )
+    probability_change = latest_probability - opening_probability
+
+    if latest < opening:
+        direction = "SHORTENING"
+    elif latest > opening:
+        direction = "DRIFTING"
+    else:
+        direction = "FLAT"
+
+    steam_move = (
+        direction == "SHORTENING"
+        and abs(price_change_pct) >= abs(steam_threshold)
+    )
+
+    return LineMovement(
+        selection=selection,
+        opening_odds=opening,
+        latest_odds=latest,
+        closing_odds=closing,
+        opening_probability=opening_probability,
+        latest_probability=latest_probability,
+        closing_probability=closing_probability,
+        price_change_pct=price_change_pct,
+        probability_change=probability_change,
+        direction=direction,
+        steam_move=steam_move,
+    )
+
+
+def build_clv_result(
+    selection: str,
+    bet_odds: float,
+    closing: float | None,
+) -> CLVResult | None:
+    if closing is None or closing <= 1.0 or bet_odds <= 1.0:
+        return None
+
+    clv_pct = (bet_odds / closing - 1.0) * 100.0
+
+    return CLVResult(
+        selection=selection,
+        bet_odds=bet_odds,
+        closing_odds=closing,
+        clv_pct=clv_pct,
+        positive=clv_pct > 0,
+    )
+
+
 class FootballMarketDatabase:
     def __init__(self, settings: Settings):
         self.settings = settings
@@ -174,6 +345,7 @@ class FootballMarketDatabase:
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
 
+    @schema_once("football_market")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -201,13 +373,19 @@ class FootballMarketDatabase:
                 """
             )
 
+            # Opening/latest price seeks for market_prices; the closing
+            # side is served by ix_football_closing_lookup. It replaces
+            # ix_football_market_lookup (same columns without market), so
+            # snapshot inserts maintain a single lookup index.
+            conn.execute("DROP INDEX IF EXISTS ix_football_market_lookup")
             conn.execute(
                 """
-                CREATE INDEX IF NOT EXISTS ix_football_market_lookup
+                CREATE INDEX IF NOT EXISTS ix_football_market_prices
                 ON football_market_snapshots (
                     sport_key,
                     event,
                     selection,
+                    market,
                     captured_at
                 )
                 """
@@ -287,9 +465,71 @@ class FootballMarketDatabase:
         sport_key: str,
         league: str,
         event: dict,
+        session: FootballScanSession | None = None,
     ) -> int:
-        self.init_db()
+        """
+        Store the event's prices; with SNAPSHOT_CHANGES_ONLY=1 (default)
+        only outcomes whose price is new or moved since the last scan.
+        """
+        rows = self._event_snapshot_rows(
+            sport_key=sport_key,
+            league=league,
+            event=event,
+        )
+
+        store = None
+
+        if rows and changes_only_enabled():
+            store = get_odds_delta_store(
+                self.db_file,
+                "football_market_snapshots",
+                key_columns=(
+                    "sport_key",
+                    "event",
+                    "bookmaker",
+                    "market",
+                    "selection",
+                ),
+            )
+            rows = store.filter_changed(
+                rows,
+                key=lambda row: (row[0], row[2], row[7], row[8], row[9]),
+                odds=lambda row: row[10],
+            )
+
+        if not rows:
+            return 0
+
+        if session is not None:
+            if store is not None:
+                session.track_delta_store(store)
+            return session.add_many(
+                "football_market_snapshots",
+                EVENT_SNAPSHOT_INSERT_SQL,
+                rows,
+            )
 
+        try:
+            self.init_db()
+
+            with self.connect() as conn:
+                before = conn.total_changes
+                conn.executemany(EVENT_SNAPSHOT_INSERT_SQL, rows)
+                conn.commit()
+                return conn.total_changes - before
+        except sqlite3.Error:
+            # The prices were remembered for rows that were not written.
+            if store is not None:
+                store.forget()
+            raise
+
+    def _event_snapshot_rows(
+        self,
+        *,
+        sport_key: str,
+        league: str,
+        event: dict,
+    ) -> list[tuple[Any, ...]]:
         home_team = normalize_text(event.get("home_team"))
         away_team = normalize_text(event.get("away_team"))
         commence_time = normalize_text(event.get("commence_time"))
@@ -345,37 +585,7 @@ class FootballMarketDatabase:
                         )
                     )
 
-        if not rows:
-            return 0
-
-        with self.connect() as conn:
-            before = conn.total_changes
-
-            conn.executemany(
-                """
-                INSERT OR IGNORE INTO football_market_snapshots (
-                    sport_key,
-                    league,
-                    event,
-                    home_team,
-                    away_team,
-                    commence_time,
-                    captured_at,
-                    bookmaker,
-                    market,
-                    selection,
-                    odds,
-                    implied_probability,
-                    source_hash,
-                    created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-
-            conn.commit()
-            return conn.total_changes - before
+        return rows
 
     def save_closing_snapshot_if_due(
         self,
@@ -385,6 +595,7 @@ class FootballMarketDatabase:
         event: dict,
         window_hours: float = 12.0,
         captured_at: datetime | None = None,
+        session: FootballScanSession | None = None,
     ) -> int:
         if not is_closing_window(
             event.get("commence_time"),
@@ -396,6 +607,7 @@ class FootballMarketDatabase:
             sport_key=sport_key,
             league=league,
             event=event,
+            session=session,
         )
 
     def save_closing_snapshot(
@@ -404,9 +616,39 @@ class FootballMarketDatabase:
         sport_key: str,
         league: str,
         event: dict,
+        session: FootballScanSession | None = None,
     ) -> int:
+        rows = self._closing_snapshot_rows(
+            sport_key=sport_key,
+            league=league,
+            event=event,
+        )
+
+        if not rows:
+            return 0
+
+        if session is not None:
+            return session.add_many(
+                "football_market_closing",
+                CLOSING_SNAPSHOT_INSERT_SQL,
+                rows,
+            )
+
         self.init_db()
 
+        with self.connect() as conn:
+            before = conn.total_changes
+            conn.executemany(CLOSING_SNAPSHOT_INSERT_SQL, rows)
+            conn.commit()
+            return conn.total_changes - before
+
+    def _closing_snapshot_rows(
+        self,
+        *,
+        sport_key: str,
+        league: str,
+        event: dict,
+    ) -> list[tuple[Any, ...]]:
         home_team = normalize_text(event.get("home_team"))
         away_team = normalize_text(event.get("away_team"))
         commence_time = normalize_text(event.get("commence_time"))
@@ -458,37 +700,7 @@ class FootballMarketDatabase:
                         )
                     )
 
-        if not rows:
-            return 0
-
-        with self.connect() as conn:
-            before = conn.total_changes
-
-            conn.executemany(
-                """
-                INSERT OR IGNORE INTO football_market_closing (
-                    sport_key,
-                    league,
-                    event,
-                    home_team,
-                    away_team,
-                    commence_time,
-                    external_event_id,
-                    selection,
-                    bookmaker,
-                    closing_odds,
-                    closing_probability,
-                    captured_at,
-                    source_hash,
-                    created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-
-            conn.commit()
-            return conn.total_changes - before
+        return rows
 
     def reconcile_closing_lines(self) -> int:
         """Attach captured pre-kickoff closing prices without changing bet odds."""
@@ -661,28 +873,44 @@ class FootballMarketDatabase:
             join_ready_snapshots=join_ready,
         )
 
-    def opening_odds(
+    def _snapshot_price(
         self,
         *,
         sport_key: str,
         event: str,
         selection: str,
+        bookmaker: str | None,
+        at: str | None,
+        order: str,
     ) -> float | None:
+        # Snapshot rows are change points, so the price at ``at`` is the
+        # last row captured at or before it.
+        filters = ""
+        params: list[Any] = [sport_key, event, selection]
+
+        if bookmaker is not None:
+            filters += " AND bookmaker=?"
+            params.append(bookmaker)
+
+        if at is not None:
+            filters += " AND captured_at <= ?"
+            params.append(at)
+
         self.init_db()
 
         with self.connect() as conn:
             row = conn.execute(
-                """
+                f"""
                 SELECT odds
                 FROM football_market_snapshots
                 WHERE sport_key=?
                   AND event=?
                   AND selection=?
-                  AND market='h2h'
-                ORDER BY captured_at ASC, id ASC
+                  AND market='h2h'{filters}
+                ORDER BY captured_at {order}, id {order}
                 LIMIT 1
                 """,
-                (sport_key, event, selection),
+                params,
             ).fetchone()
 
         if row is None:
@@ -690,34 +918,46 @@ class FootballMarketDatabase:
 
         return safe_float(row["odds"], 0.0) or None
 
-    def latest_odds(
+    def opening_odds(
         self,
         *,
         sport_key: str,
         event: str,
         selection: str,
+        bookmaker: str | None = None,
     ) -> float | None:
-        self.init_db()
-
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT odds
-                FROM football_market_snapshots
-                WHERE sport_key=?
-                  AND event=?
-                  AND selection=?
-                  AND market='h2h'
-                ORDER BY captured_at DESC, id DESC
-                LIMIT 1
-                """,
-                (sport_key, event, selection),
-            ).fetchone()
+        return self._snapshot_price(
+            sport_key=sport_key,
+            event=event,
+            selection=selection,
+            bookmaker=bookmaker,
+            at=None,
+            order="ASC",
+        )
 
-        if row is None:
-            return None
+    def latest_odds(
+        self,
+        *,
+        sport_key: str,
+        event: str,
+        selection: str,
+        bookmaker: str | None = None,
+        at: str | None = None,
+    ) -> float | None:
+        """
+        Newest price, or the price in force at ``at`` (ISO timestamp).
 
-        return safe_float(row["odds"], 0.0) or None
+        With change-only snapshots and no ``bookmaker``, this is the price
+        of the bookmaker that moved last, not a consensus of the last scan.
+        """
+        return self._snapshot_price(
+            sport_key=sport_key,
+            event=event,
+            selection=selection,
+            bookmaker=bookmaker,
+            at=at,
+            order="DESC",
+        )
 
     def closing_odds(
         self,
@@ -747,6 +987,70 @@ class FootballMarketDatabase:
 
         return safe_float(row["closing_odds"], 0.0) or None
 
+    def market_prices(
+        self,
+        keys: Iterable[PriceLookupKey],
+    ) -> dict[PriceLookupKey, MarketPrices]:
+        """
+        Opening, latest and closing price for a whole slate in one query.
+
+        Matches ``opening_odds``/``latest_odds`` (all bookmakers) and
+        ``closing_odds`` key by key, so ``latest_odds`` carries the same
+        last-moved-bookmaker caveat. Keys without any price map to an
+        empty ``MarketPrices``.
+        """
+        keys = [
+            (str(sport_key), str(event), str(selection))
+            for sport_key, event, selection in keys
+        ]
+
+        if not keys:
+            return {}
+
+        self.init_db()
+
+        with self.connect() as conn:
+            load_key_table(
+                conn,
+                "football_price_keys",
+                ("sport_key", "event", "selection"),
+                keys,
+            )
+            rows = conn.execute(MARKET_PRICES_SQL).fetchall()
+
+        def price(value: Any) -> float | None:
+            return safe_float(value, 0.0) or None
+
+        return {
+            (row["sport_key"], row["event"], row["selection"]): MarketPrices(
+                opening_odds=price(row["opening_odds"]),
+                latest_odds=price(row["latest_odds"]),
+                closing_odds=price(row["closing_odds"]),
+            )
+            for row in rows
+        }
+
+    def line_movements(
+        self,
+        keys: Iterable[PriceLookupKey],
+        *,
+        steam_threshold: float = 0.05,
+    ) -> dict[PriceLookupKey, LineMovement]:
+        """``line_movement`` for many keys; keys without prices are left out."""
+        movements = {}
+
+        for key, prices in self.market_prices(keys).items():
+            movement = build_line_movement(
+                key[2],
+                prices,
+                steam_threshold=steam_threshold,
+            )
+
+            if movement is not None:
+                movements[key] = movement
+
+        return movements
+
     def line_movement(
         self,
         *,
@@ -754,67 +1058,62 @@ class FootballMarketDatabase:
         event: str,
         selection: str,
         steam_threshold: float = 0.05,
+        bookmaker: str | None = None,
     ) -> LineMovement | None:
-        opening = self.opening_odds(
-            sport_key=sport_key,
-            event=event,
-            selection=selection,
-        )
-        latest = self.latest_odds(
-            sport_key=sport_key,
-            event=event,
-            selection=selection,
-        )
-        closing = self.closing_odds(
-            sport_key=sport_key,
-            event=event,
-            selection=selection,
-        )
-
-        if opening is None or latest is None:
-            return None
-
-        opening_probability = implied_probability(opening)
-        latest_probability = implied_probability(latest)
-        closing_probability = (
-            implied_probability(closing)
-            if closing is not None
-            else None
-        )
+        key = (sport_key, event, selection)
 
-        price_change_pct = (
-            (latest - opening) / opening
-            if opening > 0
-            else 0.0
-        )
-        probability_change = latest_probability - opening_probability
-
-        if latest < opening:
-            direction = "SHORTENING"
-        elif latest > opening:
-            direction = "DRIFTING"
+        if bookmaker is None:
+            prices = self.market_prices([key]).get(key, MarketPrices())
         else:
-            direction = "FLAT"
+            prices = MarketPrices(
+                opening_odds=self.opening_odds(
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                    bookmaker=bookmaker,
+                ),
+                latest_odds=self.latest_odds(
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                    bookmaker=bookmaker,
+                ),
+                closing_odds=self.closing_odds(
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                ),
+            )
 
-        steam_move = (
-            direction == "SHORTENING"
-            and abs(price_change_pct) >= abs(steam_threshold)
+        return build_line_movement(
+            selection,
+            prices,
+            steam_threshold=steam_threshold,
         )
 
-        return LineMovement(
-            selection=selection,
-            opening_odds=opening,
-            latest_odds=latest,
-            closing_odds=closing,
-            opening_probability=opening_probability,
-            latest_probability=latest_probability,
-            closing_probability=closing_probability,
-            price_change_pct=price_change_pct,
-            probability_change=probability_change,
-            direction=direction,
-            steam_move=steam_move,
+    def calculate_clv_many(
+        self,
+        bets: Iterable[tuple[str, str, str, float]],
+    ) -> list[CLVResult | None]:
+        """
+        ``calculate_clv`` for (sport_key, event, selection, bet_odds) rows,
+        in input order, with one closing-price query for the whole list.
+        """
+        bets = list(bets)
+        prices = self.market_prices(
+            (sport_key, event, selection)
+            for sport_key, event, selection, _ in bets
         )
 
+        return [
+            build_clv_result(
+                selection,
+                bet_odds,
+                prices.get((sport_key, event, selection), MarketPrices()).closing_odds,
+            )
+            for sport_key, event, selection, bet_odds in bets
+        ]
+
     def calculate_clv(
         self,
         *,
@@ -829,18 +1128,7 @@ class FootballMarketDatabase:
             selection=selection,
         )
 
-        if closing is None or closing <= 1.0 or bet_odds <= 1.0:
-            return None
-
-        clv_pct = (bet_odds / closing - 1.0) * 100.0
-
-        return CLVResult(
-            selection=selection,
-            bet_odds=bet_odds,
-            closing_odds=closing,
-            clv_pct=clv_pct,
-            positive=clv_pct > 0,
-        )
+        return build_clv_result(selection, bet_odds, closing)
 
     def export_json(
         self,
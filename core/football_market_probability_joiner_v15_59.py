@@ -1,44 +1,25 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import SnapshotIndex, load_rows, write_rows
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_59.csv")
+SNAPSHOTS = Path("exports/history_football_market_snapshots_v14.csv")
 
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def run_market_probability_joiner_v15_59(
-    source="exports/history_football_learning_dataset_v15_58.csv"
-):
-    base = load_rows(source)
-    snapshots = load_rows(
-        "exports/history_football_market_snapshots_v14.csv"
-    )
-
-    market_map = {
-        row.get("source_hash"): row
-        for row in snapshots
-        if row.get("source_hash")
-    }
-
+def join_market_probability(base, index):
     found = 0
     output = []
 
     for row in base:
         item = dict(row)
-        snap = market_map.get(row.get("source_hash"), {})
+        snap = index.by_hash.get(row.get("source_hash"), {})
 
         item["market_probability"] = (
             snap.get("market_selection_probability")
@@ -49,12 +30,6 @@ def run_market_probability_joiner_v15_59(
 
         output.append(item)
 
-    if output:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=output[0].keys())
-            writer.writeheader()
-            writer.writerows(output)
-
     return {
         "version": "v15.59",
         "created_at": now(),
@@ -63,4 +38,16 @@ def run_market_probability_joiner_v15_59(
         "missing_market_probability": len(output) - found,
         "output": str(OUTPUT),
         "status": "READY" if output else "BUILDING",
-    }
+    }, output
+
+
+def run_market_probability_joiner_v15_59(
+    source="exports/history_football_learning_dataset_v15_58.csv"
+):
+    report, output = join_market_probability(
+        load_rows(source),
+        SnapshotIndex.from_csv(SNAPSHOTS),
+    )
+    write_rows(OUTPUT, output)
+
+    return report
@@ -8,7 +8,9 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
+
+from core.export_tables import export_table
 
 
 SNAPSHOT_SOURCE = Path("exports/history_football_market_snapshots_v14.csv")
@@ -111,12 +113,8 @@ def _time_difference_minutes(a: str, b: str) -> float | None:
     return round(abs((first - second).total_seconds()) / 60.0, 1)
 
 
-def _read_csv(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        return []
-
-    with path.open("r", encoding="utf-8-sig", newline="") as file:
-        return list(csv.DictReader(file))
+def _read_csv(path: Path) -> list[Mapping[str, str]]:
+    return list(export_table(path).rows)
 
 
 def _snapshot_fields(row: dict[str, Any]) -> dict[str, str]:
@@ -7,7 +7,9 @@ import unicodedata
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Mapping
+
+from core.export_tables import export_table
 
 
 SNAPSHOT_SOURCE = Path("exports/history_football_market_snapshots_v14.csv")
@@ -31,14 +33,9 @@ def _normalize_text(value: str) -> str:
     return re.sub(r"[^a-z0-9]+", "", value)
 
 
-def _read_csv(path: Path) -> tuple[list[dict[str, str]], list[str]]:
-    if not path.exists():
-        return [], []
-
-    with path.open("r", encoding="utf-8-sig", newline="") as file:
-        reader = csv.DictReader(file)
-        rows = list(reader)
-        return rows, list(reader.fieldnames or [])
+def _read_csv(path: Path) -> tuple[list[Mapping[str, str]], list[str]]:
+    table = export_table(path)
+    return list(table.rows), list(table.fieldnames)
 
 
 def _detect_column(
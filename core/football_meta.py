@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import math
+import operator
 import os
 import pickle
 from dataclasses import asdict, dataclass
@@ -15,6 +16,15 @@ from core.football_features import FootballFeatures
 DEFAULT_MODEL_PATH = "models/football_meta_model.pkl"
 DEFAULT_METADATA_PATH = "models/football_meta_model.json"
 
+# Compiled linear scorer exported next to the pickle. Loading it avoids
+# importing scikit-learn at inference time. Opt-in: it must score exactly
+# like the pickle before it may replace it in live decisions.
+SCORER_SUFFIX = ".scorer.json"
+USE_COMPILED_SCORER = os.getenv(
+    "FOOTBALL_META_USE_SCORER",
+    "0",
+).strip().lower() in {"1", "true", "yes", "on"}
+
 _MODEL_CACHE: dict[tuple[str, str], "FootballMetaModel"] = {}
 
 
@@ -38,6 +48,190 @@ def safe_float(value: Any, default: float = 0.0) -> float:
     return result
 
 
+def named_feature_vector(
+    features: FootballFeatures,
+    feature_order: list[str],
+) -> list[float]:
+    return [
+        safe_float(getattr(features, name), 0.0)
+        for name in feature_order
+    ]
+
+
+def football_meta_scorer_path(model_path: str | Path) -> Path:
+    model_file = Path(model_path)
+    return model_file.with_name(model_file.stem + SCORER_SUFFIX)
+
+
+@dataclass
+class FootballLinearScorer:
+    """
+    StandardScaler + LogisticRegression reduced to plain lists.
+
+    The scaler is folded into the weights at load time, so scoring a row
+    is one dot product and a sigmoid.
+    """
+
+    feature_order: list[str]
+    means: list[float]
+    scales: list[float]
+    coefficients: list[float]
+    intercept: float
+    model_type: str = "linear_logistic_scorer"
+
+    def __post_init__(self) -> None:
+        width = len(self.coefficients)
+
+        if width == 0:
+            raise ValueError("scorer has no coefficients")
+
+        for name in ("feature_order", "means", "scales"):
+            if len(getattr(self, name)) != width:
+                raise ValueError(
+                    f"scorer {name} has {len(getattr(self, name))} values "
+                    f"for {width} coefficients"
+                )
+
+        scales = [
+            scale if scale not in (0.0, None) else 1.0
+            for scale in self.scales
+        ]
+        self._weights = [
+            coefficient / scale
+            for coefficient, scale in zip(self.coefficients, scales)
+        ]
+        self._bias = self.intercept - sum(
+            weight * mean
+            for weight, mean in zip(self._weights, self.means)
+        )
+
+    @classmethod
+    def from_pipeline(
+        cls,
+        model: Any,
+        feature_order: list[str],
+    ) -> "FootballLinearScorer | None":
+        """
+        Read fitted attributes off a scaler + binary logistic pipeline.
+
+        Returns None for any other estimator (trees, boosting), which
+        cannot be expressed as a single dot product.
+        """
+        steps = getattr(model, "steps", None)
+
+        if not steps or len(steps) != 2:
+            return None
+
+        scaler = steps[0][1]
+        classifier = steps[1][1]
+        coefficients = getattr(classifier, "coef_", None)
+        intercept = getattr(classifier, "intercept_", None)
+        scales = getattr(scaler, "scale_", None)
+
+        if coefficients is None or intercept is None or scales is None:
+            return None
+
+        if len(coefficients) != 1 or len(intercept) != 1:
+            return None
+
+        means = getattr(scaler, "mean_", None)
+
+        if means is None:
+            means = [0.0] * len(coefficients[0])
+
+        return cls(
+            feature_order=list(feature_order),
+            means=[float(value) for value in means],
+            scales=[float(value) for value in scales],
+            coefficients=[float(value) for value in coefficients[0]],
+            intercept=float(intercept[0]),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "FootballLinearScorer":
+        raw = json.loads(Path(path).read_text(encoding="utf-8"))
+
+        return cls(
+            feature_order=[str(name) for name in raw["feature_order"]],
+            means=[float(value) for value in raw["means"]],
+            scales=[float(value) for value in raw["scales"]],
+            coefficients=[float(value) for value in raw["coefficients"]],
+            intercept=float(raw["intercept"]),
+            model_type=str(raw.get("model_type", "linear_logistic_scorer")),
+        )
+
+    def save(self, path: str | Path) -> None:
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(
+            json.dumps(
+                {
+                    "model_type": self.model_type,
+                    "feature_order": self.feature_order,
+                    "means": self.means,
+                    "scales": self.scales,
+                    "coefficients": self.coefficients,
+                    "intercept": self.intercept,
+                },
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    def vector(self, features: FootballFeatures) -> list[float]:
+        """Feature values in the order the scorer was trained on."""
+        return named_feature_vector(features, self.feature_order)
+
+    def score(self, vector: list[float]) -> float:
+        if len(vector) != len(self._weights):
+            raise ValueError(
+                f"vector has {len(vector)} values; "
+                f"scorer expects {len(self._weights)}"
+            )
+
+        logit = self._bias + sum(map(operator.mul, self._weights, vector))
+
+        if logit >= 0.0:
+            return 1.0 / (1.0 + math.exp(-logit))
+
+        exp_logit = math.exp(logit)
+        return exp_logit / (1.0 + exp_logit)
+
+    def predict_proba(self, vectors: list[list[float]]) -> list[list[float]]:
+        """sklearn-compatible ``[[P(lost), P(won)], ...]`` rows."""
+        rows = []
+
+        for vector in vectors:
+            probability = self.score(vector)
+            rows.append([1.0 - probability, probability])
+
+        return rows
+
+
+def export_football_meta_scorer(
+    model: Any,
+    feature_order: list[str],
+    *,
+    model_path: str | Path = DEFAULT_MODEL_PATH,
+) -> Path | None:
+    """
+    Write the compiled scorer next to a freshly pickled model.
+
+    A non-linear winner removes any previous scorer file so inference
+    never pairs an old scorer with a new pickle.
+    """
+    scorer_path = football_meta_scorer_path(model_path)
+    scorer = FootballLinearScorer.from_pipeline(model, feature_order)
+
+    if scorer is None:
+        scorer_path.unlink(missing_ok=True)
+        return None
+
+    scorer.save(scorer_path)
+    return scorer_path
+
+
 @dataclass
 class FootballMetaPrediction:
     probability: float
@@ -70,6 +264,7 @@ class FootballMetaModel:
     ) -> None:
         self.model_path = Path(model_path)
         self.metadata_path = Path(metadata_path)
+        self.scorer_path = football_meta_scorer_path(model_path)
         self.model: Any | None = None
         self.metadata = FootballMetaMetadata()
         self.load_error = ""
@@ -112,7 +307,40 @@ class FootballMetaModel:
                 f"metadata load failed: {type(exc).__name__}: {exc}"
             )
 
+    def _load_scorer(self) -> bool:
+        if not USE_COMPILED_SCORER or not self.scorer_path.exists():
+            return False
+
+        # A pickle rewritten after the scorer belongs to a newer training
+        # run that did not export one; trust the pickle instead.
+        if (
+            self.model_path.exists()
+            and self.model_path.stat().st_mtime
+            > self.scorer_path.stat().st_mtime
+        ):
+            return False
+
+        try:
+            scorer = FootballLinearScorer.load(self.scorer_path)
+        except Exception as exc:
+            self.load_error = (
+                f"scorer load failed: {type(exc).__name__}: {exc}"
+            )
+            return False
+
+        feature_order = self.metadata.feature_order
+
+        if feature_order and list(feature_order) != scorer.feature_order:
+            self.load_error = "scorer load failed: feature order mismatch"
+            return False
+
+        self.model = scorer
+        return True
+
     def _load_model(self) -> None:
+        if self._load_scorer():
+            return
+
         if not self.model_path.exists():
             self.load_error = (
                 self.load_error
@@ -188,51 +416,92 @@ class FootballMetaModel:
         # Avoid extreme football probabilities without strong evidence.
         return clamp(probability, 0.03, 0.92)
 
-    def _predict_with_model(
+    @staticmethod
+    def _probability_from_row(row: Any) -> float:
+        if len(row) >= 2:
+            return safe_float(row[1], 0.0)
+
+        if len(row) == 1:
+            return safe_float(row[0], 0.0)
+
+        raise RuntimeError("predict_proba returned an empty row")
+
+    def _model_probabilities(
         self,
-        features: FootballFeatures,
-    ) -> float:
+        vectors: list[list[float]],
+    ) -> list[float]:
+        """Raw model probabilities for many feature vectors in one call."""
         if self.model is None:
             raise RuntimeError("Football meta model is not loaded")
 
-        vector = features.numeric_vector()
-        matrix = [vector]
-
         if hasattr(self.model, "predict_proba"):
-            probabilities = self.model.predict_proba(matrix)
+            probabilities = self.model.predict_proba(vectors)
 
             if len(probabilities) == 0:
                 raise RuntimeError("predict_proba returned no rows")
 
-            row = probabilities[0]
-
-            if len(row) >= 2:
-                return safe_float(row[1], 0.0)
-
-            if len(row) == 1:
-                return safe_float(row[0], 0.0)
+            if len(probabilities) != len(vectors):
+                raise RuntimeError(
+                    f"predict_proba returned {len(probabilities)} rows "
+                    f"for {len(vectors)} vectors"
+                )
 
-            raise RuntimeError("predict_proba returned an empty row")
+            return [
+                self._probability_from_row(row)
+                for row in probabilities
+            ]
 
         if hasattr(self.model, "predict"):
-            prediction = self.model.predict(matrix)
+            prediction = self.model.predict(vectors)
 
             if len(prediction) == 0:
                 raise RuntimeError("predict returned no rows")
 
-            return safe_float(prediction[0], 0.0)
+            if len(prediction) != len(vectors):
+                raise RuntimeError(
+                    f"predict returned {len(prediction)} rows "
+                    f"for {len(vectors)} vectors"
+                )
+
+            return [safe_float(value, 0.0) for value in prediction]
 
         if callable(self.model):
-            return safe_float(self.model(vector), 0.0)
+            return [
+                safe_float(self.model(vector), 0.0)
+                for vector in vectors
+            ]
 
         raise TypeError(
             "Loaded football meta model has no predict interface"
         )
 
-    def predict(
+    def _vector(self, features: FootballFeatures) -> list[float]:
+        if isinstance(self.model, FootballLinearScorer):
+            return self.model.vector(features)
+
+        # Trained models record their columns; numeric_vector() only
+        # covers the 48 legacy fields, not the trainer's FEATURE_ORDER.
+        if self.metadata.feature_order:
+            return named_feature_vector(features, self.metadata.feature_order)
+
+        return features.numeric_vector()
+
+    def _predict_with_model(
         self,
         features: FootballFeatures,
+    ) -> float:
+        return self._model_probabilities(
+            [self._vector(features)]
+        )[0]
+
+    def _prediction(
+        self,
+        features: FootballFeatures,
+        *,
+        raw_model_probability: float | None = None,
+        error: Exception | None = None,
     ) -> FootballMetaPrediction:
+        """Trust blend and fallback for one selection."""
         fallback = self.fallback_probability(features)
 
         confidence = clamp(
@@ -269,8 +538,14 @@ class FootballMetaModel:
             )
 
         try:
+            if error is not None:
+                raise error
+
+            if raw_model_probability is None:
+                raise RuntimeError("model probability missing")
+
             raw_probability = clamp(
-                self._predict_with_model(features),
+                raw_model_probability,
                 0.01,
                 0.99,
             )
@@ -341,6 +616,58 @@ class FootballMetaModel:
                 reason=reason,
             )
 
+    def predict(
+        self,
+        features: FootballFeatures,
+    ) -> FootballMetaPrediction:
+        if not self.is_loaded:
+            return self._prediction(features)
+
+        try:
+            raw_probability = self._predict_with_model(features)
+        except Exception as exc:
+            return self._prediction(features, error=exc)
+
+        return self._prediction(
+            features,
+            raw_model_probability=raw_probability,
+        )
+
+    def predict_many(
+        self,
+        features_list: list[FootballFeatures],
+    ) -> list[FootballMetaPrediction]:
+        """
+        Score many selections with one model call.
+
+        sklearn pipelines pay their input validation per call, which costs
+        far more than the arithmetic for a single row. If the batch call
+        fails, every row is retried on its own so one bad vector only
+        sends that selection to the fallback.
+        """
+        features_list = list(features_list)
+
+        if not self.is_loaded or not features_list:
+            return [self._prediction(features) for features in features_list]
+
+        try:
+            raw_probabilities = self._model_probabilities(
+                [self._vector(features) for features in features_list]
+            )
+        except Exception:
+            return [self.predict(features) for features in features_list]
+
+        return [
+            self._prediction(
+                features,
+                raw_model_probability=raw_probability,
+            )
+            for features, raw_probability in zip(
+                features_list,
+                raw_probabilities,
+            )
+        ]
+
 
 def get_football_meta_model(
     *,
@@ -415,6 +742,20 @@ def predict_football_probability(
     return model.predict(features)
 
 
+def predict_football_probabilities(
+    features_list: list[FootballFeatures],
+    *,
+    model_path: str = DEFAULT_MODEL_PATH,
+    metadata_path: str = DEFAULT_METADATA_PATH,
+) -> list[FootballMetaPrediction]:
+    model = get_football_meta_model(
+        model_path=model_path,
+        metadata_path=metadata_path,
+    )
+
+    return model.predict_many(features_list)
+
+
 def save_football_meta_metadata(
     metadata: FootballMetaMetadata,
     path: str = DEFAULT_METADATA_PATH,
@@ -13,6 +13,7 @@ from core.config import Settings
 from core.football_meta import (
     DEFAULT_METADATA_PATH,
     DEFAULT_MODEL_PATH,
+    export_football_meta_scorer,
 )
 from core.football_trainer import (
     FEATURE_ORDER,
@@ -428,6 +429,12 @@ class FootballMetaAIV14:
         with self.model_path.open("wb") as handle:
             pickle.dump(best_model, handle)
 
+        export_football_meta_scorer(
+            best_model,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+
         metadata = {
             "model_type": f"football_meta_v14_{best_name}",
             "trained_at": now_utc(),
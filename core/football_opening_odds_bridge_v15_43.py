@@ -1,36 +1,30 @@
 from __future__ import annotations
 
-import csv
-from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
+    return export_table(path).records()
 
 
 def run_opening_odds_bridge_v15_43(resolved_matches):
-    rows = load_rows("exports/history_football_dataset_v15.csv")
-
-    by_hash = {
-        r.get("source_hash"): r
-        for r in rows
-        if r.get("source_hash")
-    }
+    dataset = export_table("exports/history_football_dataset_v15.csv")
 
     output = []
 
     for item in resolved_matches:
         post = item.get("postmatch", {})
-        source = by_hash.get(post.get("source_hash"), {})
+        source_hash = post.get("source_hash")
+        # Last dataset row per hash, as the old dict comprehension kept.
+        source = (
+            dataset.last("source_hash", source_hash) if source_hash else None
+        ) or {}
 
         merged = dict(post)
         merged["opening_odds"] = (
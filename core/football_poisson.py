@@ -27,6 +27,17 @@ def poisson_pmf(goals: int, expected_goals: float) -> float:
     )
 
 
+def poisson_pmf_vector(expected_goals: float, max_goals: int) -> list[float]:
+    """P(goals=k) for k=0..max_goals via p(k) = p(k-1) * xg / k."""
+    expected_goals = clamp(float(expected_goals), MIN_XG, MAX_XG)
+    pmf = [math.exp(-expected_goals)]
+
+    for goals in range(1, max_goals + 1):
+        pmf.append(pmf[-1] * expected_goals / goals)
+
+    return pmf
+
+
 @dataclass
 class PoissonMarkets:
     home_win: float
@@ -86,17 +97,15 @@ class FootballPoissonModel:
             MAX_XG,
         )
 
+        home_pmf = poisson_pmf_vector(home_xg, self.max_goals)
+        away_pmf = poisson_pmf_vector(away_xg, self.max_goals)
+
         matrix: Dict[Tuple[int, int], float] = {}
         total = 0.0
 
-        for home_goals in range(self.max_goals + 1):
-            home_prob = poisson_pmf(home_goals, home_xg)
-
-            for away_goals in range(self.max_goals + 1):
-                probability = (
-                    home_prob
-                    * poisson_pmf(away_goals, away_xg)
-                )
+        for home_goals, home_prob in enumerate(home_pmf):
+            for away_goals, away_prob in enumerate(away_pmf):
+                probability = home_prob * away_prob
 
                 matrix[(home_goals, away_goals)] = probability
                 total += probability
@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.football_enrichment import (
+    ensure_enrichment_indexes,
+    load_closing_snapshots,
+)
+from core.schema_registry import schema_once, table_columns, table_exists
 
 
 def now_utc() -> str:
@@ -78,27 +83,16 @@ class FootballPostmatchDatasetV14:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        return conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone() is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
+    @schema_once("football_postmatch_dataset_v14")
     def init_db(self) -> None:
         self.db_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -276,6 +270,25 @@ class FootballPostmatchDatasetV14:
                 """
             ).fetchall()
 
+            ensure_enrichment_indexes(conn)
+            closing_by_key = load_closing_snapshots(
+                conn,
+                (
+                    tuple(
+                        normalize_text(
+                            self._pick(row, columns, name, default="")
+                        )
+                        for name in (
+                            "sport_key",
+                            "event",
+                            "selection",
+                            "commence_time",
+                        )
+                    )
+                    for row in rows
+                ),
+            )
+
             inserted = 0
             updated = 0
             missing_closing = 0
@@ -391,12 +404,8 @@ class FootballPostmatchDatasetV14:
                     None,
                 )
 
-                closing = self._latest_closing_snapshot(
-                    conn,
-                    sport_key=sport_key,
-                    event=event,
-                    selection=selection,
-                    commence_time=commence_time,
+                closing = closing_by_key.get(
+                    (sport_key, event, selection, commence_time)
                 )
 
                 closing_probability = (
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+from core.football_rating_snapshot import invalidate_rating_snapshot
+
+
+T = TypeVar("T")
+
+
+class RatingReplay(Generic[T]):
+    """
+    In-memory team state for replaying many matches through a rating model.
+
+    Existing ratings and history hashes are read once, every match is
+    applied to the in-memory states, and ``write`` stores the final
+    ratings plus all history rows with ``executemany`` in one transaction.
+    The rating models expose the same per-match math to ``update_after_match``
+    and to the replay, so both paths produce the same ratings.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., T],
+        *,
+        states: dict[tuple[str, str], T] | None = None,
+        seen_hashes: Iterable[str] = (),
+    ) -> None:
+        self.factory = factory
+        self.states: dict[tuple[str, str], T] = dict(states or {})
+        self.seen_hashes = {str(value) for value in seen_hashes if value}
+        self.history: list[tuple[Any, ...]] = []
+        self.touched: dict[tuple[str, str], None] = {}
+        self.applied = 0
+        self.duplicates = 0
+
+    @classmethod
+    def from_db(
+        cls,
+        conn: sqlite3.Connection,
+        factory: Callable[..., T],
+        *,
+        ratings_table: str,
+        history_table: str | None = None,
+    ) -> "RatingReplay[T]":
+        conn.row_factory = sqlite3.Row
+        states = {}
+
+        for row in conn.execute(f"SELECT * FROM {ratings_table}"):
+            state = factory(**dict(row)).normalized()
+            states[(state.team, state.league)] = state
+
+        seen_hashes: list[str] = []
+
+        if history_table:
+            seen_hashes = [
+                row[0]
+                for row in conn.execute(
+                    f"""
+                    SELECT source_hash
+                    FROM {history_table}
+                    WHERE source_hash IS NOT NULL
+                    """
+                )
+            ]
+
+        return cls(factory, states=states, seen_hashes=seen_hashes)
+
+    def team(self, team: str, league: str) -> T:
+        key = (team, league)
+        state = self.states.get(key)
+
+        if state is None:
+            state = self.factory(team=team, league=league).normalized()
+            self.states[key] = state
+
+        return state
+
+    def pair(
+        self,
+        home_team: str,
+        away_team: str,
+        league: str,
+    ) -> tuple[T, T]:
+        home = self.team(home_team, league)
+        away = self.team(away_team, league)
+
+        if home is away:
+            # The per-match path loads two copies and saves away last.
+            home = replace(home)
+
+        return home, away
+
+    def is_duplicate(self, source_hash: str | None) -> bool:
+        if source_hash and source_hash in self.seen_hashes:
+            self.duplicates += 1
+            return True
+        return False
+
+    def record(
+        self,
+        history_row: tuple[Any, ...] | None,
+        *,
+        source_hash: str | None = None,
+        teams: Iterable[T] = (),
+    ) -> None:
+        if source_hash:
+            self.seen_hashes.add(source_hash)
+
+        if history_row is not None:
+            self.history.append(history_row)
+
+        for state in teams:
+            self.put(state)
+
+        self.applied += 1
+
+    def put(self, state: T) -> None:
+        state.normalized()
+        key = (state.team, state.league)
+        self.states[key] = state
+        self.touched[key] = None
+
+    def touched_states(self) -> list[T]:
+        return [self.states[key] for key in self.touched]
+
+    def write(
+        self,
+        conn: sqlite3.Connection,
+        db_file: Any,
+        *,
+        ratings_sql: str,
+        rating_row: Callable[[T], tuple[Any, ...]],
+        history_sql: str | None = None,
+    ) -> int:
+        if not self.applied:
+            return 0
+
+        invalidate_rating_snapshot(db_file)
+
+        try:
+            conn.executemany(
+                ratings_sql,
+                [rating_row(state) for state in self.touched_states()],
+            )
+
+            if history_sql and self.history:
+                conn.executemany(history_sql, self.history)
+
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+        return self.applied
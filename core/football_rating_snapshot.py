@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.config import Settings
+
+
+RATING_TABLES = (
+    "football_elo_ratings",
+    "football_xg_ratings",
+    "football_team_form",
+    "football_team_elo_v14",
+    "football_team_xg_v14",
+)
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _db_key(db_file: str | Path) -> str:
+    return str(Path(db_file).resolve())
+
+
+@dataclass
+class FootballRatingSnapshot:
+    """
+    Read-only copy of every team rating table, keyed by (team, league).
+
+    Tables that did not exist when the snapshot was taken are not covered,
+    so their loaders keep using SQLite (and create the table on first use).
+    """
+
+    db_file: str
+    loaded_at: str
+    tables: dict[str, dict[tuple[str, str], dict[str, Any]]] = field(
+        default_factory=dict
+    )
+    hits: int = 0
+    misses: int = 0
+
+    def covers(self, table: str) -> bool:
+        return table in self.tables
+
+    def row(self, table: str, team: str, league: str) -> dict[str, Any] | None:
+        row = self.tables[table].get((team, league))
+
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return row
+
+    @property
+    def teams(self) -> int:
+        return sum(len(rows) for rows in self.tables.values())
+
+    def summary(self) -> str:
+        return (
+            f"{self.teams} ratings in {len(self.tables)} tables, "
+            f"{self.hits} hits, {self.misses} defaults"
+        )
+
+
+_ACTIVE_SNAPSHOTS: dict[str, FootballRatingSnapshot] = {}
+
+
+def load_rating_snapshot(settings: Settings) -> FootballRatingSnapshot:
+    """Bulk-load all rating tables and make the snapshot active for the DB."""
+    db_file = Path(settings.db_file or "bets.db")
+    snapshot = FootballRatingSnapshot(
+        db_file=str(db_file),
+        loaded_at=now_utc(),
+    )
+
+    if db_file.exists():
+        with sqlite3.connect(db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            existing = {
+                str(row[0])
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                ).fetchall()
+            }
+
+            for table in RATING_TABLES:
+                if table not in existing:
+                    continue
+
+                snapshot.tables[table] = {
+                    (str(row["team"]), str(row["league"])): dict(row)
+                    for row in conn.execute(f"SELECT * FROM {table}")
+                }
+
+    _ACTIVE_SNAPSHOTS[_db_key(db_file)] = snapshot
+    return snapshot
+
+
+def active_rating_snapshot(db_file: str | Path) -> FootballRatingSnapshot | None:
+    if not _ACTIVE_SNAPSHOTS:
+        return None
+    return _ACTIVE_SNAPSHOTS.get(_db_key(db_file))
+
+
+def invalidate_rating_snapshot(db_file: str | Path) -> None:
+    """Called by every rating writer; readers fall back to SQLite."""
+    if _ACTIVE_SNAPSHOTS:
+        _ACTIVE_SNAPSHOTS.pop(_db_key(db_file), None)
@@ -13,6 +13,7 @@ from core.config import Settings
 from core.football_elo import FootballEloDatabase
 from core.football_team_form import FootballFormDatabase
 from core.football_xg import FootballXGDatabase
+from core.schema_registry import table_columns, table_exists
 
 
 SCORE_COLUMN_PAIRS = (
@@ -165,28 +166,14 @@ class FootballResultLearning:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        row = conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone()
-
-        return row is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
     def _already_processed(self, source_hash: str) -> bool:
         with self.connect() as conn:
@@ -368,64 +355,70 @@ class FootballResultLearning:
     def run(self) -> FootballResultLearningSummary:
         matches, skipped_without_score = self.discover_matches()
 
-        processed = 0
-        xg_updates = 0
-        elo_updates = 0
-        form_updates = 0
+        unprocessed: dict[str, SettledFootballMatch] = {}
 
         for match in matches:
-            if self._already_processed(match.source_hash):
+            if match.source_hash in unprocessed:
                 continue
 
-            elo_result = self.elo.update_after_match(
-                league=match.league,
-                home_team=match.home_team,
-                away_team=match.away_team,
-                home_goals=match.home_goals,
-                away_goals=match.away_goals,
-                played_at=match.played_at,
-                source=match.source,
-                source_hash=f"{match.source_hash}:elo",
-            )
-
-            if elo_result.inserted:
-                elo_updates += 1
-
-            form_inserted = self.form.update_after_match(
-                league=match.league,
-                home_team=match.home_team,
-                away_team=match.away_team,
-                home_goals=match.home_goals,
-                away_goals=match.away_goals,
-                home_xg=match.home_xg,
-                away_xg=match.away_xg,
-                played_at=match.played_at,
-                source=match.source,
-                source_hash=f"{match.source_hash}:form",
-            )
+            if not self._already_processed(match.source_hash):
+                unprocessed[match.source_hash] = match
+
+        pending = list(unprocessed.values())
+
+        # Elo, form and xG do not read each other, so each model replays
+        # the whole batch in memory and writes once.
+        elo_updates = self.elo.replay_matches(
+            {
+                "league": match.league,
+                "home_team": match.home_team,
+                "away_team": match.away_team,
+                "home_goals": match.home_goals,
+                "away_goals": match.away_goals,
+                "played_at": match.played_at,
+                "source": match.source,
+                "source_hash": f"{match.source_hash}:elo",
+            }
+            for match in pending
+        )
 
-            if form_inserted:
-                form_updates += 1
-
-            if match.home_xg is not None and match.away_xg is not None:
-                xg_inserted = self.xg.update_after_match(
-                    league=match.league,
-                    home_team=match.home_team,
-                    away_team=match.away_team,
-                    home_xg=match.home_xg,
-                    away_xg=match.away_xg,
-                    home_goals=match.home_goals,
-                    away_goals=match.away_goals,
-                    played_at=match.played_at,
-                    source=match.source,
-                    source_hash=f"{match.source_hash}:xg",
-                )
+        form_updates = self.form.replay_matches(
+            {
+                "league": match.league,
+                "home_team": match.home_team,
+                "away_team": match.away_team,
+                "home_goals": match.home_goals,
+                "away_goals": match.away_goals,
+                "home_xg": match.home_xg,
+                "away_xg": match.away_xg,
+                "played_at": match.played_at,
+                "source": match.source,
+                "source_hash": f"{match.source_hash}:form",
+            }
+            for match in pending
+        )
 
-                if xg_inserted:
-                    xg_updates += 1
+        xg_updates = self.xg.replay_matches(
+            {
+                "league": match.league,
+                "home_team": match.home_team,
+                "away_team": match.away_team,
+                "home_xg": match.home_xg,
+                "away_xg": match.away_xg,
+                "home_goals": match.home_goals,
+                "away_goals": match.away_goals,
+                "played_at": match.played_at,
+                "source": match.source,
+                "source_hash": f"{match.source_hash}:xg",
+            }
+            for match in pending
+            if match.home_xg is not None and match.away_xg is not None
+        )
 
+        for match in pending:
             self._mark_processed(match)
-            processed += 1
+
+        processed = len(pending)
 
         return FootballResultLearningSummary(
             discovered=len(matches),
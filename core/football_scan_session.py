@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from core.config import Settings
+from core.odds_delta_store import OddsDeltaStore
+
+log = logging.getLogger("football-scan-session")
+
+
+def flush_threshold() -> int:
+    try:
+        value = int(os.getenv("FOOTBALL_SCAN_FLUSH_ROWS", "1000"))
+    except ValueError:
+        value = 1000
+    return max(1, value)
+
+
+@dataclass
+class FootballScanSessionMetrics:
+    flushes: int = 0
+    rows_flushed: int = 0
+    commit_seconds: float = 0.0
+    max_commit_seconds: float = 0.0
+    rows_by_table: dict[str, int] = field(default_factory=dict)
+    inserted_by_table: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def rows_per_flush(self) -> float:
+        if not self.flushes:
+            return 0.0
+        return self.rows_flushed / self.flushes
+
+    @property
+    def avg_commit_ms(self) -> float:
+        if not self.flushes:
+            return 0.0
+        return self.commit_seconds / self.flushes * 1000.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows_flushed} rows in {self.flushes} flushes "
+            f"(avg {self.rows_per_flush:.1f} rows/flush, "
+            f"commit avg {self.avg_commit_ms:.1f} ms, "
+            f"max {self.max_commit_seconds * 1000.0:.1f} ms)"
+        )
+
+
+class FootballScanSession:
+    """
+    Unit of work for one FootballModule.scan.
+
+    Owns a single connection and buffers snapshot, audit, bet and
+    explainability rows per table. ``flush`` writes every buffer with
+    ``executemany`` inside one transaction. Buffers are flushed
+    automatically once ``FOOTBALL_SCAN_FLUSH_ROWS`` rows are pending and
+    always when the session is closed.
+
+    Delta stores that filtered rows into the session are registered with
+    ``track_delta_store``; a failed flush makes them forget their
+    remembered prices, since the dropped rows never reached the table.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        max_pending_rows: int | None = None,
+    ) -> None:
+        self.settings = settings
+        self.db_file = Path(settings.db_file or os.getenv("DB_FILE", "bets.db"))
+        self.max_pending_rows = max_pending_rows or flush_threshold()
+        self.metrics = FootballScanSessionMetrics()
+
+        self._conn: sqlite3.Connection | None = None
+        # table -> (sql, rows); dict order keeps first-use order per flush.
+        self._buffers: dict[str, tuple[str, list[tuple[Any, ...]]]] = {}
+        self._pending = 0
+        self._delta_stores: list[OddsDeltaStore] = []
+
+    def __enter__(self) -> "FootballScanSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_file)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        return self._conn
+
+    @property
+    def pending_rows(self) -> int:
+        return self._pending
+
+    def track_delta_store(self, store: OddsDeltaStore) -> OddsDeltaStore:
+        if store not in self._delta_stores:
+            self._delta_stores.append(store)
+        return store
+
+    def add(self, table: str, sql: str, row: tuple[Any, ...]) -> None:
+        self.add_many(table, sql, [row])
+
+    def add_many(
+        self,
+        table: str,
+        sql: str,
+        rows: Iterable[tuple[Any, ...]],
+    ) -> int:
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        buffered_sql, buffer = self._buffers.setdefault(table, (sql, []))
+        if buffered_sql != sql:
+            # Different statement for the same table: keep write order.
+            self.flush()
+            buffered_sql, buffer = self._buffers.setdefault(table, (sql, []))
+
+        buffer.extend(rows)
+        self._pending += len(rows)
+
+        if self._pending >= self.max_pending_rows:
+            self.flush()
+
+        return len(rows)
+
+    def inserted(self, table: str) -> int:
+        return self.metrics.inserted_by_table.get(table, 0)
+
+    def flush(self) -> int:
+        if not self._pending:
+            return 0
+
+        conn = self.connection()
+        buffers = self._buffers
+        pending = self._pending
+        self._buffers = {}
+        self._pending = 0
+
+        started = time.perf_counter()
+        try:
+            for table, (sql, rows) in buffers.items():
+                before = conn.total_changes
+                conn.executemany(sql, rows)
+                changed = conn.total_changes - before
+
+                self.metrics.rows_by_table[table] = (
+                    self.metrics.rows_by_table.get(table, 0) + len(rows)
+                )
+                self.metrics.inserted_by_table[table] = (
+                    self.metrics.inserted_by_table.get(table, 0) + changed
+                )
+
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            for store in self._delta_stores:
+                store.forget()
+            log.exception("Football scan flush failed; %s rows dropped", pending)
+            raise
+
+        elapsed = time.perf_counter() - started
+        self.metrics.flushes += 1
+        self.metrics.rows_flushed += pending
+        self.metrics.commit_seconds += elapsed
+        self.metrics.max_commit_seconds = max(
+            self.metrics.max_commit_seconds,
+            elapsed,
+        )
+        return pending
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Dict, Tuple
+
+from core.football_poisson import MAX_XG, MIN_XG, clamp, poisson_pmf_vector
+
+try:
+    import numpy as np
+except ImportError:  # the list-based grid below gives the same markets
+    np = None
+
+
+# Inputs are rounded before they reach the cache so float noise from the
+# xG/ELO blends still hits the same entry. 1e-12 keeps every market equal
+# to the unquantized matrix far below reporting precision.
+INPUT_DECIMALS = 12
+SCORE_GRID_CACHE_SIZE = 4096
+
+
+def _suffix_sums(values: list[float]) -> list[float]:
+    result = [0.0] * (len(values) + 1)
+
+    for index in range(len(values) - 1, -1, -1):
+        result[index] = result[index + 1] + values[index]
+
+    return result
+
+
+def _array_tails(values) -> Tuple[float, ...]:
+    """``_tail`` of every suffix sum, i.e. P(goals >= k), as one array pass."""
+    suffix = np.cumsum(values[::-1])[::-1]
+    return tuple(np.clip(suffix, 0.0, 1.0).tolist()) + (0.0,)
+
+
+@lru_cache(maxsize=8)
+def _grid_indices(side: int):
+    """Total goals per cell and the home-win/away-win cells of a grid."""
+    goal_sums = np.add.outer(np.arange(side), np.arange(side)).ravel()
+    return goal_sums, np.tril_indices(side, -1), np.triu_indices(side, 1)
+
+
+def _tail(suffix: list[float], goals: int) -> float:
+    if goals >= len(suffix):
+        return 0.0
+    return clamp(suffix[goals], 0.0, 1.0)
+
+
+@dataclass(frozen=True)
+class ScoreGridMarkets:
+    """Every market derived from one normalized score grid."""
+
+    home_win: float
+    draw: float
+    away_win: float
+
+    over: Tuple[float, ...]
+    btts_yes: float
+    home_over: Tuple[float, ...]
+    away_over: Tuple[float, ...]
+
+    # Row-major (home_goals, away_goals) grid, side x side.
+    cells: Tuple[float, ...]
+    side: int
+
+    def over_line(self, line: float) -> float:
+        goals = int(math.floor(line)) + 1
+        return self.over[goals] if goals < len(self.over) else 0.0
+
+    @cached_property
+    def _matrix(self) -> Dict[Tuple[int, int], float]:
+        side = self.side
+        return {
+            (index // side, index % side): probability
+            for index, probability in enumerate(self.cells)
+        }
+
+    @cached_property
+    def _ranked_cells(self) -> list[int]:
+        # Stable sort, so ties keep (home, away) order like the dict models.
+        return sorted(
+            range(len(self.cells)),
+            key=lambda index: self.cells[index],
+            reverse=True,
+        )
+
+    def score_matrix(self) -> Dict[Tuple[int, int], float]:
+        # Grids are shared through the cache; callers get their own dict.
+        return dict(self._matrix)
+
+    def top_correct_scores(self, top_scores: int) -> Dict[str, float]:
+        side = self.side
+        return {
+            f"{index // side}-{index % side}": round(self.cells[index], 6)
+            for index in self._ranked_cells[:max(1, int(top_scores))]
+        }
+
+
+def _finish_markets(
+    *,
+    home_win: float,
+    draw: float,
+    away_win: float,
+    btts_yes: float,
+    over: Tuple[float, ...],
+    home_over: Tuple[float, ...],
+    away_over: Tuple[float, ...],
+    cells: list[float],
+    side: int,
+) -> ScoreGridMarkets:
+    home_win = clamp(home_win, 0.0, 1.0)
+    draw = clamp(draw, 0.0, 1.0)
+    away_win = clamp(away_win, 0.0, 1.0)
+
+    total_1x2 = home_win + draw + away_win
+
+    if total_1x2 > 0:
+        home_win /= total_1x2
+        draw /= total_1x2
+        away_win /= total_1x2
+
+    return ScoreGridMarkets(
+        home_win=home_win,
+        draw=draw,
+        away_win=away_win,
+        over=over,
+        btts_yes=clamp(btts_yes, 0.0, 1.0),
+        home_over=home_over,
+        away_over=away_over,
+        cells=tuple(cells),
+        side=side,
+    )
+
+
+def _tails(values: list[float]) -> Tuple[float, ...]:
+    suffix = _suffix_sums(values)
+    return tuple(_tail(suffix, goals) for goals in range(len(suffix)))
+
+
+def _markets_from_array(grid, side: int) -> ScoreGridMarkets:
+    # Rows are home goals, so below the diagonal is a home win.
+    goal_sums, home_cells, away_cells = _grid_indices(side)
+    total_goals = np.bincount(
+        goal_sums,
+        weights=grid.ravel(),
+        minlength=2 * side - 1,
+    )
+
+    return _finish_markets(
+        home_win=float(grid[home_cells].sum()),
+        draw=float(np.trace(grid)),
+        away_win=float(grid[away_cells].sum()),
+        btts_yes=float(grid[1:, 1:].sum()),
+        over=_array_tails(total_goals),
+        home_over=_array_tails(grid.sum(axis=1)),
+        away_over=_array_tails(grid.sum(axis=0)),
+        cells=grid.ravel().tolist(),
+        side=side,
+    )
+
+
+def _markets_from_cells(cells: list[float], side: int) -> ScoreGridMarkets:
+    home_win = draw = away_win = btts_yes = 0.0
+    home_marginal = [0.0] * side
+    away_marginal = [0.0] * side
+    total_goals = [0.0] * (2 * side - 1)
+
+    for home_goals in range(side):
+        row = home_goals * side
+
+        for away_goals in range(side):
+            probability = cells[row + away_goals]
+
+            if home_goals > away_goals:
+                home_win += probability
+            elif home_goals == away_goals:
+                draw += probability
+            else:
+                away_win += probability
+
+            if home_goals and away_goals:
+                btts_yes += probability
+
+            home_marginal[home_goals] += probability
+            away_marginal[away_goals] += probability
+            total_goals[home_goals + away_goals] += probability
+
+    return _finish_markets(
+        home_win=home_win,
+        draw=draw,
+        away_win=away_win,
+        btts_yes=btts_yes,
+        over=_tails(total_goals),
+        home_over=_tails(home_marginal),
+        away_over=_tails(away_marginal),
+        cells=cells,
+        side=side,
+    )
+
+
+@dataclass(frozen=True)
+class ScoreGrid:
+    home_xg: float
+    away_xg: float
+    rho: float
+    max_goals: int
+
+    poisson: ScoreGridMarkets
+    dixon_coles: ScoreGridMarkets
+
+
+@lru_cache(maxsize=SCORE_GRID_CACHE_SIZE)
+def _cached_score_grid(
+    home_xg: float,
+    away_xg: float,
+    rho: float,
+    max_goals: int,
+) -> ScoreGrid:
+    side = max_goals + 1
+    home_pmf = poisson_pmf_vector(home_xg, max_goals)
+    away_pmf = poisson_pmf_vector(away_xg, max_goals)
+
+    # Dixon-Coles tau only touches 0-0, 0-1, 1-0 and 1-1.
+    tau = (
+        max(0.01, 1.0 - home_xg * away_xg * rho),
+        max(0.01, 1.0 + home_xg * rho),
+        max(0.01, 1.0 + away_xg * rho),
+        max(0.01, 1.0 - rho),
+    )
+
+    if np is not None:
+        grid = np.outer(home_pmf, away_pmf)
+        total = grid.sum()
+
+        if total > 0:
+            grid = grid / total
+
+        corrected_grid = grid.copy()
+        corrected_grid[:2, :2] *= np.reshape(tau, (2, 2))
+        corrected_total = corrected_grid.sum()
+
+        if corrected_total > 0:
+            corrected_grid = corrected_grid / corrected_total
+        else:
+            corrected_grid = grid
+
+        return ScoreGrid(
+            home_xg=home_xg,
+            away_xg=away_xg,
+            rho=rho,
+            max_goals=max_goals,
+            poisson=_markets_from_array(grid, side),
+            dixon_coles=_markets_from_array(corrected_grid, side),
+        )
+
+    cells = [
+        home_probability * away_probability
+        for home_probability in home_pmf
+        for away_probability in away_pmf
+    ]
+    total = sum(cells)
+
+    if total > 0:
+        cells = [probability / total for probability in cells]
+
+    corrected = list(cells)
+    corrected[0] *= tau[0]
+    corrected[1] *= tau[1]
+    corrected[side] *= tau[2]
+    corrected[side + 1] *= tau[3]
+
+    corrected_total = sum(corrected)
+
+    if corrected_total > 0:
+        corrected = [probability / corrected_total for probability in corrected]
+    else:
+        corrected = cells
+
+    return ScoreGrid(
+        home_xg=home_xg,
+        away_xg=away_xg,
+        rho=rho,
+        max_goals=max_goals,
+        poisson=_markets_from_cells(cells, side),
+        dixon_coles=_markets_from_cells(corrected, side),
+    )
+
+
+def score_grid(
+    expected_home_goals: float,
+    expected_away_goals: float,
+    *,
+    rho: float,
+    max_goals: int,
+) -> ScoreGrid:
+    """
+    Poisson and Dixon-Coles markets for one fixture, computed once.
+
+    xG is clamped like the dict-based models; rho is used as given, the
+    Dixon-Coles model clamps it. Inputs are quantized before the LRU
+    lookup, so HOME/DRAW/AWAY candidates of a fixture share one grid.
+    The grid is a numpy array when numpy is installed, else plain lists.
+    """
+    return _cached_score_grid(
+        round(clamp(float(expected_home_goals), MIN_XG, MAX_XG), INPUT_DECIMALS),
+        round(clamp(float(expected_away_goals), MIN_XG, MAX_XG), INPUT_DECIMALS),
+        round(float(rho), INPUT_DECIMALS),
+        max(5, int(max_goals)),
+    )
+
+
+def score_grid_cache_info():
+    return _cached_score_grid.cache_info()
+
+
+def clear_score_grid_cache() -> None:
+    _cached_score_grid.cache_clear()
@@ -1,27 +1,28 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import sqlite3
-import urllib.error
-import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 from core.config import Settings
 from core.football_team_aliases import (
     FootballTeamAliasEngine,
 )
+from core.odds_api import (
+    OddsApiError,
+    close_odds_api_client,
+    fetch_scores as fetch_odds_api_scores,
+)
+from core.schema_registry import table_columns, table_exists
 
 
 log = logging.getLogger(__name__)
 
-API_HOST = "https://api.the-odds-api.com"
 DEFAULT_DAYS_FROM = 3
 
 
@@ -100,6 +101,81 @@ class CompletedFootballGame:
     last_update: str
 
 
+class FootballFixtureIndex:
+    """
+    Completed games of one sport key, indexed once per scores fetch.
+
+    Bets resolve by external event id first. Otherwise team similarity is
+    evaluated once per distinct provider team name instead of once per
+    game; the alias engine memoizes the scores across bets.
+    """
+
+    def __init__(
+        self,
+        games: Iterable[CompletedFootballGame],
+    ) -> None:
+        self.games = list(games)
+        self.by_event_id: dict[str, CompletedFootballGame] = {}
+        self.home_positions: dict[str, list[int]] = {}
+        self.away_positions: dict[str, list[int]] = {}
+
+        for position, game in enumerate(self.games):
+            if game.event_id:
+                self.by_event_id.setdefault(game.event_id, game)
+
+            self.home_positions.setdefault(
+                game.home_team,
+                [],
+            ).append(position)
+            self.away_positions.setdefault(
+                game.away_team,
+                [],
+            ).append(position)
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    @staticmethod
+    def _positions(
+        positions_by_name: dict[str, list[int]],
+        team: str,
+        team_match: Callable[[str, str], bool],
+    ) -> set[int]:
+        return {
+            position
+            for name, positions in positions_by_name.items()
+            if team_match(name, team)
+            for position in positions
+        }
+
+    def candidates(
+        self,
+        home_team: str,
+        away_team: str,
+        team_match: Callable[[str, str], bool],
+    ) -> list[CompletedFootballGame]:
+        """Games whose home and away teams both match, in feed order."""
+        home = self._positions(
+            self.home_positions,
+            home_team,
+            team_match,
+        )
+
+        if not home:
+            return []
+
+        away = self._positions(
+            self.away_positions,
+            away_team,
+            team_match,
+        )
+
+        return [
+            self.games[position]
+            for position in sorted(home & away)
+        ]
+
+
 @dataclass
 class FootballSettlementSummary:
     open_bets: int
@@ -154,28 +230,14 @@ class FootballSettlementEngine:
         conn: sqlite3.Connection,
         table_name: str,
     ) -> bool:
-        row = conn.execute(
-            """
-            SELECT 1
-            FROM sqlite_master
-            WHERE type='table' AND name=?
-            """,
-            (table_name,),
-        ).fetchone()
-
-        return row is not None
+        return table_exists(conn, table_name)
 
     @staticmethod
     def _columns(
         conn: sqlite3.Connection,
         table_name: str,
     ) -> set[str]:
-        return {
-            str(row[1])
-            for row in conn.execute(
-                f"PRAGMA table_info({table_name})"
-            ).fetchall()
-        }
+        return set(table_columns(conn, table_name))
 
     def _ensure_schema(self) -> None:
         with self.connect() as conn:
@@ -363,62 +425,35 @@ class FootballSettlementEngine:
 
         return open_bets
 
-    def _fetch_scores_sync(
+    async def _fetch_scores_payload(
         self,
         sport_key: str,
     ) -> list[dict[str, Any]]:
         if not self.api_key:
             raise RuntimeError("ODDS_API_KEY is missing")
 
-        query = urllib.parse.urlencode(
-            {
-                "apiKey": self.api_key,
-                "daysFrom": self.days_from,
-                "dateFormat": "iso",
-            }
-        )
-        url = (
-            f"{API_HOST}/v4/sports/"
-            f"{urllib.parse.quote(sport_key)}/scores/?{query}"
-        )
-
-        request = urllib.request.Request(
-            url,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "Football-v13-settlement/1.0",
-            },
-        )
-
+        # Shared with the per-sport settlement: one /scores call per key.
         try:
-            with urllib.request.urlopen(
-                request,
-                timeout=30,
-            ) as response:
-                payload = json.loads(
-                    response.read().decode("utf-8")
-                )
-        except urllib.error.HTTPError as exc:
-            body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(
-                f"Scores API {exc.code} for {sport_key}: {body}"
-            ) from exc
-        except urllib.error.URLError as exc:
+            return await fetch_odds_api_scores(
+                self.api_key,
+                sport_key,
+                self.days_from,
+            )
+        except OddsApiError as exc:
+            if exc.status is None:
+                raise RuntimeError(
+                    f"Scores API connection failed for "
+                    f"{sport_key}: {exc}"
+                ) from exc
             raise RuntimeError(
-                f"Scores API connection failed for "
-                f"{sport_key}: {exc}"
+                f"Scores API {exc.status} for {sport_key}: {exc.body}"
             ) from exc
 
-        return payload if isinstance(payload, list) else []
-
     async def fetch_scores(
         self,
         sport_key: str,
     ) -> list[CompletedFootballGame]:
-        payload = await asyncio.to_thread(
-            self._fetch_scores_sync,
-            sport_key,
-        )
+        payload = await self._fetch_scores_payload(sport_key)
 
         games: list[CompletedFootballGame] = []
 
@@ -480,33 +515,29 @@ class FootballSettlementEngine:
     def _match_game(
         self,
         bet: OpenFootballBet,
-        games: list[CompletedFootballGame],
+        games: list[CompletedFootballGame] | FootballFixtureIndex,
     ) -> CompletedFootballGame | None:
+        index = (
+            games
+            if isinstance(games, FootballFixtureIndex)
+            else FootballFixtureIndex(games)
+        )
+
         if bet.external_event_id:
-            for game in games:
-                if game.event_id and game.event_id == bet.external_event_id:
-                    return game
-
-        exact_candidates = [
-            game
-            for game in games
-            if self._team_match(game.home_team, bet.home_team)
-            and self._team_match(game.away_team, bet.away_team)
-        ]
+            game = index.by_event_id.get(bet.external_event_id)
 
-        if not exact_candidates:
-            reversed_candidates = [
-                game
-                for game in games
-                if self._team_match(game.home_team, bet.away_team)
-                and self._team_match(game.away_team, bet.home_team)
-            ]
-
-            # Do not silently settle reversed fixtures. This only helps
-            # identify provider naming/order issues during diagnostics.
-            if reversed_candidates:
-                return None
+            if game is not None:
+                return game
 
+        exact_candidates = index.candidates(
+            bet.home_team,
+            bet.away_team,
+            self._team_match,
+        )
+
+        # Reversed fixtures are never settled silently; the diagnostics
+        # report them as provider naming/order issues.
+        if not exact_candidates:
             return None
 
         if len(exact_candidates) == 1:
@@ -1026,10 +1057,16 @@ class FootballSettlementEngine:
         unmatched = 0
         unmatched_rows: list[OpenFootballBet] = []
 
+        fixture_indexes = {
+            sport_key: FootballFixtureIndex(games)
+            for sport_key, games in scores_by_key.items()
+        }
+        empty_index = FootballFixtureIndex(())
+
         for bet in eligible_bets:
             game = self._match_game(
                 bet,
-                scores_by_key.get(bet.sport_key, []),
+                fixture_indexes.get(bet.sport_key, empty_index),
             )
 
             if game is None:
@@ -1096,7 +1133,10 @@ async def settle_football_bets(
 if __name__ == "__main__":
     async def _main() -> None:
         settings = Settings.from_env()
-        summary = await settle_football_bets(settings)
+        try:
+            summary = await settle_football_bets(settings)
+        finally:
+            await close_odds_api_client()
 
         print(
             "Football settlement: "
@@ -1,24 +1,18 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import SnapshotIndex, load_rows, write_rows
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_60.csv")
+SNAPSHOTS = Path("exports/history_football_market_snapshots_v14.csv")
 
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
-
-
 def pick_probability(snapshot, selection):
     s = (selection or "").lower()
 
@@ -32,24 +26,13 @@ def pick_probability(snapshot, selection):
     return snapshot.get("market_selection_probability")
 
 
-def run_smart_market_probability_resolver_v15_60(
-    source="exports/history_football_learning_dataset_v15_58.csv"
-):
-    base = load_rows(source)
-    snapshots = load_rows("exports/history_football_market_snapshots_v14.csv")
-
-    by_hash = {
-        r.get("source_hash"): r
-        for r in snapshots
-        if r.get("source_hash")
-    }
-
+def resolve_smart_market_probability(base, index):
     found = 0
     output = []
 
     for row in base:
         item = dict(row)
-        snap = by_hash.get(row.get("source_hash"))
+        snap = index.by_hash.get(row.get("source_hash"))
 
         if snap:
             probability = pick_probability(
@@ -66,12 +49,6 @@ def run_smart_market_probability_resolver_v15_60(
 
         output.append(item)
 
-    if output:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=output[0].keys())
-            writer.writeheader()
-            writer.writerows(output)
-
     return {
         "version": "v15.60",
         "created_at": now(),
@@ -80,4 +57,16 @@ def run_smart_market_probability_resolver_v15_60(
         "missing_market_probability": len(output) - found,
         "output": str(OUTPUT),
         "status": "READY" if output else "BUILDING",
-    }
+    }, output
+
+
+def run_smart_market_probability_resolver_v15_60(
+    source="exports/history_football_learning_dataset_v15_58.csv"
+):
+    report, output = resolve_smart_market_probability(
+        load_rows(source),
+        SnapshotIndex.from_csv(SNAPSHOTS),
+    )
+    write_rows(OUTPUT, output)
+
+    return report
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import csv
 import json
 import re
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def _now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -44,39 +45,44 @@ def team_match(a, b):
     return normalize_team(a) == normalize_team(b)
 
 
+def team_key(row):
+    return (
+        normalize_team(row.get("home_team")),
+        normalize_team(row.get("away_team")),
+    )
+
+
 def resolve_smart_matches(
     join_ready_rows,
     source="exports/history_football_postmatch_dataset_v14.csv",
 ):
-    path = Path(source)
+    matches = export_table(source)
 
-    if not path.exists():
+    if not matches.exists:
         return []
 
-    with path.open("r", encoding="utf-8", newline="") as file:
-        matches = list(csv.DictReader(file))
-
+    by_teams = matches.index("v15_29_teams", team_key)
     resolved = []
 
     for row in join_ready_rows:
-        for match in matches:
-            direct = (
-                team_match(row.get("home_team"), match.get("home_team"))
-                and team_match(row.get("away_team"), match.get("away_team"))
-            )
-
-            reverse = (
-                team_match(row.get("home_team"), match.get("away_team"))
-                and team_match(row.get("away_team"), match.get("home_team"))
-            )
-
-            if direct or reverse:
-                resolved.append({
-                    "snapshot": row,
-                    "match": match,
-                    "confidence": 1.0 if direct else 0.9,
-                })
-                break
+        home, away = team_key(row)
+        direct = by_teams.get((home, away), ())
+        reverse = by_teams.get((away, home), ())
+
+        if not direct and not reverse:
+            continue
+
+        # The first postmatch row in file order wins, direct on a tie.
+        if direct and (not reverse or direct[0] <= reverse[0]):
+            position, confidence = direct[0], 1.0
+        else:
+            position, confidence = reverse[0], 0.9
+
+        resolved.append({
+            "snapshot": row,
+            "match": dict(matches.rows[position]),
+            "confidence": confidence,
+        })
 
     return resolved
 
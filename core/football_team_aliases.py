@@ -10,6 +10,9 @@ from typing import Any
 
 DEFAULT_ALIAS_FILE = "config/football_team_aliases.json"
 
+# Upper bound for the per-engine name and similarity memos.
+MEMO_LIMIT = 50_000
+
 
 BUILTIN_ALIASES: dict[str, str] = {
     "psg": "paris saint germain",
@@ -106,6 +109,9 @@ class FootballTeamAliasEngine:
             for key, value in BUILTIN_ALIASES.items()
         }
         self._load_external_aliases()
+        # Aliases are fixed after loading, so both memos stay valid.
+        self._canonical_memo: dict[str, str] = {}
+        self._similarity_memo: dict[tuple[str, str], float] = {}
 
     def _load_external_aliases(self) -> None:
         if not self.alias_file.exists():
@@ -129,8 +135,19 @@ class FootballTeamAliasEngine:
                 self.aliases[alias_key] = canonical_value
 
     def canonical(self, value: Any) -> str:
-        normalized = canonical_team_name(value)
-        return self.aliases.get(normalized, normalized)
+        key = str(value or "")
+        canonical = self._canonical_memo.get(key)
+
+        if canonical is None:
+            normalized = canonical_team_name(key)
+            canonical = self.aliases.get(normalized, normalized)
+
+            if len(self._canonical_memo) >= MEMO_LIMIT:
+                self._canonical_memo.clear()
+
+            self._canonical_memo[key] = canonical
+
+        return canonical
 
     def similarity(self, left: Any, right: Any) -> float:
         left_canonical = self.canonical(left)
@@ -142,6 +159,27 @@ class FootballTeamAliasEngine:
         if left_canonical == right_canonical:
             return 1.0
 
+        key = (left_canonical, right_canonical)
+        score = self._similarity_memo.get(key)
+
+        if score is None:
+            score = self._canonical_similarity(
+                left_canonical,
+                right_canonical,
+            )
+
+            if len(self._similarity_memo) >= MEMO_LIMIT:
+                self._similarity_memo.clear()
+
+            self._similarity_memo[key] = score
+
+        return score
+
+    @staticmethod
+    def _canonical_similarity(
+        left_canonical: str,
+        right_canonical: str,
+    ) -> float:
         left_tokens = set(left_canonical.split())
         right_tokens = set(right_canonical.split())
 
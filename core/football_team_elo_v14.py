@@ -6,9 +6,15 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from core.config import Settings
+from core.football_rating_replay import RatingReplay
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+)
+from core.schema_registry import schema_once
 
 
 DEFAULT_ELO = 1500.0
@@ -17,6 +23,73 @@ DEFAULT_K_FACTOR = 24.0
 MAX_HISTORY_MATCHES = 100
 
 
+TEAM_ELO_V14_UPSERT_SQL = """
+    INSERT INTO football_team_elo_v14 (
+        team,
+        league,
+        rating,
+        home_rating,
+        away_rating,
+        matches,
+        home_matches,
+        away_matches,
+        wins,
+        draws,
+        losses,
+        goals_for,
+        goals_against,
+        recent_form,
+        reliability,
+        uncertainty,
+        last_match_at,
+        last_updated
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(team, league) DO UPDATE SET
+        rating=excluded.rating,
+        home_rating=excluded.home_rating,
+        away_rating=excluded.away_rating,
+        matches=excluded.matches,
+        home_matches=excluded.home_matches,
+        away_matches=excluded.away_matches,
+        wins=excluded.wins,
+        draws=excluded.draws,
+        losses=excluded.losses,
+        goals_for=excluded.goals_for,
+        goals_against=excluded.goals_against,
+        recent_form=excluded.recent_form,
+        reliability=excluded.reliability,
+        uncertainty=excluded.uncertainty,
+        last_match_at=excluded.last_match_at,
+        last_updated=excluded.last_updated
+"""
+
+
+TEAM_ELO_V14_HISTORY_INSERT_SQL = """
+    INSERT INTO football_team_elo_v14_history (
+        league,
+        home_team,
+        away_team,
+        home_goals,
+        away_goals,
+        home_old_rating,
+        away_old_rating,
+        home_new_rating,
+        away_new_rating,
+        home_change,
+        away_change,
+        k_factor,
+        expected_home,
+        actual_home,
+        played_at,
+        source,
+        source_hash,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def now_utc() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -183,6 +256,7 @@ class FootballTeamEloV14Database:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    @schema_once("football_team_elo_v14")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -273,20 +347,25 @@ class FootballTeamEloV14Database:
             conn.commit()
 
     def load(self, team: str, league: str) -> TeamEloV14:
-        self.init_db()
-
         team = normalize_team(team)
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
 
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT *
-                FROM football_team_elo_v14
-                WHERE team=? AND league=?
-                """,
-                (team, league),
-            ).fetchone()
+        snapshot = active_rating_snapshot(self.db_file)
+
+        if snapshot is not None and snapshot.covers("football_team_elo_v14"):
+            row = snapshot.row("football_team_elo_v14", team, league)
+        else:
+            self.init_db()
+
+            with self.connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT *
+                    FROM football_team_elo_v14
+                    WHERE team=? AND league=?
+                    """,
+                    (team, league),
+                ).fetchone()
 
         if row is None:
             return TeamEloV14(
@@ -298,74 +377,37 @@ class FootballTeamEloV14Database:
         return TeamEloV14(**dict(row)).normalized()
 
     def save(self, rating: TeamEloV14) -> None:
+        invalidate_rating_snapshot(self.db_file)
         self.init_db()
         rating = rating.normalized()
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_team_elo_v14 (
-                    team,
-                    league,
-                    rating,
-                    home_rating,
-                    away_rating,
-                    matches,
-                    home_matches,
-                    away_matches,
-                    wins,
-                    draws,
-                    losses,
-                    goals_for,
-                    goals_against,
-                    recent_form,
-                    reliability,
-                    uncertainty,
-                    last_match_at,
-                    last_updated
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(team, league) DO UPDATE SET
-                    rating=excluded.rating,
-                    home_rating=excluded.home_rating,
-                    away_rating=excluded.away_rating,
-                    matches=excluded.matches,
-                    home_matches=excluded.home_matches,
-                    away_matches=excluded.away_matches,
-                    wins=excluded.wins,
-                    draws=excluded.draws,
-                    losses=excluded.losses,
-                    goals_for=excluded.goals_for,
-                    goals_against=excluded.goals_against,
-                    recent_form=excluded.recent_form,
-                    reliability=excluded.reliability,
-                    uncertainty=excluded.uncertainty,
-                    last_match_at=excluded.last_match_at,
-                    last_updated=excluded.last_updated
-                """,
-                (
-                    rating.team,
-                    rating.league,
-                    rating.rating,
-                    rating.home_rating,
-                    rating.away_rating,
-                    rating.matches,
-                    rating.home_matches,
-                    rating.away_matches,
-                    rating.wins,
-                    rating.draws,
-                    rating.losses,
-                    rating.goals_for,
-                    rating.goals_against,
-                    rating.recent_form,
-                    rating.reliability,
-                    rating.uncertainty,
-                    rating.last_match_at,
-                    rating.last_updated,
-                ),
-            )
+            conn.execute(TEAM_ELO_V14_UPSERT_SQL, self.rating_row(rating))
             conn.commit()
 
+    @staticmethod
+    def rating_row(rating: TeamEloV14) -> tuple[Any, ...]:
+        return (
+            rating.team,
+            rating.league,
+            rating.rating,
+            rating.home_rating,
+            rating.away_rating,
+            rating.matches,
+            rating.home_matches,
+            rating.away_matches,
+            rating.wins,
+            rating.draws,
+            rating.losses,
+            rating.goals_for,
+            rating.goals_against,
+            rating.recent_form,
+            rating.reliability,
+            rating.uncertainty,
+            rating.last_match_at,
+            rating.last_updated,
+        )
+
     @staticmethod
     def expected_score(
         rating_a: float,
@@ -496,6 +538,42 @@ class FootballTeamEloV14Database:
                     actual_home=0.5,
                 )
 
+        result, history_row = self._apply_match(
+            home,
+            away,
+            league=league,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            played_at=played_at,
+            source=source,
+            source_hash=source_hash,
+            home_advantage_elo=home_advantage_elo,
+            importance=importance,
+        )
+
+        self.save(home)
+        self.save(away)
+
+        with self.connect() as conn:
+            conn.execute(TEAM_ELO_V14_HISTORY_INSERT_SQL, history_row)
+            conn.commit()
+
+        return result
+
+    def _apply_match(
+        self,
+        home: TeamEloV14,
+        away: TeamEloV14,
+        *,
+        league: str,
+        home_goals: int,
+        away_goals: int,
+        played_at: str,
+        source: str,
+        source_hash: str | None,
+        home_advantage_elo: float,
+        importance: float,
+    ) -> tuple[EloV14Update, tuple[Any, ...]]:
         effective_home_rating = (
             home.home_rating + home_advantage_elo
         )
@@ -603,58 +681,28 @@ class FootballTeamEloV14Database:
         home.last_updated = now_utc()
         away.last_updated = now_utc()
 
-        self.save(home)
-        self.save(away)
-
-        with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_team_elo_v14_history (
-                    league,
-                    home_team,
-                    away_team,
-                    home_goals,
-                    away_goals,
-                    home_old_rating,
-                    away_old_rating,
-                    home_new_rating,
-                    away_new_rating,
-                    home_change,
-                    away_change,
-                    k_factor,
-                    expected_home,
-                    actual_home,
-                    played_at,
-                    source,
-                    source_hash,
-                    created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    league,
-                    home.team,
-                    away.team,
-                    int(home_goals),
-                    int(away_goals),
-                    home_old_rating,
-                    away_old_rating,
-                    home.rating,
-                    away.rating,
-                    home.rating - home_old_rating,
-                    away.rating - away_old_rating,
-                    k_factor,
-                    expected_home,
-                    actual_home,
-                    played_at,
-                    source,
-                    source_hash,
-                    now_utc(),
-                ),
-            )
-            conn.commit()
+        history_row = (
+            league,
+            home.team,
+            away.team,
+            int(home_goals),
+            int(away_goals),
+            home_old_rating,
+            away_old_rating,
+            home.rating,
+            away.rating,
+            home.rating - home_old_rating,
+            away.rating - away_old_rating,
+            k_factor,
+            expected_home,
+            actual_home,
+            played_at,
+            source,
+            source_hash,
+            now_utc(),
+        )
 
-        return EloV14Update(
+        result = EloV14Update(
             inserted=True,
             home_old_rating=home_old_rating,
             away_old_rating=away_old_rating,
@@ -667,6 +715,8 @@ class FootballTeamEloV14Database:
             actual_home=actual_home,
         )
 
+        return result, history_row
+
     def predict_match(
         self,
         *,
@@ -789,32 +839,101 @@ class FootballTeamEloV14Database:
                 FROM football_form_history
                 ORDER BY played_at, id
                 """
-            ).fetchall()
+            )
 
-        processed = 0
+            return self._replay(
+                conn,
+                (
+                    {
+                        "league": row["league"],
+                        "home_team": row["home_team"],
+                        "away_team": row["away_team"],
+                        "home_goals": int(row["home_goals"]),
+                        "away_goals": int(row["away_goals"]),
+                        "played_at": row["played_at"],
+                        "source": row["source"] or "football_form_history",
+                        "source_hash": (
+                            f"{row['source_hash']}:elo_v14"
+                            if row["source_hash"]
+                            else None
+                        ),
+                    }
+                    for row in rows
+                ),
+            )
+
+    def replay_matches(
+        self,
+        matches: Iterable[dict[str, Any]],
+        *,
+        home_advantage_elo: float = DEFAULT_HOME_ADVANTAGE,
+    ) -> int:
+        """
+        Apply many matches in order, like repeated ``update_after_match``
+        calls, but with one read of the ratings and one write at the end.
+        """
+        self.init_db()
 
-        for row in rows:
-            source_hash = (
-                f"{row['source_hash']}:elo_v14"
-                if row["source_hash"]
-                else None
+        with self.connect() as conn:
+            return self._replay(
+                conn,
+                matches,
+                home_advantage_elo=home_advantage_elo,
             )
 
-            result = self.update_after_match(
-                league=row["league"],
-                home_team=row["home_team"],
-                away_team=row["away_team"],
-                home_goals=int(row["home_goals"]),
-                away_goals=int(row["away_goals"]),
-                played_at=row["played_at"],
-                source=row["source"] or "football_form_history",
+    def _replay(
+        self,
+        conn: sqlite3.Connection,
+        matches: Iterable[dict[str, Any]],
+        *,
+        home_advantage_elo: float = DEFAULT_HOME_ADVANTAGE,
+    ) -> int:
+        replay = RatingReplay.from_db(
+            conn,
+            TeamEloV14,
+            ratings_table="football_team_elo_v14",
+            history_table="football_team_elo_v14_history",
+        )
+
+        for match in matches:
+            source_hash = match.get("source_hash") or None
+
+            if replay.is_duplicate(source_hash):
+                continue
+
+            league = match["league"]
+            home, away = replay.pair(
+                normalize_team(match["home_team"]),
+                normalize_team(match["away_team"]),
+                str(league or "UNKNOWN").strip() or "UNKNOWN",
+            )
+
+            _, history_row = self._apply_match(
+                home,
+                away,
+                league=league,
+                home_goals=match["home_goals"],
+                away_goals=match["away_goals"],
+                played_at=match["played_at"],
+                source=match.get("source", ""),
                 source_hash=source_hash,
+                home_advantage_elo=home_advantage_elo,
+                importance=match.get("importance", 1.0),
             )
 
-            if result.inserted:
-                processed += 1
+            replay.record(
+                history_row,
+                source_hash=source_hash,
+                teams=(home, away),
+            )
 
-        return processed
+        return replay.write(
+            conn,
+            self.db_file,
+            ratings_sql=TEAM_ELO_V14_UPSERT_SQL,
+            rating_row=self.rating_row,
+            history_sql=TEAM_ELO_V14_HISTORY_INSERT_SQL,
+        )
 
     def export_json(
         self,
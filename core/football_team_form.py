@@ -7,15 +7,99 @@ import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from core.config import Settings
+from core.football_rating_replay import RatingReplay
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+)
+from core.schema_registry import schema_once, table_columns
 
 
 DEFAULT_FORM = 0.50
 DEFAULT_GOALS = 1.35
 
 
+TEAM_FORM_UPSERT_SQL = """
+    INSERT INTO football_team_form (
+        team,
+        league,
+        matches,
+        points_last_5,
+        points_last_10,
+        goals_for_last_5,
+        goals_against_last_5,
+        goals_for_last_10,
+        goals_against_last_10,
+        xg_for_last_5,
+        xga_last_5,
+        xg_for_last_10,
+        xga_last_10,
+        home_points_last_5,
+        away_points_last_5,
+        wins_last_5,
+        draws_last_5,
+        losses_last_5,
+        wins_last_10,
+        draws_last_10,
+        losses_last_10,
+        form_score,
+        attack_form,
+        defense_form,
+        last_result,
+        last_updated
+    )
+    VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(team, league) DO UPDATE SET
+        matches=excluded.matches,
+        points_last_5=excluded.points_last_5,
+        points_last_10=excluded.points_last_10,
+        goals_for_last_5=excluded.goals_for_last_5,
+        goals_against_last_5=excluded.goals_against_last_5,
+        goals_for_last_10=excluded.goals_for_last_10,
+        goals_against_last_10=excluded.goals_against_last_10,
+        xg_for_last_5=excluded.xg_for_last_5,
+        xga_last_5=excluded.xga_last_5,
+        xg_for_last_10=excluded.xg_for_last_10,
+        xga_last_10=excluded.xga_last_10,
+        home_points_last_5=excluded.home_points_last_5,
+        away_points_last_5=excluded.away_points_last_5,
+        wins_last_5=excluded.wins_last_5,
+        draws_last_5=excluded.draws_last_5,
+        losses_last_5=excluded.losses_last_5,
+        wins_last_10=excluded.wins_last_10,
+        draws_last_10=excluded.draws_last_10,
+        losses_last_10=excluded.losses_last_10,
+        form_score=excluded.form_score,
+        attack_form=excluded.attack_form,
+        defense_form=excluded.defense_form,
+        last_result=excluded.last_result,
+        last_updated=excluded.last_updated
+"""
+
+
+FORM_HISTORY_INSERT_SQL = """
+    INSERT OR IGNORE INTO football_form_history (
+        played_at,
+        league,
+        home_team,
+        away_team,
+        home_goals,
+        away_goals,
+        home_xg,
+        away_xg,
+        source,
+        source_hash,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def now_utc() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -207,6 +291,7 @@ class FootballFormDatabase:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    @schema_once("football_team_form")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -285,15 +370,8 @@ class FootballFormDatabase:
             ).fetchone()[0] or 0)
             dataset_samples = 0
             dataset_total = 0
-            if conn.execute(
-                "SELECT 1 FROM sqlite_master WHERE type='table' "
-                "AND name='football_dataset_v15'"
-            ).fetchone() is not None:
-                columns = {
-                    str(row[1]) for row in conn.execute(
-                        "PRAGMA table_info(football_dataset_v15)"
-                    ).fetchall()
-                }
+            columns = table_columns(conn, "football_dataset_v15")
+            if columns:
                 dataset_total = int(conn.execute(
                     "SELECT COUNT(*) FROM football_dataset_v15"
                 ).fetchone()[0] or 0)
@@ -309,20 +387,25 @@ class FootballFormDatabase:
         )
 
     def load_team(self, team: str, league: str = "UNKNOWN") -> TeamForm:
-        self.init_db()
-
         team = normalize_team_name(team)
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
 
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT *
-                FROM football_team_form
-                WHERE team=? AND league=?
-                """,
-                (team, league),
-            ).fetchone()
+        snapshot = active_rating_snapshot(self.db_file)
+
+        if snapshot is not None and snapshot.covers("football_team_form"):
+            row = snapshot.row("football_team_form", team, league)
+        else:
+            self.init_db()
+
+            with self.connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT *
+                    FROM football_team_form
+                    WHERE team=? AND league=?
+                    """,
+                    (team, league),
+                ).fetchone()
 
         if row is None:
             return TeamForm(
@@ -334,100 +417,45 @@ class FootballFormDatabase:
         return TeamForm(**dict(row)).normalized()
 
     def save_team(self, form: TeamForm) -> None:
+        invalidate_rating_snapshot(self.db_file)
         self.init_db()
         form = form.normalized()
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_team_form (
-                    team,
-                    league,
-                    matches,
-                    points_last_5,
-                    points_last_10,
-                    goals_for_last_5,
-                    goals_against_last_5,
-                    goals_for_last_10,
-                    goals_against_last_10,
-                    xg_for_last_5,
-                    xga_last_5,
-                    xg_for_last_10,
-                    xga_last_10,
-                    home_points_last_5,
-                    away_points_last_5,
-                    wins_last_5,
-                    draws_last_5,
-                    losses_last_5,
-                    wins_last_10,
-                    draws_last_10,
-                    losses_last_10,
-                    form_score,
-                    attack_form,
-                    defense_form,
-                    last_result,
-                    last_updated
-                )
-                VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                ON CONFLICT(team, league) DO UPDATE SET
-                    matches=excluded.matches,
-                    points_last_5=excluded.points_last_5,
-                    points_last_10=excluded.points_last_10,
-                    goals_for_last_5=excluded.goals_for_last_5,
-                    goals_against_last_5=excluded.goals_against_last_5,
-                    goals_for_last_10=excluded.goals_for_last_10,
-                    goals_against_last_10=excluded.goals_against_last_10,
-                    xg_for_last_5=excluded.xg_for_last_5,
-                    xga_last_5=excluded.xga_last_5,
-                    xg_for_last_10=excluded.xg_for_last_10,
-                    xga_last_10=excluded.xga_last_10,
-                    home_points_last_5=excluded.home_points_last_5,
-                    away_points_last_5=excluded.away_points_last_5,
-                    wins_last_5=excluded.wins_last_5,
-                    draws_last_5=excluded.draws_last_5,
-                    losses_last_5=excluded.losses_last_5,
-                    wins_last_10=excluded.wins_last_10,
-                    draws_last_10=excluded.draws_last_10,
-                    losses_last_10=excluded.losses_last_10,
-                    form_score=excluded.form_score,
-                    attack_form=excluded.attack_form,
-                    defense_form=excluded.defense_form,
-                    last_result=excluded.last_result,
-                    last_updated=excluded.last_updated
-                """,
-                (
-                    form.team,
-                    form.league,
-                    form.matches,
-                    form.points_last_5,
-                    form.points_last_10,
-                    form.goals_for_last_5,
-                    form.goals_against_last_5,
-                    form.goals_for_last_10,
-                    form.goals_against_last_10,
-                    form.xg_for_last_5,
-                    form.xga_last_5,
-                    form.xg_for_last_10,
-                    form.xga_last_10,
-                    form.home_points_last_5,
-                    form.away_points_last_5,
-                    form.wins_last_5,
-                    form.draws_last_5,
-                    form.losses_last_5,
-                    form.wins_last_10,
-                    form.draws_last_10,
-                    form.losses_last_10,
-                    form.form_score,
-                    form.attack_form,
-                    form.defense_form,
-                    form.last_result,
-                    form.last_updated,
-                ),
-            )
+            conn.execute(TEAM_FORM_UPSERT_SQL, self.form_row(form))
             conn.commit()
 
+    @staticmethod
+    def form_row(form: TeamForm) -> tuple[Any, ...]:
+        return (
+            form.team,
+            form.league,
+            form.matches,
+            form.points_last_5,
+            form.points_last_10,
+            form.goals_for_last_5,
+            form.goals_against_last_5,
+            form.goals_for_last_10,
+            form.goals_against_last_10,
+            form.xg_for_last_5,
+            form.xga_last_5,
+            form.xg_for_last_10,
+            form.xga_last_10,
+            form.home_points_last_5,
+            form.away_points_last_5,
+            form.wins_last_5,
+            form.draws_last_5,
+            form.losses_last_5,
+            form.wins_last_10,
+            form.draws_last_10,
+            form.losses_last_10,
+            form.form_score,
+            form.attack_form,
+            form.defense_form,
+            form.last_result,
+            form.last_updated,
+        )
+
     def _recent_matches(
         self,
         team: str,
@@ -454,6 +482,16 @@ class FootballFormDatabase:
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
         rows = self._recent_matches(team, league, limit=10)
 
+        form = self._form_from_matches(team, league, rows)
+        self.save_team(form)
+        return form
+
+    @staticmethod
+    def _form_from_matches(
+        team: str,
+        league: str,
+        rows: list[sqlite3.Row],
+    ) -> TeamForm:
         form = TeamForm(team=team, league=league)
         form.matches = len(rows)
 
@@ -586,7 +624,6 @@ class FootballFormDatabase:
         form.defense_form = clamp(defense_component, 0.40, 2.50)
         form.last_updated = now_utc()
 
-        self.save_team(form)
         return form
 
     def update_after_match(
@@ -625,22 +662,7 @@ class FootballFormDatabase:
             before = conn.total_changes
 
             conn.execute(
-                """
-                INSERT OR IGNORE INTO football_form_history (
-                    played_at,
-                    league,
-                    home_team,
-                    away_team,
-                    home_goals,
-                    away_goals,
-                    home_xg,
-                    away_xg,
-                    source,
-                    source_hash,
-                    created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                FORM_HISTORY_INSERT_SQL,
                 (
                     played_at,
                     league,
@@ -666,6 +688,127 @@ class FootballFormDatabase:
         self.rebuild_team(away_team, league)
         return True
 
+    def replay_matches(self, matches: Iterable[dict[str, Any]]) -> int:
+        """
+        Insert ``update_after_match`` keyword dicts in one transaction and
+        rebuild every touched team once from its last ten matches.
+        Returns inserted matches.
+        """
+        self.init_db()
+
+        with self.connect() as conn:
+            replay = RatingReplay(
+                TeamForm,
+                seen_hashes=(
+                    row[0]
+                    for row in conn.execute(
+                        """
+                        SELECT source_hash
+                        FROM football_form_history
+                        WHERE source_hash IS NOT NULL
+                        """
+                    )
+                ),
+            )
+            touched: dict[str, dict[str, None]] = {}
+
+            for match in matches:
+                league = str(match.get("league") or "UNKNOWN").strip() or "UNKNOWN"
+                home_team = normalize_team_name(match["home_team"])
+                away_team = normalize_team_name(match["away_team"])
+                home_goals = max(0, safe_int(match["home_goals"]))
+                away_goals = max(0, safe_int(match["away_goals"]))
+                played_at = match.get("played_at") or now_utc()
+
+                source_hash = match.get("source_hash") or make_source_hash(
+                    league,
+                    home_team,
+                    away_team,
+                    played_at,
+                    home_goals,
+                    away_goals,
+                )
+
+                if replay.is_duplicate(source_hash):
+                    continue
+
+                replay.record(
+                    (
+                        played_at,
+                        league,
+                        home_team,
+                        away_team,
+                        home_goals,
+                        away_goals,
+                        match.get("home_xg"),
+                        match.get("away_xg"),
+                        match.get("source", "manual"),
+                        source_hash,
+                        now_utc(),
+                    ),
+                    source_hash=source_hash,
+                )
+
+                league_teams = touched.setdefault(league, {})
+                league_teams[home_team] = None
+                league_teams[away_team] = None
+
+            if not replay.applied:
+                return 0
+
+            conn.executemany(FORM_HISTORY_INSERT_SQL, replay.history)
+
+            for league, teams in touched.items():
+                recent = self._recent_matches_many(conn, league, teams)
+
+                for team in teams:
+                    replay.put(
+                        self._form_from_matches(team, league, recent[team])
+                    )
+
+            return replay.write(
+                conn,
+                self.db_file,
+                ratings_sql=TEAM_FORM_UPSERT_SQL,
+                rating_row=self.form_row,
+            )
+
+    @staticmethod
+    def _recent_matches_many(
+        conn: sqlite3.Connection,
+        league: str,
+        teams: Iterable[str],
+        limit: int = 10,
+    ) -> dict[str, list[sqlite3.Row]]:
+        """``_recent_matches`` for many teams from one pass over the league."""
+        recent: dict[str, list[sqlite3.Row]] = {team: [] for team in teams}
+        open_teams = len(recent)
+
+        for row in conn.execute(
+            """
+            SELECT *
+            FROM football_form_history
+            WHERE league=?
+            ORDER BY played_at DESC, id DESC
+            """,
+            (league,),
+        ):
+            for team in {row["home_team"], row["away_team"]}:
+                rows = recent.get(team)
+
+                if rows is None or len(rows) >= limit:
+                    continue
+
+                rows.append(row)
+
+                if len(rows) == limit:
+                    open_teams -= 1
+
+            if not open_teams:
+                break
+
+        return recent
+
     def predict_match(
         self,
         *,
@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Any
 
 from core.config import Settings
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+)
+from core.schema_registry import schema_once
 
 
 DEFAULT_LEAGUE_XG = 1.35
@@ -177,6 +182,7 @@ class FootballTeamXGV14Database:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    @schema_once("football_team_xg_v14")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -223,20 +229,25 @@ class FootballTeamXGV14Database:
             conn.commit()
 
     def load(self, team: str, league: str) -> TeamXGV14:
-        self.init_db()
-
         team = normalize_team(team)
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
 
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT *
-                FROM football_team_xg_v14
-                WHERE team=? AND league=?
-                """,
-                (team, league),
-            ).fetchone()
+        snapshot = active_rating_snapshot(self.db_file)
+
+        if snapshot is not None and snapshot.covers("football_team_xg_v14"):
+            row = snapshot.row("football_team_xg_v14", team, league)
+        else:
+            self.init_db()
+
+            with self.connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT *
+                    FROM football_team_xg_v14
+                    WHERE team=? AND league=?
+                    """,
+                    (team, league),
+                ).fetchone()
 
         if row is None:
             return TeamXGV14(
@@ -248,6 +259,7 @@ class FootballTeamXGV14Database:
         return TeamXGV14(**dict(row)).normalized()
 
     def save(self, rating: TeamXGV14) -> None:
+        invalidate_rating_snapshot(self.db_file)
         self.init_db()
         rating = rating.normalized()
 
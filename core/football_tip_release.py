@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from core.config import Settings
+from core.schema_registry import ensure_schema
 from core.sport_context import SportContextDatabase
 from core.types import Bet, SportResult
 
@@ -34,6 +35,10 @@ def ensure_release_columns(settings: Settings) -> None:
     database = Path(settings.db_file or "bets.db")
     if not database.exists():
         return
+    ensure_schema(database, "football_tip_release", lambda: _add_release_columns(database))
+
+
+def _add_release_columns(database: Path) -> None:
     with sqlite3.connect(database) as conn:
         columns = {
             str(row[1]) for row in conn.execute("PRAGMA table_info(sport_bets)")
@@ -13,6 +13,7 @@ from core.football_meta import (
     DEFAULT_METADATA_PATH,
     DEFAULT_MODEL_PATH,
     FootballMetaMetadata,
+    export_football_meta_scorer,
     save_football_meta_metadata,
 )
 
@@ -492,6 +493,12 @@ def train(
     with model_file.open("wb") as handle:
         pickle.dump(model, handle)
 
+    scorer_file = export_football_meta_scorer(
+        model,
+        FEATURE_ORDER,
+        model_path=model_file,
+    )
+
     metadata = FootballMetaMetadata(
         model_type="sklearn_logistic_regression_pipeline",
         trained_at=now_utc(),
@@ -528,6 +535,7 @@ def train(
                 "validation_score": validation_score,
                 "feature_count": len(FEATURE_ORDER),
                 "model_path": str(model_file),
+                "scorer_path": str(scorer_file or ""),
             },
             ensure_ascii=False,
             indent=2,
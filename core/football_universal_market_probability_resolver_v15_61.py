@@ -1,28 +1,23 @@
 from __future__ import annotations
 
-import csv
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.football_learning_tables import (
+    SnapshotIndex,
+    load_rows,
+    normalize,
+    write_rows,
+)
+
 OUTPUT = Path("exports/history_football_learning_dataset_v15_61.csv")
+SNAPSHOTS = Path("exports/history_football_market_snapshots_v14.csv")
 
 
 def now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def load_rows(path):
-    p = Path(path)
-    if not p.exists():
-        return []
-    with p.open("r", encoding="utf-8-sig", newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def normalize(value):
-    return (value or "").strip().lower()
-
-
 def pick_probability(snapshot, selection):
     s = normalize(selection)
 
@@ -36,28 +31,9 @@ def pick_probability(snapshot, selection):
     return snapshot.get("market_selection_probability")
 
 
-def run_universal_market_probability_resolver_v15_61(
-    source="exports/history_football_learning_dataset_v15_58.csv"
-):
-    base = load_rows(source)
-    snapshots = load_rows(
-        "exports/history_football_market_snapshots_v14.csv"
-    )
-
-    hash_map = {
-        r.get("source_hash"): r
-        for r in snapshots
-        if r.get("source_hash")
-    }
-
-    event_map = {}
-
-    for r in snapshots:
-        key = (
-            normalize(r.get("event")),
-            normalize(r.get("selection")),
-        )
-        event_map.setdefault(key, r)
+def resolve_universal_market_probability(base, index):
+    hash_map = index.by_hash
+    event_map = index.by_event_selection
 
     hash_matches = 0
     event_matches = 0
@@ -101,15 +77,6 @@ def run_universal_market_probability_resolver_v15_61(
 
         output.append(item)
 
-    if output:
-        with OUTPUT.open("w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=output[0].keys()
-            )
-            writer.writeheader()
-            writer.writerows(output)
-
     return {
         "version": "v15.61",
         "created_at": now(),
@@ -120,4 +87,16 @@ def run_universal_market_probability_resolver_v15_61(
         "event_matches": event_matches,
         "output": str(OUTPUT),
         "status": "READY" if output else "BUILDING",
-    }
+    }, output
+
+
+def run_universal_market_probability_resolver_v15_61(
+    source="exports/history_football_learning_dataset_v15_58.csv"
+):
+    report, output = resolve_universal_market_probability(
+        load_rows(source),
+        SnapshotIndex.from_csv(SNAPSHOTS),
+    )
+    write_rows(OUTPUT, output)
+
+    return report
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import csv
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+from core.export_tables import export_table
+
 
 def _now():
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -21,32 +22,28 @@ def normalize_team(name):
     )
 
 
-def resolve_matches(join_ready_rows, source="exports/history_football_postmatch_dataset_v14.csv"):
-    path = Path(source)
+def team_key(row):
+    return (
+        normalize_team(row.get("home_team")),
+        normalize_team(row.get("away_team")),
+    )
 
-    if not path.exists():
-        return []
 
-    with path.open("r", encoding="utf-8", newline="") as file:
-        matches = list(csv.DictReader(file))
+def resolve_matches(join_ready_rows, source="exports/history_football_postmatch_dataset_v14.csv"):
+    matches = export_table(source)
 
     resolved = []
 
     for row in join_ready_rows:
-        for match in matches:
-            home_match = normalize_team(match.get("home_team"))
-            away_match = normalize_team(match.get("away_team"))
-
-            if (
-                normalize_team(row.get("home_team")) == home_match
-                and normalize_team(row.get("away_team")) == away_match
-            ):
-                resolved.append({
-                    "snapshot": row,
-                    "match": match,
-                    "matched": True,
-                })
-                break
+        # First postmatch row (file order) with the same normalized teams.
+        match = matches.first("v15_28_teams", team_key(row), team_key)
+
+        if match is not None:
+            resolved.append({
+                "snapshot": row,
+                "match": dict(match),
+                "matched": True,
+            })
 
     return resolved
 
@@ -9,6 +9,12 @@ from pathlib import Path
 from typing import Any, Iterable
 
 from core.config import Settings
+from core.football_rating_replay import RatingReplay
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+)
+from core.schema_registry import schema_once, table_columns
 
 
 DEFAULT_XG = 1.35
@@ -21,6 +27,72 @@ MIN_EXPECTED_GOALS = 0.15
 MAX_EXPECTED_GOALS = 4.50
 
 
+XG_RATING_UPSERT_SQL = """
+    INSERT INTO football_xg_ratings (
+        team,
+        league,
+        attack_rating,
+        defense_rating,
+        rolling_xg_for_5,
+        rolling_xga_5,
+        rolling_xg_for_10,
+        rolling_xga_10,
+        home_xg_for,
+        home_xga,
+        away_xg_for,
+        away_xga,
+        matches,
+        home_matches,
+        away_matches,
+        xg_for_sum,
+        xga_sum,
+        last_xg_for,
+        last_xga,
+        last_updated
+    )
+    VALUES (
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    ON CONFLICT(team, league) DO UPDATE SET
+        attack_rating=excluded.attack_rating,
+        defense_rating=excluded.defense_rating,
+        rolling_xg_for_5=excluded.rolling_xg_for_5,
+        rolling_xga_5=excluded.rolling_xga_5,
+        rolling_xg_for_10=excluded.rolling_xg_for_10,
+        rolling_xga_10=excluded.rolling_xga_10,
+        home_xg_for=excluded.home_xg_for,
+        home_xga=excluded.home_xga,
+        away_xg_for=excluded.away_xg_for,
+        away_xga=excluded.away_xga,
+        matches=excluded.matches,
+        home_matches=excluded.home_matches,
+        away_matches=excluded.away_matches,
+        xg_for_sum=excluded.xg_for_sum,
+        xga_sum=excluded.xga_sum,
+        last_xg_for=excluded.last_xg_for,
+        last_xga=excluded.last_xga,
+        last_updated=excluded.last_updated
+"""
+
+
+XG_HISTORY_INSERT_SQL = """
+    INSERT OR IGNORE INTO football_xg_history (
+        played_at,
+        league,
+        home_team,
+        away_team,
+        home_xg,
+        away_xg,
+        home_goals,
+        away_goals,
+        source,
+        source_hash,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def now_utc() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -191,6 +263,7 @@ class FootballXGDatabase:
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
 
+    @schema_once("football_xg")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -274,17 +347,8 @@ class FootballXGDatabase:
 
             dataset_samples = 0
             dataset_total = 0
-            dataset_exists = conn.execute(
-                "SELECT 1 FROM sqlite_master "
-                "WHERE type='table' AND name='football_dataset_v15'"
-            ).fetchone()
-            if dataset_exists is not None:
-                columns = {
-                    str(row[1])
-                    for row in conn.execute(
-                        "PRAGMA table_info(football_dataset_v15)"
-                    ).fetchall()
-                }
+            columns = table_columns(conn, "football_dataset_v15")
+            if columns:
                 dataset_total = int(conn.execute(
                     "SELECT COUNT(*) FROM football_dataset_v15"
                 ).fetchone()[0] or 0)
@@ -301,20 +365,25 @@ class FootballXGDatabase:
         )
 
     def load_team(self, team: str, league: str = "UNKNOWN") -> TeamXG:
-        self.init_db()
-
         team = normalize_team_name(team)
         league = str(league or "UNKNOWN").strip() or "UNKNOWN"
 
-        with self.connect() as conn:
-            row = conn.execute(
-                """
-                SELECT *
-                FROM football_xg_ratings
-                WHERE team=? AND league=?
-                """,
-                (team, league),
-            ).fetchone()
+        snapshot = active_rating_snapshot(self.db_file)
+
+        if snapshot is not None and snapshot.covers("football_xg_ratings"):
+            row = snapshot.row("football_xg_ratings", team, league)
+        else:
+            self.init_db()
+
+            with self.connect() as conn:
+                row = conn.execute(
+                    """
+                    SELECT *
+                    FROM football_xg_ratings
+                    WHERE team=? AND league=?
+                    """,
+                    (team, league),
+                ).fetchone()
 
         if row is None:
             return TeamXG(
@@ -326,82 +395,39 @@ class FootballXGDatabase:
         return TeamXG(**dict(row)).normalized()
 
     def save_team(self, rating: TeamXG) -> None:
+        invalidate_rating_snapshot(self.db_file)
         self.init_db()
         rating = rating.normalized()
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO football_xg_ratings (
-                    team,
-                    league,
-                    attack_rating,
-                    defense_rating,
-                    rolling_xg_for_5,
-                    rolling_xga_5,
-                    rolling_xg_for_10,
-                    rolling_xga_10,
-                    home_xg_for,
-                    home_xga,
-                    away_xg_for,
-                    away_xga,
-                    matches,
-                    home_matches,
-                    away_matches,
-                    xg_for_sum,
-                    xga_sum,
-                    last_xg_for,
-                    last_xga,
-                    last_updated
-                )
-                VALUES (
-                    ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                )
-                ON CONFLICT(team, league) DO UPDATE SET
-                    attack_rating=excluded.attack_rating,
-                    defense_rating=excluded.defense_rating,
-                    rolling_xg_for_5=excluded.rolling_xg_for_5,
-                    rolling_xga_5=excluded.rolling_xga_5,
-                    rolling_xg_for_10=excluded.rolling_xg_for_10,
-                    rolling_xga_10=excluded.rolling_xga_10,
-                    home_xg_for=excluded.home_xg_for,
-                    home_xga=excluded.home_xga,
-                    away_xg_for=excluded.away_xg_for,
-                    away_xga=excluded.away_xga,
-                    matches=excluded.matches,
-                    home_matches=excluded.home_matches,
-                    away_matches=excluded.away_matches,
-                    xg_for_sum=excluded.xg_for_sum,
-                    xga_sum=excluded.xga_sum,
-                    last_xg_for=excluded.last_xg_for,
-                    last_xga=excluded.last_xga,
-                    last_updated=excluded.last_updated
-                """,
-                (
-                    rating.team,
-                    rating.league,
-                    rating.attack_rating,
-                    rating.defense_rating,
-                    rating.rolling_xg_for_5,
-                    rating.rolling_xga_5,
-                    rating.rolling_xg_for_10,
-                    rating.rolling_xga_10,
-                    rating.home_xg_for,
-                    rating.home_xga,
-                    rating.away_xg_for,
-                    rating.away_xga,
-                    rating.matches,
-                    rating.home_matches,
-                    rating.away_matches,
-                    rating.xg_for_sum,
-                    rating.xga_sum,
-                    rating.last_xg_for,
-                    rating.last_xga,
-                    rating.last_updated,
-                ),
-            )
+            conn.execute(XG_RATING_UPSERT_SQL, self.rating_row(rating))
             conn.commit()
 
+    @staticmethod
+    def rating_row(rating: TeamXG) -> tuple[Any, ...]:
+        return (
+            rating.team,
+            rating.league,
+            rating.attack_rating,
+            rating.defense_rating,
+            rating.rolling_xg_for_5,
+            rating.rolling_xga_5,
+            rating.rolling_xg_for_10,
+            rating.rolling_xga_10,
+            rating.home_xg_for,
+            rating.home_xga,
+            rating.away_xg_for,
+            rating.away_xga,
+            rating.matches,
+            rating.home_matches,
+            rating.away_matches,
+            rating.xg_for_sum,
+            rating.xga_sum,
+            rating.last_xg_for,
+            rating.last_xga,
+            rating.last_updated,
+        )
+
     def estimate_match(
         self,
         home_team: str,
@@ -568,6 +594,52 @@ class FootballXGDatabase:
         home = self.load_team(home_team, league)
         away = self.load_team(away_team, league)
 
+        history_row = self._apply_match(
+            home,
+            away,
+            league=league,
+            home_team=home_team,
+            away_team=away_team,
+            home_xg=home_xg,
+            away_xg=away_xg,
+            home_goals=home_goals,
+            away_goals=away_goals,
+            played_at=played_at,
+            source=source,
+            source_hash=source_hash,
+            learning_rate=learning_rate,
+            decay_5=decay_5,
+            decay_10=decay_10,
+        )
+
+        self.save_team(home)
+        self.save_team(away)
+
+        with self.connect() as conn:
+            conn.execute(XG_HISTORY_INSERT_SQL, history_row)
+            conn.commit()
+
+        return True
+
+    def _apply_match(
+        self,
+        home: TeamXG,
+        away: TeamXG,
+        *,
+        league: str,
+        home_team: str,
+        away_team: str,
+        home_xg: float,
+        away_xg: float,
+        home_goals: int | None,
+        away_goals: int | None,
+        played_at: str,
+        source: str,
+        source_hash: str | None,
+        learning_rate: float,
+        decay_5: float,
+        decay_10: float,
+    ) -> tuple[Any, ...]:
         league_baseline = DEFAULT_XG
 
         home_attack_observed = home_xg / league_baseline
@@ -659,44 +731,106 @@ class FootballXGDatabase:
         away.last_xga = home_xg
         away.last_updated = now_utc()
 
-        self.save_team(home)
-        self.save_team(away)
+        history_row = (
+            played_at,
+            league,
+            home_team,
+            away_team,
+            home_xg,
+            away_xg,
+            home_goals,
+            away_goals,
+            source,
+            source_hash,
+            now_utc(),
+        )
+
+        return history_row
+
+    def replay_matches(self, matches: Iterable[dict[str, Any]]) -> int:
+        """
+        Apply ``update_after_match`` keyword dicts in order with one read
+        of the ratings and one bulk write. Returns inserted matches.
+        """
+        self.init_db()
 
         with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO football_xg_history (
-                    played_at,
-                    league,
-                    home_team,
-                    away_team,
-                    home_xg,
-                    away_xg,
-                    home_goals,
-                    away_goals,
-                    source,
-                    source_hash,
-                    created_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    played_at,
-                    league,
-                    home_team,
-                    away_team,
-                    home_xg,
-                    away_xg,
-                    home_goals,
-                    away_goals,
-                    source,
-                    source_hash,
-                    now_utc(),
-                ),
+            replay = RatingReplay.from_db(
+                conn,
+                TeamXG,
+                ratings_table="football_xg_ratings",
+                history_table="football_xg_history",
             )
-            conn.commit()
 
-        return True
+            for match in matches:
+                source_hash = match.get("source_hash") or None
+
+                if replay.is_duplicate(source_hash):
+                    continue
+
+                league = str(match.get("league") or "UNKNOWN").strip() or "UNKNOWN"
+                home_team = normalize_team_name(match["home_team"])
+                away_team = normalize_team_name(match["away_team"])
+
+                home, away = replay.pair(home_team, away_team, league)
+
+                history_row = self._apply_match(
+                    home,
+                    away,
+                    league=league,
+                    home_team=home_team,
+                    away_team=away_team,
+                    home_xg=clamp(
+                        safe_float(match["home_xg"], DEFAULT_XG),
+                        0.0,
+                        8.0,
+                    ),
+                    away_xg=clamp(
+                        safe_float(match["away_xg"], DEFAULT_XG),
+                        0.0,
+                        8.0,
+                    ),
+                    home_goals=match.get("home_goals"),
+                    away_goals=match.get("away_goals"),
+                    played_at=match.get("played_at") or now_utc(),
+                    source=match.get("source", "manual"),
+                    source_hash=source_hash,
+                    learning_rate=clamp(
+                        safe_float(
+                            match.get("learning_rate", DEFAULT_LEARNING_RATE),
+                            DEFAULT_LEARNING_RATE,
+                        ),
+                        0.01,
+                        0.50,
+                    ),
+                    decay_5=clamp(
+                        safe_float(match.get("decay_5", 0.70), 0.70),
+                        0.40,
+                        0.95,
+                    ),
+                    decay_10=clamp(
+                        safe_float(
+                            match.get("decay_10", DEFAULT_DECAY),
+                            DEFAULT_DECAY,
+                        ),
+                        0.70,
+                        0.98,
+                    ),
+                )
+
+                replay.record(
+                    history_row,
+                    source_hash=source_hash,
+                    teams=(home, away),
+                )
+
+            return replay.write(
+                conn,
+                self.db_file,
+                ratings_sql=XG_RATING_UPSERT_SQL,
+                rating_row=self.rating_row,
+                history_sql=XG_HISTORY_INSERT_SQL,
+            )
 
     def export_json(self, path: str = "exports/football_xg_ratings.json") -> int:
         self.init_db()
@@ -0,0 +1,564 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import math
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from core.schema_registry import forget_schema, table_columns
+
+
+HISTORY_STATE_TABLE = "history_export_state"
+
+# History tables whose rows are only ever inserted (no UPDATE, DELETE or
+# upsert anywhere in the tree). Their CSVs can be extended by appending
+# rows past the last exported rowid; every other table is rewritten.
+APPEND_ONLY_HISTORY = frozenset({
+    "football_xg_history",
+    "football_elo_history",
+    "football_form_history",
+    "football_settlement_audit",
+    "football_team_elo_v14_history",
+    "football_market_closing",
+    "football_clv_audit",
+    "football_xg_history_v14",
+    "sport_context_features",
+})
+
+# Blank CSV cells restored as NULL even in TEXT columns, where an empty
+# string would otherwise be indistinguishable from "not set yet".
+BLANK_AS_NULL = {
+    "sport_bets": frozenset({
+        "closing_odds", "clv_pct", "settled_at", "external_event_id",
+        "home_goals", "away_goals", "final_score", "settlement_source",
+        "profit", "profit_units",
+        "opening_odds", "final_odds", "early_released_at",
+        "final_confirmed_at",
+    }),
+}
+
+STATE_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {HISTORY_STATE_TABLE} (
+        table_name TEXT PRIMARY KEY,
+        csv_file TEXT NOT NULL,
+        last_rowid INTEGER NOT NULL,
+        csv_size INTEGER NOT NULL,
+        exported_at TEXT NOT NULL
+    )
+"""
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def snapshot_enabled() -> bool:
+    return os.getenv("HISTORY_PERSISTENCE", "csv").strip().lower() == "sqlite"
+
+
+def snapshot_file() -> Path:
+    return Path(os.getenv(
+        "HISTORY_SNAPSHOT_FILE",
+        "exports/history_learning.sqlite.gz",
+    ))
+
+
+def _csv_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
+def _csv_header(path: Path) -> list[str]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _max_rowid(conn: sqlite3.Connection, table: str) -> int:
+    return int(conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0])
+
+
+def _record_export(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_file: Path,
+    last_rowid: int,
+) -> None:
+    conn.execute(
+        f"""
+        INSERT INTO {HISTORY_STATE_TABLE} (
+            table_name, csv_file, last_rowid, csv_size, exported_at
+        )
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(table_name) DO UPDATE SET
+            csv_file=excluded.csv_file,
+            last_rowid=excluded.last_rowid,
+            csv_size=excluded.csv_size,
+            exported_at=excluded.exported_at
+        """,
+        (table, str(csv_file), last_rowid, _csv_size(csv_file), now_utc()),
+    )
+
+
+def _export_state(
+    conn: sqlite3.Connection,
+    table: str,
+) -> Any:
+    if not table_columns(conn, HISTORY_STATE_TABLE):
+        return None
+
+    return conn.execute(
+        f"""
+        SELECT csv_file, last_rowid, csv_size
+        FROM {HISTORY_STATE_TABLE}
+        WHERE table_name=?
+        """,
+        (table,),
+    ).fetchone()
+
+
+def csv_matches_export(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_file: str | Path,
+) -> bool:
+    """True when ``csv_file`` is still exactly what the last export wrote."""
+    state = _export_state(conn, table)
+    path = Path(csv_file)
+
+    return (
+        state is not None
+        and state[0] == str(path)
+        and state[2] == _csv_size(path)
+    )
+
+
+def mark_history_imported(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_file: str | Path,
+) -> None:
+    """
+    Record that ``table`` holds exactly the rows of ``csv_file``.
+
+    Only valid right after importing the CSV into an empty table: the next
+    export of an append-only table then writes just the rows added since.
+    """
+    # Created on the caller's connection: it usually holds the import's
+    # write transaction, which a second connection would wait on.
+    conn.execute(STATE_SQL)
+    _record_export(conn, table, Path(csv_file), _max_rowid(conn, table))
+
+
+def export_history_table(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_file: str | Path,
+) -> int:
+    """
+    Write ``table`` to ``csv_file`` and return the number of rows written.
+
+    Append-only tables whose CSV is unchanged since the last export (same
+    size and header) only get the rows past the recorded rowid appended;
+    anything else is rewritten in full.
+    """
+    path = Path(csv_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn.execute(STATE_SQL)
+
+    columns = [
+        str(row[1])
+        for row in conn.execute(f"PRAGMA table_info({table})").fetchall()
+    ]
+    last_rowid = _max_rowid(conn, table)
+    state = _export_state(conn, table)
+
+    append_from = None
+    if (
+        table in APPEND_ONLY_HISTORY
+        and state is not None
+        and csv_matches_export(conn, table, path)
+        and _csv_header(path) == columns
+    ):
+        append_from = int(state[1])
+
+    if append_from is not None:
+        cursor = conn.execute(
+            f"SELECT * FROM {table} WHERE rowid > ? ORDER BY rowid",
+            (append_from,),
+        )
+        mode = "a"
+    else:
+        cursor = conn.execute(f"SELECT * FROM {table}")
+        mode = "w"
+
+    written = 0
+    with path.open(mode, encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+
+        if mode == "w":
+            writer.writerow(columns)
+
+        for row in cursor:
+            writer.writerow(row)
+            written += 1
+
+    _record_export(conn, table, path, last_rowid)
+    return written
+
+
+@dataclass
+class HistoryImportStats:
+    table: str
+    rows_read: int = 0
+    rows_inserted: int = 0
+    seconds: float = 0.0
+    peak_rss_mb: float | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.seconds if self.seconds > 0 else 0.0
+
+
+def import_chunk_rows() -> int:
+    try:
+        return max(1, int(os.getenv("HISTORY_IMPORT_CHUNK_ROWS", "5000")))
+    except ValueError:
+        return 5000
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process, or None where unsupported."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def column_affinity(declared_type: str) -> str:
+    """SQLite's type affinity rules for a declared column type."""
+    declared = str(declared_type or "").upper()
+
+    if "INT" in declared:
+        return "INTEGER"
+    if any(name in declared for name in ("CHAR", "CLOB", "TEXT")):
+        return "TEXT"
+    if not declared or "BLOB" in declared:
+        return "BLOB"
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB")):
+        return "REAL"
+    return "NUMERIC"
+
+
+def _parse_number(value: str, affinity: str) -> Any:
+    text = value.strip()
+
+    try:
+        if affinity != "REAL":
+            return int(text)
+    except ValueError:
+        pass
+
+    try:
+        number = float(text)
+    except ValueError:
+        return value
+
+    if not math.isfinite(number):
+        return value
+
+    if affinity != "REAL" and number.is_integer():
+        return int(number)
+
+    return number
+
+
+def _column_converter(
+    declared_type: str,
+    notnull: bool,
+    default: Any,
+    blank_as_null: bool,
+) -> Callable[[str], Any] | None:
+    """Cell converter for one column; None when the text is stored as is."""
+    affinity = column_affinity(declared_type)
+    numeric = affinity in ("INTEGER", "REAL", "NUMERIC")
+
+    if not numeric and not blank_as_null:
+        return None
+
+    if blank_as_null or not notnull:
+        blank: Any = None
+    elif numeric and default is not None:
+        # A NOT NULL numeric column falls back to its declared default.
+        blank = _parse_number(str(default), affinity)
+    else:
+        blank = ""
+
+    def convert(value: str) -> Any:
+        if not value.strip():
+            return blank
+        if numeric:
+            return _parse_number(value, affinity)
+        return value
+
+    return convert
+
+
+def import_history_csv(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_file: str | Path,
+    *,
+    chunk_rows: int | None = None,
+) -> HistoryImportStats:
+    """
+    Stream ``csv_file`` into ``table`` with ``INSERT OR IGNORE``.
+
+    Rows are read and inserted ``chunk_rows`` at a time (one transaction
+    per chunk), so memory stays flat whatever the file size. Cells are
+    converted to the column's declared type first: numbers are stored as
+    numbers and blank numeric cells as NULL instead of empty strings.
+    CSV columns the table does not have are skipped.
+
+    Importing into an empty table records the export watermark (see
+    ``mark_history_imported``).
+    """
+    path = Path(csv_file)
+    stats = HistoryImportStats(table=table)
+    started = time.perf_counter()
+    chunk_rows = chunk_rows or import_chunk_rows()
+    info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+
+    if not info or not path.exists():
+        return stats
+
+    was_empty = conn.execute(
+        f"SELECT 1 FROM {table} LIMIT 1"
+    ).fetchone() is None
+    declared = {str(row[1]): row for row in info}
+    blank_as_null = BLANK_AS_NULL.get(table, frozenset())
+    before = conn.total_changes
+
+    with path.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = [
+            index
+            for index, column in enumerate(header)
+            if column in declared
+        ]
+
+        if not positions:
+            return stats
+
+        columns = [header[index] for index in positions]
+        converters = [
+            _column_converter(
+                declared[column][2],
+                bool(declared[column][3]),
+                declared[column][4],
+                column in blank_as_null,
+            )
+            for column in columns
+        ]
+        sql = (
+            f"INSERT OR IGNORE INTO {table} ({','.join(columns)}) "
+            f"VALUES ({','.join('?' for _ in columns)})"
+        )
+        typed = [
+            (offset, convert)
+            for offset, convert in enumerate(converters)
+            if convert is not None
+        ]
+        width = len(header)
+        chunk: list[list[Any]] = []
+
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+
+            values = [row[index] for index in positions]
+            for offset, convert in typed:
+                values[offset] = convert(values[offset])
+            chunk.append(values)
+
+            if len(chunk) >= chunk_rows:
+                conn.executemany(sql, chunk)
+                conn.commit()
+                stats.rows_read += len(chunk)
+                chunk.clear()
+
+        if chunk:
+            conn.executemany(sql, chunk)
+            stats.rows_read += len(chunk)
+
+    stats.rows_inserted = conn.total_changes - before
+
+    if was_empty and stats.rows_read:
+        mark_history_imported(conn, table, path)
+
+    conn.commit()
+    stats.seconds = time.perf_counter() - started
+    stats.peak_rss_mb = peak_rss_mb()
+    return stats
+
+
+def save_history_snapshot(
+    db_file: str | Path,
+    tables: Iterable[str],
+    path: str | Path | None = None,
+) -> int:
+    """
+    Copy the learning tables into one gzip-compressed SQLite file.
+
+    Uses the online backup API, so rows still in the WAL are included and
+    writers are not blocked; other tables are dropped from the copy before
+    it is vacuumed and compressed. Returns the number of tables kept.
+    """
+    target = Path(path) if path is not None else snapshot_file()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    keep = set(tables) | {HISTORY_STATE_TABLE, "sqlite_sequence"}
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        copy_file = Path(temp_dir) / "history.sqlite"
+
+        source = sqlite3.connect(db_file)
+        copy = sqlite3.connect(copy_file)
+        try:
+            source.backup(copy)
+            names = [
+                str(row[0])
+                for row in copy.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                ).fetchall()
+            ]
+            for name in names:
+                if name not in keep:
+                    copy.execute(f'DROP TABLE IF EXISTS "{name}"')
+            copy.commit()
+            copy.execute("VACUUM")
+        finally:
+            copy.close()
+            source.close()
+
+        partial = target.with_name(target.name + ".tmp")
+        with copy_file.open("rb") as src, gzip.open(partial, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.replace(partial, target)
+
+    return len([name for name in names if name in keep and name != "sqlite_sequence"])
+
+
+def _has_learning_rows(db_file: Path, tables: Iterable[str]) -> bool:
+    if not db_file.exists():
+        return False
+
+    with sqlite3.connect(db_file) as conn:
+        for table in tables:
+            if table_columns(conn, table) and conn.execute(
+                f"SELECT 1 FROM {table} LIMIT 1"
+            ).fetchone() is not None:
+                return True
+
+    return False
+
+
+def restore_history_snapshot(
+    db_file: str | Path,
+    tables: Iterable[str],
+    path: str | Path | None = None,
+) -> int:
+    """
+    Restore the learning tables from ``save_history_snapshot`` output.
+
+    A database without learning rows (a fresh runner) is replaced by the
+    decompressed snapshot, a single file copy. Otherwise the snapshot is
+    attached and merged with ``INSERT OR IGNORE``. Returns the number of
+    rows now present (copy) or inserted (merge); 0 without a snapshot.
+    """
+    source = Path(path) if path is not None else snapshot_file()
+    database = Path(db_file)
+    tables = list(tables)
+
+    if not source.exists():
+        return 0
+
+    database.parent.mkdir(parents=True, exist_ok=True)
+
+    if not _has_learning_rows(database, tables):
+        partial = database.with_name(database.name + ".restore")
+        with gzip.open(source, "rb") as src, partial.open("wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+        for suffix in ("-wal", "-shm"):
+            Path(f"{database}{suffix}").unlink(missing_ok=True)
+
+        os.replace(partial, database)
+        forget_schema(database)
+
+        with sqlite3.connect(database) as conn:
+            return sum(
+                int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+                for table in tables
+                if table_columns(conn, table)
+            )
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        snapshot = Path(temp_dir) / "history.sqlite"
+        with gzip.open(source, "rb") as src, snapshot.open("wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+        conn = sqlite3.connect(database)
+        try:
+            conn.execute("ATTACH DATABASE ? AS history", (str(snapshot),))
+            before = conn.total_changes
+
+            for table in tables:
+                snapshot_columns = {
+                    str(row[1])
+                    for row in conn.execute(
+                        f"PRAGMA history.table_info({table})"
+                    ).fetchall()
+                }
+                shared = [
+                    column
+                    for column in table_columns(conn, table)
+                    if column in snapshot_columns
+                ]
+                if not shared:
+                    continue
+
+                column_sql = ", ".join(f'"{column}"' for column in shared)
+                conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO main.{table} ({column_sql})
+                    SELECT {column_sql} FROM history.{table}
+                    """
+                )
+
+            conn.commit()
+            inserted = conn.total_changes - before
+            conn.execute("DETACH DATABASE history")
+        finally:
+            conn.close()
+
+    return inserted
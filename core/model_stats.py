@@ -62,6 +62,11 @@ def save_model_stats(
         encoding="utf-8",
     )
 
+    # Imported here: the provider itself reads through this module.
+    from core.weight_provider import get_weight_provider
+
+    get_weight_provider().invalidate_model_stats()
+
 
 def load_model_stats() -> dict:
     if not MODEL_STATS_FILE.exists():
@@ -4,6 +4,13 @@ import math
 import os
 import random
 from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # bez numpy beží rovnaký výpočet v čistom Pythone
+    np = None
 
 
 @dataclass(frozen=True)
@@ -21,6 +28,39 @@ class MonteCarloResult:
     risk_score: int
 
 
+@dataclass(frozen=True)
+class SlateSimulationResult:
+    simulations: int
+    correlation: float
+    total_stake: float
+    bets: tuple[MonteCarloResult, ...]
+    expected_profit: float
+    expected_roi_pct: float
+    standard_deviation: float
+    profit_ci_low: float
+    profit_ci_high: float
+    probability_of_profit: float
+    probability_of_loss: float
+    risk_score: int
+
+
+@dataclass(frozen=True)
+class BankrollSimulationResult:
+    paths: int
+    bets: int
+    start_bank: float
+    stake_pct: float
+    median_final: float
+    p05_final: float
+    p95_final: float
+    probability_of_ruin: float
+    median_max_drawdown: float
+
+
+# Najviac hodnôt v jednom numpy bloku bankroll simulácie (~8 MB na pole).
+BANKROLL_BLOCK_CELLS = 1_000_000
+
+
 def clamp(
     value: float,
     low: float = 0.0,
@@ -89,72 +129,80 @@ def _risk_score(
     return int(round(max(1.0, min(100.0, score))))
 
 
-def simulate_single_bet(
-    probability: float,
-    odds: float,
-    simulations: int | None = None,
-    seed: int | None = None,
-) -> MonteCarloResult:
-    """
-    Simuluje rovnaký tip veľakrát so stake 1 jednotka.
+def _simulation_count(simulations: int | None) -> int:
+    if simulations is None:
+        simulations = _safe_int(
+            os.getenv("MONTE_CARLO_SIMULATIONS", "10000"),
+            10_000,
+        )
 
-    Pri výhre:
-        profit = odds - 1
+    return max(1_000, min(int(simulations), 100_000))
 
-    Pri prehre:
-        profit = -1
-    """
 
-    probability = clamp(_safe_float(probability, 0.0), 0.001, 0.999)
+def _validate_odds(odds: float) -> float:
     odds = _safe_float(odds, 0.0)
 
     if odds <= 1.0:
         raise ValueError("Odds must be greater than 1.0.")
 
-    if simulations is None:
-        simulations = _safe_int(
-            os.getenv("MONTE_CARLO_SIMULATIONS", "10000"),
-            10_000,
-        )
+    return odds
+
+
+def _two_point_percentile(
+    losses: int,
+    simulations: int,
+    win_profit: float,
+    percentile: float,
+) -> float:
+    """
+    Percentil zoradených výsledkov [-1] * losses + [win_profit] * wins
+    bez ich vytvorenia (rovnaká interpolácia ako _percentile).
+    """
 
-    simulations = max(1_000, min(int(simulations), 100_000))
+    position = (simulations - 1) * clamp(percentile, 0.0, 1.0)
+    lower_index = math.floor(position)
+    upper_index = math.ceil(position)
 
-    rng = random.Random(seed)
+    lower_value = -1.0 if lower_index < losses else win_profit
+    upper_value = -1.0 if upper_index < losses else win_profit
 
-    profits: list[float] = []
-    wins = 0
+    if lower_index == upper_index:
+        return lower_value
 
-    win_profit = odds - 1.0
+    fraction = position - lower_index
+
+    return lower_value + (upper_value - lower_value) * fraction
 
-    for _ in range(simulations):
-        if rng.random() < probability:
-            wins += 1
-            profits.append(win_profit)
-        else:
-            profits.append(-1.0)
+
+def _result_from_wins(
+    probability: float,
+    odds: float,
+    simulations: int,
+    wins: int,
+) -> MonteCarloResult:
+    """
+    Tip so stake 1 má iba dva výsledky (odds - 1 alebo -1), takže všetky
+    štatistiky simulácie vyplývajú z počtu výhier.
+    """
+
+    losses = simulations - wins
+    win_profit = odds - 1.0
 
     simulated_win_probability = wins / simulations
-    expected_profit = sum(profits) / simulations
+    expected_profit = (wins * win_profit - losses) / simulations
     expected_roi_pct = expected_profit * 100.0
 
+    # Rozptyl dvojbodového rozdelenia: q * (1 - q) * (rozdiel hodnôt)^2.
     variance = (
-        sum(
-            (profit - expected_profit) ** 2
-            for profit in profits
-        )
-        / simulations
+        simulated_win_probability
+        * (1.0 - simulated_win_probability)
+        * odds
+        * odds
     )
-
     standard_deviation = math.sqrt(max(variance, 0.0))
 
-    profit_ci_low = _percentile(profits, 0.025)
-    profit_ci_high = _percentile(profits, 0.975)
-
-    profitable_results = sum(1 for profit in profits if profit > 0)
-    losing_results = sum(1 for profit in profits if profit < 0)
-
-    probability_of_profit = profitable_results / simulations
-    probability_of_loss = losing_results / simulations
+    probability_of_profit = wins / simulations
+    probability_of_loss = losses / simulations
 
     risk_score = _risk_score(
         probability_of_loss=probability_of_loss,
@@ -172,14 +220,298 @@ def simulate_single_bet(
         expected_profit_per_unit=round(expected_profit, 6),
         expected_roi_pct=round(expected_roi_pct, 4),
         standard_deviation=round(standard_deviation, 6),
-        profit_ci_low=round(profit_ci_low, 4),
-        profit_ci_high=round(profit_ci_high, 4),
+        profit_ci_low=round(
+            _two_point_percentile(losses, simulations, win_profit, 0.025),
+            4,
+        ),
+        profit_ci_high=round(
+            _two_point_percentile(losses, simulations, win_profit, 0.975),
+            4,
+        ),
         probability_of_profit=round(probability_of_profit, 6),
         probability_of_loss=round(probability_of_loss, 6),
         risk_score=risk_score,
     )
 
 
+def _draw_wins(
+    probability: float,
+    simulations: int,
+    seed: int | None,
+) -> int:
+    if np is not None:
+        # Súčet nezávislých Bernoulliho pokusov je jeden binomický ťah.
+        rng = np.random.default_rng(seed)
+        return int(rng.binomial(simulations, probability))
+
+    # Rovnaký prúd random.Random ako pôvodná slučka, takže výsledky
+    # pre daný seed sa bez numpy nemenia.
+    draw = random.Random(seed).random
+
+    return sum(1 for _ in range(simulations) if draw() < probability)
+
+
+def simulate_single_bet(
+    probability: float,
+    odds: float,
+    simulations: int | None = None,
+    seed: int | None = None,
+) -> MonteCarloResult:
+    """
+    Simuluje rovnaký tip veľakrát so stake 1 jednotka.
+
+    Pri výhre:
+        profit = odds - 1
+
+    Pri prehre:
+        profit = -1
+    """
+
+    probability = clamp(_safe_float(probability, 0.0), 0.001, 0.999)
+    odds = _validate_odds(odds)
+    simulations = _simulation_count(simulations)
+
+    wins = _draw_wins(probability, simulations, seed)
+
+    return _result_from_wins(probability, odds, simulations, wins)
+
+
+def _slate_inputs(
+    probabilities: Sequence[float],
+    odds: Sequence[float],
+    stakes: Sequence[float] | None,
+) -> tuple[list[float], list[float], list[float]]:
+    if len(probabilities) != len(odds):
+        raise ValueError("Probabilities and odds must have the same length.")
+
+    if stakes is None:
+        stakes = [1.0] * len(odds)
+    elif len(stakes) != len(odds):
+        raise ValueError("Stakes and odds must have the same length.")
+
+    return (
+        [clamp(_safe_float(value, 0.0), 0.001, 0.999) for value in probabilities],
+        [_validate_odds(value) for value in odds],
+        [max(0.0, _safe_float(value, 0.0)) for value in stakes],
+    )
+
+
+def simulate_slate(
+    probabilities: Sequence[float],
+    odds: Sequence[float],
+    stakes: Sequence[float] | None = None,
+    correlation: float = 0.0,
+    simulations: int | None = None,
+    seed: int | None = None,
+) -> SlateSimulationResult:
+    """
+    Simuluje celý tiket tipov naraz (singles, nie AKO).
+
+    Korelácia je spoločný faktor gaussovskej kopuly: tip i vyhrá, keď
+    sqrt(rho) * M + sqrt(1 - rho) * e_i < Phi^-1(p_i). Pravdepodobnosť
+    výhry každého tipu zostáva p_i, mení sa iba rozptyl celkového profitu.
+    """
+
+    probabilities, odds, stakes = _slate_inputs(probabilities, odds, stakes)
+    simulations = _simulation_count(simulations)
+    correlation = clamp(_safe_float(correlation, 0.0), 0.0, 0.999)
+
+    count = len(odds)
+    total_stake = sum(stakes)
+
+    if count == 0 or total_stake <= 0:
+        raise ValueError("Slate needs at least one bet with a positive stake.")
+
+    normal = NormalDist()
+    thresholds = [normal.inv_cdf(value) for value in probabilities]
+    shared = math.sqrt(correlation)
+    own = math.sqrt(1.0 - correlation)
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        latent = (
+            shared * rng.standard_normal((simulations, 1))
+            + own * rng.standard_normal((simulations, count))
+        )
+        won = latent < np.asarray(thresholds)
+        stake_array = np.asarray(stakes)
+        profits = np.where(
+            won,
+            stake_array * (np.asarray(odds) - 1.0),
+            -stake_array,
+        )
+        totals = profits.sum(axis=1)
+
+        wins = [int(value) for value in won.sum(axis=0)]
+        expected_profit = float(totals.mean())
+        standard_deviation = float(totals.std())
+        ci_low, ci_high = (
+            float(value) for value in np.percentile(totals, [2.5, 97.5])
+        )
+        probability_of_profit = float((totals > 0).mean())
+        probability_of_loss = float((totals < 0).mean())
+    else:
+        rng = random.Random(seed)
+        gauss = rng.gauss
+        wins = [0] * count
+        totals_list: list[float] = []
+
+        for _ in range(simulations):
+            common = shared * gauss(0.0, 1.0)
+            total = 0.0
+
+            for index in range(count):
+                if common + own * gauss(0.0, 1.0) < thresholds[index]:
+                    wins[index] += 1
+                    total += stakes[index] * (odds[index] - 1.0)
+                else:
+                    total -= stakes[index]
+
+            totals_list.append(total)
+
+        expected_profit = sum(totals_list) / simulations
+        variance = (
+            sum((total - expected_profit) ** 2 for total in totals_list)
+            / simulations
+        )
+        standard_deviation = math.sqrt(max(variance, 0.0))
+        ci_low = _percentile(totals_list, 0.025)
+        ci_high = _percentile(totals_list, 0.975)
+        probability_of_profit = (
+            sum(1 for total in totals_list if total > 0) / simulations
+        )
+        probability_of_loss = (
+            sum(1 for total in totals_list if total < 0) / simulations
+        )
+
+    expected_roi_pct = expected_profit / total_stake * 100.0
+
+    return SlateSimulationResult(
+        simulations=simulations,
+        correlation=round(correlation, 6),
+        total_stake=round(total_stake, 6),
+        bets=tuple(
+            _result_from_wins(probability, price, simulations, won_count)
+            for probability, price, won_count in zip(probabilities, odds, wins)
+        ),
+        expected_profit=round(expected_profit, 6),
+        expected_roi_pct=round(expected_roi_pct, 4),
+        standard_deviation=round(standard_deviation, 6),
+        profit_ci_low=round(ci_low, 4),
+        profit_ci_high=round(ci_high, 4),
+        probability_of_profit=round(probability_of_profit, 6),
+        probability_of_loss=round(probability_of_loss, 6),
+        risk_score=_risk_score(
+            probability_of_loss=probability_of_loss,
+            expected_roi_pct=expected_roi_pct,
+            standard_deviation=standard_deviation / total_stake,
+        ),
+    )
+
+
+def simulate_bankroll_paths(
+    probabilities: Sequence[float],
+    odds: Sequence[float],
+    stake_pct: float = 0.02,
+    paths: int | None = None,
+    start_bank: float = 100.0,
+    ruin_pct: float = 0.5,
+    seed: int | None = None,
+) -> BankrollSimulationResult:
+    """
+    Simuluje bankroll cez postupnosť tipov, stake = stake_pct * aktuálny bank.
+
+    Tip násobí bank (1 + stake_pct * (odds - 1)) pri výhre a
+    (1 - stake_pct) pri prehre, takže cesta je kumulatívny súčin.
+    Ruin = bank aspoň raz klesne na start_bank * ruin_pct.
+    """
+
+    probabilities, odds, _ = _slate_inputs(probabilities, odds, None)
+    paths = _simulation_count(paths)
+    stake_pct = clamp(_safe_float(stake_pct, 0.0), 0.0, 1.0)
+    start_bank = max(0.0, _safe_float(start_bank, 0.0))
+    ruin_level = start_bank * clamp(_safe_float(ruin_pct, 0.0), 0.0, 1.0)
+    bets = len(odds)
+
+    if bets == 0:
+        raise ValueError("Bankroll simulation needs at least one bet.")
+
+    win_factors = [1.0 + stake_pct * (price - 1.0) for price in odds]
+    loss_factor = 1.0 - stake_pct
+
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        probability_array = np.asarray(probabilities)
+        win_array = np.asarray(win_factors)
+        block = max(1, BANKROLL_BLOCK_CELLS // bets)
+
+        finals_parts = []
+        drawdown_parts = []
+        ruined = 0
+
+        for first in range(0, paths, block):
+            rows = min(block, paths - first)
+            won = rng.random((rows, bets)) < probability_array
+            banks = start_bank * np.cumprod(
+                np.where(won, win_array, loss_factor),
+                axis=1,
+            )
+            peaks = np.maximum(
+                np.maximum.accumulate(banks, axis=1),
+                start_bank,
+            )
+
+            finals_parts.append(banks[:, -1])
+            drawdown_parts.append((peaks - banks).max(axis=1))
+            ruined += int((banks.min(axis=1) <= ruin_level).sum())
+
+        finals = np.concatenate(finals_parts)
+        p05_final, median_final, p95_final = (
+            float(value) for value in np.percentile(finals, [5, 50, 95])
+        )
+        median_max_drawdown = float(
+            np.percentile(np.concatenate(drawdown_parts), 50)
+        )
+    else:
+        draw = random.Random(seed).random
+        finals_list: list[float] = []
+        drawdowns: list[float] = []
+        ruined = 0
+
+        for _ in range(paths):
+            bank = start_bank
+            peak = start_bank
+            max_drawdown = 0.0
+            path_ruined = False
+
+            for probability, win_factor in zip(probabilities, win_factors):
+                bank *= win_factor if draw() < probability else loss_factor
+                peak = max(peak, bank)
+                max_drawdown = max(max_drawdown, peak - bank)
+                path_ruined = path_ruined or bank <= ruin_level
+
+            ruined += path_ruined
+            finals_list.append(bank)
+            drawdowns.append(max_drawdown)
+
+        p05_final = _percentile(finals_list, 0.05)
+        median_final = _percentile(finals_list, 0.50)
+        p95_final = _percentile(finals_list, 0.95)
+        median_max_drawdown = _percentile(drawdowns, 0.50)
+
+    return BankrollSimulationResult(
+        paths=paths,
+        bets=bets,
+        start_bank=round(start_bank, 4),
+        stake_pct=round(stake_pct, 6),
+        median_final=round(median_final, 4),
+        p05_final=round(p05_final, 4),
+        p95_final=round(p95_final, 4),
+        probability_of_ruin=round(ruined / paths, 6),
+        median_max_drawdown=round(median_max_drawdown, 4),
+    )
+
+
 def monte_carlo_score(result: MonteCarloResult) -> float:
     """
     Doplnkové skóre 0–100.
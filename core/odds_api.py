@@ -1,22 +1,297 @@
 from __future__ import annotations
 
+import asyncio
 import aiohttp
+import json
 import logging
+import os
+import random
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Iterable
 
 log = logging.getLogger("odds-api")
 
+ODDS_API_BASE_URL = "https://api.the-odds-api.com/v4"
 
-async def fetch_odds(
+# Transient statuses retried with jittered backoff; others fail at once.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF_SECONDS = 0.5
+RETRY_BACKOFF_CAP_SECONDS = 8.0
+
+
+class OddsApiError(RuntimeError):
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        body: str = "",
+        retry_after: float = 0.0,
+    ):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+@dataclass
+class OddsApiStats:
+    requests: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    failures: int = 0
+    quota_used: int = 0
+    quota_remaining: int | None = None
+
+
+def odds_api_concurrency() -> int:
+    try:
+        value = int(os.getenv("ODDS_API_CONCURRENCY", "6"))
+    except ValueError:
+        value = 6
+    return max(1, value)
+
+
+def create_odds_session(limit_per_host: int | None = None) -> aiohttp.ClientSession:
+    """Pooled keep-alive session shared by every sport key of one scan."""
+    limit = limit_per_host or odds_api_concurrency()
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def odds_api_retries() -> int:
+    try:
+        value = int(os.getenv("ODDS_API_RETRIES", "2"))
+    except ValueError:
+        value = 2
+    return max(0, value)
+
+
+def odds_api_cache_ttl() -> float:
+    """ODDS_API_CACHE_TTL_SECONDS for /sports and /scores (0 disables the cache)."""
+    try:
+        value = float(os.getenv("ODDS_API_CACHE_TTL_SECONDS", "300"))
+    except ValueError:
+        value = 300.0
+    return max(0.0, value)
+
+
+RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+# Response bodies, not parsed objects: every caller decodes its own copy.
+_CACHE: dict[RequestKey, tuple[float, str]] = {}
+_STATS = OddsApiStats()
+_CLIENT: "OddsApiClient | None" = None
+
+
+class OddsApiClient:
+    """
+    One pooled session per event loop for every Odds API endpoint.
+
+    Identical requests already in flight are joined instead of sent again,
+    transient failures are retried with full-jitter backoff, and responses
+    requested with a ``ttl`` are reused until it expires. Quota headers are
+    recorded in the shared stats.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str | None = None,
+        limit: int | None = None,
+        retries: int | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.base_url = (base_url or ODDS_API_BASE_URL).rstrip("/")
+        self.limit = limit or odds_api_concurrency()
+        self.retries = odds_api_retries() if retries is None else max(0, retries)
+        self.timeout = timeout
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._in_flight: dict[RequestKey, asyncio.Future[str]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = create_odds_session(self.limit)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def get_json(self, path: str, params: dict[str, Any], *, ttl: float = 0.0) -> Any:
+        return json.loads(await self.get_text(path, params, ttl=ttl))
+
+    async def get_text(self, path: str, params: dict[str, Any], *, ttl: float = 0.0) -> str:
+        key: RequestKey = (path, tuple(sorted((str(k), str(v)) for k, v in params.items())))
+
+        cached = _CACHE.get(key)
+        if ttl > 0 and cached is not None and cached[0] > time.monotonic():
+            _STATS.cache_hits += 1
+            return cached[1]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            _STATS.coalesced += 1
+            # A cancelled joiner must not cancel the request others wait on.
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        try:
+            text = await self._fetch(path, params)
+        except asyncio.CancelledError:
+            # The cancellation belongs to this caller only; joiners get an
+            # ordinary request failure they already handle.
+            future.set_exception(
+                OddsApiError(f"Odds API request for {path} was cancelled")
+            )
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark it retrieved; the caller below re-raises it anyway.
+            future.exception()
+            raise
+        else:
+            future.set_result(text)
+            if ttl > 0:
+                _CACHE[key] = (time.monotonic() + ttl, text)
+            return text
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def _fetch(self, path: str, params: dict[str, Any]) -> str:
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        error = OddsApiError(f"Odds API request failed for {path}")
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                _STATS.retries += 1
+                delay = random.uniform(
+                    0.0,
+                    min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_SECONDS * 2 ** attempt),
+                )
+                await asyncio.sleep(max(delay, min(RETRY_BACKOFF_CAP_SECONDS, error.retry_after)))
+
+            _STATS.requests += 1
+            try:
+                async with self._get_session().get(
+                    url,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as resp:
+                    _record_quota(resp.headers)
+                    body = await resp.text()
+                    if resp.status == 200:
+                        return body
+                    error = OddsApiError(
+                        f"Odds API {resp.status} for {path}",
+                        status=resp.status,
+                        body=body,
+                        retry_after=_retry_after(resp.headers.get("Retry-After")),
+                    )
+                    if resp.status not in RETRY_STATUSES:
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                error = OddsApiError(f"Odds API request failed for {path}: {exc}")
+
+        _STATS.failures += 1
+        raise error
+
+
+def _retry_after(value: str | None) -> float:
+    try:
+        return max(0.0, float(value or 0))
+    except ValueError:
+        return 0.0
+
+
+def _record_quota(headers: Any) -> None:
+    try:
+        _STATS.quota_used += int(headers.get("x-requests-last") or 0)
+    except ValueError:
+        pass
+    try:
+        _STATS.quota_remaining = int(float(headers["x-requests-remaining"]))
+    except (KeyError, TypeError, ValueError):
+        pass
+
+
+def odds_api_client() -> OddsApiClient:
+    """The shared client of the running event loop."""
+    global _CLIENT
+
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.loop is not loop:
+        _CLIENT = OddsApiClient()
+        _CLIENT.loop = loop
+    return _CLIENT
+
+
+async def close_odds_api_client() -> None:
+    global _CLIENT
+
+    if _CLIENT is not None and _CLIENT.loop is asyncio.get_running_loop():
+        await _CLIENT.close()
+        _CLIENT = None
+
+
+def odds_api_counters() -> dict[str, Any]:
+    return {
+        **asdict(_STATS),
+        "requests_saved": _STATS.cache_hits + _STATS.coalesced,
+        "cached_responses": len(_CACHE),
+    }
+
+
+def clear_odds_api_cache() -> None:
+    global _STATS
+
+    _CACHE.clear()
+    _STATS = OddsApiStats()
+
+
+async def fetch_sports(api_key: str) -> list[dict]:
+    """The /sports list, fetched once per cache TTL however many modules ask."""
+    data = await odds_api_client().get_json(
+        "sports/",
+        {"apiKey": api_key},
+        ttl=odds_api_cache_ttl(),
+    )
+    return data if isinstance(data, list) else []
+
+
+async def fetch_scores(api_key: str, sport_key: str, days_from: int = 3) -> list[dict]:
+    """Scores of one sport key; raises OddsApiError when the request fails."""
+    data = await odds_api_client().get_json(
+        f"sports/{sport_key}/scores/",
+        {
+            "apiKey": api_key,
+            "daysFrom": max(1, min(int(days_from), 3)),
+            "dateFormat": "iso",
+        },
+        ttl=odds_api_cache_ttl(),
+    )
+    return data if isinstance(data, list) else []
+
+
+async def _get_odds(
+    session: aiohttp.ClientSession,
     api_key: str,
     sport_key: str,
-    markets: str = "h2h",
-    regions: str = "eu",
+    markets: str,
+    regions: str,
 ) -> list[dict]:
-    if not api_key:
-        log.warning("Missing ODDS_API_KEY.")
-        return []
-
-    url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/odds/"
+    url = f"{ODDS_API_BASE_URL}/sports/{sport_key}/odds/"
     params = {
         "apiKey": api_key,
         "regions": regions,
@@ -24,14 +299,106 @@ async def fetch_odds(
         "oddsFormat": "decimal",
     }
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, params=params, timeout=30) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    log.warning("Odds API %s for %s: %s", resp.status, sport_key, body[:300])
-                    return []
-                return await resp.json()
-        except Exception as e:
+    try:
+        async with session.get(url, params=params, timeout=30) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                log.warning("Odds API %s for %s: %s", resp.status, sport_key, body[:300])
+                return []
+            return await resp.json()
+    except Exception as e:
+        log.warning("Odds API error for %s: %s", sport_key, e)
+        return []
+
+
+async def _get_odds_shared(
+    api_key: str,
+    sport_key: str,
+    markets: str,
+    regions: str,
+) -> list[dict]:
+    """Odds through the shared client: joined when in flight, never cached."""
+    try:
+        return await odds_api_client().get_json(
+            f"sports/{sport_key}/odds/",
+            {
+                "apiKey": api_key,
+                "regions": regions,
+                "markets": markets,
+                "oddsFormat": "decimal",
+            },
+        )
+    except OddsApiError as e:
+        if e.status is not None:
+            log.warning("Odds API %s for %s: %s", e.status, sport_key, e.body[:300])
+        else:
             log.warning("Odds API error for %s: %s", sport_key, e)
-            return []
+        return []
+    except Exception as e:
+        log.warning("Odds API error for %s: %s", sport_key, e)
+        return []
+
+
+async def fetch_odds(
+    api_key: str,
+    sport_key: str,
+    markets: str = "h2h",
+    regions: str = "eu",
+    session: aiohttp.ClientSession | None = None,
+) -> list[dict]:
+    if not api_key:
+        log.warning("Missing ODDS_API_KEY.")
+        return []
+
+    if session is not None:
+        return await _get_odds(session, api_key, sport_key, markets, regions)
+
+    return await _get_odds_shared(api_key, sport_key, markets, regions)
+
+
+async def fetch_odds_many(
+    api_key: str,
+    sport_keys: Iterable[str],
+    markets: str = "h2h",
+    regions: str = "eu",
+    concurrency: int | None = None,
+) -> AsyncIterator[tuple[str, list[dict]]]:
+    """
+    Fetch all sport keys concurrently over the shared pooled client.
+
+    Payloads are yielded as ``(sport_key, data)`` in completion order, so
+    the caller's per-event loop starts on the first league that arrives.
+    Keys that fail or return nothing are skipped, like ``fetch_odds``.
+    """
+    keys = list(dict.fromkeys(
+        str(key).strip()
+        for key in sport_keys
+        if str(key).strip()
+    ))
+
+    if not keys:
+        return
+
+    if not api_key:
+        log.warning("Missing ODDS_API_KEY.")
+        return
+
+    limit = concurrency or odds_api_concurrency()
+    semaphore = asyncio.Semaphore(limit)
+
+    async def fetch_one(sport_key: str) -> tuple[str, list[dict]]:
+        async with semaphore:
+            data = await _get_odds_shared(api_key, sport_key, markets, regions)
+        return sport_key, data
+
+    tasks = [asyncio.ensure_future(fetch_one(key)) for key in keys]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            sport_key, data = await next_done
+            if data:
+                yield sport_key, data
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
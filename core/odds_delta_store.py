@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+# Values of the five key columns, e.g. (sport_key, event, bookmaker,
+# market, selection).
+PriceKey = tuple[Any, ...]
+
+_STORES: dict[tuple[Any, ...], "OddsDeltaStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def changes_only_enabled() -> bool:
+    return os.getenv("SNAPSHOT_CHANGES_ONLY", "1") == "1"
+
+
+def lookback_days() -> int:
+    try:
+        return max(1, int(os.getenv("SNAPSHOT_CHANGES_LOOKBACK_DAYS", "14")))
+    except ValueError:
+        return 14
+
+
+class OddsDeltaStore:
+    """
+    Last known price per key of one snapshot table.
+
+    A snapshot table fed through this store only receives a row when a
+    price appears or moves, so a series is a list of change points: the
+    price at time T is the last row captured at or before T. Per bookmaker,
+    opening and latest prices read as they did from full per-scan copies.
+    Across bookmakers they do not: the newest row is the price of the
+    bookmaker that moved last, not the last row of the latest scan.
+
+    Last prices are kept in memory for the process. They are seeded from
+    the table itself (newest row per key captured within
+    ``SNAPSHOT_CHANGES_LOOKBACK_DAYS``), so no separate state has to be
+    written or kept in sync with the snapshots. A database that starts
+    empty every run gains nothing: its first scan writes every row. The
+    savings are for long-lived databases only; the CI runner rebuilds
+    ``bets.db`` per run and does not restore these tables.
+    """
+
+    def __init__(
+        self,
+        db_file: str | Path,
+        table: str,
+        *,
+        key_columns: tuple[str, ...],
+        scope: tuple[str, Any] | None = None,
+    ) -> None:
+        self.db_file = Path(db_file)
+        self.table = table
+        self.key_columns = key_columns
+        self.scope = scope
+        self._prices: dict[PriceKey, float] | None = None
+        self._lock = threading.Lock()
+        self.seen = 0
+        self.changed = 0
+
+    def _load(self) -> dict[PriceKey, float]:
+        since = (
+            datetime.now(timezone.utc)
+            - timedelta(days=lookback_days())
+        ).isoformat(timespec="seconds")
+        keys = ", ".join(self.key_columns)
+        scope_sql = ""
+        params: list[Any] = [since]
+
+        if self.scope is not None:
+            scope_sql = f" AND {self.scope[0]}=?"
+            params.append(self.scope[1])
+
+        with sqlite3.connect(self.db_file) as conn:
+            if conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?",
+                (self.table,),
+            ).fetchone() is None:
+                return {}
+
+            # SQLite returns the bare ``odds`` of the MAX(captured_at) row.
+            rows = conn.execute(
+                f"""
+                SELECT {keys}, odds, MAX(captured_at)
+                FROM {self.table}
+                WHERE captured_at >= ?{scope_sql}
+                GROUP BY {keys}
+                """,
+                params,
+            ).fetchall()
+
+        width = len(self.key_columns)
+        return {tuple(row[:width]): float(row[width]) for row in rows}
+
+    def filter_changed(
+        self,
+        rows: Iterable[tuple[Any, ...]],
+        *,
+        key: Callable[[tuple[Any, ...]], PriceKey],
+        odds: Callable[[tuple[Any, ...]], float],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Rows whose price is new or moved since the last one kept.
+
+        The remembered prices are updated immediately, so the caller must
+        write every returned row (or call ``forget`` if the write fails).
+        """
+        changed: list[tuple[Any, ...]] = []
+
+        with self._lock:
+            if self._prices is None:
+                self._prices = self._load()
+
+            for row in rows:
+                price_key = key(row)
+                price = float(odds(row))
+                self.seen += 1
+
+                if self._prices.get(price_key) == price:
+                    continue
+
+                self._prices[price_key] = price
+                self.changed += 1
+                changed.append(row)
+
+        return changed
+
+    def forget(self) -> None:
+        """Drop remembered prices; the next call reloads from the table."""
+        with self._lock:
+            self._prices = None
+
+
+def get_odds_delta_store(
+    db_file: str | Path,
+    table: str,
+    *,
+    key_columns: tuple[str, ...],
+    scope: tuple[str, Any] | None = None,
+) -> OddsDeltaStore:
+    cache_key = (str(Path(db_file).resolve()), table, scope)
+
+    with _STORES_LOCK:
+        store = _STORES.get(cache_key)
+
+        if store is None:
+            store = OddsDeltaStore(
+                db_file,
+                table,
+                key_columns=key_columns,
+                scope=scope,
+            )
+            _STORES[cache_key] = store
+
+        return store
+
+
+def clear_odds_delta_stores() -> None:
+    with _STORES_LOCK:
+        _STORES.clear()
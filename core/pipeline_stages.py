@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterable
+
+log = logging.getLogger("pipeline-stages")
+
+
+DEFAULT_STATE_FILE = "exports/pipeline_stages.json"
+
+# Columns whose MAX() changes when rows are updated in place.
+VERSION_COLUMNS = (
+    "updated_at",
+    "last_updated",
+    "settled_at",
+    "captured_at",
+    "created_at",
+)
+
+
+def now_utc() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def stage_workers() -> int:
+    try:
+        value = int(os.getenv("PIPELINE_STAGE_WORKERS", "4"))
+    except ValueError:
+        value = 4
+    return max(1, value)
+
+
+@dataclass
+class Stage:
+    """
+    One post-scan step.
+
+    ``reads`` and ``writes`` are DB tables, ``files`` are export files the
+    stage produces. Stages declared later that touch something an earlier
+    stage writes (or write something it reads) wait for it; everything else
+    may run concurrently. Stages with ``writes`` never overlap each other,
+    because SQLite has a single writer.
+    """
+
+    name: str
+    run: Callable[[], Any]
+    reads: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()
+    files: tuple[str, ...] = ()
+    enabled: bool = True
+    # Only for stages that are a pure function of their tables.
+    skip_unchanged: bool = True
+    report: Callable[[Any], None] | None = None
+
+
+@dataclass
+class StageOutcome:
+    name: str
+    status: str = "pending"
+    seconds: float = 0.0
+    result: Any = None
+    depends_on: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in {"ok", "unchanged"}
+
+
+def _conflicts(earlier: Stage, later: Stage) -> bool:
+    earlier_writes = set(earlier.writes) | set(earlier.files)
+    later_writes = set(later.writes) | set(later.files)
+
+    return bool(
+        earlier_writes & (set(later.reads) | later_writes)
+        or later_writes & set(earlier.reads)
+    )
+
+
+def stage_dependencies(stages: list[Stage]) -> dict[str, list[str]]:
+    dependencies: dict[str, list[str]] = {}
+
+    for index, stage in enumerate(stages):
+        dependencies[stage.name] = [
+            earlier.name
+            for earlier in stages[:index]
+            if _conflicts(earlier, stage)
+        ]
+
+    return dependencies
+
+
+def _jsonable(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        value = dataclasses.asdict(value)
+
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return None
+
+    return value
+
+
+class StageScheduler:
+    def __init__(
+        self,
+        db_file: str | Path,
+        *,
+        max_workers: int | None = None,
+        state_file: str | Path = DEFAULT_STATE_FILE,
+        skip_unchanged: bool | None = None,
+    ) -> None:
+        self.db_file = Path(db_file)
+        self.max_workers = max_workers or stage_workers()
+        self.state_file = Path(state_file)
+        self.skip_unchanged = (
+            os.getenv("PIPELINE_SKIP_UNCHANGED", "1") == "1"
+            if skip_unchanged is None
+            else skip_unchanged
+        )
+        self._write_lock = threading.Lock()
+
+    def _load_state(self) -> dict[str, Any]:
+        try:
+            payload = json.loads(self.state_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        stages = payload.get("stages", {}) if isinstance(payload, dict) else {}
+        return stages if isinstance(stages, dict) else {}
+
+    def _save_state(
+        self,
+        state: dict[str, Any],
+        outcomes: dict[str, StageOutcome],
+        wall_seconds: float,
+    ) -> None:
+        payload = {
+            "finished_at": now_utc(),
+            "wall_seconds": round(wall_seconds, 3),
+            "stage_seconds": round(
+                sum(outcome.seconds for outcome in outcomes.values()),
+                3,
+            ),
+            "stages": state,
+        }
+
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.state_file.write_text(
+                json.dumps(payload, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        except OSError:
+            log.exception("Could not write %s", self.state_file)
+
+    def fingerprint(self, stage: Stage) -> dict[str, Any]:
+        """Cheap content version of every table and file a stage touches."""
+        tables = sorted(set(stage.reads) | set(stage.writes))
+        fingerprint: dict[str, Any] = {}
+
+        if tables and self.db_file.exists():
+            with sqlite3.connect(self.db_file) as conn:
+                existing = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table'"
+                    )
+                }
+
+                for table in tables:
+                    if table not in existing:
+                        fingerprint[table] = None
+                        continue
+
+                    columns = {
+                        row[1]
+                        for row in conn.execute(f"PRAGMA table_info({table})")
+                    }
+                    aggregates = ["COUNT(*)", "MAX(rowid)"] + [
+                        f"MAX({column})"
+                        for column in VERSION_COLUMNS
+                        if column in columns
+                    ]
+                    fingerprint[table] = list(
+                        conn.execute(
+                            f"SELECT {', '.join(aggregates)} FROM {table}"
+                        ).fetchone()
+                    )
+        else:
+            fingerprint.update({table: None for table in tables})
+
+        for name in stage.files:
+            path = Path(name)
+            # Content, not mtime: a git checkout touches every export.
+            fingerprint[name] = (
+                hashlib.sha1(path.read_bytes()).hexdigest()
+                if path.is_file()
+                else None
+            )
+
+        return fingerprint
+
+    def _run_stage(
+        self,
+        stage: Stage,
+        previous: dict[str, Any],
+    ) -> tuple[StageOutcome, dict[str, Any] | None]:
+        outcome = StageOutcome(name=stage.name)
+        started = time.perf_counter()
+
+        try:
+            if (
+                self.skip_unchanged
+                and stage.skip_unchanged
+                and previous
+                and "result" in previous
+                and previous.get("fingerprint") == self.fingerprint(stage)
+            ):
+                result = previous["result"]
+                outcome.status = "unchanged"
+                outcome.result = (
+                    SimpleNamespace(**result)
+                    if previous.get("dataclass") and isinstance(result, dict)
+                    else result
+                )
+                return outcome, previous
+
+            if stage.writes:
+                with self._write_lock:
+                    result = stage.run()
+            else:
+                result = stage.run()
+
+            outcome.status = "ok"
+            outcome.result = result
+
+            if stage.report is not None:
+                stage.report(result)
+
+            stored = _jsonable(result)
+            entry: dict[str, Any] = {
+                "fingerprint": self.fingerprint(stage),
+                "finished_at": now_utc(),
+            }
+
+            if stored is not None or result is None:
+                entry["result"] = stored
+                entry["dataclass"] = dataclasses.is_dataclass(result)
+
+            return outcome, entry
+
+        except Exception:
+            outcome.status = "failed"
+            log.exception("%s failed", stage.name)
+            return outcome, None
+
+        finally:
+            outcome.seconds = time.perf_counter() - started
+
+    def run(self, stages: Iterable[Stage]) -> dict[str, StageOutcome]:
+        stages = list(stages)
+        dependencies = stage_dependencies(stages)
+        previous_state = self._load_state()
+        state = dict(previous_state)
+
+        outcomes = {
+            stage.name: StageOutcome(
+                name=stage.name,
+                depends_on=dependencies[stage.name],
+            )
+            for stage in stages
+        }
+
+        for stage in stages:
+            if not stage.enabled:
+                outcomes[stage.name].status = "disabled"
+
+        pending = [stage for stage in stages if stage.enabled]
+        running: dict[Future, Stage] = {}
+        started = time.perf_counter()
+
+        def ready(stage: Stage) -> bool:
+            return all(
+                outcomes[name].status not in {"pending", "running"}
+                for name in dependencies[stage.name]
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="stage",
+        ) as pool:
+            while pending or running:
+                for stage in [stage for stage in pending if ready(stage)]:
+                    pending.remove(stage)
+                    outcomes[stage.name].status = "running"
+                    running[pool.submit(
+                        self._run_stage,
+                        stage,
+                        previous_state.get(stage.name, {}),
+                    )] = stage
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage = running.pop(future)
+                    outcome, entry = future.result()
+                    outcome.depends_on = dependencies[stage.name]
+                    outcomes[stage.name] = outcome
+
+                    if entry is None:
+                        state.pop(stage.name, None)
+                    else:
+                        state[stage.name] = {
+                            **entry,
+                            "seconds": round(outcome.seconds, 3),
+                        }
+
+        wall_seconds = time.perf_counter() - started
+        self._save_state(state, outcomes, wall_seconds)
+
+        log.info(
+            "Pipeline stages finished in %.2fs (%s)",
+            wall_seconds,
+            ", ".join(
+                f"{outcome.name}={outcome.status}:{outcome.seconds:.2f}s"
+                for outcome in outcomes.values()
+                if outcome.status != "disabled"
+            ),
+        )
+
+        return outcomes
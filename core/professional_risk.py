@@ -98,23 +98,26 @@ def apply_professional_risk_controls(
             ).fetchall()
         }
     context_db = SportContextDatabase(settings)
+    settled_profiles: dict[str, tuple[int, float]] = {}
     for output in outputs:
         result = output.get("result")
         if not isinstance(result, SportResult):
             continue
         policy = sport_policy(result.sport)
-        samples, hit_rate = _settled_profile(settings, result.sport)
+        if result.sport not in settled_profiles:
+            settled_profiles[result.sport] = _settled_profile(settings, result.sport)
+        samples, hit_rate = settled_profiles[result.sport]
         sport_limit = settings.bank * policy.max_sport_exposure_pct
         sport_exposure = sport_allocations.get(result.sport, 0.0)
         accepted: list[Bet] = []
         seen_events: set[tuple[str, str]] = set()
 
-        for bet in sorted(result.bets, key=lambda item: (item.score, item.edge), reverse=True):
+        candidates = sorted(result.bets, key=lambda item: (item.score, item.edge), reverse=True)
+        contexts = context_db.latest_many(result.sport, candidates)
+
+        for bet, context in zip(candidates, contexts):
             summary.candidates += 1
             calibrated = calibrated_probability(bet.prob_final, samples, hit_rate)
-            context = context_db.latest(
-                result.sport, bet.event, bet.external_event_id, bet.start_time
-            )
             if context.verified:
                 availability = context_db.selection_availability_adjustment(
                     context, bet.selection
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import functools
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# (database, schema name) pairs whose DDL already ran in this process.
+_INITIALIZED: set[tuple[str, str]] = set()
+# database -> (schema_version, table -> column names).
+_CATALOG: dict[str, tuple[int, dict[str, frozenset[str]]]] = {}
+_LOCK = threading.RLock()
+
+
+@dataclass
+class SchemaRegistryStats:
+    ddl_runs: int = 0
+    ddl_skipped: int = 0
+    catalog_hits: int = 0
+    catalog_misses: int = 0
+
+
+_STATS = SchemaRegistryStats()
+
+
+def _database_key(db_file: str | Path) -> str | None:
+    name = str(db_file)
+
+    if not name or name == ":memory:" or name.startswith("file:"):
+        return None
+
+    return os.path.abspath(name)
+
+
+def _connection_key(conn: sqlite3.Connection) -> str | None:
+    # PRAGMA database_list reads the connection, not sqlite_master.
+    for _, name, path in conn.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return _database_key(path) if path else None
+
+    return None
+
+
+def ensure_schema(
+    db_file: str | Path,
+    name: str,
+    init: Callable[[], Any],
+) -> bool:
+    """
+    Run ``init`` (a module's DDL and column migrations) once per database
+    file and process. Returns True when it ran.
+
+    A database file that disappeared since (tests, manual resets) is
+    initialized again.
+    """
+    key = _database_key(db_file)
+
+    if key is None:
+        init()
+        return True
+
+    marker = (key, name)
+
+    if marker in _INITIALIZED and os.path.exists(key):
+        _STATS.ddl_skipped += 1
+        return False
+
+    with _LOCK:
+        if marker in _INITIALIZED:
+            if os.path.exists(key):
+                _STATS.ddl_skipped += 1
+                return False
+
+            forget_schema(key)
+
+        init()
+        _INITIALIZED.add(marker)
+        _STATS.ddl_runs += 1
+
+    return True
+
+
+def schema_once(name: str) -> Callable[[F], F]:
+    """
+    Decorator for ``init_db(self)`` methods of ``*Database`` classes; the
+    database file is taken from ``self.db_file``.
+    """
+    def decorate(method: F) -> F:
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            ensure_schema(
+                self.db_file,
+                name,
+                lambda: method(self, *args, **kwargs),
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _load_columns(conn: sqlite3.Connection, table: str) -> frozenset[str]:
+    quoted = '"' + table.replace('"', '""') + '"'
+    return frozenset(
+        str(row[1])
+        for row in conn.execute(f"PRAGMA table_info({quoted})").fetchall()
+    )
+
+
+def table_columns(conn: sqlite3.Connection, table: str) -> frozenset[str]:
+    """
+    Column names of ``table`` (empty when it does not exist), read from the
+    catalog once per database file and schema version.
+
+    SQLite bumps ``PRAGMA schema_version`` in the file header on every
+    CREATE/ALTER/DROP, from any connection or process, so a table created
+    or migrated elsewhere is picked up on the next call.
+    """
+    key = _connection_key(conn)
+
+    if key is None:
+        return _load_columns(conn, table)
+
+    version = int(conn.execute("PRAGMA schema_version").fetchone()[0])
+
+    with _LOCK:
+        entry = _CATALOG.get(key)
+
+        if entry is None or entry[0] != version:
+            entry = (version, {})
+            _CATALOG[key] = entry
+
+        cached = entry[1].get(table)
+
+        if cached is not None:
+            _STATS.catalog_hits += 1
+            return cached
+
+        _STATS.catalog_misses += 1
+        columns = _load_columns(conn, table)
+        entry[1][table] = columns
+
+    return columns
+
+
+def table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return bool(table_columns(conn, table))
+
+
+def forget_schema(db_file: str | Path | None = None) -> None:
+    """
+    Forget DDL runs and cached catalog entries for one database file, or
+    for all of them. Call after replacing a database file in place.
+    """
+    with _LOCK:
+        if db_file is None:
+            _INITIALIZED.clear()
+            _CATALOG.clear()
+            return
+
+        key = _database_key(db_file)
+        _CATALOG.pop(key, None)
+
+        for marker in [item for item in _INITIALIZED if item[0] == key]:
+            _INITIALIZED.discard(marker)
+
+
+def schema_registry_counters() -> dict[str, int]:
+    return asdict(_STATS)
+
+
+def clear_schema_registry() -> None:
+    global _STATS
+
+    with _LOCK:
+        _INITIALIZED.clear()
+        _CATALOG.clear()
+        _STATS = SchemaRegistryStats()
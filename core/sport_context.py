@@ -7,10 +7,21 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from core.config import Settings
-from core.football_team_aliases import team_similarity, teams_match
+from core.football_team_aliases import (
+    canonical_team_name_with_aliases,
+    team_similarity,
+    teams_match,
+)
+from core.schema_registry import schema_once
+from core.types import Bet
+
+# Values bound per IN (...) lookup, well below SQLite's variable limit.
+LOOKUP_CHUNK = 500
+# Newest football rows a fuzzy team-name match is searched in.
+MATCH_WINDOW_ROWS = 200
 
 
 @dataclass
@@ -45,6 +56,71 @@ class SportContext:
         return bool(self.source and self.captured_at)
 
 
+class _MatchWindow:
+    """
+    The newest football context rows, loaded once per batch for team-name
+    matching. Teams, kickoff and canonical names are prepared per row, so a
+    bet whose canonical teams equal a row's is matched without scoring the
+    rest of the window.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, database: "SportContextDatabase"):
+        self.database = database
+        self.tolerance_seconds = float(os.getenv("SPORT_CONTEXT_MATCH_HOURS", "3")) * 3600
+        self.rows = conn.execute(
+            """
+            SELECT * FROM sport_context_features
+            WHERE sport='football' AND TRIM(source) <> ''
+            ORDER BY captured_at DESC, id DESC LIMIT ?
+            """,
+            (MATCH_WINDOW_ROWS,),
+        ).fetchall()
+        self.candidates: list[tuple[sqlite3.Row, datetime | None, str, str]] = []
+        self.by_teams: dict[tuple[str, str], list[int]] = {}
+        self.by_external_id: dict[str, sqlite3.Row] = {}
+        for row in self.rows:
+            home = str(row["home_team"] or "")
+            away = str(row["away_team"] or "")
+            if not home or not away:
+                home, away = database._split_event(str(row["event"]))
+            self.by_teams.setdefault(
+                (canonical_team_name_with_aliases(home), canonical_team_name_with_aliases(away)),
+                [],
+            ).append(len(self.candidates))
+            self.candidates.append((row, database._parse_time(row["start_time"]), home, away))
+            if row["external_event_id"] is not None and str(row["captured_at"]).strip():
+                self.by_external_id.setdefault(str(row["external_event_id"]), row)
+
+    def _in_time(self, target: datetime | None, candidate: datetime | None) -> bool:
+        if target is None or candidate is None:
+            return True
+        return abs((target - candidate).total_seconds()) <= self.tolerance_seconds
+
+    def best_match(self, event: str, start_time: str) -> tuple[sqlite3.Row | None, float]:
+        """First row with the highest team similarity (>= .84) within kickoff tolerance."""
+        home, away = self.database._split_event(event)
+        target_time = self.database._parse_time(start_time)
+        teams = (canonical_team_name_with_aliases(home), canonical_team_name_with_aliases(away))
+        if all(teams):
+            # Equal canonical names score 1.0, which no other row can beat.
+            for position in self.by_teams.get(teams, ()):
+                row, candidate_time, _, _ = self.candidates[position]
+                if self._in_time(target_time, candidate_time):
+                    return row, 1.0
+        best = None
+        best_score = 0.0
+        for row, candidate_time, candidate_home, candidate_away in self.candidates:
+            if not self._in_time(target_time, candidate_time):
+                continue
+            score = min(
+                team_similarity(home, candidate_home),
+                team_similarity(away, candidate_away),
+            )
+            if score >= .84 and score > best_score:
+                best, best_score = row, score
+        return best, best_score
+
+
 class SportContextDatabase:
     def __init__(self, settings: Settings):
         self.db_file = Path(settings.db_file or "bets.db")
@@ -54,6 +130,7 @@ class SportContextDatabase:
         conn.row_factory = sqlite3.Row
         return conn
 
+    @schema_once("sport_context")
     def init_db(self) -> None:
         with self.connect() as conn:
             conn.execute(
@@ -190,85 +267,132 @@ class SportContextDatabase:
         external_event_id: str = "",
         start_time: str = "",
     ) -> SportContext:
+        return self._resolve(sport, [(event, external_event_id, start_time)])[0]
+
+    def latest_many(self, sport: str, bets: Iterable[Bet]) -> list[SportContext]:
+        """
+        Contexts for many bets of one sport, in the order given.
+
+        Gives the same result as calling ``latest`` per bet in that order,
+        but with one connection, one query per lookup kind and a single
+        load of the fuzzy-match window shared by every football miss.
+        """
+        return self._resolve(
+            sport,
+            [(bet.event, bet.external_event_id, bet.start_time) for bet in bets],
+        )
+
+    @staticmethod
+    def _latest_rows(
+        conn: sqlite3.Connection,
+        sport: str,
+        column: str,
+        values: set[str],
+    ) -> dict[str, sqlite3.Row]:
+        """Newest verified row per value of ``column``."""
+        latest: dict[str, sqlite3.Row] = {}
+        ordered = sorted(values)
+        for offset in range(0, len(ordered), LOOKUP_CHUNK):
+            chunk = ordered[offset:offset + LOOKUP_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            for row in conn.execute(
+                f"""
+                SELECT * FROM sport_context_features
+                WHERE sport=? AND {column} IN ({placeholders})
+                  AND TRIM(source) <> '' AND TRIM(captured_at) <> ''
+                ORDER BY captured_at DESC, id DESC
+                """,
+                (sport, *chunk),
+            ):
+                latest.setdefault(str(row[column]), row)
+        return latest
+
+    def _resolve(
+        self,
+        sport: str,
+        requests: list[tuple[str, str, str]],
+    ) -> list[SportContext]:
+        if not requests:
+            return []
         self.init_db()
+        links: dict[str, str] = {}
+        new_links: dict[str, tuple] = {}
+        matched: list[sqlite3.Row | None] = []
+        window: _MatchWindow | None = None
         with self.connect() as conn:
-            row = None
-            if external_event_id:
-                link = conn.execute(
-                    """
-                    SELECT provider_event_id FROM sport_event_identity_links
-                    WHERE sport=? AND consumer_event_id=? AND provider='sportmonks-v3'
-                    """,
-                    (sport, external_event_id),
-                ).fetchone()
-                identity = str(link[0]) if link else external_event_id
-                row = conn.execute(
-                    """
-                    SELECT * FROM sport_context_features
-                    WHERE sport=? AND external_event_id=?
-                      AND TRIM(source) <> '' AND TRIM(captured_at) <> ''
-                    ORDER BY captured_at DESC, id DESC LIMIT 1
-                    """,
-                    (sport, identity),
-                ).fetchone()
-            if row is None and not external_event_id:
-                row = conn.execute(
-                    """
-                    SELECT * FROM sport_context_features
-                    WHERE sport=? AND event=?
-                      AND TRIM(source) <> '' AND TRIM(captured_at) <> ''
-                    ORDER BY captured_at DESC, id DESC LIMIT 1
-                    """,
-                    (sport, event),
-                ).fetchone()
-            if row is None and sport == "football":
-                home, away = self._split_event(event)
-                target_time = self._parse_time(start_time)
-                best = None
-                best_score = 0.0
-                rows = conn.execute(
-                    """
-                    SELECT * FROM sport_context_features
-                    WHERE sport='football' AND TRIM(source) <> ''
-                    ORDER BY captured_at DESC, id DESC LIMIT 200
-                    """
-                ).fetchall()
-                for candidate in rows:
-                    candidate_time = self._parse_time(candidate["start_time"])
-                    if target_time and candidate_time:
-                        tolerance = float(os.getenv("SPORT_CONTEXT_MATCH_HOURS", "3"))
-                        if abs((target_time - candidate_time).total_seconds()) > tolerance * 3600:
-                            continue
-                    candidate_home = str(candidate["home_team"] or "")
-                    candidate_away = str(candidate["away_team"] or "")
-                    if not candidate_home or not candidate_away:
-                        candidate_home, candidate_away = self._split_event(str(candidate["event"]))
-                    score = min(
-                        team_similarity(home, candidate_home),
-                        team_similarity(away, candidate_away),
-                    )
-                    if score >= .84 and score > best_score:
-                        best, best_score = candidate, score
-                row = best
-                if row is not None and external_event_id:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO sport_event_identity_links (
-                            sport, consumer_event_id, provider, provider_event_id,
-                            consumer_event, provider_event, similarity, linked_at
-                        ) VALUES (?, ?, 'sportmonks-v3', ?, ?, ?, ?, ?)
+            external_ids = sorted({external for _, external, _ in requests if external})
+            for offset in range(0, len(external_ids), LOOKUP_CHUNK):
+                chunk = external_ids[offset:offset + LOOKUP_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                links.update(
+                    (str(row[0]), str(row[1]))
+                    for row in conn.execute(
+                        f"""
+                        SELECT consumer_event_id, provider_event_id
+                        FROM sport_event_identity_links
+                        WHERE sport=? AND provider='sportmonks-v3'
+                          AND consumer_event_id IN ({placeholders})
                         """,
-                        (
+                        (sport, *chunk),
+                    )
+                )
+            by_identity = self._latest_rows(
+                conn, sport, "external_event_id",
+                {links.get(external, external) for external in external_ids},
+            )
+            by_event = self._latest_rows(
+                conn, sport, "event",
+                {event for event, external, _ in requests if not external},
+            )
+
+            for event, external_event_id, start_time in requests:
+                row = None
+                if external_event_id:
+                    identity = links.get(external_event_id, external_event_id)
+                    row = by_identity.get(identity)
+                    if row is None and window is not None:
+                        # Identity linked earlier in this batch; its newest
+                        # verified row is always inside the window.
+                        row = window.by_external_id.get(identity)
+                else:
+                    row = by_event.get(event)
+                if row is None and sport == "football":
+                    if window is None:
+                        window = _MatchWindow(conn, self)
+                    row, score = window.best_match(event, start_time)
+                    if row is not None and external_event_id:
+                        links[external_event_id] = str(row["external_event_id"])
+                        new_links[external_event_id] = (
                             sport, external_event_id, str(row["external_event_id"]),
-                            event, str(row["event"]), best_score,
+                            event, str(row["event"]), score,
                             datetime.now(timezone.utc).isoformat(),
-                        ),
-                    )
+                        )
+                matched.append(row)
+
+            if new_links:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO sport_event_identity_links (
+                        sport, consumer_event_id, provider, provider_event_id,
+                        consumer_event, provider_event, similarity, linked_at
+                    ) VALUES (?, ?, 'sportmonks-v3', ?, ?, ?, ?, ?)
+                    """,
+                    list(new_links.values()),
+                )
+
+        max_age = float(os.getenv("SPORT_CONTEXT_MAX_AGE_HOURS", "24"))
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age)
+        return [self._context_from_row(row, cutoff) for row in matched]
+
+    def _context_from_row(
+        self,
+        row: sqlite3.Row | None,
+        cutoff: datetime,
+    ) -> SportContext:
         if row is None:
             return SportContext()
         captured = self._parse_time(str(row["captured_at"]))
-        max_age = float(os.getenv("SPORT_CONTEXT_MAX_AGE_HOURS", "24"))
-        if captured and captured < datetime.now(timezone.utc) - timedelta(hours=max_age):
+        if captured and captured < cutoff:
             return SportContext()
         return SportContext(
             lineup_confirmed=bool(row["lineup_confirmed"]),
@@ -6,9 +6,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import aiohttp
-
 from core.config import Settings
+from core.odds_api import fetch_sports
+from core.schema_registry import ensure_schema
+from core.weight_provider import get_weight_provider
 
 
 def now_utc() -> str:
@@ -37,6 +38,10 @@ def env_float(name: str, default: float) -> float:
 
 
 def init_sport_db(settings: Settings) -> None:
+    ensure_schema(db_path(settings), "sport_quant", lambda: _create_sport_tables(settings))
+
+
+def _create_sport_tables(settings: Settings) -> None:
     with connect(settings) as conn:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS sport_bets (
@@ -130,21 +135,17 @@ def init_sport_db(settings: Settings) -> None:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_sport_bets_result ON sport_bets(result)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_sport_snapshots_event ON sport_odds_snapshots(sport, league, event, selection)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_sport_snapshots_clv ON sport_odds_snapshots(sport, league, event, selection, captured_at)")
+        # Covers the closing-line backfill: latest price per bookmaker.
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sport_snapshots_closing ON sport_odds_snapshots(sport, league, event, selection, bookmaker, captured_at, odds)")
 
 
 async def discover_active_sport_keys(api_key: str, groups: list[str]) -> set[str]:
     if not api_key:
         return set()
 
-    url = "https://api.the-odds-api.com/v4/sports/"
-    params = {"apiKey": api_key}
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=30) as resp:
-                if resp.status != 200:
-                    return set()
-                data = await resp.json()
+        # Shared and cached, so every sport module reuses one /sports call.
+        data = await fetch_sports(api_key)
     except Exception:
         return set()
 
@@ -169,49 +170,91 @@ def filter_active_keys(configured_keys: list[str], active_keys: set[str]) -> lis
     return [key for key in clean if key in active_keys]
 
 
+# One statement for every open bet. The bet's own bookmaker is an index
+# seek to its last pre-start price; only bets that bookmaker never quoted
+# fall back to the average of each bookmaker's last pre-start price (SQLite
+# takes the bare ``odds`` from the MAX(captured_at) row), computed once
+# per distinct market. A NULL start_time means "no cut-off".
+CLOSING_LINES_SQL = """
+    WITH open_bets AS (
+        SELECT id, sport, league, event, selection, bookmaker, odds,
+               COALESCE(start_time, '9999-12-31T23:59:59Z') AS closes_before
+        FROM sport_bets
+        WHERE sport=?
+          AND odds > 1.01
+          AND (closing_odds IS NULL OR clv_pct IS NULL)
+    ),
+    priced AS (
+        SELECT b.*,
+               (
+                   SELECT s.odds
+                   FROM sport_odds_snapshots AS s
+                   WHERE s.sport=b.sport
+                     AND s.league=b.league
+                     AND s.event=b.event
+                     AND s.selection=b.selection
+                     AND s.bookmaker=b.bookmaker
+                     AND s.odds > 1.01
+                     AND s.captured_at <= b.closes_before
+                   ORDER BY s.captured_at DESC
+                   LIMIT 1
+               ) AS same_book_odds
+        FROM open_bets AS b
+    ),
+    markets AS (
+        SELECT DISTINCT sport, league, event, selection, closes_before
+        FROM priced
+        WHERE same_book_odds IS NULL
+    ),
+    latest AS (
+        SELECT m.sport,
+               m.league,
+               m.event,
+               m.selection,
+               m.closes_before,
+               s.odds,
+               MAX(s.captured_at) AS captured_at
+        FROM markets AS m
+        JOIN sport_odds_snapshots AS s
+          ON s.sport=m.sport
+         AND s.league=m.league
+         AND s.event=m.event
+         AND s.selection=m.selection
+        WHERE s.odds > 1.01
+          AND s.captured_at <= m.closes_before
+        GROUP BY m.sport, m.league, m.event, m.selection, m.closes_before, s.bookmaker
+    ),
+    market_average AS (
+        SELECT sport, league, event, selection, closes_before,
+               AVG(odds) AS market_odds
+        FROM latest
+        GROUP BY sport, league, event, selection, closes_before
+    )
+    SELECT p.id, p.odds, p.same_book_odds, a.market_odds
+    FROM priced AS p
+    LEFT JOIN market_average AS a
+      ON a.sport=p.sport
+     AND a.league=p.league
+     AND a.event=p.event
+     AND a.selection=p.selection
+     AND a.closes_before=p.closes_before
+    WHERE p.same_book_odds IS NOT NULL
+       OR a.market_odds IS NOT NULL
+"""
+
+
 def update_closing_lines(settings: Settings, sport: str) -> int:
     with connect(settings) as conn:
-        rows = conn.execute("""
-            SELECT id, league, event, selection, bookmaker, odds, start_time
-            FROM sport_bets
-            WHERE sport=?
-              AND odds > 1.01
-              AND (closing_odds IS NULL OR clv_pct IS NULL)
-        """, (sport,)).fetchall()
+        rows = conn.execute(CLOSING_LINES_SQL, (sport,)).fetchall()
 
     updates: list[tuple[float, float, int]] = []
 
-    for bet_id, league, event, selection, bookmaker, taken_odds, start_time in rows:
-        closing_odds = None
-
-        with connect(settings) as conn:
-            same_book = conn.execute("""
-                SELECT odds
-                FROM sport_odds_snapshots
-                WHERE sport=? AND league=? AND event=? AND selection=? AND bookmaker=?
-                  AND odds > 1.01
-                  AND captured_at <= COALESCE(?, captured_at)
-                ORDER BY captured_at DESC
-                LIMIT 1
-            """, (sport, league, event, selection, bookmaker, start_time)).fetchone()
-
-            if same_book:
-                closing_odds = float(same_book[0])
-            else:
-                market_avg = conn.execute("""
-                    SELECT AVG(odds)
-                    FROM (
-                        SELECT bookmaker, odds, MAX(captured_at)
-                        FROM sport_odds_snapshots
-                        WHERE sport=? AND league=? AND event=? AND selection=?
-                          AND odds > 1.01
-                          AND captured_at <= COALESCE(?, captured_at)
-                        GROUP BY bookmaker
-                    )
-                """, (sport, league, event, selection, start_time)).fetchone()
-
-                if market_avg and market_avg[0]:
-                    closing_odds = float(market_avg[0])
+    for bet_id, taken_odds, same_book_odds, market_odds in rows:
+        closing_odds = (
+            float(same_book_odds)
+            if same_book_odds is not None
+            else float(market_odds or 0.0)
+        )
 
         if closing_odds and closing_odds > 1.01:
             clv_pct = (float(taken_odds) / closing_odds) - 1.0
@@ -271,16 +314,12 @@ def refresh_bookmaker_stats(settings: Settings, sport: str) -> int:
                 updated_at=excluded.updated_at
         """, payload)
 
+    get_weight_provider().invalidate_bookmakers(db_path(settings))
     return len(payload)
 
 
 def bookmaker_grade(settings: Settings, sport: str, bookmaker: str, min_samples: int = 20) -> float:
-    with connect(settings) as conn:
-        row = conn.execute("""
-            SELECT bets, profit, turnover, avg_clv
-            FROM sport_bookmaker_stats
-            WHERE bookmaker=? AND sport=?
-        """, (bookmaker, sport)).fetchone()
+    row = get_weight_provider().bookmaker_row(db_path(settings), sport, bookmaker)
 
     if not row:
         return 1.0
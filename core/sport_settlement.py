@@ -4,11 +4,12 @@ import os
 from datetime import datetime, timezone
 from typing import Any
 
-import aiohttp
-
 from core.config import Settings
+from core.odds_api import OddsApiError, fetch_scores as fetch_odds_api_scores
+from core.schema_registry import ensure_schema
 from core.sport_quant import (
     connect,
+    db_path,
     norm,
     update_closing_lines,
     refresh_bookmaker_stats,
@@ -69,25 +70,18 @@ async def fetch_scores(
     if not api_key:
         return []
 
-    url = f"https://api.the-odds-api.com/v4/sports/{sport_key}/scores/"
-    params = {
-        "apiKey": api_key,
-        "daysFrom": max(1, min(int(days_from), 3)),
-    }
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=30) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    print(
-                        f"WARNING | Scores API {resp.status} "
-                        f"for {sport_key}: {body[:200]}"
-                    )
-                    return []
-
-                data = await resp.json()
-                return data if isinstance(data, list) else []
+        return await fetch_odds_api_scores(api_key, sport_key, days_from)
+
+    except OddsApiError as exc:
+        if exc.status is None:
+            print(f"WARNING | Scores API error for {sport_key}: {exc}")
+        else:
+            print(
+                f"WARNING | Scores API {exc.status} "
+                f"for {sport_key}: {exc.body[:200]}"
+            )
+        return []
 
     except Exception as exc:
         print(f"WARNING | Scores API error for {sport_key}: {exc}")
@@ -95,6 +89,14 @@ async def fetch_scores(
 
 
 def ensure_settlement_columns(settings: Settings) -> None:
+    ensure_schema(
+        db_path(settings),
+        "sport_settlement",
+        lambda: _add_settlement_columns(settings),
+    )
+
+
+def _add_settlement_columns(settings: Settings) -> None:
     with connect(settings) as conn:
         columns = {
             row[1]
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 from core.sport_context import SportContextDatabase
 
 
 API_BASE = "https://api.sportmonks.com/v3/football"
+BASE_INCLUDES = "participants;lineups;sidelined.sideline;metadata"
 
 
 class SportmonksError(RuntimeError):
@@ -245,62 +252,308 @@ def _explicit_metric(payload: Any, names: set[str]) -> float | None:
     return None
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _has_more(payload: dict[str, Any]) -> bool:
+    pagination = payload.get("pagination") or payload.get("meta", {}).get("pagination") or {}
+    return bool(pagination.get("has_more") or pagination.get("has_more_pages"))
+
+
+def _last_page(payload: dict[str, Any]) -> int | None:
+    """Page count when the provider reports one (v3 usually only sends has_more)."""
+    pagination = payload.get("pagination") or payload.get("meta", {}).get("pagination") or {}
+    for key in ("total_pages", "last_page"):
+        try:
+            return int(pagination[key])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+@dataclass
+class SportmonksStats:
+    requests: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    pages: int = 0
+
+
+class _RateLimiter:
+    """Spaces request starts evenly; 0 requests per second means unlimited."""
+
+    def __init__(self, per_second: float) -> None:
+        self.interval = 1.0 / per_second if per_second > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ResponseCache:
+    """
+    Sportmonks JSON responses on disk, one file per request without the
+    API token. A fresh entry is served without a request; a stale one is
+    revalidated with its ETag / Last-Modified when the provider sent them.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def load(self, url: str) -> dict[str, Any] | None:
+        try:
+            entry = json.loads((self.directory / f"{self.key(url)}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url or "payload" not in entry:
+            return None
+        return entry
+
+    def store(self, url: str, entry: dict[str, Any]) -> None:
+        path = self.directory / f"{self.key(url)}.json"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp.write_text(json.dumps({**entry, "url": url}, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp, path)
+        except OSError:
+            # The cache only saves requests; a read-only disk must not fail a sync.
+            pass
+
+
 class SportmonksClient:
-    def __init__(self, token: str, timeout: float = 30.0, include_xg: bool = False):
+    # Class-level defaults keep subclasses that skip __init__ usable.
+    concurrency = 1
+    page_lookahead = 1
+
+    def __init__(
+        self,
+        token: str,
+        timeout: float = 30.0,
+        include_xg: bool = False,
+        *,
+        base_url: str = API_BASE,
+        concurrency: int | None = None,
+        requests_per_second: float | None = None,
+        page_lookahead: int | None = None,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float | None = None,
+        matchday_cache_ttl: float | None = None,
+    ):
         token = token.strip()
         if not token:
             raise ValueError("SPORTMONKS_API_TOKEN is missing")
         self._token = token
         self.timeout = timeout
         self.include_xg = include_xg
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, int(
+            concurrency if concurrency is not None
+            else _env_float("SPORTMONKS_CONCURRENCY", 4)
+        ))
+        self.page_lookahead = max(1, int(
+            page_lookahead if page_lookahead is not None
+            else _env_float("SPORTMONKS_PAGE_LOOKAHEAD", 3)
+        ))
+        self._limiter = _RateLimiter(
+            requests_per_second if requests_per_second is not None
+            else _env_float("SPORTMONKS_REQUESTS_PER_SECOND", 4)
+        )
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        cache_dir = (
+            cache_dir if cache_dir is not None
+            else os.getenv("SPORTMONKS_CACHE_DIR", ".cache/sportmonks")
+        )
+        self.cache = ResponseCache(cache_dir) if str(cache_dir).strip() else None
+        self.cache_ttl = (
+            cache_ttl if cache_ttl is not None
+            else _env_float("SPORTMONKS_CACHE_TTL_SECONDS", 3600)
+        )
+        # Lineups and sidelined lists change on the day itself.
+        self.matchday_cache_ttl = (
+            matchday_cache_ttl if matchday_cache_ttl is not None
+            else _env_float("SPORTMONKS_MATCHDAY_CACHE_TTL_SECONDS", 300)
+        )
+        self.stats = SportmonksStats()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, field: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+    def _ttl(self, path: str) -> float:
+        match = re.search(r"fixtures/date/(\d{4}-\d{2}-\d{2})", path)
+        if match and date.fromisoformat(match.group(1)) <= datetime.now(timezone.utc).date():
+            return min(self.cache_ttl, self.matchday_cache_ttl)
+        return self.cache_ttl
+
+    def _cache_url(self, path: str, params: dict[str, Any]) -> str:
+        # The cache key never contains the token.
+        return f"{self.base_url}/{path}?{urllib.parse.urlencode(sorted(params.items()))}"
+
+    def _fresh(self, path: str, params: dict[str, Any]) -> dict[str, Any] | None:
+        """Cached payload still within its TTL, without any request."""
+        cached = self.cache.load(self._cache_url(path, params)) if self.cache else None
+        if cached is None or time.time() - float(cached.get("fetched_at", 0)) >= self._ttl(path):
+            return None
+        self._count("cache_hits")
+        return cached["payload"]
 
     def _get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
+        fresh = self._fresh(path, params)
+        if fresh is not None:
+            return fresh
+        url = self._cache_url(path, params)
+        cached = self.cache.load(url) if self.cache else None
+
+        headers = {"Accept": "application/json", "User-Agent": "Futbal-dnes/2.0"}
+        if cached is not None and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached is not None and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
         query = urllib.parse.urlencode({**params, "api_token": self._token})
-        request = urllib.request.Request(
-            f"{API_BASE}/{path}?{query}",
-            headers={"Accept": "application/json", "User-Agent": "Futbal-dnes/2.0"},
-        )
+        request = urllib.request.Request(f"{self.base_url}/{path}?{query}", headers=headers)
+        with self._slots:
+            self._limiter.wait()
+            self._count("requests")
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    payload = json.loads(response.read().decode("utf-8"))
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+            except urllib.error.HTTPError as exc:
+                if exc.code == 304 and cached is not None:
+                    self._count("not_modified")
+                    self.cache.store(url, {**cached, "fetched_at": time.time()})
+                    return cached["payload"]
+                detail = exc.read().decode("utf-8", errors="replace")[:500]
+                raise SportmonksError(
+                    f"Sportmonks HTTP {exc.code}: {detail}",
+                    status=exc.code,
+                    detail=detail,
+                ) from exc
+            except (urllib.error.URLError, TimeoutError, json.JSONDecodeError) as exc:
+                raise SportmonksError(f"Sportmonks request failed: {exc}") from exc
+        if self.cache is not None:
+            self.cache.store(url, {
+                "fetched_at": time.time(),
+                "etag": etag,
+                "last_modified": last_modified,
+                "payload": payload,
+            })
+        return payload
+
+    @staticmethod
+    def _page_request(fixture_date: date, page: int, with_xg: bool) -> tuple[str, dict[str, Any]]:
+        includes = f"{BASE_INCLUDES};xGFixture" if with_xg else BASE_INCLUDES
+        return f"fixtures/date/{fixture_date.isoformat()}", {"include": includes, "page": page}
+
+    def _fresh_page(self, fixture_date: date, page: int) -> dict[str, Any] | None:
+        payload = self._fresh(*self._page_request(fixture_date, page, self.include_xg))
+        if payload is not None:
+            self._count("pages")
+        return payload
+
+    def _fixtures_page(self, fixture_date: date, page: int) -> dict[str, Any]:
+        with_xg = self.include_xg
         try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")[:500]
-            raise SportmonksError(
-                f"Sportmonks HTTP {exc.code}: {detail}",
-                status=exc.code,
-                detail=detail,
-            ) from exc
-        except (urllib.error.URLError, TimeoutError, json.JSONDecodeError) as exc:
-            raise SportmonksError(f"Sportmonks request failed: {exc}") from exc
+            payload = self._get(*self._page_request(fixture_date, page, with_xg))
+        except SportmonksError as exc:
+            # xG is a paid add-on. A valid free-plan token must still be able
+            # to collect the context fields that are included in its plan.
+            # Pages fetched concurrently may each hit the denial once.
+            xg_denied = exc.status == 403 and "xgfixture" in exc.detail.lower()
+            if not with_xg or not xg_denied:
+                raise
+            self.include_xg = False
+            payload = self._get(*self._page_request(fixture_date, page, False))
+        self._count("pages")
+        return payload
 
     def fixtures_by_date(self, fixture_date: date, max_pages: int = 10) -> list[dict[str, Any]]:
+        """
+        All fixture pages of one day, in page order.
+
+        Sportmonks v3 reports only ``has_more``, so after the first page up
+        to ``page_lookahead`` further pages are requested at once. Pages past
+        the last one are discarded, including their errors.
+        """
+        payloads = [self._fixtures_page(fixture_date, 1)]
+        next_page = 2
+        if _has_more(payloads[0]) and max_pages > 1:
+            last_page = _last_page(payloads[0])
+            with ThreadPoolExecutor(
+                max_workers=self.page_lookahead,
+                thread_name_prefix="sportmonks-page",
+            ) as pool:
+                while next_page <= max_pages and _has_more(payloads[-1]):
+                    # Cached pages are read in order first, so a rerun does
+                    # not speculate past a last page it already knows.
+                    cached = self._fresh_page(fixture_date, next_page)
+                    if cached is not None:
+                        payloads.append(cached)
+                        next_page += 1
+                        continue
+                    stop = min(
+                        max_pages,
+                        last_page if last_page else next_page + self.page_lookahead - 1,
+                    )
+                    futures = [
+                        pool.submit(self._fixtures_page, fixture_date, page)
+                        for page in range(next_page, max(stop, next_page) + 1)
+                    ]
+                    for future in futures:
+                        if not _has_more(payloads[-1]):
+                            future.cancel()
+                            continue
+                        payloads.append(future.result())
+                    next_page += len(futures)
+
         fixtures: list[dict[str, Any]] = []
-        for page in range(1, max_pages + 1):
-            base_includes = "participants;lineups;sidelined.sideline;metadata"
-            includes = f"{base_includes};xGFixture" if self.include_xg else base_includes
-            try:
-                payload = self._get(
-                    f"fixtures/date/{fixture_date.isoformat()}",
-                    {"include": includes, "page": page},
-                )
-            except SportmonksError as exc:
-                # xG is a paid add-on. A valid free-plan token must still be able
-                # to collect the context fields that are included in its plan.
-                xg_denied = exc.status == 403 and "xgfixture" in exc.detail.lower()
-                if not self.include_xg or not xg_denied:
-                    raise
-                self.include_xg = False
-                payload = self._get(
-                    f"fixtures/date/{fixture_date.isoformat()}",
-                    {"include": base_includes, "page": page},
-                )
+        for payload in payloads:
             data = payload.get("data", [])
             if isinstance(data, dict):
                 data = [data]
             fixtures.extend(item for item in data if isinstance(item, dict))
-            pagination = payload.get("pagination") or payload.get("meta", {}).get("pagination") or {}
-            if not pagination.get("has_more") and not pagination.get("has_more_pages"):
-                break
+        return fixtures
+
+    def fixtures_by_dates(self, dates: list[date], max_pages: int = 10) -> list[dict[str, Any]]:
+        """Fixtures of several days fetched concurrently, returned in date order."""
+        if len(dates) <= 1 or self.concurrency <= 1:
+            return [
+                fixture
+                for fixture_date in dates
+                for fixture in self.fixtures_by_date(fixture_date, max_pages)
+            ]
+        with ThreadPoolExecutor(
+            max_workers=len(dates),
+            thread_name_prefix="sportmonks-day",
+        ) as pool:
+            futures = [pool.submit(self.fixtures_by_date, day, max_pages) for day in dates]
+            fixtures: list[dict[str, Any]] = []
+            try:
+                for future in futures:
+                    fixtures.extend(future.result())
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
         return fixtures
 
 
@@ -315,9 +568,9 @@ def sync_upcoming_context(
     totals = {field: 0 for field in SyncSummary.__dataclass_fields__}
     captured_at = datetime.now(timezone.utc).isoformat()
 
-    fixtures: list[dict[str, Any]] = []
-    for offset in range(max(1, days)):
-        fixtures.extend(client.fixtures_by_date(start + timedelta(days=offset)))
+    fixtures = client.fixtures_by_dates(
+        [start + timedelta(days=offset) for offset in range(max(1, days))]
+    )
     schedule_index = _schedule_index(fixtures)
 
     for fixture in fixtures:
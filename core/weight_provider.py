@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core import model_stats
+
+
+BOOKMAKER_STATS_SQL = """
+    SELECT sport, bookmaker, bets, profit, turnover, avg_clv
+    FROM sport_bookmaker_stats
+"""
+
+
+@dataclass
+class WeightCacheStats:
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+
+
+class WeightProvider:
+    """
+    Process-wide cache for model_stats.json and sport_bookmaker_stats.
+
+    Sport modules ask for sport, league and bookmaker weights and a
+    bookmaker grade for every candidate. Both sources change only after
+    settlement, so they are loaded once and kept in dicts:
+
+    - model stats reload when the JSON file's mtime or size changes;
+    - bookmaker stats reload per database after ``invalidate_bookmakers``,
+      which ``refresh_bookmaker_stats`` calls after writing.
+
+    A hit is a lookup served from memory, a miss one that had to read the
+    source, and a reload a miss caused by a detected change.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats_signature: tuple[str, int, int] | None = None
+        self._stats: dict[str, Any] | None = None
+        self._weights: dict[tuple[str, str], float] = {}
+        self._bookmakers: dict[str, dict[tuple[str, str], tuple]] = {}
+        self._stale_bookmakers: set[str] = set()
+        self.model_stats_counters = WeightCacheStats()
+        self.bookmaker_counters = WeightCacheStats()
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[str, int, int]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return (str(path), -1, -1)
+
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def model_stats(self) -> dict[str, Any]:
+        signature = self._signature(model_stats.MODEL_STATS_FILE)
+
+        with self._lock:
+            if self._stats is not None and signature == self._stats_signature:
+                self.model_stats_counters.hits += 1
+                return self._stats
+
+            self.model_stats_counters.misses += 1
+
+            if self._stats is not None:
+                self.model_stats_counters.reloads += 1
+
+            self._stats = model_stats.load_model_stats()
+            self._stats_signature = signature
+            self._weights.clear()
+            return self._stats
+
+    def weight(
+        self,
+        group: str,
+        name: str,
+        compute,
+    ) -> float:
+        """
+        Memoised ``compute(stats[group].get(name))`` for the current stats.
+        """
+        stats = self.model_stats()
+        key = (group, name)
+
+        with self._lock:
+            value = self._weights.get(key)
+
+        if value is None:
+            value = compute(stats.get(group, {}).get(name))
+
+            with self._lock:
+                if self._stats is stats:
+                    self._weights[key] = value
+
+        return value
+
+    def bookmaker_row(
+        self,
+        db_file: str | Path,
+        sport: str,
+        bookmaker: str,
+    ) -> tuple | None:
+        """(bets, profit, turnover, avg_clv) or None for an unknown pair."""
+        key = str(Path(db_file).resolve())
+
+        with self._lock:
+            rows = self._bookmakers.get(key)
+
+            if rows is not None and key not in self._stale_bookmakers:
+                self.bookmaker_counters.hits += 1
+                return rows.get((sport, bookmaker))
+
+            self.bookmaker_counters.misses += 1
+
+            if rows is not None:
+                self.bookmaker_counters.reloads += 1
+
+        with sqlite3.connect(db_file) as conn:
+            loaded = {
+                (str(row[0]), str(row[1])): tuple(row[2:])
+                for row in conn.execute(BOOKMAKER_STATS_SQL)
+            }
+
+        with self._lock:
+            self._bookmakers[key] = loaded
+            self._stale_bookmakers.discard(key)
+
+        return loaded.get((sport, bookmaker))
+
+    def invalidate_bookmakers(self, db_file: str | Path) -> None:
+        with self._lock:
+            self._stale_bookmakers.add(str(Path(db_file).resolve()))
+
+    def invalidate_model_stats(self) -> None:
+        with self._lock:
+            self._stats_signature = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats_signature = None
+            self._stats = None
+            self._weights.clear()
+            self._bookmakers.clear()
+            self._stale_bookmakers.clear()
+            self.model_stats_counters = WeightCacheStats()
+            self.bookmaker_counters = WeightCacheStats()
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                "model_stats": asdict(self.model_stats_counters),
+                "bookmaker_stats": asdict(self.bookmaker_counters),
+            }
+
+
+_PROVIDER = WeightProvider()
+
+
+def get_weight_provider() -> WeightProvider:
+    return _PROVIDER
+
+
+def weight_cache_counters() -> dict[str, dict[str, int]]:
+    return _PROVIDER.counters()
+
+
+def clear_weight_cache() -> None:
+    _PROVIDER.clear()
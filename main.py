@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import csv
 import logging
 import os
 import sqlite3
@@ -31,6 +30,7 @@ from v16_alerting import evaluate_alerts
 
 from core.multisport_learning_v2.manager import MultisportLearningV2Manager
 from core.config import Settings
+from core.pipeline_stages import Stage, StageScheduler
 from core.reporting import print_report
 from core.sport_settlement import (
     backfill_settled_profit,
@@ -90,10 +90,24 @@ from core.football_snapshot_schema_extractor_v15_20 import run_snapshot_schema_e
 from core.football_closing_odds_writer_v15_21 import run_closing_odds_writer_v15_21
 from core.football_result_learning import run_football_result_learning
 from core.football_settlement import settle_football_bets
+from core.odds_api import close_odds_api_client, odds_api_counters
 from core.football_trainer import ensure_feature_history_table
 from core.football_xg import FootballXGDatabase, FootballXGMetrics
 from core.football_elo import FootballEloDatabase, FootballEloMetrics
 from core.football_team_form import FootballFormDatabase, FootballFormMetrics
+from core.football_rating_snapshot import (
+    RATING_TABLES,
+    invalidate_rating_snapshot,
+)
+from core.history_store import (
+    csv_matches_export,
+    export_history_table,
+    import_history_csv,
+    restore_history_snapshot,
+    save_history_snapshot,
+    snapshot_enabled,
+    snapshot_file,
+)
 from core.football_pipeline_metrics import (
     FootballPipelineMetrics,
     load_football_pipeline_metrics,
@@ -224,46 +238,23 @@ def import_csv_to_table(settings: Settings, table: str, csv_file: str) -> int:
         if not table_exists(conn, table):
             return 0
 
-        with path.open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        stats = import_history_csv(conn, table, csv_file)
 
-        if not rows:
-            return 0
+    if stats.rows_read:
+        log.info(
+            "History import %s: %s rows read, %s new, %.0f rows/s, "
+            "peak RSS %s MB",
+            table,
+            stats.rows_read,
+            stats.rows_inserted,
+            stats.rows_per_second,
+            "n/a" if stats.peak_rss_mb is None else f"{stats.peak_rss_mb:.1f}",
+        )
 
-        columns = list(rows[0].keys())
-        placeholders = ",".join(["?"] * len(columns))
-        col_sql = ",".join(columns)
-
-        sql = f"""
-            INSERT OR IGNORE INTO {table}
-            ({col_sql})
-            VALUES ({placeholders})
-        """
-
-        nullable_sport_bet_columns = {
-            "closing_odds", "clv_pct", "settled_at", "external_event_id",
-            "home_goals", "away_goals", "final_score", "settlement_source",
-            "profit", "profit_units",
-            "opening_odds", "final_odds", "early_released_at",
-            "final_confirmed_at",
-        }
-        values = []
-        for row in rows:
-            values.append([
-                None
-                if table == "sport_bets"
-                and col in nullable_sport_bet_columns
-                and not str(row.get(col, "")).strip()
-                else row.get(col, "")
-                for col in columns
-            ])
-
-        before = conn.total_changes
-        conn.executemany(sql, values)
-        conn.commit()
+    if stats.rows_inserted and table in RATING_TABLES:
+        invalidate_rating_snapshot(db_path(settings))
 
-        return conn.total_changes - before
+    return stats.rows_inserted
 
 
 def export_table_to_csv(settings: Settings, table: str, csv_file: str) -> int:
@@ -275,16 +266,7 @@ def export_table_to_csv(settings: Settings, table: str, csv_file: str) -> int:
         if not table_exists(conn, table):
             return 0
 
-        cursor = conn.execute(f"SELECT * FROM {table}")
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(columns)
-        writer.writerows(rows)
-
-    return len(rows)
+        return export_history_table(conn, table, path)
 
 
 
@@ -351,6 +333,25 @@ def ensure_football_settlement_columns(settings: Settings) -> None:
         conn.commit()
 
 def restore_learning_history(settings: Settings) -> None:
+    snapshot_restored = False
+
+    if snapshot_enabled():
+        try:
+            restored = restore_history_snapshot(
+                db_path(settings),
+                HISTORY_EXPORTS,
+                snapshot_file(),
+            )
+            snapshot_restored = snapshot_file().exists()
+            invalidate_rating_snapshot(db_path(settings))
+            log.info(
+                "Restored learning history snapshot %s (%s rows)",
+                snapshot_file(),
+                restored,
+            )
+        except Exception as e:
+            log.warning("History snapshot restore failed: %s", e)
+
     if init_sport_db is not None:
         try:
             init_sport_db(settings)
@@ -389,6 +390,13 @@ def restore_learning_history(settings: Settings) -> None:
 
     for table, csv_file in HISTORY_EXPORTS.items():
         try:
+            if snapshot_restored:
+                # CSVs written together with the snapshot are already in
+                # it; only files changed since (e.g. cleanups) are merged.
+                with db_connect(settings) as conn:
+                    if csv_matches_export(conn, table, csv_file):
+                        continue
+
             imported = import_csv_to_table(settings, table, csv_file)
             total += imported
 
@@ -422,6 +430,21 @@ def save_learning_history(settings: Settings) -> None:
 
     log.info("Learning history export finished. Exported rows: %s", total)
 
+    if snapshot_enabled():
+        try:
+            kept = save_history_snapshot(
+                db_path(settings),
+                HISTORY_EXPORTS,
+                snapshot_file(),
+            )
+            log.info(
+                "Saved learning history snapshot %s (%s tables)",
+                snapshot_file(),
+                kept,
+            )
+        except Exception as e:
+            log.warning("History snapshot save failed: %s", e)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Multisport betting engine")
@@ -436,6 +459,11 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--analytics", action="store_true")
     parser.add_argument("--backtest", action="store_true")
     parser.add_argument("--no-email", action="store_true")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild incremental datasets from scratch.",
+    )
 
     parser.add_argument(
         "--backtest-days",
@@ -486,6 +514,305 @@ def send_multisport_email(body: str) -> bool:
         return False
 
 
+def post_scan_stages(
+    settings: Settings,
+    *,
+    full_rebuild: bool = False,
+) -> list[Stage]:
+    """
+    Football rebuilds after settlement, in their original order.
+
+    Reads/writes drive the ordering in StageScheduler; independent
+    rebuilds (league calibration, team xG/ELO v14, feature sync) overlap
+    with the report-only stages that read the dataset.
+    """
+
+    def enabled(name: str) -> bool:
+        return os.getenv(name, "1") == "1"
+
+    def report_result_learning(result) -> None:
+        log.info(
+            "Football result learning finished: "
+            "discovered=%s, processed=%s, missing_score=%s, "
+            "xg=%s, elo=%s, form=%s",
+            result.discovered,
+            result.processed,
+            result.skipped_without_score,
+            result.xg_updates,
+            result.elo_updates,
+            result.form_updates,
+        )
+
+    def report_data_collector(result) -> None:
+        log.info(
+            "Football Data Collector v14 finished: "
+            "market_added=%s, xg_added=%s, "
+            "market_total=%s, xg_total=%s",
+            result.market_snapshots_added,
+            result.xg_rows_added,
+            result.market_snapshots_total,
+            result.xg_rows_total,
+        )
+
+    def report_feature_sync(result) -> None:
+        log.info(
+            "Football feature sync finished: "
+            "synced=%s, settled=%s, open=%s",
+            result.synced_features,
+            result.settled_features,
+            result.open_features,
+        )
+
+    def report_meta_v14(result) -> None:
+        log.info(
+            "Football Meta AI v14 finished: "
+            "trained=%s, samples=%s, wins=%s, losses=%s, "
+            "milestone=%s, model=%s, validation=%.3f",
+            result.trained,
+            result.samples,
+            result.wins,
+            result.losses,
+            result.milestone,
+            result.model_type or "none",
+            result.validation_score,
+        )
+
+        if result.skipped_reason:
+            log.info(
+                "Football Meta AI v14 skipped: %s",
+                result.skipped_reason,
+            )
+
+    def report_postmatch(result) -> None:
+        log.info(
+            "Football Postmatch Dataset v14 finished: "
+            "discovered=%s, inserted=%s, updated=%s, "
+            "missing_closing=%s, total=%s",
+            result.discovered,
+            result.inserted,
+            result.updated,
+            result.missing_closing_line,
+            result.total_rows,
+        )
+
+    def report_dataset_v15(result) -> None:
+        log.info(
+            "Football Dataset v15 finished: "
+            "discovered=%s, inserted=%s, updated=%s, "
+            "with_closing=%s, with_xg=%s, "
+            "with_elo=%s, with_form=%s, "
+            "training_ready=%s, total=%s, mode=%s",
+            result.discovered,
+            result.inserted,
+            result.updated,
+            result.with_closing,
+            result.with_xg,
+            result.with_elo,
+            result.with_form,
+            result.training_ready,
+            result.total_rows,
+            "incremental" if getattr(result, "incremental", False) else "full",
+        )
+
+    def report_evaluation(result) -> None:
+        log.info(
+            "Football Evaluation Dashboard v15 finished: "
+            "total=%s, training_ready=%s, wins=%s, losses=%s, "
+            "hit_rate=%s, brier=%s, log_loss=%s, "
+            "avg_clv=%s, avg_consensus_safety=%s",
+            result.total_rows,
+            result.training_ready_rows,
+            result.wins,
+            result.losses,
+            (
+                f"{result.hit_rate:.3f}"
+                if result.hit_rate is not None
+                else "n/a"
+            ),
+            (
+                f"{result.brier_score:.4f}"
+                if result.brier_score is not None
+                else "n/a"
+            ),
+            (
+                f"{result.log_loss:.4f}"
+                if result.log_loss is not None
+                else "n/a"
+            ),
+            (
+                f"{result.average_clv_probability:.4f}"
+                if result.average_clv_probability is not None
+                else "n/a"
+            ),
+            (
+                f"{result.average_consensus_safety:.3f}"
+                if result.average_consensus_safety is not None
+                else "n/a"
+            ),
+        )
+
+    def report_feature_importance(result) -> None:
+        ranking = result.get("feature_ranking", [])
+
+        log.info(
+            "Football Feature Importance v15 finished: "
+            "samples=%s, top_feature=%s, warning=%s",
+            result.get("training_samples", 0),
+            ranking[0].get("feature", "n/a") if ranking else "n/a",
+            result.get("warning", "none"),
+        )
+
+    feature_history = ("football_feature_history",)
+    elo_form_xg = (
+        "football_elo_ratings",
+        "football_elo_history",
+        "football_team_form",
+        "football_form_history",
+        "football_xg_ratings",
+        "football_xg_history",
+    )
+
+    return [
+        Stage(
+            name="football_result_learning",
+            run=lambda: run_football_result_learning(settings),
+            reads=("sport_bets",),
+            writes=("football_result_learning_state",) + elo_form_xg,
+            enabled=enabled("FOOTBALL_RESULT_LEARNING_ENABLED"),
+            report=report_result_learning,
+        ),
+        Stage(
+            name="football_data_collector_v14",
+            run=lambda: run_football_data_collector_v14(
+                settings,
+                closing_window_hours=float(
+                    os.getenv("FOOTBALL_CLOSING_WINDOW_HOURS", "12")
+                ),
+            ),
+            reads=feature_history + ("football_xg_history",),
+            writes=(
+                "football_market_snapshots_v14",
+                "football_xg_history_v14",
+            ),
+            enabled=enabled("FOOTBALL_DATA_COLLECTOR_V14_ENABLED"),
+            # The closing window is relative to the current time.
+            skip_unchanged=False,
+            report=report_data_collector,
+        ),
+        Stage(
+            name="football_league_calibration",
+            run=lambda: rebuild_football_league_calibrations(settings),
+            reads=("football_form_history",),
+            writes=("football_league_calibration",),
+            files=("exports/football_league_calibration.json",),
+            enabled=enabled("FOOTBALL_LEAGUE_CALIBRATION_ENABLED"),
+            report=lambda rebuilt: log.info(
+                "Football league calibration finished: rebuilt=%s",
+                rebuilt,
+            ),
+        ),
+        Stage(
+            name="football_team_xg_v14",
+            run=lambda: FootballTeamXGV14Database(settings).rebuild_all(),
+            reads=("football_xg_history",),
+            writes=("football_team_xg_v14",),
+            enabled=enabled("FOOTBALL_TEAM_XG_V14_ENABLED"),
+            report=lambda rebuilt: log.info(
+                "Football Team xG v14 finished: rebuilt=%s",
+                rebuilt,
+            ),
+        ),
+        Stage(
+            name="football_team_elo_v14",
+            run=lambda: FootballTeamEloV14Database(
+                settings,
+            ).rebuild_from_history(),
+            reads=("football_form_history",),
+            writes=(
+                "football_team_elo_v14",
+                "football_team_elo_v14_history",
+            ),
+            enabled=enabled("FOOTBALL_TEAM_ELO_V14_ENABLED"),
+            report=lambda rebuilt: log.info(
+                "Football Team ELO v14 finished: rebuilt=%s",
+                rebuilt,
+            ),
+        ),
+        Stage(
+            # First synchronize settled results into feature history.
+            name="football_feature_sync",
+            run=lambda: run_football_learning(settings, min_samples=999999),
+            reads=("sport_bets",),
+            writes=feature_history,
+            enabled=enabled("FOOTBALL_LEARNING_ENABLED"),
+            report=report_feature_sync,
+        ),
+        Stage(
+            name="football_meta_v14",
+            run=lambda: run_football_meta_ai_v14(settings),
+            reads=feature_history,
+            files=(
+                "exports/football_meta_v14_report.json",
+                "exports/football_meta_v14_feature_importance.json",
+            ),
+            enabled=enabled("FOOTBALL_LEARNING_ENABLED"),
+            # Training also depends on the model files on disk.
+            skip_unchanged=False,
+            report=report_meta_v14,
+        ),
+        Stage(
+            name="football_postmatch_dataset_v14",
+            run=lambda: rebuild_football_postmatch_dataset_v14(settings),
+            reads=feature_history + (
+                "football_market_closing",
+                "football_market_snapshots_v14",
+            ),
+            writes=("football_postmatch_dataset_v14",),
+            enabled=enabled("FOOTBALL_POSTMATCH_DATASET_V14_ENABLED"),
+            report=report_postmatch,
+        ),
+        Stage(
+            name="football_dataset_v15",
+            run=lambda: rebuild_football_dataset_v15(
+                settings,
+                full=full_rebuild,
+            ),
+            reads=feature_history + elo_form_xg + (
+                "football_market_closing",
+                "football_market_snapshots_v14",
+                "football_xg_history_v14",
+                "football_team_elo_v14",
+            ),
+            writes=("football_dataset_v15", "football_dataset_v15_state"),
+            enabled=enabled("FOOTBALL_DATASET_V15_ENABLED"),
+            skip_unchanged=not full_rebuild,
+            report=report_dataset_v15,
+        ),
+        Stage(
+            name="football_evaluation_v15",
+            run=lambda: run_football_evaluation_dashboard_v15(settings),
+            reads=("football_dataset_v15",),
+            files=(
+                "exports/football_evaluation_dashboard_v15.csv",
+                "exports/football_evaluation_dashboard_v15.json",
+            ),
+            enabled=enabled("FOOTBALL_EVALUATION_V15_ENABLED"),
+            report=report_evaluation,
+        ),
+        Stage(
+            name="football_feature_importance_v15",
+            run=lambda: run_feature_importance_v15(str(db_path(settings))),
+            reads=("football_dataset_v15",),
+            files=(
+                "exports/football_feature_importance_v15.csv",
+                "exports/football_feature_importance_v15.json",
+            ),
+            enabled=enabled("FOOTBALL_FEATURE_IMPORTANCE_V15_ENABLED"),
+            report=report_feature_importance,
+        ),
+    ]
+
+
 async def run_sport_module(
     sport,
     settings: Settings,
@@ -898,233 +1225,22 @@ async def run() -> None:
         except Exception:
             log.exception("Football settlement failed")
 
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_RESULT_LEARNING_ENABLED", "1") == "1"
-    ):
-        try:
-            football_result_learning = run_football_result_learning(
-                settings,
-            )
-
-            log.info(
-                "Football result learning finished: "
-                "discovered=%s, processed=%s, missing_score=%s, "
-                "xg=%s, elo=%s, form=%s",
-                football_result_learning.discovered,
-                football_result_learning.processed,
-                football_result_learning.skipped_without_score,
-                football_result_learning.xg_updates,
-                football_result_learning.elo_updates,
-                football_result_learning.form_updates,
-            )
-
-        except Exception:
-            log.exception("Football result learning failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_DATA_COLLECTOR_V14_ENABLED", "1") == "1"
-    ):
-        try:
-            football_data = run_football_data_collector_v14(
-                settings,
-                closing_window_hours=float(
-                    os.getenv(
-                        "FOOTBALL_CLOSING_WINDOW_HOURS",
-                        "12",
-                    )
-                ),
-            )
-
-            log.info(
-                "Football Data Collector v14 finished: "
-                "market_added=%s, xg_added=%s, "
-                "market_total=%s, xg_total=%s",
-                football_data.market_snapshots_added,
-                football_data.xg_rows_added,
-                football_data.market_snapshots_total,
-                football_data.xg_rows_total,
-            )
-
-        except Exception:
-            log.exception("Football Data Collector v14 failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_LEAGUE_CALIBRATION_ENABLED", "1") == "1"
-    ):
-        try:
-            calibrated_leagues = rebuild_football_league_calibrations(
-                settings,
-            )
-
-            log.info(
-                "Football league calibration finished: rebuilt=%s",
-                calibrated_leagues,
-            )
-
-        except Exception:
-            log.exception("Football league calibration failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_TEAM_XG_V14_ENABLED", "1") == "1"
-    ):
-        try:
-            rebuilt_team_xg = FootballTeamXGV14Database(
-                settings,
-            ).rebuild_all()
-
-            log.info(
-                "Football Team xG v14 finished: rebuilt=%s",
-                rebuilt_team_xg,
-            )
-
-        except Exception:
-            log.exception("Football Team xG v14 failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_TEAM_ELO_V14_ENABLED", "1") == "1"
-    ):
-        try:
-            rebuilt_team_elo = FootballTeamEloV14Database(
-                settings,
-            ).rebuild_from_history()
-
-            log.info(
-                "Football Team ELO v14 finished: rebuilt=%s",
-                rebuilt_team_elo,
-            )
-
-        except Exception:
-            log.exception("Football Team ELO v14 failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_LEARNING_ENABLED", "1") == "1"
-    ):
-        try:
-            # First synchronize settled results into feature history.
-            football_learning = run_football_learning(
-                settings,
-                min_samples=999999,
-            )
-
-            log.info(
-                "Football feature sync finished: "
-                "synced=%s, settled=%s, open=%s",
-                football_learning.synced_features,
-                football_learning.settled_features,
-                football_learning.open_features,
-            )
-
-        except Exception:
-            log.exception("Football feature sync failed")
-
-        try:
-            football_meta_v14 = run_football_meta_ai_v14(
-                settings,
-            )
-
-            log.info(
-                "Football Meta AI v14 finished: "
-                "trained=%s, samples=%s, wins=%s, losses=%s, "
-                "milestone=%s, model=%s, validation=%.3f",
-                football_meta_v14.trained,
-                football_meta_v14.samples,
-                football_meta_v14.wins,
-                football_meta_v14.losses,
-                football_meta_v14.milestone,
-                football_meta_v14.model_type or "none",
-                football_meta_v14.validation_score,
-            )
-
-            if football_meta_v14.skipped_reason:
-                log.info(
-                    "Football Meta AI v14 skipped: %s",
-                    football_meta_v14.skipped_reason,
-                )
-
-        except Exception:
-            log.exception("Football Meta AI v14 failed")
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_POSTMATCH_DATASET_V14_ENABLED", "1") == "1"
-    ):
-        try:
-            postmatch_dataset = (
-                rebuild_football_postmatch_dataset_v14(
-                    settings,
-                )
-            )
-
-            log.info(
-                "Football Postmatch Dataset v14 finished: "
-                "discovered=%s, inserted=%s, updated=%s, "
-                "missing_closing=%s, total=%s",
-                postmatch_dataset.discovered,
-                postmatch_dataset.inserted,
-                postmatch_dataset.updated,
-                postmatch_dataset.missing_closing_line,
-                postmatch_dataset.total_rows,
-            )
-
-        except Exception:
-            log.exception(
-                "Football Postmatch Dataset v14 failed"
-            )
+    if not args.dry_run and not args.analytics and not args.backtest:
+        stage_outcomes = StageScheduler(db_path(settings)).run(
+            post_scan_stages(settings, full_rebuild=args.full)
+        )
 
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_DATASET_V15_ENABLED", "1") == "1"
-    ):
-        try:
-            football_dataset_v15 = (
-                rebuild_football_dataset_v15(
-                    settings,
-                )
-            )
+        # Later reports check locals() for results of successful stages.
+        if stage_outcomes["football_meta_v14"].ok:
+            football_meta_v14 = stage_outcomes["football_meta_v14"].result
 
-            log.info(
-                "Football Dataset v15 finished: "
-                "discovered=%s, inserted=%s, updated=%s, "
-                "with_closing=%s, with_xg=%s, "
-                "with_elo=%s, with_form=%s, "
-                "training_ready=%s, total=%s",
-                football_dataset_v15.discovered,
-                football_dataset_v15.inserted,
-                football_dataset_v15.updated,
-                football_dataset_v15.with_closing,
-                football_dataset_v15.with_xg,
-                football_dataset_v15.with_elo,
-                football_dataset_v15.with_form,
-                football_dataset_v15.training_ready,
-                football_dataset_v15.total_rows,
-            )
+        if stage_outcomes["football_dataset_v15"].ok:
+            football_dataset_v15 = stage_outcomes["football_dataset_v15"].result
 
-        except Exception:
-            log.exception(
-                "Football Dataset v15 failed"
-            )
+        if stage_outcomes["football_feature_importance_v15"].ok:
+            football_feature_importance = stage_outcomes[
+                "football_feature_importance_v15"
+            ].result
 
     if not args.dry_run and not args.analytics and not args.backtest:
         try:
@@ -1175,101 +1291,6 @@ async def run() -> None:
         except Exception:
             log.exception("Football pipeline metrics failed")
 
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_EVALUATION_V15_ENABLED", "1") == "1"
-    ):
-        try:
-            football_evaluation = (
-                run_football_evaluation_dashboard_v15(
-                    settings,
-                )
-            )
-
-            log.info(
-                "Football Evaluation Dashboard v15 finished: "
-                "total=%s, training_ready=%s, wins=%s, losses=%s, "
-                "hit_rate=%s, brier=%s, log_loss=%s, "
-                "avg_clv=%s, avg_consensus_safety=%s",
-                football_evaluation.total_rows,
-                football_evaluation.training_ready_rows,
-                football_evaluation.wins,
-                football_evaluation.losses,
-                (
-                    f"{football_evaluation.hit_rate:.3f}"
-                    if football_evaluation.hit_rate is not None
-                    else "n/a"
-                ),
-                (
-                    f"{football_evaluation.brier_score:.4f}"
-                    if football_evaluation.brier_score is not None
-                    else "n/a"
-                ),
-                (
-                    f"{football_evaluation.log_loss:.4f}"
-                    if football_evaluation.log_loss is not None
-                    else "n/a"
-                ),
-                (
-                    f"{football_evaluation.average_clv_probability:.4f}"
-                    if football_evaluation.average_clv_probability is not None
-                    else "n/a"
-                ),
-                (
-                    f"{football_evaluation.average_consensus_safety:.3f}"
-                    if football_evaluation.average_consensus_safety is not None
-                    else "n/a"
-                ),
-            )
-
-        except Exception:
-            log.exception(
-                "Football Evaluation Dashboard v15 failed"
-            )
-
-    if (
-        not args.dry_run
-        and not args.analytics
-        and not args.backtest
-        and os.getenv("FOOTBALL_FEATURE_IMPORTANCE_V15_ENABLED", "1") == "1"
-    ):
-        try:
-            football_feature_importance = run_feature_importance_v15(
-                str(db_path(settings)),
-            )
-
-            ranking = football_feature_importance.get(
-                "feature_ranking",
-                [],
-            )
-
-            top_feature = (
-                ranking[0].get("feature", "n/a")
-                if ranking
-                else "n/a"
-            )
-
-            log.info(
-                "Football Feature Importance v15 finished: "
-                "samples=%s, top_feature=%s, warning=%s",
-                football_feature_importance.get(
-                    "training_samples",
-                    0,
-                ),
-                top_feature,
-                football_feature_importance.get(
-                    "warning",
-                    "none",
-                ),
-            )
-
-        except Exception:
-            log.exception(
-                "Football Feature Importance v15 failed"
-            )
-
     if (
         not args.dry_run
         and not args.analytics
@@ -2252,7 +2273,15 @@ async def run() -> None:
         log.info("Email sending disabled by configuration.")
 
 
+async def run_and_close() -> None:
+    try:
+        await run()
+    finally:
+        log.info("Odds API usage: %s", odds_api_counters())
+        await close_odds_api_client()
+
+
 if __name__ == "__main__":
-    asyncio.run(run())
+    asyncio.run(run_and_close())
 
 
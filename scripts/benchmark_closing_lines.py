@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config import Settings
+from core.sport_quant import connect, init_sport_db, update_closing_lines
+
+
+BOOKMAKERS = [
+    "Pinnacle", "Bet365", "Unibet", "Tipsport", "Betfair", "William Hill",
+    "Marathonbet", "1xBet",
+]
+SELECTIONS = ["Home", "Draw", "Away"]
+
+
+def row_by_row_update(settings: Settings, sport: str) -> int:
+    """The per-bet backfill this replaces: two correlated queries per bet."""
+    with connect(settings) as conn:
+        rows = conn.execute("""
+            SELECT id, league, event, selection, bookmaker, odds, start_time
+            FROM sport_bets
+            WHERE sport=?
+              AND odds > 1.01
+              AND (closing_odds IS NULL OR clv_pct IS NULL)
+        """, (sport,)).fetchall()
+
+    updates: list[tuple[float, float, int]] = []
+
+    for bet_id, league, event, selection, bookmaker, taken_odds, start_time in rows:
+        closing_odds = None
+
+        with connect(settings) as conn:
+            same_book = conn.execute("""
+                SELECT odds
+                FROM sport_odds_snapshots
+                WHERE sport=? AND league=? AND event=? AND selection=? AND bookmaker=?
+                  AND odds > 1.01
+                  AND captured_at <= COALESCE(?, captured_at)
+                ORDER BY captured_at DESC
+                LIMIT 1
+            """, (sport, league, event, selection, bookmaker, start_time)).fetchone()
+
+            if same_book:
+                closing_odds = float(same_book[0])
+            else:
+                market_avg = conn.execute("""
+                    SELECT AVG(odds)
+                    FROM (
+                        SELECT bookmaker, odds, MAX(captured_at)
+                        FROM sport_odds_snapshots
+                        WHERE sport=? AND league=? AND event=? AND selection=?
+                          AND odds > 1.01
+                          AND captured_at <= COALESCE(?, captured_at)
+                        GROUP BY bookmaker
+                    )
+                """, (sport, league, event, selection, start_time)).fetchone()
+
+                if market_avg and market_avg[0]:
+                    closing_odds = float(market_avg[0])
+
+        if closing_odds and closing_odds > 1.01:
+            clv_pct = (float(taken_odds) / closing_odds) - 1.0
+            updates.append((round(closing_odds, 4), round(clv_pct, 5), int(bet_id)))
+
+    if updates:
+        with connect(settings) as conn:
+            conn.executemany("""
+                UPDATE sport_bets
+                SET closing_odds=?, clv_pct=?
+                WHERE id=?
+            """, updates)
+
+    return len(updates)
+
+
+def build_database(db_file: Path, snapshots: int, bets: int, seed: int) -> None:
+    settings = Settings(db_file=str(db_file))
+    init_sport_db(settings)
+    rng = random.Random(seed)
+    events = max(10, snapshots // 400)
+    start = datetime(2026, 8, 1)
+    kickoffs = [
+        start + timedelta(minutes=rng.randrange(60 * 24 * 60))
+        for _ in range(events)
+    ]
+
+    def snapshot_rows():
+        # Prices are polled over the three days before kickoff, with a
+        # few in-play captures that must not count as closing lines.
+        for index in range(snapshots):
+            event = rng.randrange(events)
+            captured = kickoffs[event] - timedelta(
+                seconds=rng.randrange(-2 * 3600, 3 * 24 * 3600)
+            )
+            yield (
+                captured.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "football",
+                f"League {event % 20}",
+                f"Event {event}",
+                rng.choice(BOOKMAKERS),
+                rng.choice(SELECTIONS),
+                round(rng.uniform(1.2, 6.0), 3),
+                f"s{index}",
+            )
+
+    def bet_rows():
+        for index in range(bets):
+            event = rng.randrange(events)
+            yield (
+                "football",
+                f"League {event % 20}",
+                f"Event {event}",
+                rng.choice(SELECTIONS),
+                rng.choice(BOOKMAKERS),
+                round(rng.uniform(1.2, 6.0), 3),
+                kickoffs[event].strftime("%Y-%m-%dT%H:%M:%SZ"),
+                f"b{index}",
+            )
+
+    with sqlite3.connect(db_file) as conn:
+        conn.executemany("""
+            INSERT INTO sport_odds_snapshots (
+                captured_at, sport, league, event, bookmaker, selection,
+                odds, source_hash
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, snapshot_rows())
+        conn.executemany("""
+            INSERT INTO sport_bets (
+                sport, league, event, selection, bookmaker, odds,
+                start_time, source_hash
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, bet_rows())
+        conn.execute("ANALYZE")
+
+
+def closing_values(db_file: Path) -> list[tuple]:
+    with sqlite3.connect(db_file) as conn:
+        return conn.execute("""
+            SELECT id, closing_odds, clv_pct
+            FROM sport_bets
+            ORDER BY id
+        """).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the row-by-row and set-based closing-line backfill "
+            "on synthetic sport_odds_snapshots tables."
+        )
+    )
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--bets", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        for size in (int(value) for value in args.sizes.split(",") if value):
+            source = Path(temp_dir) / f"snapshots_{size}.db"
+            started = time.perf_counter()
+            build_database(source, size, args.bets, seed=size)
+            built = time.perf_counter() - started
+
+            timings = {}
+            results = {}
+
+            for name, update in (
+                ("row-by-row", row_by_row_update),
+                ("set-based", update_closing_lines),
+            ):
+                db_file = Path(temp_dir) / f"{name}.db"
+                db_file.unlink(missing_ok=True)
+
+                with sqlite3.connect(source) as src, sqlite3.connect(db_file) as dst:
+                    src.backup(dst)
+
+                settings = Settings(db_file=str(db_file))
+
+                started = time.perf_counter()
+                updated = update(settings, "football")
+                timings[name] = time.perf_counter() - started
+                results[name] = closing_values(db_file)
+
+                print(
+                    f"snapshots={size:>9} bets={args.bets} {name:>10}: "
+                    f"{timings[name]:8.3f}s updated={updated}"
+                )
+
+            same = results["row-by-row"] == results["set-based"]
+            print(
+                f"snapshots={size:>9} build={built:.1f}s "
+                f"speed-up={timings['row-by-row'] / max(timings['set-based'], 1e-9):.1f}x "
+                f"identical={same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config import Settings
+from core.football_data_collector_v14 import FootballDataCollectorV14
+from core.football_dataset_v15 import FootballDatasetV15
+from core.football_enrichment import (
+    ELO_SOURCES,
+    FORM_SOURCES,
+    ensure_enrichment_indexes,
+    load_closing_snapshots,
+    load_team_values,
+    load_xg_rows,
+)
+from core.football_market import FootballMarketDatabase
+from core.football_postmatch_dataset_v14 import FootballPostmatchDatasetV14
+from core.football_team_elo_v14 import FootballTeamEloV14Database
+from core.football_team_form import FootballFormDatabase
+from core.football_trainer import ensure_feature_history_table
+
+
+HISTORY_TABLES = {
+    "football_feature_history": "history_football_features.csv",
+    "football_market_closing": "history_football_market_closing.csv",
+    "football_market_snapshots_v14": "history_football_market_snapshots_v14.csv",
+    "football_xg_history_v14": "history_football_xg_history_v14.csv",
+    "football_team_elo_v14": "history_football_team_elo_v14.csv",
+    "football_team_form": "history_football_team_form.csv",
+}
+
+
+def load_history(db_file: Path, exports_dir: Path) -> dict[str, int]:
+    settings = Settings(db_file=str(db_file))
+    ensure_feature_history_table(db_file)
+    FootballMarketDatabase(settings).init_db()
+    FootballDataCollectorV14(settings)
+    FootballTeamEloV14Database(settings).init_db()
+    FootballFormDatabase(settings).init_db()
+
+    counts: dict[str, int] = {}
+
+    with sqlite3.connect(db_file) as conn:
+        for table, file_name in HISTORY_TABLES.items():
+            path = exports_dir / file_name
+
+            if not path.exists():
+                counts[table] = 0
+                continue
+
+            columns = {
+                str(row[1])
+                for row in conn.execute(f"PRAGMA table_info({table})")
+            }
+
+            with path.open("r", encoding="utf-8", newline="") as handle:
+                rows = list(csv.DictReader(handle))
+
+            if not rows:
+                counts[table] = 0
+                continue
+
+            names = [name for name in rows[0] if name in columns]
+            conn.executemany(
+                f"""
+                INSERT OR IGNORE INTO {table} ({", ".join(names)})
+                VALUES ({", ".join("?" for _ in names)})
+                """,
+                [
+                    [row[name] if row[name] != "" else None for name in names]
+                    for row in rows
+                ],
+            )
+            counts[table] = len(rows)
+
+        conn.commit()
+
+    return counts
+
+
+def row_at_a_time(
+    dataset: FootballDatasetV15,
+    conn: sqlite3.Connection,
+    identities: list[tuple[str, ...]],
+) -> list[tuple]:
+    results = []
+
+    for sport_key, league, event, selection, commence_time, home, away in identities:
+        closing = dataset._closing_snapshot(
+            conn,
+            sport_key=sport_key,
+            event=event,
+            selection=selection,
+            commence_time=commence_time,
+        )
+        xg = dataset._xg_row(
+            conn,
+            league=league,
+            home_team=home,
+            away_team=away,
+            commence_time=commence_time,
+        )
+        results.append((
+            closing["selected_odds"] if closing is not None else None,
+            xg["home_xg"] if xg is not None else None,
+            dataset._elo_context(
+                conn, league=league, home_team=home, away_team=away,
+            ),
+            dataset._form_context(
+                conn, league=league, home_team=home, away_team=away,
+            ),
+        ))
+
+    return results
+
+
+def set_based(
+    conn: sqlite3.Connection,
+    identities: list[tuple[str, ...]],
+) -> list[tuple]:
+    ensure_enrichment_indexes(conn)
+    closing = load_closing_snapshots(
+        conn,
+        ((row[0], row[2], row[3], row[4]) for row in identities),
+    )
+    xg = load_xg_rows(
+        conn,
+        ((row[1], row[5], row[6], row[4]) for row in identities),
+    )
+    elo = load_team_values(conn, ELO_SOURCES)
+    form = load_team_values(conn, FORM_SOURCES)
+
+    results = []
+
+    for sport_key, league, event, selection, commence_time, home, away in identities:
+        snapshot = closing.get((sport_key, event, selection, commence_time))
+        match_xg = xg.get((league, home, away, commence_time))
+        results.append((
+            snapshot["selected_odds"] if snapshot is not None else None,
+            match_xg["home_xg"] if match_xg is not None else None,
+            (elo.get((home, league)), elo.get((away, league))),
+            (form.get((home, league)), form.get((away, league))),
+        ))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare row-at-a-time and set-based enrichment on the "
+            "exports/history_*.csv data."
+        )
+    )
+    parser.add_argument("--exports", default=str(PROJECT_ROOT / "exports"))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        db_file = Path(temp_dir) / "bench.db"
+        counts = load_history(db_file, Path(args.exports))
+        print("Loaded:", ", ".join(f"{k}={v}" for k, v in counts.items()))
+
+        settings = Settings(db_file=str(db_file))
+        dataset = FootballDatasetV15(settings)
+
+        with dataset.connect() as conn:
+            columns = dataset._columns(conn, "football_feature_history")
+            rows = conn.execute(
+                """
+                SELECT *
+                FROM football_feature_history
+                WHERE UPPER(COALESCE(result, 'OPEN')) IN ('WON', 'LOST')
+                """
+            ).fetchall()
+            identities = [dataset._identity(row, columns) for row in rows]
+
+            timings = {}
+            outputs = {}
+
+            for name, run in (
+                ("row-at-a-time", lambda: row_at_a_time(dataset, conn, identities)),
+                ("set-based", lambda: set_based(conn, identities)),
+            ):
+                best = float("inf")
+
+                for _ in range(max(1, args.repeat)):
+                    started = time.perf_counter()
+                    outputs[name] = run()
+                    best = min(best, time.perf_counter() - started)
+
+                timings[name] = best
+
+        same = outputs["row-at-a-time"] == outputs["set-based"]
+        print(f"Settled feature rows: {len(identities)}")
+
+        for name, seconds in timings.items():
+            print(f"{name:>14}: {seconds * 1000:8.1f} ms")
+
+        print(
+            f"Speed-up: {timings['row-at-a-time'] / max(timings['set-based'], 1e-9):.1f}x, "
+            f"identical={same}"
+        )
+
+        for label, rebuild in (
+            ("dataset v15 rebuild", lambda: dataset.rebuild(full=True)),
+            (
+                "postmatch v14 rebuild",
+                lambda: FootballPostmatchDatasetV14(settings).rebuild(),
+            ),
+        ):
+            started = time.perf_counter()
+            summary = rebuild()
+            print(
+                f"{label}: {time.perf_counter() - started:.3f}s "
+                f"(discovered={summary.discovered})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.export_tables import clear_export_tables, export_table_counters
+from core.football_closing_features_bridge_v15_48 import run_closing_features_bridge_v15_48
+from core.football_closing_odds_match_writer_v15_27 import run_closing_odds_match_writer_v15_27
+from core.football_correct_snapshot_source_loader_v15_39 import (
+    run_correct_snapshot_source_loader_v15_39,
+)
+from core.football_csv_snapshot_loader_v15_26 import run_csv_snapshot_loader_v15_26
+from core.football_dataset_key_diagnostics_v15_62 import run_dataset_key_diagnostics_v15_62
+from core.football_event_split_adapter_v15_32 import run_event_split_adapter_v15_32
+from core.football_opening_odds_bridge_v15_43 import run_opening_odds_bridge_v15_43
+from core.football_smart_match_resolver_v15_29 import run_smart_match_resolver_v15_29
+from core.football_universal_match_resolver_v15_28 import run_universal_match_resolver_v15_28
+
+
+TEAMS = [f"Team {index}" for index in range(400)]
+
+
+def write_csv(path: Path, rows: list[dict]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_exports(exports: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+    exports.mkdir(parents=True, exist_ok=True)
+
+    def match_row(index: int) -> dict:
+        home, away = rng.sample(TEAMS, 2)
+        return {
+            "source_hash": f"h{index}",
+            "event": f"{home} vs {away}",
+            "home_team": home,
+            "away_team": away,
+            "selection": rng.choice(["Home", "Draw", "Away"]),
+            "bookmaker": rng.choice(["Pinnacle", "Bet365", "Unibet"]),
+            "league": "EPL",
+            "commence_time": f"2026-09-{index % 28 + 1:02d}T15:00:00Z",
+            "captured_at": f"2026-09-{index % 28 + 1:02d}T12:00:00Z",
+            "odds": f"{rng.uniform(1.3, 5.0):.3f}",
+            "opening_odds": f"{rng.uniform(1.3, 5.0):.3f}",
+        }
+
+    for name in (
+        "history_football_market_snapshots_v14.csv",
+        "history_football_postmatch_dataset_v14.csv",
+        "history_football_dataset_v15.csv",
+        "history_football_features.csv",
+    ):
+        write_csv(exports / name, [match_row(index) for index in range(rows)])
+
+
+def run_readers(rows: int) -> None:
+    join_ready = [
+        {"home_team": home, "away_team": away}
+        for home, away in zip(TEAMS[::2], TEAMS[1::2])
+    ]
+    resolved = [{"postmatch": {"source_hash": f"h{index}"}} for index in range(0, rows, 7)]
+
+    run_csv_snapshot_loader_v15_26()
+    run_closing_odds_match_writer_v15_27(join_ready_rows=join_ready)
+    run_universal_match_resolver_v15_28(join_ready)
+    run_smart_match_resolver_v15_29(join_ready)
+    run_event_split_adapter_v15_32()
+    run_correct_snapshot_source_loader_v15_39()
+    run_opening_odds_bridge_v15_43(resolved)
+    run_closing_features_bridge_v15_48([item["postmatch"] for item in resolved])
+    run_dataset_key_diagnostics_v15_62()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Run the CSV-reading v15 loaders, resolvers and diagnostics with "
+            "and without the shared export table cache."
+        )
+    )
+    parser.add_argument("--sizes", default="5000,50000")
+    args = parser.parse_args()
+
+    cwd = os.getcwd()
+    budget = os.environ.get("EXPORT_TABLE_CACHE_MB")
+
+    try:
+        for rows in (int(value) for value in args.sizes.split(",") if value):
+            with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+                os.chdir(temp_dir)
+                build_exports(Path("exports"), rows, seed=rows)
+                timings = {}
+
+                for name, cache_mb in (("no cache", "0"), ("cache", "512")):
+                    os.environ["EXPORT_TABLE_CACHE_MB"] = cache_mb
+                    clear_export_tables()
+
+                    started = time.perf_counter()
+                    run_readers(rows)
+                    timings[name] = time.perf_counter() - started
+
+                counters = export_table_counters()
+                os.chdir(cwd)
+
+            print(
+                f"rows={rows:>7}: no cache {timings['no cache']:6.2f}s, "
+                f"cache {timings['cache']:6.2f}s "
+                f"({timings['no cache'] / max(timings['cache'], 1e-9):4.1f}x), "
+                f"parsed={counters['misses']} reused={counters['hits']}"
+            )
+    finally:
+        os.chdir(cwd)
+        if budget is None:
+            os.environ.pop("EXPORT_TABLE_CACHE_MB", None)
+        else:
+            os.environ["EXPORT_TABLE_CACHE_MB"] = budget
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import argparse
+import json
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.football_meta import (
+    FootballLinearScorer,
+    export_football_meta_scorer,
+    football_meta_scorer_path,
+)
+from core.football_trainer import FEATURE_ORDER
+
+
+# Child process body: fresh interpreter, so import cost is not cached.
+LOAD_PICKLE = """
+import pickle, time
+started = time.perf_counter()
+with open({path!r}, "rb") as handle:
+    model = pickle.load(handle)
+print(time.perf_counter() - started)
+"""
+
+LOAD_SCORER = """
+import sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+from core.football_meta import FootballLinearScorer
+model = FootballLinearScorer.load({path!r})
+print(time.perf_counter() - started)
+"""
+
+
+def synthetic_rows(count: int, seed: int) -> tuple[list[list[float]], list[int]]:
+    rng = random.Random(seed)
+    weights = [rng.uniform(-1.0, 1.0) for _ in FEATURE_ORDER]
+    rows = []
+    labels = []
+
+    for _ in range(count):
+        row = [rng.uniform(0.0, 1.0) for _ in FEATURE_ORDER]
+        row[0] = rng.uniform(1.3, 6.0)
+        rows.append(row)
+        labels.append(int(sum(w * x for w, x in zip(weights, row)) > sum(weights) / 2))
+
+    return rows, labels
+
+
+def cold_load_seconds(source: str, repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(max(1, repeat)):
+        output = subprocess.run(
+            [sys.executable, "-c", source],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        best = min(best, float(output.strip().splitlines()[-1]))
+
+    return best
+
+
+def per_row_seconds(model, rows: list[list[float]], repeat: int) -> float:
+    best = float("inf")
+
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+
+        for row in rows:
+            model.predict_proba([row])
+
+        best = min(best, time.perf_counter() - started)
+
+    return best / max(1, len(rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare cold load and per-row latency of the pickled sklearn "
+            "football meta model against the compiled JSON scorer."
+        )
+    )
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows, labels = synthetic_rows(args.rows, seed=42)
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        model_path = Path(temp_dir) / "football_meta_model.pkl"
+        scorer_path = football_meta_scorer_path(model_path)
+        pipeline = None
+
+        try:
+            from sklearn.linear_model import LogisticRegression
+            from sklearn.pipeline import Pipeline
+            from sklearn.preprocessing import StandardScaler
+        except ImportError:
+            print("scikit-learn is not installed: pickle path skipped.")
+            rng = random.Random(7)
+            FootballLinearScorer(
+                feature_order=list(FEATURE_ORDER),
+                means=[rng.uniform(0.0, 1.0) for _ in FEATURE_ORDER],
+                scales=[rng.uniform(0.1, 1.0) for _ in FEATURE_ORDER],
+                coefficients=[rng.uniform(-1.0, 1.0) for _ in FEATURE_ORDER],
+                intercept=0.1,
+            ).save(scorer_path)
+        else:
+            pipeline = Pipeline(
+                steps=[
+                    ("scaler", StandardScaler()),
+                    ("classifier", LogisticRegression(max_iter=2000, C=0.70)),
+                ]
+            )
+            pipeline.fit(rows, labels)
+
+            with model_path.open("wb") as handle:
+                pickle.dump(pipeline, handle)
+
+            export_football_meta_scorer(
+                pipeline,
+                FEATURE_ORDER,
+                model_path=model_path,
+            )
+
+        scorer = FootballLinearScorer.load(scorer_path)
+        results = {
+            "scorer_cold_load_ms": cold_load_seconds(
+                LOAD_SCORER.format(root=str(PROJECT_ROOT), path=str(scorer_path)),
+                args.repeat,
+            ) * 1000,
+            "scorer_per_row_us": per_row_seconds(scorer, rows, args.repeat) * 1e6,
+        }
+
+        if pipeline is not None:
+            results["pickle_cold_load_ms"] = cold_load_seconds(
+                LOAD_PICKLE.format(path=str(model_path)),
+                args.repeat,
+            ) * 1000
+            results["pickle_per_row_us"] = (
+                per_row_seconds(pipeline, rows[:200], args.repeat) * 1e6
+            )
+            expected = [row[1] for row in pipeline.predict_proba(rows)]
+            actual = [row[1] for row in scorer.predict_proba(rows)]
+            results["max_abs_difference"] = max(
+                abs(left - right) for left, right in zip(expected, actual)
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
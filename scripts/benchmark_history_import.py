@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.history_store import import_history_csv
+
+
+TABLE_SQL = """
+    CREATE TABLE football_market_closing (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sport_key TEXT NOT NULL,
+        event TEXT NOT NULL,
+        selection TEXT NOT NULL,
+        bookmaker TEXT NOT NULL,
+        closing_odds REAL NOT NULL,
+        closing_probability REAL NOT NULL,
+        external_event_id TEXT,
+        captured_at TEXT NOT NULL,
+        source_hash TEXT UNIQUE
+    )
+"""
+
+
+def write_csv(path: Path, rows: int, seed: int) -> None:
+    rng = random.Random(seed)
+
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "id", "sport_key", "event", "selection", "bookmaker",
+            "closing_odds", "closing_probability", "external_event_id",
+            "captured_at", "source_hash",
+        ])
+        for index in range(rows):
+            odds = round(rng.uniform(1.2, 8.0), 3)
+            writer.writerow([
+                index + 1,
+                "soccer_epl",
+                f"Home {index % 5000} vs Away {index % 4000}",
+                rng.choice(["Home", "Draw", "Away"]),
+                rng.choice(["Pinnacle", "Bet365", "Unibet"]),
+                odds,
+                round(1.0 / odds, 6),
+                "" if index % 3 else f"ext-{index}",
+                f"2026-08-{index % 28 + 1:02d}T12:00:00+00:00",
+                f"h{index}",
+            ])
+
+
+def list_import(conn: sqlite3.Connection, table: str, path: Path) -> int:
+    """The import this replaces: whole file in memory, text values."""
+    with path.open("r", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+
+    columns = list(rows[0].keys())
+    values = [[row.get(column, "") for column in columns] for row in rows]
+    before = conn.total_changes
+    conn.executemany(
+        f"INSERT OR IGNORE INTO {table} ({','.join(columns)}) "
+        f"VALUES ({','.join('?' for _ in columns)})",
+        values,
+    )
+    conn.commit()
+    return conn.total_changes - before
+
+
+def streaming_import(conn: sqlite3.Connection, table: str, path: Path) -> int:
+    return import_history_csv(conn, table, path).rows_inserted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the in-memory and the streaming, typed history CSV "
+            "import on a synthetic football_market_closing export."
+        )
+    )
+    parser.add_argument("--rows", default="10000,100000,500000")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        for rows in (int(value) for value in args.rows.split(",") if value):
+            source = Path(temp_dir) / f"closing_{rows}.csv"
+            write_csv(source, rows, seed=rows)
+            size_mb = source.stat().st_size / (1024 * 1024)
+
+            for name, importer in (
+                ("in-memory", list_import),
+                ("streaming", streaming_import),
+            ):
+                # tracemalloc slows every allocation down, so time and peak
+                # memory are measured in separate runs.
+                db_file = Path(temp_dir) / f"{name}_{rows}.db"
+                with sqlite3.connect(db_file) as conn:
+                    conn.execute(TABLE_SQL)
+                    started = time.perf_counter()
+                    inserted = importer(conn, "football_market_closing", source)
+                    seconds = time.perf_counter() - started
+
+                    blank_text = conn.execute(
+                        "SELECT COUNT(*) FROM football_market_closing "
+                        "WHERE external_event_id=''"
+                    ).fetchone()[0]
+
+                traced_file = Path(temp_dir) / f"{name}_{rows}_traced.db"
+                with sqlite3.connect(traced_file) as conn:
+                    conn.execute(TABLE_SQL)
+                    tracemalloc.start()
+                    importer(conn, "football_market_closing", source)
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+                print(
+                    f"rows={rows:>8} csv={size_mb:6.1f}MB {name:>9}: "
+                    f"{seconds:7.2f}s {rows / max(seconds, 1e-9):>9.0f} rows/s "
+                    f"peak={peak / (1024 * 1024):7.1f}MB inserted={inserted} "
+                    f"blank_text_ids={blank_text}"
+                )
+
+
+if __name__ == "__main__":
+    main()
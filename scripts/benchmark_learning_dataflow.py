@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.football_feature_enrichment_v15_57 import run_feature_enrichment_v15_57
+from core.football_feature_source_joiner_v15_58 import run_feature_source_joiner_v15_58
+from core.football_learning_dataflow import run_learning_dataflow
+from core.football_learning_dataset_builder_v15_56 import run_learning_dataset_builder_v15_56
+from core.football_market_probability_joiner_v15_59 import run_market_probability_joiner_v15_59
+from core.football_smart_market_probability_resolver_v15_60 import (
+    run_smart_market_probability_resolver_v15_60,
+)
+from core.football_universal_market_probability_resolver_v15_61 import (
+    run_universal_market_probability_resolver_v15_61,
+)
+
+
+def write_csv(path: Path, rows: list[dict]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_exports(exports: Path, results: int, snapshots: int, seed: int) -> None:
+    rng = random.Random(seed)
+    exports.mkdir(parents=True, exist_ok=True)
+
+    write_csv(exports / "history_football_clv_results_v15_49.csv", [
+        {
+            "created_at": "2026-09-01T10:00:00+00:00",
+            "source_hash": f"h{rng.randrange(snapshots)}",
+            "event": f"Home {index % 3000} vs Away {index % 2000}",
+            "opening_odds": f"{rng.uniform(1.4, 4.0):.3f}",
+            "closing_odds": f"{rng.uniform(1.4, 4.0):.3f}",
+            "clv_percent": f"{rng.uniform(-8, 8):.3f}",
+            "result": rng.choice(["V", "P"]),
+            "target": rng.choice(["0", "1"]),
+        }
+        for index in range(results)
+    ])
+    write_csv(exports / "history_football_features.csv", [
+        {
+            "source_hash": f"h{index}",
+            "elo_difference": f"{rng.uniform(-200, 200):.1f}",
+            "xg_home": f"{rng.uniform(0.4, 2.8):.2f}",
+            "xg_away": f"{rng.uniform(0.4, 2.8):.2f}",
+        }
+        for index in range(0, snapshots, 3)
+    ])
+    write_csv(exports / "history_football_market_snapshots_v14.csv", [
+        {
+            "source_hash": f"h{index % (snapshots // 4 or 1)}",
+            "event": f"Home {index % 3000} vs Away {index % 2000}",
+            "selection": rng.choice(["Home", "Draw", "Away"]),
+            "bookmaker": rng.choice(["Pinnacle", "Bet365", "Unibet"]),
+            "captured_at": f"2026-09-{index % 28 + 1:02d}T12:00:00+00:00",
+            "odds": f"{rng.uniform(1.4, 4.0):.3f}",
+            "market_selection_probability": f"{rng.random():.4f}",
+            "market_home_probability": f"{rng.random():.4f}",
+            "market_draw_probability": f"{rng.random():.4f}",
+            "market_away_probability": f"{rng.random():.4f}",
+        }
+        for index in range(snapshots)
+    ])
+
+
+def csv_chain(root: Path) -> None:
+    """The hand-offs this replaces: every stage reads the previous CSV."""
+    cwd = os.getcwd()
+    os.chdir(root)
+
+    try:
+        run_learning_dataset_builder_v15_56()
+        run_feature_enrichment_v15_57()
+        run_feature_source_joiner_v15_58()
+        run_market_probability_joiner_v15_59()
+        run_smart_market_probability_resolver_v15_60()
+        run_universal_market_probability_resolver_v15_61()
+    finally:
+        os.chdir(cwd)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the CSV hand-off chain v15.56-v15.61 with the in-memory "
+            "learning dataflow on synthetic exports."
+        )
+    )
+    parser.add_argument("--sizes", default="5000:50000,20000:200000")
+    args = parser.parse_args()
+
+    for size in (value for value in args.sizes.split(",") if value):
+        results, snapshots = (int(part) for part in size.split(":"))
+
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+            root = Path(temp_dir)
+            build_exports(root / "exports", results, snapshots, seed=results)
+
+            started = time.perf_counter()
+            csv_chain(root)
+            csv_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            result = run_learning_dataflow(export_dir=root / "exports", debug_csv=False)
+            dataflow_seconds = time.perf_counter() - started
+
+        print(
+            f"results={results:>7} snapshots={snapshots:>8}: "
+            f"csv chain {csv_seconds:6.2f}s, in-memory {dataflow_seconds:6.2f}s "
+            f"({csv_seconds / max(dataflow_seconds, 1e-9):4.1f}x), "
+            f"{len(result.rows)} rows, files written={len(result.written)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
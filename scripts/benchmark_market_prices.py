@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config import Settings
+from core.football_market import FootballMarketDatabase, MarketPrices
+
+
+BOOKMAKERS = ["Pinnacle", "Bet365", "Unibet", "Tipsport", "Betfair", "1xBet"]
+SELECTIONS = ["Home", "Draw", "Away"]
+
+
+def build_database(db_file: Path, snapshots: int, seed: int) -> list[tuple[str, str, str]]:
+    market = FootballMarketDatabase(Settings(db_file=str(db_file)))
+    market.init_db()
+    rng = random.Random(seed)
+    events = max(10, snapshots // 300)
+    start = datetime(2026, 8, 1)
+
+    def snapshot_rows():
+        for index in range(snapshots):
+            event = f"Event {rng.randrange(events)}"
+            captured = (
+                start + timedelta(minutes=rng.randrange(90 * 24 * 60))
+            ).isoformat(timespec="seconds")
+            yield (
+                "soccer_bench", "League", event, "Home", "Away", captured,
+                captured, rng.choice(BOOKMAKERS),
+                "h2h" if index % 7 else "totals", rng.choice(SELECTIONS),
+                round(rng.uniform(1.3, 5.0), 3), 0.5, f"s{index}", captured,
+            )
+
+    with sqlite3.connect(db_file) as conn:
+        conn.executemany(
+            """
+            INSERT INTO football_market_snapshots (
+                sport_key, league, event, home_team, away_team,
+                commence_time, captured_at, bookmaker, market, selection,
+                odds, implied_probability, source_hash, created_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            snapshot_rows(),
+        )
+        conn.execute("ANALYZE")
+
+    return [
+        ("soccer_bench", f"Event {event}", selection)
+        for event in rng.sample(range(events), min(events, 300))
+        for selection in SELECTIONS
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare per-key opening/latest/closing lookups with the "
+            "batched FootballMarketDatabase.market_prices query."
+        )
+    )
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        for size in (int(value) for value in args.sizes.split(",") if value):
+            db_file = Path(temp_dir) / f"snapshots_{size}.db"
+            keys = build_database(db_file, size, seed=size)
+            market = FootballMarketDatabase(Settings(db_file=str(db_file)))
+
+            started = time.perf_counter()
+            per_key = {}
+            for sport_key, event, selection in keys:
+                lookup = {"sport_key": sport_key, "event": event, "selection": selection}
+                per_key[(sport_key, event, selection)] = MarketPrices(
+                    opening_odds=market.opening_odds(**lookup),
+                    latest_odds=market.latest_odds(**lookup),
+                    closing_odds=market.closing_odds(**lookup),
+                )
+            per_key_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            batched = market.market_prices(keys)
+            batched_time = time.perf_counter() - started
+
+            print(
+                f"snapshots={size:>9} keys={len(keys)} "
+                f"per-key={per_key_time:.3f}s batched={batched_time:.3f}s "
+                f"speed-up={per_key_time / max(batched_time, 1e-9):.1f}x "
+                f"identical={per_key == batched}"
+            )
+
+
+if __name__ == "__main__":
+    main()
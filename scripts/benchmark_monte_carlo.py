@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core import monte_carlo
+from core.monte_carlo import (
+    _percentile,
+    simulate_bankroll_paths,
+    simulate_single_bet,
+    simulate_slate,
+)
+
+
+def loop_single_bet(probability: float, odds: float, simulations: int, seed: int) -> float:
+    """The simulation this replaces: one draw and one list entry per run."""
+    rng = random.Random(seed)
+    profits = [odds - 1.0 if rng.random() < probability else -1.0 for _ in range(simulations)]
+    mean = sum(profits) / simulations
+    math.sqrt(sum((profit - mean) ** 2 for profit in profits) / simulations)
+    _percentile(profits, 0.025)
+    _percentile(profits, 0.975)
+    return mean
+
+
+def timed(function) -> float:
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the per-run loop and the vectorized Monte Carlo simulator."
+    )
+    parser.add_argument("--tips", type=int, default=50)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--bets", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    tips = [
+        (rng.uniform(0.3, 0.7), rng.uniform(1.5, 3.5))
+        for _ in range(args.tips)
+    ]
+    numpy_module = monte_carlo.np
+    backends = ["python"] + (["numpy"] if numpy_module is not None else [])
+
+    for simulations in (int(value) for value in args.sizes.split(",") if value):
+        loop_seconds = timed(lambda: [
+            loop_single_bet(probability, odds, simulations, seed)
+            for seed, (probability, odds) in enumerate(tips)
+        ])
+        print(
+            f"sims={simulations:>7} tips={len(tips)} loop: "
+            f"{loop_seconds / len(tips) * 1000:9.3f} ms/tip"
+        )
+
+        for backend in backends:
+            monte_carlo.np = numpy_module if backend == "numpy" else None
+
+            seconds = timed(lambda: [
+                simulate_single_bet(probability, odds, simulations, seed)
+                for seed, (probability, odds) in enumerate(tips)
+            ])
+            slate_seconds = timed(lambda: simulate_slate(
+                [probability for probability, _ in tips],
+                [odds for _, odds in tips],
+                correlation=0.2,
+                simulations=simulations,
+                seed=1,
+            ))
+            bankroll_seconds = timed(lambda: simulate_bankroll_paths(
+                [tips[index % len(tips)][0] for index in range(args.bets)],
+                [tips[index % len(tips)][1] for index in range(args.bets)],
+                paths=simulations,
+                seed=1,
+            ))
+
+            print(
+                f"sims={simulations:>7} {backend:>6}: "
+                f"{seconds / len(tips) * 1000:9.3f} ms/tip "
+                f"({loop_seconds / max(seconds, 1e-9):7.0f}x) "
+                f"slate={slate_seconds * 1000:8.1f} ms "
+                f"bankroll[{args.bets} bets]={bankroll_seconds * 1000:8.1f} ms"
+            )
+
+    monte_carlo.np = numpy_module
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import aiohttp
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import core.odds_api as odds_api
+from core.odds_api import clear_odds_api_cache, close_odds_api_client, odds_api_counters
+from core.sport_quant import discover_active_sport_keys
+from core.sport_settlement import fetch_scores
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        path = urllib.parse.urlsplit(self.path).path
+        with server.lock:
+            server.requests += 1
+        time.sleep(server.latency)
+
+        if path.endswith("/sports/"):
+            body = [
+                {"key": f"soccer_{index}", "group": "Soccer", "active": True}
+                for index in range(60)
+            ]
+        else:
+            body = [{"id": f"{path}-{index}", "completed": True} for index in range(30)]
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("x-requests-last", "1")
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+async def per_call_sessions(base_url: str, modules: int, keys: list[str]) -> None:
+    """The previous pattern: a new session and request for every call."""
+    async def get(path: str, params: dict) -> list:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{base_url}/{path}", params=params, timeout=30) as resp:
+                return await resp.json()
+
+    async def module() -> None:
+        await get("sports/", {"apiKey": "key"})
+        for key in keys:
+            await get(f"sports/{key}/scores/", {"apiKey": "key", "daysFrom": 3})
+
+    await asyncio.gather(*(module() for _ in range(modules)))
+
+
+async def shared_client(modules: int, keys: list[str]) -> None:
+    async def module() -> None:
+        await discover_active_sport_keys("key", ["Soccer"])
+        for key in keys:
+            await fetch_scores("key", key, days_from=3)
+
+    try:
+        await asyncio.gather(*(module() for _ in range(modules)))
+    finally:
+        await close_odds_api_client()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Several sport modules asking for /sports and the same /scores keys, "
+            "with a session per call and with the shared Odds API client."
+        )
+    )
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--keys", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=120)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LatencyHandler)
+    server.daemon_threads = True
+    server.latency = args.latency_ms / 1000.0
+    server.lock = threading.Lock()
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v4"
+    keys = [f"soccer_{index}" for index in range(args.keys)]
+
+    previous_base_url = odds_api.ODDS_API_BASE_URL
+    odds_api.ODDS_API_BASE_URL = base_url
+
+    try:
+        started = time.perf_counter()
+        asyncio.run(per_call_sessions(base_url, args.modules, keys))
+        print(
+            f"session per call: {time.perf_counter() - started:6.2f}s, "
+            f"requests={server.requests}"
+        )
+
+        server.requests = 0
+        clear_odds_api_cache()
+        started = time.perf_counter()
+        asyncio.run(shared_client(args.modules, keys))
+        counters = odds_api_counters()
+        print(
+            f"   shared client: {time.perf_counter() - started:6.2f}s, "
+            f"requests={server.requests}, saved={counters['requests_saved']}, "
+            f"quota_used={counters['quota_used']}"
+        )
+    finally:
+        odds_api.ODDS_API_BASE_URL = previous_base_url
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
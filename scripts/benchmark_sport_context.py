@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.config import Settings
+from core.sport_context import SportContextDatabase
+from core.types import Bet
+
+
+TEAMS = [f"Club {index}" for index in range(120)]
+
+
+def build_database(path: Path, rows: int, seed: int) -> list[Bet]:
+    rng = random.Random(seed)
+    database = SportContextDatabase(Settings(db_file=str(path)))
+    database.init_db()
+    now = datetime.now(timezone.utc)
+    fixtures = []
+
+    with database.connect() as conn:
+        for index in range(rows):
+            home, away = rng.sample(TEAMS, 2)
+            start = now + timedelta(hours=rng.randint(1, 48))
+            fixtures.append((home, away, start))
+            conn.execute(
+                """
+                INSERT INTO sport_context_features (
+                    sport, event, external_event_id, start_time, home_team,
+                    away_team, home_absence_impact, source, captured_at,
+                    source_hash
+                ) VALUES ('football', ?, ?, ?, ?, ?, ?, 'sportmonks-v3', ?, ?)
+                """,
+                (
+                    f"{home} vs {away}", f"sm-{index}", start.isoformat(),
+                    home, away, rng.random() * .05,
+                    (now - timedelta(minutes=index)).isoformat(), f"ctx-{index}",
+                ),
+            )
+
+    bets = []
+    for index in range(rows):
+        # Odds-side names and ids differ from the provider's, as in production.
+        home, away, start = rng.choice(fixtures[:150])
+        bets.append(Bet(
+            sport="football", league="L", event=f"FC {home} vs {away} FC",
+            market="h2h", selection=home, odds=2.0, prob_model=.5,
+            prob_market=.5, prob_final=.5, edge=0.0, stake=1.0,
+            bookmaker="Book", start_time=start.isoformat(), score=80,
+            external_event_id=f"odds-{index}" if index % 2 else "",
+        ))
+    return bets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Resolve sport context for a slate of football bets one at a time "
+            "and with one latest_many batch."
+        )
+    )
+    parser.add_argument("--sizes", default="100,500")
+    args = parser.parse_args()
+
+    for size in (int(value) for value in args.sizes.split(",") if value):
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+            bets = build_database(Path(temp_dir) / "per_bet.db", size, seed=size)
+            shutil.copy(Path(temp_dir) / "per_bet.db", Path(temp_dir) / "batch.db")
+
+            per_bet = SportContextDatabase(Settings(db_file=str(Path(temp_dir) / "per_bet.db")))
+            started = time.perf_counter()
+            expected = [
+                per_bet.latest("football", bet.event, bet.external_event_id, bet.start_time)
+                for bet in bets
+            ]
+            per_bet_seconds = time.perf_counter() - started
+
+            batch = SportContextDatabase(Settings(db_file=str(Path(temp_dir) / "batch.db")))
+            started = time.perf_counter()
+            contexts = batch.latest_many("football", bets)
+            batch_seconds = time.perf_counter() - started
+
+        print(
+            f"bets={size:>6}: per bet {per_bet_seconds:6.3f}s, "
+            f"latest_many {batch_seconds:6.3f}s "
+            f"({per_bet_seconds / max(batch_seconds, 1e-9):5.1f}x), "
+            f"verified={sum(context.verified for context in contexts)}, "
+            f"identical={contexts == expected}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.sportmonks import SportmonksClient
+
+
+class LatencyHandler(BaseHTTPRequestHandler):
+    """fixtures/date/<day> with a fixed page count and per-request latency."""
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        page = int(dict(urllib.parse.parse_qsl(url.query)).get("page", 1))
+        time.sleep(server.latency)
+        etag = f'"{url.path}-{page}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps({
+            "data": [
+                {"id": f"{url.path}-{page}-{index}", "name": f"Home {index} vs Away {index}",
+                 "lineups": [{"player_id": player} for player in range(22)]}
+                for index in range(25)
+            ],
+            "pagination": {"current_page": page, "has_more": page < server.pages},
+        }).encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def timed(client: SportmonksClient, days: list[date]) -> tuple[float, int]:
+    started = time.perf_counter()
+    fixtures = client.fixtures_by_dates(days)
+    return time.perf_counter() - started, len(fixtures)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fetch several days of paginated fixtures from a local stub with "
+            "network latency: sequentially, concurrently and from the cache."
+        )
+    )
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LatencyHandler)
+    server.daemon_threads = True
+    server.latency = args.latency_ms / 1000.0
+    server.pages = args.pages
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    days = [date(2026, 9, 1) + timedelta(days=offset) for offset in range(args.days)]
+
+    try:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as cache_dir:
+            def client(**options) -> SportmonksClient:
+                options = {"cache_ttl": 3600, "matchday_cache_ttl": 3600, **options}
+                return SportmonksClient(
+                    "benchmark-token", base_url=base_url, requests_per_second=0, **options,
+                )
+
+            rows = [
+                ("sequential", client(concurrency=1, page_lookahead=1, cache_dir="")),
+                ("concurrent", client(concurrency=6, page_lookahead=3, cache_dir=cache_dir)),
+                ("cached rerun", client(concurrency=6, page_lookahead=3, cache_dir=cache_dir)),
+                ("revalidated", client(concurrency=6, page_lookahead=3, cache_dir=cache_dir, cache_ttl=0)),
+            ]
+            for name, sportmonks in rows:
+                seconds, fixtures = timed(sportmonks, days)
+                stats = sportmonks.stats
+                print(
+                    f"{name:>12}: {seconds:6.2f}s, {fixtures} fixtures, "
+                    f"requests={stats.requests} cache_hits={stats.cache_hits} "
+                    f"not_modified={stats.not_modified}"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
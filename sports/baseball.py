@@ -20,7 +20,7 @@ from core.monte_carlo import (
     monte_carlo_score,
     simulate_single_bet,
 )
-from core.odds_api import fetch_odds
+from core.odds_api import fetch_odds_many
 from core.sport_quant import (
     bookmaker_grade,
     discover_active_sport_keys,
@@ -347,16 +347,11 @@ class BaseballModule(SportModule):
         blocked = 0
         scanned_events = 0
 
-        for sport_key in clean_sport_keys:
-            data = await fetch_odds(
-                settings.odds_api_key,
-                sport_key,
-                markets="h2h",
-            )
-
-            if not data:
-                continue
-
+        async for sport_key, data in fetch_odds_many(
+            settings.odds_api_key,
+            clean_sport_keys,
+            markets="h2h",
+        ):
             for event in data:
                 league = sport_key
                 home = str(event.get("home_team", ""))
@@ -10,7 +10,7 @@ from typing import Any
 from core.adaptive_weights import bookmaker_weight, league_weight, sport_weight
 from core.config import Settings
 from core.market import consensus_h2h, best_outlier_prices, dedupe_best_bets
-from core.odds_api import fetch_odds
+from core.odds_api import fetch_odds_many
 from core.monte_carlo import simulate_single_bet
 from core.sport_quant import (
     bookmaker_grade,
@@ -268,16 +268,11 @@ class EsportsModule(SportModule):
         blocked = 0
         scanned_events = 0
 
-        for sport_key in clean_sport_keys:
-            data = await fetch_odds(
-                settings.odds_api_key,
-                sport_key,
-                markets="h2h",
-            )
-
-            if not data:
-                continue
-
+        async for sport_key, data in fetch_odds_many(
+            settings.odds_api_key,
+            clean_sport_keys,
+            markets="h2h",
+        ):
             for event in data:
                 league = sport_key
                 home = str(event.get("home_team", ""))
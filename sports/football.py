@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import os
-import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
 
 from core.config import Settings
 from core.market import best_outlier_prices, dedupe_best_bets
-from core.odds_api import fetch_odds
+from core.odds_api import fetch_odds_many
 from core.sport_quant import (
     bookmaker_grade,
     discover_active_sport_keys,
@@ -25,12 +25,19 @@ from core.staking import kelly_stake
 from core.types import Bet, SportResult
 from sports.base import SportModule
 from core.football_feature_store import save_football_features
-from core.football_features import build_football_features
+from core.football_features import (
+    FootballFeatures,
+    FootballModelBundleCache,
+    build_football_features,
+)
 from core.football_market import (
     FootballMarketDatabase,
     build_market_snapshot,
 )
-from core.football_meta import predict_football_probability
+from core.football_meta import (
+    FootballMetaPrediction,
+    predict_football_probabilities,
+)
 from core.football_league_calibration import (
     get_league_calibration,
 )
@@ -41,8 +48,12 @@ from core.football_candidate_optimizer_v14 import (
     optimize_candidate_prices,
 )
 from core.football_explainability_v15 import (
+    FootballExplainabilityV15,
     explain_and_save_football_decision_v15,
 )
+from core.football_scan_session import FootballScanSession
+from core.odds_delta_store import changes_only_enabled, get_odds_delta_store
+from core.football_rating_snapshot import load_rating_snapshot
 from core.adaptive_weights import (
     sport_weight,
     bookmaker_weight,
@@ -469,20 +480,35 @@ def make_hash(*parts: Any) -> str:
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
 
 
+@dataclass
+class FootballCandidate:
+    """One priced selection waiting for the batched meta-model call."""
+
+    sport_key: str
+    league: str
+    event_name: str
+    start: str
+    external_event_id: str
+    selection: str
+    bookmaker: str
+    odds: float
+    grade: float
+    features: FootballFeatures
+    calibration_reliability: float
+    sport_weight: float
+    league_weight: float
+    bookmaker_weight: float
+
+
 class FootballModule(SportModule):
     name = "football"
 
     def _db_path(self, settings: Settings) -> Path:
         return Path(settings.db_file or os.getenv("DB_FILE", "bets.db"))
 
-    def _connect(self, settings: Settings) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path(settings))
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
-
     def _save_snapshot(
         self,
-        settings: Settings,
+        session: FootballScanSession,
         sport_key: str,
         event_name: str,
         home: str,
@@ -522,9 +548,13 @@ class FootballModule(SportModule):
         )
 
         # Hourly bucket prevents identical reruns from creating a full new
-        # copy of distant-event snapshots.
+        # copy of distant-event snapshots. The change-only store already
+        # drops unchanged prices, and a price moving back within the hour
+        # must not collide with its earlier row.
         captured_bucket = (
-            datetime.now(timezone.utc)
+            captured_at
+            if changes_only_enabled()
+            else datetime.now(timezone.utc)
             .replace(
                 minute=0,
                 second=0,
@@ -560,23 +590,28 @@ class FootballModule(SportModule):
                 source_hash,
             ))
 
-        if not rows:
-            return 0
-
-        with self._connect(settings) as conn:
-            before = conn.total_changes
-            conn.executemany("""
-                INSERT OR IGNORE INTO sport_odds_snapshots
-                (
-                    captured_at, sport, league, event, home_team, away_team,
-                    bookmaker, market, selection, odds, source_hash
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, rows)
+        if rows and changes_only_enabled():
+            rows = session.track_delta_store(get_odds_delta_store(
+                session.db_file,
+                "sport_odds_snapshots",
+                key_columns=("league", "event", "bookmaker", "market", "selection"),
+                scope=("sport", self.name),
+            )).filter_changed(
+                rows,
+                key=lambda row: (row[2], row[3], row[6], row[7], row[8]),
+                odds=lambda row: row[9],
+            )
 
-            return conn.total_changes - before
+        return session.add_many("sport_odds_snapshots", """
+            INSERT OR IGNORE INTO sport_odds_snapshots
+            (
+                captured_at, sport, league, event, home_team, away_team,
+                bookmaker, market, selection, odds, source_hash
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
 
-    def _save_bet(self, settings: Settings, bet: Bet) -> None:
+    def _save_bet(self, session: FootballScanSession, bet: Bet) -> None:
         source_hash = make_hash(
             bet.sport,
             bet.league,
@@ -586,41 +621,40 @@ class FootballModule(SportModule):
             bet.start_time,
         )
 
-        with self._connect(settings) as conn:
-            conn.execute("""
-                INSERT OR IGNORE INTO sport_bets
-                (
-                    sport, league, event, home_team, away_team, market,
-                    selection, odds, prob_model, prob_market, prob_final,
-                    edge, stake, bookmaker, start_time, score, source_hash,
-                    result, external_event_id
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                bet.sport,
-                bet.league,
-                bet.event,
-                bet.event.split(" vs ")[0] if " vs " in bet.event else "",
-                bet.event.split(" vs ")[1] if " vs " in bet.event else "",
-                bet.market,
-                bet.selection,
-                bet.odds,
-                bet.prob_model,
-                bet.prob_market,
-                bet.prob_final,
-                bet.edge,
-                bet.stake,
-                bet.bookmaker,
-                bet.start_time,
-                bet.score,
-                source_hash,
-                "OPEN",
-                bet.external_event_id,
-            ))
+        session.add("sport_bets", """
+            INSERT OR IGNORE INTO sport_bets
+            (
+                sport, league, event, home_team, away_team, market,
+                selection, odds, prob_model, prob_market, prob_final,
+                edge, stake, bookmaker, start_time, score, source_hash,
+                result, external_event_id
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            bet.sport,
+            bet.league,
+            bet.event,
+            bet.event.split(" vs ")[0] if " vs " in bet.event else "",
+            bet.event.split(" vs ")[1] if " vs " in bet.event else "",
+            bet.market,
+            bet.selection,
+            bet.odds,
+            bet.prob_model,
+            bet.prob_market,
+            bet.prob_final,
+            bet.edge,
+            bet.stake,
+            bet.bookmaker,
+            bet.start_time,
+            bet.score,
+            source_hash,
+            "OPEN",
+            bet.external_event_id,
+        ))
 
     def _audit(
         self,
-        settings: Settings,
+        session: FootballScanSession,
         sport_key: str,
         event_name: str,
         selection: str,
@@ -631,26 +665,25 @@ class FootballModule(SportModule):
         decision: str,
         reason: str,
     ) -> None:
-        with self._connect(settings) as conn:
-            conn.execute("""
-                INSERT INTO sport_decision_audit
-                (
-                    sport, league, event, selection, bookmaker,
-                    odds, prob_market, edge, decision, reason
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                self.name,
-                sport_key,
-                event_name,
-                selection,
-                bookmaker,
-                odds,
-                prob_market,
-                edge,
-                decision,
-                reason,
-            ))
+        session.add("sport_decision_audit", """
+            INSERT INTO sport_decision_audit
+            (
+                sport, league, event, selection, bookmaker,
+                odds, prob_market, edge, decision, reason
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            self.name,
+            sport_key,
+            event_name,
+            selection,
+            bookmaker,
+            odds,
+            prob_market,
+            edge,
+            decision,
+            reason,
+        ))
 
     def _football_home_adjustment(
         self,
@@ -686,10 +719,285 @@ class FootballModule(SportModule):
 
         return 0.0
 
+    def _decide(
+        self,
+        settings: Settings,
+        session: FootballScanSession,
+        candidate: FootballCandidate,
+        meta_prediction: FootballMetaPrediction,
+    ) -> Bet | None:
+        """Apply the edge, odds and stake guards to one scored candidate."""
+        sport_key = candidate.sport_key
+        league = candidate.league
+        event_name = candidate.event_name
+        start = candidate.start
+        selection = candidate.selection
+        bookmaker = candidate.bookmaker
+        odds = candidate.odds
+        grade = candidate.grade
+        features = candidate.features
+        calibration_reliability = candidate.calibration_reliability
+        current_sport_weight = candidate.sport_weight
+        current_league_weight = candidate.league_weight
+        current_bookmaker_weight = candidate.bookmaker_weight
+        prob_market = features.market_selection_probability
+
+        prob_final = meta_prediction.probability
+        edge = prob_final * odds - 1.0
+
+        adjusted_edge = (
+            edge
+            * grade
+            * current_sport_weight
+            * current_bookmaker_weight
+            * current_league_weight
+            * max(0.50, features.confidence_input)
+        )
+
+        audit_context = (
+            f"league={league}; "
+            f"probability_source={meta_prediction.source}; "
+            f"market={prob_market:.4f}; "
+            f"v13_consensus={features.model_consensus_probability:.4f}; "
+            f"final={prob_final:.4f}; "
+            f"dispersion={features.model_dispersion:.4f}; "
+            f"reliability={features.reliability_input:.3f}; "
+            f"xG={features.xg_home:.2f}-{features.xg_away:.2f}; "
+            f"elo_diff={features.elo_difference:.1f}; "
+            f"dixon_rho={features.dixon_rho:.3f}; "
+            f"league_calibration_reliability="
+            f"{calibration_reliability:.3f}; "
+            f"bookmaker_grade={grade:.2f}; "
+            f"{meta_prediction.reason}"
+        )
+
+        if edge < settings.min_edge:
+            rejection_source_hash = make_hash(
+                self.name,
+                league,
+                event_name,
+                selection,
+                start,
+            )
+            explain_and_save_football_decision_v15(
+                settings,
+                source_hash=rejection_source_hash,
+                features=features,
+                meta_prediction=meta_prediction,
+                decision="BLOCK",
+                adjusted_edge=adjusted_edge,
+                confidence=features.confidence_input,
+                risk="high",
+                rejection_reason="edge below minimum",
+                session=session,
+            )
+            self._audit(
+                session,
+                sport_key,
+                event_name,
+                selection,
+                bookmaker,
+                odds,
+                prob_market,
+                edge,
+                "BLOCK",
+                f"edge below minimum; {audit_context}",
+            )
+            return None
+
+        if edge > settings.max_edge:
+            rejection_source_hash = make_hash(
+                self.name,
+                league,
+                event_name,
+                selection,
+                start,
+            )
+            explain_and_save_football_decision_v15(
+                settings,
+                source_hash=rejection_source_hash,
+                features=features,
+                meta_prediction=meta_prediction,
+                decision="BLOCK",
+                adjusted_edge=adjusted_edge,
+                confidence=features.confidence_input,
+                risk="high",
+                rejection_reason="edge above max guard",
+                session=session,
+            )
+            self._audit(
+                session,
+                sport_key,
+                event_name,
+                selection,
+                bookmaker,
+                odds,
+                prob_market,
+                edge,
+                "BLOCK",
+                f"edge above max guard; {audit_context}",
+            )
+            return None
+
+        if odds > settings.max_odds:
+            rejection_source_hash = make_hash(
+                self.name,
+                league,
+                event_name,
+                selection,
+                start,
+            )
+            explain_and_save_football_decision_v15(
+                settings,
+                source_hash=rejection_source_hash,
+                features=features,
+                meta_prediction=meta_prediction,
+                decision="BLOCK",
+                adjusted_edge=adjusted_edge,
+                confidence=features.confidence_input,
+                risk="high",
+                rejection_reason="odds above maximum",
+                session=session,
+            )
+            self._audit(
+                session,
+                sport_key,
+                event_name,
+                selection,
+                bookmaker,
+                odds,
+                prob_market,
+                edge,
+                "BLOCK",
+                f"odds above max odds; {audit_context}",
+            )
+            return None
+
+        stake = kelly_stake(prob_final, odds, settings)
+        stake = round(
+            stake
+            * grade
+            * max(0.50, features.confidence_input),
+            2,
+        )
+
+        if stake <= 0:
+            rejection_source_hash = make_hash(
+                self.name,
+                league,
+                event_name,
+                selection,
+                start,
+            )
+            explain_and_save_football_decision_v15(
+                settings,
+                source_hash=rejection_source_hash,
+                features=features,
+                meta_prediction=meta_prediction,
+                decision="BLOCK",
+                adjusted_edge=adjusted_edge,
+                confidence=features.confidence_input,
+                risk="high",
+                rejection_reason="stake not positive",
+                session=session,
+            )
+            self._audit(
+                session,
+                sport_key,
+                event_name,
+                selection,
+                bookmaker,
+                odds,
+                prob_market,
+                edge,
+                "BLOCK",
+                f"stake <= 0; {audit_context}",
+            )
+            return None
+
+        bet = Bet(
+            sport=self.name,
+            league=league,
+            event=event_name,
+            market="h2h",
+            selection=selection,
+            odds=odds,
+            prob_model=features.model_consensus_probability,
+            prob_market=prob_market,
+            prob_final=prob_final,
+            edge=edge,
+            stake=stake,
+            bookmaker=bookmaker,
+            start_time=start,
+            score=adjusted_edge * 100,
+            external_event_id=candidate.external_event_id,
+        )
+
+        feature_source_hash = make_hash(
+            bet.sport,
+            bet.league,
+            bet.event,
+            bet.market,
+            bet.selection,
+            bet.start_time,
+        )
+
+        explain_and_save_football_decision_v15(
+            settings,
+            source_hash=feature_source_hash,
+            features=features,
+            meta_prediction=meta_prediction,
+            decision="PASS",
+            adjusted_edge=adjusted_edge,
+            confidence=features.confidence_input,
+            risk=(
+                "low"
+                if features.confidence_input >= 0.80
+                else "medium"
+                if features.confidence_input >= 0.65
+                else "high"
+            ),
+            session=session,
+        )
+
+        save_football_features(
+            settings,
+            features,
+            source_hash=feature_source_hash,
+        )
+
+        self._save_bet(session, bet)
+
+        self._audit(
+            session,
+            sport_key,
+            event_name,
+            selection,
+            bookmaker,
+            odds,
+            prob_market,
+            edge,
+            "PASS",
+            audit_context,
+        )
+
+        return bet
+
     async def scan(self, settings: Settings) -> SportResult:
+        # One connection and a handful of batched transactions per scan
+        # instead of a connect/commit cycle for every row.
+        with FootballScanSession(settings) as session:
+            return await self._scan(settings, session)
+
+    async def _scan(
+        self,
+        settings: Settings,
+        session: FootballScanSession,
+    ) -> SportResult:
         init_sport_db(settings)
         football_market_db = FootballMarketDatabase(settings)
         football_market_db.init_db()
+        FootballExplainabilityV15(settings).init_db()
 
         default_keys = configured_football_keys()
 
@@ -731,27 +1039,26 @@ class FootballModule(SportModule):
         updated_clv = update_closing_lines(settings, self.name)
         refresh_bookmaker_stats(settings, self.name)
 
+        # Ratings are only written by settlement/learning, which ran above.
+        rating_snapshot = load_rating_snapshot(settings)
+
         min_books = int(os.getenv("MIN_FOOTBALL_BOOKMAKERS", "3"))
         top_n = int(os.getenv("TOP_N_REPORT", "8"))
         grade_min_samples = int(os.getenv("FOOTBALL_BOOKMAKER_GRADE_MIN_SAMPLES", "20"))
 
         bets: list[Bet] = []
-        snapshots_saved = 0
+        candidates: list[FootballCandidate] = []
+        bundle_cache = FootballModelBundleCache()
         blocked = 0
         scanned_events = 0
         candidate_rows_raw = 0
         candidate_rows_optimized = 0
 
-        for sport_key in clean_sport_keys:
-            data = await fetch_odds(
-                settings.odds_api_key,
-                sport_key,
-                markets="h2h",
-            )
-
-            if not data:
-                continue
-
+        async for sport_key, data in fetch_odds_many(
+            settings.odds_api_key,
+            clean_sport_keys,
+            markets="h2h",
+        ):
             for event in data:
                 league_info = league_config_by_key(sport_key)
                 league = (
@@ -766,8 +1073,8 @@ class FootballModule(SportModule):
                 bookmakers = event.get("bookmakers", [])
 
                 scanned_events += 1
-                snapshots_saved += self._save_snapshot(
-                    settings=settings,
+                self._save_snapshot(
+                    session=session,
                     sport_key=sport_key,
                     event_name=event_name,
                     home=home,
@@ -780,6 +1087,7 @@ class FootballModule(SportModule):
                     sport_key=sport_key,
                     league=league,
                     event=event,
+                    session=session,
                 )
                 football_market_db.save_closing_snapshot_if_due(
                     sport_key=sport_key,
@@ -788,6 +1096,7 @@ class FootballModule(SportModule):
                     window_hours=float(
                         os.getenv("FOOTBALL_CLOSING_WINDOW_HOURS", "12")
                     ),
+                    session=session,
                 )
 
                 market_snapshot = build_market_snapshot(
@@ -800,7 +1109,7 @@ class FootballModule(SportModule):
                 if market_snapshot is None:
                     blocked += 1
                     self._audit(
-                        settings,
+                        session,
                         sport_key,
                         event_name,
                         "",
@@ -875,11 +1184,12 @@ class FootballModule(SportModule):
                             home_advantage_xg=home_advantage_xg,
                             home_advantage_elo=home_advantage_elo,
                             dixon_rho=dixon_rho,
+                            bundle_cache=bundle_cache,
                         )
                     except Exception as exc:
                         blocked += 1
                         self._audit(
-                            settings,
+                            session,
                             sport_key,
                             event_name,
                             selection,
@@ -900,7 +1210,7 @@ class FootballModule(SportModule):
                     if prob_market <= 0:
                         blocked += 1
                         self._audit(
-                            settings,
+                            session,
                             sport_key,
                             event_name,
                             selection,
@@ -913,247 +1223,48 @@ class FootballModule(SportModule):
                         )
                         continue
 
-                    meta_prediction = predict_football_probability(features)
-                    prob_final = meta_prediction.probability
-                    edge = prob_final * odds - 1.0
-
-                    adjusted_edge = (
-                        edge
-                        * grade
-                        * current_sport_weight
-                        * current_bookmaker_weight
-                        * current_league_weight
-                        * max(0.50, features.confidence_input)
-                    )
-
-                    audit_context = (
-                        f"league={league}; "
-                        f"probability_source={meta_prediction.source}; "
-                        f"market={prob_market:.4f}; "
-                        f"v13_consensus={features.model_consensus_probability:.4f}; "
-                        f"final={prob_final:.4f}; "
-                        f"dispersion={features.model_dispersion:.4f}; "
-                        f"reliability={features.reliability_input:.3f}; "
-                        f"xG={features.xg_home:.2f}-{features.xg_away:.2f}; "
-                        f"elo_diff={features.elo_difference:.1f}; "
-                        f"dixon_rho={features.dixon_rho:.3f}; "
-                        f"league_calibration_reliability="
-                        f"{calibration_reliability:.3f}; "
-                        f"bookmaker_grade={grade:.2f}; "
-                        f"{meta_prediction.reason}"
-                    )
-
-                    if edge < settings.min_edge:
-                        blocked += 1
-                        rejection_source_hash = make_hash(
-                            self.name,
-                            league,
-                            event_name,
-                            selection,
-                            start,
-                        )
-                        explain_and_save_football_decision_v15(
-                            settings,
-                            source_hash=rejection_source_hash,
-                            features=features,
-                            meta_prediction=meta_prediction,
-                            decision="BLOCK",
-                            adjusted_edge=adjusted_edge,
-                            confidence=features.confidence_input,
-                            risk="high",
-                            rejection_reason="edge below minimum",
-                        )
-                        self._audit(
-                            settings,
-                            sport_key,
-                            event_name,
-                            selection,
-                            bookmaker,
-                            odds,
-                            prob_market,
-                            edge,
-                            "BLOCK",
-                            f"edge below minimum; {audit_context}",
-                        )
-                        continue
-
-                    if edge > settings.max_edge:
-                        blocked += 1
-                        rejection_source_hash = make_hash(
-                            self.name,
-                            league,
-                            event_name,
-                            selection,
-                            start,
-                        )
-                        explain_and_save_football_decision_v15(
-                            settings,
-                            source_hash=rejection_source_hash,
-                            features=features,
-                            meta_prediction=meta_prediction,
-                            decision="BLOCK",
-                            adjusted_edge=adjusted_edge,
-                            confidence=features.confidence_input,
-                            risk="high",
-                            rejection_reason="edge above max guard",
-                        )
-                        self._audit(
-                            settings,
-                            sport_key,
-                            event_name,
-                            selection,
-                            bookmaker,
-                            odds,
-                            prob_market,
-                            edge,
-                            "BLOCK",
-                            f"edge above max guard; {audit_context}",
-                        )
-                        continue
-
-                    if odds > settings.max_odds:
-                        blocked += 1
-                        rejection_source_hash = make_hash(
-                            self.name,
-                            league,
-                            event_name,
-                            selection,
-                            start,
-                        )
-                        explain_and_save_football_decision_v15(
-                            settings,
-                            source_hash=rejection_source_hash,
-                            features=features,
-                            meta_prediction=meta_prediction,
-                            decision="BLOCK",
-                            adjusted_edge=adjusted_edge,
-                            confidence=features.confidence_input,
-                            risk="high",
-                            rejection_reason="odds above maximum",
-                        )
-                        self._audit(
-                            settings,
-                            sport_key,
-                            event_name,
-                            selection,
-                            bookmaker,
-                            odds,
-                            prob_market,
-                            edge,
-                            "BLOCK",
-                            f"odds above max odds; {audit_context}",
-                        )
-                        continue
-
-                    stake = kelly_stake(prob_final, odds, settings)
-                    stake = round(
-                        stake
-                        * grade
-                        * max(0.50, features.confidence_input),
-                        2,
-                    )
-
-                    if stake <= 0:
-                        blocked += 1
-                        rejection_source_hash = make_hash(
-                            self.name,
-                            league,
-                            event_name,
-                            selection,
-                            start,
-                        )
-                        explain_and_save_football_decision_v15(
-                            settings,
-                            source_hash=rejection_source_hash,
+                    candidates.append(
+                        FootballCandidate(
+                            sport_key=sport_key,
+                            league=league,
+                            event_name=event_name,
+                            start=start,
+                            external_event_id=str(event.get("id", "")),
+                            selection=selection,
+                            bookmaker=bookmaker,
+                            odds=odds,
+                            grade=grade,
                             features=features,
-                            meta_prediction=meta_prediction,
-                            decision="BLOCK",
-                            adjusted_edge=adjusted_edge,
-                            confidence=features.confidence_input,
-                            risk="high",
-                            rejection_reason="stake not positive",
-                        )
-                        self._audit(
-                            settings,
-                            sport_key,
-                            event_name,
-                            selection,
-                            bookmaker,
-                            odds,
-                            prob_market,
-                            edge,
-                            "BLOCK",
-                            f"stake <= 0; {audit_context}",
+                            calibration_reliability=calibration_reliability,
+                            sport_weight=current_sport_weight,
+                            league_weight=current_league_weight,
+                            bookmaker_weight=current_bookmaker_weight,
                         )
-                        continue
-
-                    bet = Bet(
-                        sport=self.name,
-                        league=league,
-                        event=event_name,
-                        market="h2h",
-                        selection=selection,
-                        odds=odds,
-                        prob_model=features.model_consensus_probability,
-                        prob_market=prob_market,
-                        prob_final=prob_final,
-                        edge=edge,
-                        stake=stake,
-                        bookmaker=bookmaker,
-                        start_time=start,
-                        score=adjusted_edge * 100,
-                        external_event_id=str(event.get("id", "")),
-                    )
-
-                    feature_source_hash = make_hash(
-                        bet.sport,
-                        bet.league,
-                        bet.event,
-                        bet.market,
-                        bet.selection,
-                        bet.start_time,
                     )
 
-                    explain_and_save_football_decision_v15(
-                        settings,
-                        source_hash=feature_source_hash,
-                        features=features,
-                        meta_prediction=meta_prediction,
-                        decision="PASS",
-                        adjusted_edge=adjusted_edge,
-                        confidence=features.confidence_input,
-                        risk=(
-                            "low"
-                            if features.confidence_input >= 0.80
-                            else "medium"
-                            if features.confidence_input >= 0.65
-                            else "high"
-                        ),
-                    )
+        # Score every candidate of the scan with one model call, then run
+        # the per-candidate decisions in the original order.
+        meta_predictions = predict_football_probabilities(
+            [candidate.features for candidate in candidates]
+        )
 
-                    save_football_features(
-                        settings,
-                        features,
-                        source_hash=feature_source_hash,
-                    )
+        for candidate, meta_prediction in zip(candidates, meta_predictions):
+            bet = self._decide(
+                settings,
+                session,
+                candidate,
+                meta_prediction,
+            )
 
-                    bets.append(bet)
-                    self._save_bet(settings, bet)
+            if bet is None:
+                blocked += 1
+                continue
 
-                    self._audit(
-                        settings,
-                        sport_key,
-                        event_name,
-                        selection,
-                        bookmaker,
-                        odds,
-                        prob_market,
-                        edge,
-                        "PASS",
-                        audit_context,
-                    )
+            bets.append(bet)
 
         bets = dedupe_best_bets(bets)
+        session.flush()
+        snapshots_saved = session.inserted("sport_odds_snapshots")
         # Closing snapshots are captured during this scan. Reconcile once more
         # afterwards so the current production run can use them immediately.
         updated_clv += football_market_db.reconcile_closing_lines()
@@ -1172,8 +1283,11 @@ class FootballModule(SportModule):
                 f"Snapshots saved: {snapshots_saved}. "
                 f"Candidate rows: {candidate_rows_raw} -> "
                 f"{candidate_rows_optimized}. "
+                f"Model bundles: {bundle_cache.summary()}. "
+                f"Ratings: {rating_snapshot.summary()}. "
                 f"Blocked: {blocked}. "
-                f"Stored candidates: {len(bets)}.\n"
+                f"Stored candidates: {len(bets)}. "
+                f"DB writes: {session.metrics.summary()}.\n"
                 f"{analytics}"
             ),
         )
@@ -10,7 +10,7 @@ from core.adaptive_weights import bookmaker_weight, league_weight, sport_weight
 from core.config import Settings
 from core.ensemble_model import EnsembleInput, build_ensemble_probability
 from core.market import best_outlier_prices, consensus_h2h, dedupe_best_bets
-from core.odds_api import fetch_odds
+from core.odds_api import fetch_odds_many
 from core.sport_quant import (
     bookmaker_grade, discover_active_sport_keys, elo_adjustment, 
     filter_active_keys, init_sport_db, refresh_bookmaker_stats, 
@@ -77,11 +77,8 @@ class TennisModule(SportModule):
 
         bets, scanned_events = [], 0
 
-        for sport_key in clean_sport_keys:
+        async for sport_key, data in fetch_odds_many(settings.odds_api_key, clean_sport_keys, markets="h2h"):
             try:
-                data = await fetch_odds(settings.odds_api_key, sport_key, markets="h2h")
-                if not data: continue
-
                 for event in data:
                     league = sport_key
                     home, away = event.get("home_team", ""), event.get("away_team", "")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.export_tables import (
+    clear_export_tables,
+    export_table,
+    export_table_counters,
+)
+
+
+class ExportTableTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.root = Path(self.temp_dir.name)
+        self.budget = os.environ.pop("EXPORT_TABLE_CACHE_MB", None)
+        clear_export_tables()
+
+    def tearDown(self) -> None:
+        clear_export_tables()
+        if self.budget is not None:
+            os.environ["EXPORT_TABLE_CACHE_MB"] = self.budget
+        else:
+            os.environ.pop("EXPORT_TABLE_CACHE_MB", None)
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, text: str, mtime_ns: int = 1_700_000_000_000_000_000) -> Path:
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_file_is_parsed_once_per_version(self) -> None:
+        path = self._write(
+            "snapshots.csv",
+            "\ufeffsource_hash,event,selection,odds\n"
+            "h1, Home vs Away ,Home,1.90\n"
+            "h2,Home vs Away,home ,2.10\n"
+            "h1,Other vs Team,Draw,3.30\n",
+        )
+
+        table = export_table(path)
+        self.assertIs(export_table(str(path)), table)
+        self.assertEqual(table.fieldnames, ("source_hash", "event", "selection", "odds"))
+
+        with self.assertRaises(TypeError):
+            table.rows[0]["odds"] = "9.99"
+
+        records = table.records()
+        records[0]["odds"] = "9.99"
+        self.assertEqual(table.rows[0]["odds"], "1.90")
+
+        self.assertEqual(table.last("source_hash", "h1")["event"], "Other vs Team")
+        self.assertEqual(table.first("source_hash", "h1")["odds"], "1.90")
+        self.assertEqual(
+            [row["odds"] for row in table.lookup("event_selection", ("home vs away", "home"))],
+            ["1.90", "2.10"],
+        )
+        self.assertIsNone(table.first("source_hash", "missing"))
+
+        # Same size, new mtime: the rewritten file is parsed again.
+        self._write(
+            "snapshots.csv",
+            path.read_text(encoding="utf-8").replace("1.90", "1.95"),
+            mtime_ns=1_700_000_001_000_000_000,
+        )
+        reloaded = export_table(path)
+        self.assertIsNot(reloaded, table)
+        self.assertEqual(reloaded.rows[0]["odds"], "1.95")
+
+        counters = export_table_counters()
+        self.assertEqual(
+            (counters["hits"], counters["misses"], counters["reloads"]),
+            (1, 2, 1),
+        )
+
+        missing = export_table(self.root / "missing.csv")
+        self.assertFalse(missing.exists)
+        self.assertEqual(missing.records(), [])
+
+    def test_least_recently_used_tables_are_evicted(self) -> None:
+        paths = [
+            self._write(f"table_{index}.csv", "id,value\n" + "1,abcdefghij\n" * 8)
+            for index in range(3)
+        ]
+        size = paths[0].stat().st_size
+        os.environ["EXPORT_TABLE_CACHE_MB"] = str((size * 2.5) / (1024 * 1024))
+
+        first = export_table(paths[0])
+        export_table(paths[1])
+        self.assertIs(export_table(paths[0]), first)
+
+        # Third table pushes out table_1, the least recently used one.
+        export_table(paths[2])
+        self.assertIs(export_table(paths[0]), first)
+
+        counters = export_table_counters()
+        self.assertEqual((counters["tables"], counters["evictions"]), (2, 1))
+        self.assertEqual(counters["cached_bytes"], size * 2)
+
+        os.environ["EXPORT_TABLE_CACHE_MB"] = "0"
+        clear_export_tables()
+        export_table(paths[0])
+        self.assertEqual(export_table_counters()["uncached"], 1)
+        self.assertEqual(export_table_counters()["tables"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from core.config import Settings
+from core.football_dataset_v15 import FootballDatasetV15
+
+
+FEATURE_HISTORY_SQL = """
+    CREATE TABLE football_feature_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at TEXT NOT NULL,
+        settled_at TEXT,
+        sport_key TEXT NOT NULL DEFAULT '',
+        league TEXT NOT NULL DEFAULT '',
+        event TEXT NOT NULL DEFAULT '',
+        selection TEXT NOT NULL DEFAULT '',
+        bookmaker TEXT NOT NULL DEFAULT '',
+        commence_time TEXT NOT NULL DEFAULT '',
+        odds REAL,
+        final_probability REAL,
+        market_probability REAL,
+        result TEXT NOT NULL DEFAULT 'OPEN',
+        source_hash TEXT UNIQUE
+    )
+"""
+
+
+class FootballDatasetV15IncrementalTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        self.settings = Settings(db_file=str(self.db_path))
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(FEATURE_HISTORY_SQL)
+
+        for index, result in enumerate(["WON", "LOST", "WON", "OPEN"]):
+            self._add_feature(
+                f"old-{index}",
+                result=result,
+                commence_time=f"2025-03-0{index + 1}T18:00:00+00:00",
+                settled_at=(
+                    f"2025-03-0{index + 1}T20:00:00+00:00"
+                    if result != "OPEN"
+                    else None
+                ),
+            )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _add_feature(
+        self,
+        source_hash: str,
+        *,
+        result: str,
+        commence_time: str,
+        settled_at: str | None,
+    ) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO football_feature_history (
+                    created_at, settled_at, sport_key, league, event,
+                    selection, bookmaker, commence_time, odds,
+                    final_probability, market_probability, result,
+                    source_hash
+                )
+                VALUES (?, ?, 'soccer_test', 'Test', ?, 'Home', 'book',
+                        ?, 2.1, 0.52, 0.47, ?, ?)
+                """,
+                (
+                    commence_time,
+                    settled_at,
+                    f"{source_hash} Home vs {source_hash} Away",
+                    commence_time,
+                    result,
+                    source_hash,
+                ),
+            )
+
+    def _dataset(self) -> list[tuple]:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                """
+                SELECT source_hash, result, target, training_ready
+                FROM football_dataset_v15
+                ORDER BY source_hash
+                """
+            ).fetchall()
+
+    def test_incremental_rebuild_only_processes_new_settlements(self) -> None:
+        dataset = FootballDatasetV15(self.settings)
+
+        first = dataset.rebuild()
+        self.assertFalse(first.incremental)
+        self.assertEqual(first.discovered, 3)
+
+        second = dataset.rebuild()
+        self.assertTrue(second.incremental)
+        self.assertEqual(second.discovered, 0)
+        self.assertEqual(second.total_rows, 3)
+
+        recent = (
+            datetime.now(timezone.utc) - timedelta(hours=3)
+        ).isoformat(timespec="seconds")
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                UPDATE football_feature_history
+                SET result='LOST', settled_at='2025-04-01T00:00:00+00:00'
+                WHERE source_hash='old-3'
+                """
+            )
+
+        self._add_feature(
+            "new-0",
+            result="WON",
+            commence_time=recent,
+            # Score feed timestamps may lag behind the stored mark.
+            settled_at="2025-01-01T00:00:00+00:00",
+        )
+
+        third = dataset.rebuild()
+        self.assertTrue(third.incremental)
+        self.assertEqual(third.discovered, 2)
+        self.assertEqual(third.inserted, 2)
+        self.assertEqual(third.total_rows, 5)
+
+        incremental_rows = self._dataset()
+
+        full = dataset.rebuild(full=True)
+        self.assertFalse(full.incremental)
+        self.assertEqual(full.discovered, 5)
+        self.assertEqual(full.updated, 5)
+        self.assertEqual(self._dataset(), incremental_rows)
+
+    def _totals(self) -> tuple[int, int]:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(
+                """
+                SELECT SUM(training_ready), SUM(has_closing_line)
+                FROM football_dataset_v15
+                """
+            ).fetchone()
+
+    def test_incremental_summary_reports_table_totals(self) -> None:
+        dataset = FootballDatasetV15(self.settings)
+
+        full = dataset.rebuild()
+        self.assertEqual(full.ready_rebuilt, full.training_ready)
+
+        self._add_feature(
+            "new-0",
+            result="WON",
+            commence_time=(
+                datetime.now(timezone.utc) - timedelta(hours=3)
+            ).isoformat(timespec="seconds"),
+            settled_at=None,
+        )
+
+        incremental = dataset.rebuild()
+        self.assertTrue(incremental.incremental)
+        self.assertEqual(incremental.discovered, 1)
+        self.assertEqual(
+            (incremental.training_ready, incremental.with_closing),
+            self._totals(),
+        )
+        self.assertGreater(incremental.training_ready, incremental.ready_rebuilt)
+
+        again = dataset.rebuild()
+        self.assertEqual(again.training_ready, incremental.training_ready)
+        self.assertEqual(again.with_closing, incremental.with_closing)
+
+    def test_empty_dataset_falls_back_to_full_rebuild(self) -> None:
+        dataset = FootballDatasetV15(self.settings)
+        dataset.rebuild()
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM football_dataset_v15")
+
+        summary = dataset.rebuild()
+
+        self.assertFalse(summary.incremental)
+        self.assertEqual(summary.inserted, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_data_collector_v14 import FootballDataCollectorV14
+from core.football_dataset_v15 import FootballDatasetV15
+from core.football_enrichment import (
+    ELO_SOURCES,
+    ensure_enrichment_indexes,
+    load_closing_snapshots,
+    load_team_values,
+    load_xg_rows,
+)
+from core.football_market import FootballMarketDatabase
+from core.football_team_elo_v14 import FootballTeamEloV14Database
+
+
+KICKOFF = "2026-08-20T19:00:00Z"
+
+
+class FootballEnrichmentTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        settings = Settings(db_file=str(self.db_path))
+        FootballMarketDatabase(settings).init_db()
+        FootballDataCollectorV14(settings)
+        FootballTeamEloV14Database(settings).init_db()
+        self.dataset = FootballDatasetV15(settings)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO football_market_closing (
+                    sport_key, league, event, home_team, away_team,
+                    commence_time, selection, bookmaker, closing_odds,
+                    closing_probability, captured_at, source_hash, created_at
+                )
+                VALUES ('soccer_test', 'Test', 'A vs B', 'A', 'B', ?, 'A',
+                        ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (KICKOFF, "early", 2.4, 0.41, "2026-08-20T12:00:00Z", "c1", KICKOFF),
+                    (KICKOFF, "late", 2.2, 0.45, "2026-08-20T18:30:00Z", "c2", KICKOFF),
+                    # Captured after kickoff: never a closing price.
+                    (KICKOFF, "live", 1.5, 0.66, "2026-08-20T19:30:00Z", "c3", KICKOFF),
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT INTO football_market_snapshots_v14 (
+                    snapshot_hash, sport_key, league, event, selection,
+                    bookmaker, commence_time, captured_at, selected_odds,
+                    market_selection_probability, is_closing_window
+                )
+                VALUES (?, 'soccer_test', 'Test', 'A vs B', 'B', ?, ?, ?, ?,
+                        ?, ?)
+                """,
+                [
+                    ("s1", "window", KICKOFF, "2026-08-20T17:00:00Z", 3.1, 0.3, 1),
+                    ("s2", "newer", KICKOFF, "2026-08-20T18:00:00Z", 3.4, 0.28, 0),
+                ],
+            )
+            conn.executemany(
+                """
+                INSERT INTO football_xg_history_v14 (
+                    source_hash, league, home_team, away_team, home_xg,
+                    away_xg, played_at, collected_at
+                )
+                VALUES (?, 'Test', 'A', 'B', ?, ?, ?, ?)
+                """,
+                [
+                    ("x1", 1.1, 0.4, "2026-08-21T19:00:00Z", KICKOFF),
+                    ("x2", 1.9, 0.7, "2026-08-20T21:00:00Z", KICKOFF),
+                    ("x3", 0.2, 0.2, "2026-07-01T19:00:00Z", KICKOFF),
+                ],
+            )
+            conn.execute(
+                """
+                INSERT INTO football_team_elo_v14 (
+                    team, league, rating, last_updated
+                )
+                VALUES ('A', 'Test', 1540.0, ?)
+                """,
+                (KICKOFF,),
+            )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_set_based_lookups_match_row_probes(self) -> None:
+        market_keys = [
+            ("soccer_test", "A vs B", selection, KICKOFF)
+            for selection in ("A", "B", "Draw")
+        ]
+        match_key = ("Test", "A", "B", KICKOFF)
+
+        with self.dataset.connect() as conn:
+            ensure_enrichment_indexes(conn)
+            closing = load_closing_snapshots(conn, market_keys)
+            xg = load_xg_rows(conn, [match_key])
+            elo = load_team_values(conn, ELO_SOURCES)
+
+            for sport_key, event, selection, commence_time in market_keys:
+                probe = self.dataset._closing_snapshot(
+                    conn,
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                    commence_time=commence_time,
+                )
+                loaded = closing.get((sport_key, event, selection, commence_time))
+
+                if probe is None:
+                    self.assertIsNone(loaded)
+                    continue
+
+                for name in ("selected_odds", "captured_at", "is_closing_window"):
+                    self.assertEqual(loaded[name], probe[name])
+
+            probe_xg = self.dataset._xg_row(
+                conn,
+                league="Test",
+                home_team="A",
+                away_team="B",
+                commence_time=KICKOFF,
+            )
+            probe_elo = self.dataset._elo_context(
+                conn,
+                league="Test",
+                home_team="A",
+                away_team="B",
+            )
+
+        self.assertEqual(closing[market_keys[0]]["bookmaker"], "late")
+        self.assertEqual(closing[market_keys[1]]["bookmaker"], "window")
+        self.assertNotIn(market_keys[2], closing)
+        self.assertEqual(xg[match_key]["home_xg"], probe_xg["home_xg"])
+        self.assertEqual(xg[match_key]["home_xg"], 1.9)
+        self.assertEqual(
+            (elo.get(("A", "Test")), elo.get(("B", "Test"))),
+            probe_elo,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
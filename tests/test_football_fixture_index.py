@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import random
+import unittest
+
+from core.football_settlement import (
+    CompletedFootballGame,
+    FootballFixtureIndex,
+    FootballSettlementEngine,
+    OpenFootballBet,
+    parse_datetime,
+)
+from core.football_team_aliases import FootballTeamAliasEngine
+
+
+TEAMS = [
+    "Manchester United", "Man Utd", "Manchester City", "Man City",
+    "Newcastle United", "Newcastle Utd", "Tottenham Hotspur", "Tottenham",
+    "Brighton and Hove Albion", "Brighton", "West Ham United", "Everton",
+    "Bayern München", "Bayern Munich", "Borussia Dortmund", "Real Sociedad",
+    "Atlético Madrid", "Atletico Madrid", "Inter", "AC Milan", "Milan",
+]
+
+
+def brute_force_match(
+    engine: FootballSettlementEngine,
+    bet: OpenFootballBet,
+    games: list[CompletedFootballGame],
+) -> CompletedFootballGame | None:
+    """Reference: every bet against every game, as before the index."""
+    if bet.external_event_id:
+        for game in games:
+            if game.event_id and game.event_id == bet.external_event_id:
+                return game
+
+    candidates = [
+        game
+        for game in games
+        if engine._team_match(game.home_team, bet.home_team)
+        and engine._team_match(game.away_team, bet.away_team)
+    ]
+
+    if not candidates:
+        return None
+
+    if len(candidates) == 1:
+        return candidates[0]
+
+    bet_time = parse_datetime(bet.start_time)
+
+    if bet_time is None:
+        return candidates[0]
+
+    timed = sorted(
+        (
+            (abs((parse_datetime(game.commence_time) - bet_time).total_seconds()), game)
+            for game in candidates
+            if parse_datetime(game.commence_time) is not None
+        ),
+        key=lambda item: item[0],
+    )
+
+    if not timed:
+        return candidates[0]
+
+    if timed[0][0] > 12 * 60 * 60:
+        return None
+
+    return timed[0][1]
+
+
+class FootballFixtureIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = object.__new__(FootballSettlementEngine)
+        self.engine.alias_engine = FootballTeamAliasEngine()
+        rng = random.Random(7)
+
+        self.games = []
+        for index in range(60):
+            home, away = rng.sample(TEAMS, 2)
+            self.games.append(CompletedFootballGame(
+                event_id=f"event-{index}" if index % 3 else "",
+                sport_key="soccer_test",
+                home_team=home,
+                away_team=away,
+                commence_time=f"2026-08-{10 + index % 5}T{10 + index % 9}:00:00Z",
+                home_goals=rng.randint(0, 3),
+                away_goals=rng.randint(0, 3),
+                last_update="2026-08-20T12:00:00Z",
+            ))
+
+        self.bets = []
+        for index in range(200):
+            home, away = rng.sample(TEAMS, 2)
+            self.bets.append(OpenFootballBet(
+                bet_id=index,
+                source_hash=f"hash-{index}",
+                sport_key="soccer_test",
+                league="Test",
+                event=f"{home} vs {away}",
+                market="h2h",
+                selection=home,
+                start_time=(
+                    f"2026-08-{10 + index % 5}T{10 + index % 7}:00:00Z"
+                    if index % 11
+                    else ""
+                ),
+                home_team=home,
+                away_team=away,
+                external_event_id=(
+                    f"event-{index % 90}" if index % 4 == 0 else ""
+                ),
+            ))
+
+    def test_index_matches_brute_force_scan(self) -> None:
+        index = FootballFixtureIndex(self.games)
+        matched = 0
+
+        for bet in self.bets:
+            expected = brute_force_match(self.engine, bet, self.games)
+            self.assertIs(self.engine._match_game(bet, index), expected)
+            self.assertIs(self.engine._match_game(bet, self.games), expected)
+            matched += expected is not None
+
+        self.assertGreater(matched, 10)
+
+    def test_similarity_memo_is_reused(self) -> None:
+        engine = FootballTeamAliasEngine()
+        scores = {
+            (left, right): engine.similarity(left, right)
+            for left in TEAMS
+            for right in TEAMS
+        }
+        memo_size = len(engine._similarity_memo)
+
+        for (left, right), score in scores.items():
+            self.assertEqual(engine.similarity(left, right), score)
+
+        self.assertEqual(len(engine._similarity_memo), memo_size)
+        self.assertEqual(engine.similarity("Man Utd", "Manchester United"), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
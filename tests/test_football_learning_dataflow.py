@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import csv
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.football_dataset_key_diagnostics_v15_62 import run_dataset_key_diagnostics_v15_62
+from core.football_feature_source_joiner_v15_58 import run_feature_source_joiner_v15_58
+from core.football_learning_dataflow import run_learning_dataflow
+from core.football_learning_dataset_builder_v15_56 import run_learning_dataset_builder_v15_56
+from core.football_learning_tables import load_rows
+from core.football_universal_market_probability_resolver_v15_61 import (
+    run_universal_market_probability_resolver_v15_61,
+)
+
+
+def _write(path: Path, rows: list[dict]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _without_timestamps(rows: list[dict]) -> list[dict]:
+    return [
+        {key: value for key, value in row.items() if key != "created_at"}
+        for row in rows
+    ]
+
+
+class LearningDataflowTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.root = Path(self.temp_dir.name)
+        self.exports = self.root / "exports"
+        self.exports.mkdir()
+
+        _write(self.exports / "history_football_clv_results_v15_49.csv", [
+            {
+                "created_at": "2026-09-01T10:00:00+00:00",
+                "source_hash": f"h{index}",
+                "event": f"Home {index} vs Away {index}",
+                "opening_odds": "2.10",
+                "closing_odds": "1.95" if index % 2 else "2.20",
+                "clv_percent": "7.7" if index % 2 else "-4.5",
+                "result": "V" if index % 3 else "P",
+                "target": "1" if index % 3 else "0",
+            }
+            for index in range(6)
+        ])
+        _write(self.exports / "history_football_features.csv", [
+            {"source_hash": "h1", "elo_difference": "35.0", "xg_home": "1.4"},
+            {"source_hash": "h2", "elo_difference": "-12.5", "xg_home": "0.9"},
+        ])
+        _write(self.exports / "history_football_market_snapshots_v14.csv", [
+            {
+                "source_hash": "h1",
+                "event": "Home 1 vs Away 1",
+                "selection": "Home",
+                "captured_at": "2026-09-01T09:00:00+00:00",
+                "market_selection_probability": "0.48",
+            },
+            {
+                "source_hash": "h1",
+                "event": "Home 1 vs Away 1",
+                "selection": "Home",
+                "captured_at": "2026-09-01T11:00:00+00:00",
+                "market_selection_probability": "0.51",
+            },
+            {
+                "source_hash": "other",
+                "event": "Home 4 vs Away 4",
+                "selection": "",
+                "captured_at": "2026-09-01T11:00:00+00:00",
+                "market_selection_probability": "0.33",
+            },
+        ])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _legacy_chain(self) -> list[dict]:
+        cwd = os.getcwd()
+        os.chdir(self.root)
+
+        try:
+            run_learning_dataset_builder_v15_56()
+            run_feature_source_joiner_v15_58()
+            run_universal_market_probability_resolver_v15_61()
+            return load_rows("exports/history_football_learning_dataset_v15_61.csv")
+        finally:
+            os.chdir(cwd)
+
+    def test_in_memory_chain_matches_csv_handoffs(self) -> None:
+        result = run_learning_dataflow(export_dir=self.exports, debug_csv=False)
+
+        self.assertEqual(
+            result.written,
+            [str(self.exports / "history_football_learning_dataset_v15_61.csv")],
+        )
+        self.assertFalse((self.exports / "history_football_learning_dataset_v15_58.csv").exists())
+
+        reports = result.reports
+        self.assertEqual(reports["v15.50"]["positive_clv"], 3)
+        self.assertEqual(reports["v15.52"]["closing_candidates"], 2)
+        self.assertEqual(reports["v15.58"]["output"], None)
+        self.assertEqual(
+            (reports["v15.61"]["hash_matches"], reports["v15.61"]["event_matches"]),
+            (1, 1),
+        )
+
+        stored = load_rows(result.written[0])
+        self.assertEqual(_without_timestamps(stored), _without_timestamps(self._legacy_chain()))
+        self.assertEqual(result.rows[1]["market_probability"], "0.51")
+        self.assertEqual(result.rows[1]["elo_difference"], "35.0")
+
+    def test_key_diagnostics_read_the_stored_dataflow_output(self) -> None:
+        result = run_learning_dataflow(export_dir=self.exports, debug_csv=False)
+        cwd = os.getcwd()
+        os.chdir(self.root)
+
+        try:
+            stored = run_dataset_key_diagnostics_v15_62()
+            in_memory = run_dataset_key_diagnostics_v15_62(result.tables["v15.58"])
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(stored["learning_rows"], 6)
+        self.assertEqual(stored["overlap_tests"], in_memory["overlap_tests"])
+        self.assertEqual(stored["overlap_tests"]["source_hash"], 1)
+
+    def test_debug_csv_and_in_memory_inputs(self) -> None:
+        clv_rows = load_rows(self.exports / "history_football_clv_results_v15_49.csv")[:2]
+        debug = self.root / "debug"
+
+        result = run_learning_dataflow(
+            clv_rows,
+            export_dir=debug,
+            snapshots=[],
+            features=[],
+            debug_csv=True,
+        )
+
+        self.assertEqual(len(result.rows), 2)
+        self.assertEqual(
+            sorted(path.name for path in debug.iterdir()),
+            [
+                "history_football_clv_results_v15_49.csv",
+                *(
+                    f"history_football_learning_dataset_v15_{version}.csv"
+                    for version in range(56, 62)
+                ),
+            ],
+        )
+        self.assertEqual(result.reports["v15.61"]["missing"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
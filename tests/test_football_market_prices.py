@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.config import Settings
+from core.football_market import FootballMarketDatabase, MarketPrices
+from core.schema_registry import forget_schema
+
+
+BOOKMAKERS = ["Pinnacle", "Bet365", "Unibet"]
+SELECTIONS = ["Home", "Draw", "Away"]
+
+
+class FootballMarketPricesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = db_path = Path(self.temp_dir.name) / "bets.db"
+        self.market = FootballMarketDatabase(Settings(db_file=str(db_path)))
+        self.market.init_db()
+        rng = random.Random(16)
+        start = datetime(2026, 8, 1)
+
+        def stamp(minute: int) -> str:
+            return (start + timedelta(minutes=minute)).isoformat(timespec="seconds")
+
+        snapshots = []
+        for index, minute in enumerate(rng.sample(range(20000), 1500)):
+            event = f"Event {rng.randint(0, 19)}"
+            snapshots.append((
+                "soccer_test", "Test", event, "Home", "Away", stamp(30000),
+                stamp(minute), rng.choice(BOOKMAKERS),
+                "h2h" if index % 11 else "totals",
+                rng.choice(SELECTIONS), round(rng.uniform(1.3, 5.0), 3), 0.5,
+                f"s{index}", stamp(minute),
+            ))
+
+        closing = []
+        for index, minute in enumerate(rng.sample(range(20000), 90)):
+            event = f"Event {rng.randint(0, 14)}"
+            closing.append((
+                "soccer_test", "Test", event, "Home", "Away", stamp(30000),
+                rng.choice(SELECTIONS), rng.choice(BOOKMAKERS),
+                round(rng.uniform(1.3, 5.0), 3), 0.5, stamp(minute),
+                f"c{index}", stamp(minute),
+            ))
+
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO football_market_snapshots (
+                    sport_key, league, event, home_team, away_team,
+                    commence_time, captured_at, bookmaker, market, selection,
+                    odds, implied_probability, source_hash, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                snapshots,
+            )
+            conn.executemany(
+                """
+                INSERT INTO football_market_closing (
+                    sport_key, league, event, home_team, away_team,
+                    commence_time, selection, bookmaker, closing_odds,
+                    closing_probability, captured_at, source_hash, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                closing,
+            )
+
+        self.keys = [
+            ("soccer_test", f"Event {event}", selection)
+            for event in range(22)
+            for selection in SELECTIONS
+        ]
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_price_index_replaces_the_old_lookup_index(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "CREATE INDEX ix_football_market_lookup ON "
+                "football_market_snapshots (sport_key, event, selection, captured_at)"
+            )
+
+        # A new process runs the schema setup again on the old database.
+        forget_schema(self.db_path)
+        self.market.init_db()
+
+        with sqlite3.connect(self.db_path) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' "
+                    "AND tbl_name='football_market_snapshots' AND sql IS NOT NULL"
+                )
+            }
+            plan = " ".join(
+                str(row[-1])
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT odds FROM football_market_snapshots "
+                    "WHERE sport_key=? AND event=? AND selection=? "
+                    "ORDER BY captured_at DESC LIMIT 1",
+                    ("soccer_test", "Event 1", "Home"),
+                )
+            )
+
+        self.assertEqual(indexes, {"ix_football_market_prices"})
+        self.assertIn("ix_football_market_prices", plan)
+
+    def test_batched_prices_match_per_key_lookups(self) -> None:
+        prices = self.market.market_prices(self.keys + self.keys[:5])
+
+        self.assertEqual(len(prices), len(self.keys))
+
+        for sport_key, event, selection in self.keys:
+            key = {"sport_key": sport_key, "event": event, "selection": selection}
+            expected = MarketPrices(
+                opening_odds=self.market.opening_odds(**key),
+                latest_odds=self.market.latest_odds(**key),
+                closing_odds=self.market.closing_odds(**key),
+            )
+            self.assertEqual(prices[(sport_key, event, selection)], expected)
+
+        # Events 20 and 21 have no prices at all; 15-19 have no closing line.
+        self.assertEqual(prices[("soccer_test", "Event 21", "Home")], MarketPrices())
+        self.assertTrue(any(p.closing_odds is not None for p in prices.values()))
+        self.assertEqual(self.market.market_prices([]), {})
+
+    def test_slate_movements_and_clv(self) -> None:
+        movements = self.market.line_movements(self.keys)
+
+        self.assertEqual(len(movements), 60)
+
+        for (sport_key, event, selection), movement in movements.items():
+            self.assertEqual(
+                self.market.line_movement(
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                ),
+                movement,
+            )
+
+        bets = [key + (2.5,) for key in self.keys]
+        results = self.market.calculate_clv_many(bets)
+
+        self.assertEqual(len(results), len(bets))
+
+        for (sport_key, event, selection, bet_odds), result in zip(bets, results):
+            self.assertEqual(
+                self.market.calculate_clv(
+                    sport_key=sport_key,
+                    event=event,
+                    selection=selection,
+                    bet_odds=bet_odds,
+                ),
+                result,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+import random
+import tempfile
+import unittest
+from dataclasses import fields
+from pathlib import Path
+
+from core.football_features import FootballFeatures
+from core.football_meta import FootballMetaModel
+
+
+def _features(rng: random.Random) -> FootballFeatures:
+    values = {}
+
+    for field in fields(FootballFeatures):
+        if field.type in {"str", str}:
+            values[field.name] = "x"
+        elif field.type in {"int", int}:
+            values[field.name] = rng.randint(3, 20)
+        else:
+            values[field.name] = round(rng.uniform(0.05, 0.95), 4)
+
+    values["odds"] = round(rng.uniform(1.5, 4.5), 2)
+    return FootballFeatures(**values)
+
+
+class LogisticStub:
+    """Pure-Python stand-in for a fitted sklearn pipeline."""
+
+    def __init__(self, fail_on_odds: float | None = None) -> None:
+        self.calls = 0
+        self.fail_on_odds = fail_on_odds
+
+    def predict_proba(self, matrix):
+        self.calls += 1
+        rows = []
+
+        for vector in matrix:
+            if vector[0] == self.fail_on_odds:
+                raise ValueError("bad row")
+
+            score = sum(value * (index % 5 - 2) * 0.1 for index, value in enumerate(vector))
+            probability = 1.0 / (1.0 + math.exp(-score))
+            rows.append([1.0 - probability, probability])
+
+        return rows
+
+
+class FootballMetaBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        root = Path(self.temp_dir.name)
+        self.model = FootballMetaModel(
+            model_path=str(root / "missing.pkl"),
+            metadata_path=str(root / "missing.json"),
+        )
+        self.model.metadata.samples = 240
+        self.model.metadata.validation_score = 0.61
+        rng = random.Random(5)
+        self.features = [_features(rng) for _ in range(40)]
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_batch_matches_single_row_predictions(self) -> None:
+        self.model.model = LogisticStub()
+        single = [self.model.predict(features) for features in self.features]
+        self.model.model.calls = 0
+
+        batch = self.model.predict_many(self.features)
+
+        self.assertEqual(self.model.model.calls, 1)
+        self.assertEqual(batch, single)
+        self.assertEqual(batch[0].source, "FOOTBALL_V13_META_MODEL")
+
+    def test_failing_row_falls_back_alone(self) -> None:
+        self.model.model = LogisticStub(fail_on_odds=self.features[3].odds)
+
+        batch = self.model.predict_many(self.features)
+
+        self.assertEqual(
+            batch,
+            [self.model.predict(features) for features in self.features],
+        )
+        self.assertEqual(batch[3].source, "FOOTBALL_V13_FALLBACK")
+        self.assertIn("error=ValueError", batch[3].reason)
+        self.assertEqual(batch[4].source, "FOOTBALL_V13_META_MODEL")
+
+    def test_untrained_model_uses_fallback_for_every_row(self) -> None:
+        batch = self.model.predict_many(self.features)
+
+        self.assertEqual(
+            [prediction.probability for prediction in batch],
+            [self.model.fallback_probability(f) for f in self.features],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import math
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import core.football_meta as football_meta
+from core.football_meta import (
+    FootballLinearScorer,
+    FootballMetaModel,
+    FootballMetaMetadata,
+    export_football_meta_scorer,
+    football_meta_scorer_path,
+    save_football_meta_metadata,
+)
+from core.football_trainer import FEATURE_ORDER
+from tests.test_football_meta_batch import _features
+
+
+class _Step:
+    def __init__(self, **attributes) -> None:
+        self.__dict__.update(attributes)
+
+
+class FittedPipelineStub:
+    """Carries the fitted attributes of StandardScaler + LogisticRegression."""
+
+    def __init__(self, rng: random.Random) -> None:
+        width = len(FEATURE_ORDER)
+        self.steps = [
+            ("scaler", _Step(
+                mean_=[rng.uniform(0.0, 2.0) for _ in range(width)],
+                scale_=[rng.uniform(0.2, 1.5) for _ in range(width - 1)] + [0.0],
+            )),
+            ("classifier", _Step(
+                coef_=[[rng.uniform(-0.4, 0.4) for _ in range(width)]],
+                intercept_=[-0.15],
+            )),
+        ]
+
+    def predict_proba(self, matrix):
+        scaler = self.steps[0][1]
+        classifier = self.steps[1][1]
+        rows = []
+
+        for vector in matrix:
+            logit = classifier.intercept_[0] + sum(
+                coefficient * (value - mean) / (scale or 1.0)
+                for coefficient, value, mean, scale in zip(
+                    classifier.coef_[0], vector, scaler.mean_, scaler.scale_,
+                )
+            )
+            probability = 1.0 / (1.0 + math.exp(-logit))
+            rows.append([1.0 - probability, probability])
+
+        return rows
+
+
+class FootballMetaScorerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        root = Path(self.temp_dir.name)
+        self.model_path = root / "football_meta_model.pkl"
+        self.metadata_path = root / "football_meta_model.json"
+        rng = random.Random(11)
+        self.pipeline = FittedPipelineStub(rng)
+        self.features = [_features(rng) for _ in range(25)]
+        patcher = mock.patch.object(football_meta, "USE_COMPILED_SCORER", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_exported_scorer_matches_pipeline_and_skips_pickle(self) -> None:
+        # An unpicklable placeholder proves the pickle is never opened.
+        self.model_path.write_bytes(b"not a pickle")
+        os.utime(self.model_path, (1_000_000, 1_000_000))
+        scorer_path = export_football_meta_scorer(
+            self.pipeline,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+
+        self.assertEqual(scorer_path, football_meta_scorer_path(self.model_path))
+        model = FootballMetaModel(
+            model_path=str(self.model_path),
+            metadata_path=str(self.metadata_path),
+        )
+
+        self.assertIsInstance(model.model, FootballLinearScorer)
+
+        vectors = [model._vector(features) for features in self.features]
+        expected = [row[1] for row in self.pipeline.predict_proba(vectors)]
+
+        for left, right in zip(model._model_probabilities(vectors), expected):
+            self.assertAlmostEqual(left, right, places=12)
+
+        prediction = model.predict(self.features[0])
+        self.assertEqual(prediction.source, "FOOTBALL_V13_META_MODEL")
+
+    def test_non_linear_model_removes_stale_scorer(self) -> None:
+        scorer_path = export_football_meta_scorer(
+            self.pipeline,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+        self.assertTrue(scorer_path.exists())
+
+        self.assertIsNone(
+            export_football_meta_scorer(
+                object(),
+                FEATURE_ORDER,
+                model_path=self.model_path,
+            )
+        )
+        self.assertFalse(scorer_path.exists())
+
+    def test_newer_pickle_wins_over_older_scorer(self) -> None:
+        scorer_path = export_football_meta_scorer(
+            self.pipeline,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+
+        with self.model_path.open("wb") as handle:
+            pickle.dump({"placeholder": True}, handle)
+
+        stamp = scorer_path.stat().st_mtime + 5
+        os.utime(self.model_path, (stamp, stamp))
+
+        model = FootballMetaModel(
+            model_path=str(self.model_path),
+            metadata_path=str(self.metadata_path),
+        )
+
+        self.assertEqual(model.model, {"placeholder": True})
+
+    def test_scorer_and_pickle_predict_the_same_probability(self) -> None:
+        with self.model_path.open("wb") as handle:
+            pickle.dump(self.pipeline, handle)
+        os.utime(self.model_path, (1_000_000, 1_000_000))
+        export_football_meta_scorer(
+            self.pipeline,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+        save_football_meta_metadata(
+            FootballMetaMetadata(
+                samples=400,
+                validation_score=0.6,
+                feature_count=len(FEATURE_ORDER),
+                feature_order=list(FEATURE_ORDER),
+            ),
+            path=str(self.metadata_path),
+        )
+
+        models = {}
+        for enabled in (True, False):
+            with mock.patch.object(football_meta, "USE_COMPILED_SCORER", enabled):
+                models[enabled] = FootballMetaModel(
+                    model_path=str(self.model_path),
+                    metadata_path=str(self.metadata_path),
+                )
+
+        self.assertIsInstance(models[True].model, FootballLinearScorer)
+        self.assertIsInstance(models[False].model, FittedPipelineStub)
+
+        for features in self.features:
+            scorer = models[True].predict(features)
+            pickled = models[False].predict(features)
+            self.assertEqual(pickled.source, "FOOTBALL_V13_META_MODEL")
+            self.assertAlmostEqual(scorer.probability, pickled.probability, places=12)
+
+    def test_scorer_is_ignored_unless_enabled(self) -> None:
+        with self.model_path.open("wb") as handle:
+            pickle.dump({"placeholder": True}, handle)
+        os.utime(self.model_path, (1_000_000, 1_000_000))
+        export_football_meta_scorer(
+            self.pipeline,
+            FEATURE_ORDER,
+            model_path=self.model_path,
+        )
+
+        with mock.patch.object(football_meta, "USE_COMPILED_SCORER", False):
+            model = FootballMetaModel(
+                model_path=str(self.model_path),
+                metadata_path=str(self.metadata_path),
+            )
+
+        self.assertEqual(model.model, {"placeholder": True})
+
+    def test_mismatched_width_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            FootballLinearScorer(
+                feature_order=["odds"],
+                means=[0.0, 1.0],
+                scales=[1.0],
+                coefficients=[0.5],
+                intercept=0.0,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
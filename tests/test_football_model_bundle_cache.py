@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_features import (
+    FootballModelBundleCache,
+    build_football_features,
+)
+from core.football_market import build_market_snapshot
+
+
+def _event() -> dict:
+    return {
+        "id": "event-1",
+        "home_team": "Home FC",
+        "away_team": "Away FC",
+        "commence_time": "2026-08-20T20:00:00+00:00",
+        "bookmakers": [
+            {
+                "title": f"Book {index}",
+                "markets": [{
+                    "key": "h2h",
+                    "outcomes": [
+                        {"name": "Home FC", "price": 2.05 + index * 0.05},
+                        {"name": "Draw", "price": 3.40},
+                        {"name": "Away FC", "price": 3.70 - index * 0.05},
+                    ],
+                }],
+            }
+            for index in range(4)
+        ],
+    }
+
+
+class FootballModelBundleCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.settings = Settings(db_file=str(Path(self.temp_dir.name) / "bets.db"))
+        self.market = build_market_snapshot(
+            sport_key="soccer_test",
+            league="Test",
+            event=_event(),
+            min_books=3,
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_selections_of_one_fixture_share_a_bundle(self) -> None:
+        cache = FootballModelBundleCache()
+
+        cached = [
+            build_football_features(
+                self.settings,
+                market=self.market,
+                selection=selection,
+                odds=3.0,
+                bookmaker="Book 0",
+                bundle_cache=cache,
+            )
+            for selection in ("Home FC", "Draw", "Away FC")
+        ]
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 2)
+
+        for features in cached:
+            uncached = build_football_features(
+                self.settings,
+                market=self.market,
+                selection=features.selection,
+                odds=3.0,
+                bookmaker="Book 0",
+            )
+            self.assertEqual(features.to_dict(), uncached.to_dict())
+
+    def test_league_parameters_are_part_of_the_key(self) -> None:
+        cache = FootballModelBundleCache()
+
+        for rho in (-0.08, -0.02):
+            build_football_features(
+                self.settings,
+                market=self.market,
+                selection="Draw",
+                odds=3.4,
+                bookmaker="Book 0",
+                dixon_rho=rho,
+                bundle_cache=cache,
+            )
+
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_elo import FootballEloDatabase
+from core.football_team_elo_v14 import FootballTeamEloV14Database
+from core.football_team_form import FootballFormDatabase
+from core.football_xg import FootballXGDatabase
+
+
+def _matches(count: int) -> list[dict]:
+    rng = random.Random(11)
+    teams = [f"Team {index}" for index in range(8)]
+    matches = []
+
+    for index in range(count):
+        home, away = rng.sample(teams, 2)
+        matches.append({
+            "league": rng.choice(["Alpha", "Beta"]),
+            "home_team": home,
+            "away_team": away,
+            "home_goals": rng.randint(0, 4),
+            "away_goals": rng.randint(0, 4),
+            "home_xg": round(rng.uniform(0.2, 3.0), 2),
+            "away_xg": round(rng.uniform(0.2, 3.0), 2),
+            "played_at": f"2026-0{1 + index // 30}-{1 + index % 28:02d}T18:00:00",
+            "source": "test",
+            # Every tenth match repeats an earlier hash and must be skipped.
+            "source_hash": f"match-{index - 3 if index % 10 == 9 else index}",
+        })
+
+    return matches
+
+
+class FootballRatingReplayTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        root = Path(self.temp_dir.name)
+        self.sequential = Settings(db_file=str(root / "sequential.db"))
+        self.replayed = Settings(db_file=str(root / "replayed.db"))
+        self.matches = _matches(60)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _rows(self, settings: Settings, table: str) -> list[tuple]:
+        with sqlite3.connect(settings.db_file) as conn:
+            cursor = conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3")
+            columns = [item[0] for item in cursor.description]
+            skipped = {"id", "last_updated", "created_at"}
+            return [
+                tuple(
+                    value
+                    for column, value in zip(columns, row)
+                    if column not in skipped
+                )
+                for row in cursor.fetchall()
+            ]
+
+    def _assert_same(self, *tables: str) -> None:
+        for table in tables:
+            sequential = self._rows(self.sequential, table)
+            self.assertTrue(sequential, table)
+            self.assertEqual(sequential, self._rows(self.replayed, table), table)
+
+    def test_elo_replay_matches_sequential_updates(self) -> None:
+        database = FootballEloDatabase(self.sequential)
+        inserted = sum(
+            database.update_after_match(
+                **{k: v for k, v in match.items() if "xg" not in k}
+            ).inserted
+            for match in self.matches
+        )
+
+        replayed = FootballEloDatabase(self.replayed).replay_matches(self.matches)
+
+        self.assertEqual(inserted, replayed)
+        self.assertEqual(replayed, 54)
+        self._assert_same("football_elo_ratings", "football_elo_history")
+
+    def test_xg_replay_matches_sequential_updates(self) -> None:
+        database = FootballXGDatabase(self.sequential)
+        inserted = sum(
+            database.update_after_match(**match) for match in self.matches
+        )
+
+        replayed = FootballXGDatabase(self.replayed).replay_matches(self.matches)
+
+        self.assertEqual(inserted, replayed)
+        self._assert_same("football_xg_ratings", "football_xg_history")
+
+    def test_form_replay_matches_sequential_updates(self) -> None:
+        database = FootballFormDatabase(self.sequential)
+        inserted = sum(
+            database.update_after_match(**match) for match in self.matches
+        )
+
+        replayed = FootballFormDatabase(self.replayed).replay_matches(self.matches)
+
+        self.assertEqual(inserted, replayed)
+        self._assert_same("football_team_form", "football_form_history")
+
+    def test_elo_v14_rebuild_matches_sequential_updates(self) -> None:
+        for settings in (self.sequential, self.replayed):
+            FootballFormDatabase(settings).replay_matches(self.matches)
+
+        database = FootballTeamEloV14Database(self.sequential)
+        with sqlite3.connect(self.sequential.db_file) as conn:
+            history = conn.execute(
+                """
+                SELECT league, home_team, away_team, home_goals, away_goals,
+                       played_at, source, source_hash
+                FROM football_form_history
+                ORDER BY played_at, id
+                """
+            ).fetchall()
+
+        for league, home, away, home_goals, away_goals, played_at, source, source_hash in history:
+            database.update_after_match(
+                league=league,
+                home_team=home,
+                away_team=away,
+                home_goals=home_goals,
+                away_goals=away_goals,
+                played_at=played_at,
+                source=source,
+                source_hash=f"{source_hash}:elo_v14",
+            )
+
+        rebuilt = FootballTeamEloV14Database(self.replayed).rebuild_from_history()
+
+        self.assertEqual(rebuilt, len(history))
+        self.assertEqual(
+            FootballTeamEloV14Database(self.replayed).rebuild_from_history(),
+            0,
+        )
+        self._assert_same("football_team_elo_v14", "football_team_elo_v14_history")
+
+
+if __name__ == "__main__":
+    unittest.main()
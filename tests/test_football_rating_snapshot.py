@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_elo import FootballEloDatabase, TeamElo
+from core.football_rating_snapshot import (
+    active_rating_snapshot,
+    invalidate_rating_snapshot,
+    load_rating_snapshot,
+)
+from core.football_team_xg_v14 import FootballTeamXGV14Database
+
+
+class FootballRatingSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        self.settings = Settings(db_file=str(self.db_path))
+        self.elo = FootballEloDatabase(self.settings)
+        self.elo.save_team(TeamElo(team="Alpha", league="Test", overall_elo=1610.0))
+
+    def tearDown(self) -> None:
+        invalidate_rating_snapshot(self.db_path)
+        self.temp_dir.cleanup()
+
+    def test_loads_are_served_from_snapshot(self) -> None:
+        snapshot = load_rating_snapshot(self.settings)
+
+        # Rows changed behind the snapshot's back are not seen until reload.
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE football_elo_ratings SET overall_elo=1400")
+
+        self.assertEqual(self.elo.load_team("Alpha", "Test").overall_elo, 1610.0)
+        self.assertEqual(self.elo.load_team("Beta", "Test").overall_elo, 1500.0)
+        self.assertEqual((snapshot.hits, snapshot.misses), (1, 1))
+
+    def test_save_invalidates_snapshot(self) -> None:
+        load_rating_snapshot(self.settings)
+
+        self.elo.save_team(TeamElo(team="Alpha", league="Test", overall_elo=1650.0))
+
+        self.assertIsNone(active_rating_snapshot(self.db_path))
+        self.assertEqual(self.elo.load_team("Alpha", "Test").overall_elo, 1650.0)
+
+    def test_missing_table_falls_back_to_sqlite(self) -> None:
+        snapshot = load_rating_snapshot(self.settings)
+        xg = FootballTeamXGV14Database(self.settings)
+
+        self.assertFalse(snapshot.covers("football_team_xg_v14"))
+        self.assertEqual(xg.load("Alpha", "Test").team, "Alpha")
+        self.assertEqual((snapshot.hits, snapshot.misses), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_market import FootballMarketDatabase
+from core.football_scan_session import FootballScanSession
+
+
+def _event(event_id: str, home: str, away: str) -> dict:
+    return {
+        "id": event_id,
+        "home_team": home,
+        "away_team": away,
+        "commence_time": "2026-08-20T20:00:00+00:00",
+        "bookmakers": [{
+            "title": "Book A",
+            "markets": [{
+                "key": "h2h",
+                "outcomes": [
+                    {"name": home, "price": 2.0},
+                    {"name": "Draw", "price": 3.3},
+                    {"name": away, "price": 3.8},
+                ],
+            }],
+        }],
+    }
+
+
+class FootballScanSessionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        self.settings = Settings(db_file=str(self.db_path))
+        self.market = FootballMarketDatabase(self.settings)
+        self.market.init_db()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _count(self, table: str) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+    def test_rows_are_buffered_until_flush(self) -> None:
+        with FootballScanSession(self.settings) as session:
+            for index in range(3):
+                self.market.save_event_snapshot(
+                    sport_key="soccer_test",
+                    league="Test",
+                    event=_event(f"event-{index}", f"H{index}", f"A{index}"),
+                    session=session,
+                )
+                self.market.save_closing_snapshot(
+                    sport_key="soccer_test",
+                    league="Test",
+                    event=_event(f"event-{index}", f"H{index}", f"A{index}"),
+                    session=session,
+                )
+
+            self.assertEqual(session.pending_rows, 18)
+            self.assertEqual(self._count("football_market_snapshots"), 0)
+
+            self.assertEqual(session.flush(), 18)
+
+        self.assertEqual(self._count("football_market_snapshots"), 9)
+        self.assertEqual(self._count("football_market_closing"), 9)
+        self.assertEqual(session.metrics.flushes, 1)
+        self.assertEqual(session.metrics.rows_per_flush, 18.0)
+        self.assertEqual(session.inserted("football_market_closing"), 9)
+
+    def test_threshold_triggers_flush_and_close_writes_remainder(self) -> None:
+        with FootballScanSession(self.settings, max_pending_rows=4) as session:
+            for index in range(3):
+                self.market.save_event_snapshot(
+                    sport_key="soccer_test",
+                    league="Test",
+                    event=_event(f"event-{index}", f"H{index}", f"A{index}"),
+                    session=session,
+                )
+
+        self.assertEqual(self._count("football_market_snapshots"), 9)
+        self.assertEqual(session.metrics.flushes, 2)
+        self.assertEqual(session.metrics.rows_flushed, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from core.football_dixon_coles import (
+    calculate_dixon_coles_markets,
+    dixon_coles_tau,
+)
+import core.football_score_grid as football_score_grid
+from core.football_poisson import poisson_pmf
+from core.football_score_grid import (
+    clear_score_grid_cache,
+    score_grid,
+    score_grid_cache_info,
+)
+
+
+def _reference_matrix(home_xg: float, away_xg: float, rho: float) -> dict:
+    base = {
+        (h, a): poisson_pmf(h, home_xg) * poisson_pmf(a, away_xg)
+        for h in range(11)
+        for a in range(11)
+    }
+    base_total = sum(base.values())
+    corrected = {
+        score: probability / base_total
+        * dixon_coles_tau(score[0], score[1], home_xg, away_xg, rho)
+        for score, probability in base.items()
+    }
+    total = sum(corrected.values())
+    return {score: value / total for score, value in corrected.items()}
+
+
+class FootballScoreGridTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_score_grid_cache()
+
+    def test_markets_match_brute_force_matrix(self) -> None:
+        for home_xg, away_xg, rho in [
+            (1.45, 1.10, -0.08),
+            (0.30, 2.90, 0.12),
+            (3.80, 0.60, -0.20),
+        ]:
+            matrix = _reference_matrix(home_xg, away_xg, rho)
+            result = calculate_dixon_coles_markets(home_xg, away_xg, rho=rho)
+
+            raw_1x2 = (
+                sum(p for (h, a), p in matrix.items() if h > a),
+                sum(p for (h, a), p in matrix.items() if h == a),
+                sum(p for (h, a), p in matrix.items() if h < a),
+            )
+            total_1x2 = sum(raw_1x2)
+            expected = {
+                "home_win": raw_1x2[0] / total_1x2,
+                "draw": raw_1x2[1] / total_1x2,
+                "away_win": raw_1x2[2] / total_1x2,
+                "over_25": sum(p for (h, a), p in matrix.items() if h + a > 2.5),
+                "over_45": sum(p for (h, a), p in matrix.items() if h + a > 4.5),
+                "btts_yes": sum(p for (h, a), p in matrix.items() if h and a),
+                "home_over_15": sum(p for (h, a), p in matrix.items() if h >= 2),
+                "away_over_05": sum(p for (h, a), p in matrix.items() if a >= 1),
+            }
+
+            for field, value in expected.items():
+                self.assertAlmostEqual(getattr(result, field), value, places=10)
+
+            for score, value in matrix.items():
+                self.assertAlmostEqual(result.score_matrix[score], value, places=10)
+
+    @unittest.skipIf(football_score_grid.np is None, "numpy not installed")
+    def test_list_fallback_matches_array_grid(self) -> None:
+        for home_xg, away_xg, rho in [(1.45, 1.10, -0.08), (0.30, 2.90, 0.12)]:
+            array_grid = score_grid(home_xg, away_xg, rho=rho, max_goals=10)
+            clear_score_grid_cache()
+
+            with mock.patch.object(football_score_grid, "np", None):
+                list_grid = score_grid(home_xg, away_xg, rho=rho, max_goals=10)
+            clear_score_grid_cache()
+
+            for markets in ("poisson", "dixon_coles"):
+                left = getattr(array_grid, markets)
+                right = getattr(list_grid, markets)
+
+                for field in ("home_win", "draw", "away_win", "btts_yes"):
+                    self.assertAlmostEqual(getattr(left, field), getattr(right, field), places=12)
+
+                for field in ("over", "home_over", "away_over", "cells"):
+                    for a, b in zip(getattr(left, field), getattr(right, field), strict=True):
+                        self.assertAlmostEqual(a, b, places=12)
+
+    def test_repeated_fixture_hits_cache(self) -> None:
+        first = calculate_dixon_coles_markets(1.31, 0.97, rho=-0.05)
+        second = calculate_dixon_coles_markets(1.31, 0.97, rho=-0.05)
+
+        info = score_grid_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(first.home_win, second.home_win)
+        self.assertIsNot(first.score_matrix, second.score_matrix)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import csv
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.history_store import (
+    csv_matches_export,
+    export_history_table,
+    import_history_csv,
+    mark_history_imported,
+    restore_history_snapshot,
+    save_history_snapshot,
+)
+from core.schema_registry import clear_schema_registry
+
+
+TABLES = ["football_elo_history", "sport_bets"]
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE football_elo_history ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, team TEXT, rating REAL)"
+    )
+    conn.execute(
+        "CREATE TABLE sport_bets ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, event TEXT, result TEXT, "
+        "source_hash TEXT UNIQUE)"
+    )
+    conn.execute("CREATE TABLE football_market_snapshots (id INTEGER, odds REAL)")
+
+
+def _read_csv(path: Path) -> list[list[str]]:
+    with path.open("r", encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+class HistoryStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.root = Path(self.temp_dir.name)
+        self.db_file = self.root / "bets.db"
+        self.history_csv = self.root / "exports" / "history_elo.csv"
+        self.bets_csv = self.root / "exports" / "history_bets.csv"
+        clear_schema_registry()
+
+        with sqlite3.connect(self.db_file) as conn:
+            _create_tables(conn)
+            conn.executemany(
+                "INSERT INTO football_elo_history (team, rating) VALUES (?, ?)",
+                [(f"Team {index}", 1500 + index) for index in range(5)],
+            )
+            conn.executemany(
+                "INSERT INTO sport_bets (event, result, source_hash) VALUES (?, ?, ?)",
+                [(f"Event {index}", "OPEN", f"h{index}") for index in range(3)],
+            )
+            conn.execute("INSERT INTO football_market_snapshots VALUES (1, 2.0)")
+
+    def tearDown(self) -> None:
+        clear_schema_registry()
+        self.temp_dir.cleanup()
+
+    def _export(self, table: str, path: Path) -> int:
+        with sqlite3.connect(self.db_file) as conn:
+            return export_history_table(conn, table, path)
+
+    def _full_export(self, table: str) -> list[list[str]]:
+        reference = self.root / f"reference_{table}.csv"
+        reference.unlink(missing_ok=True)
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute("DELETE FROM history_export_state WHERE table_name=?", (table,))
+            export_history_table(conn, table, reference)
+        return _read_csv(reference)
+
+    def test_append_only_tables_export_only_new_rows(self) -> None:
+        self.assertEqual(self._export("football_elo_history", self.history_csv), 5)
+        self.assertEqual(self._export("sport_bets", self.bets_csv), 3)
+
+        with sqlite3.connect(self.db_file) as conn:
+            conn.executemany(
+                "INSERT INTO football_elo_history (team, rating) VALUES (?, ?)",
+                [("Team 5", 1490.5), ("Team 6", 1510.0)],
+            )
+            conn.execute("UPDATE sport_bets SET result='V' WHERE id=1")
+
+        self.assertEqual(self._export("football_elo_history", self.history_csv), 2)
+        self.assertEqual(self._export("football_elo_history", self.history_csv), 0)
+        # Mutable tables are always rewritten, so the settled row is seen.
+        self.assertEqual(self._export("sport_bets", self.bets_csv), 3)
+        self.assertEqual(_read_csv(self.bets_csv)[1][2], "V")
+
+        self.assertEqual(
+            _read_csv(self.history_csv),
+            self._full_export("football_elo_history"),
+        )
+
+        # A CSV edited outside the export is rewritten in full.
+        rows = _read_csv(self.history_csv)[:-3]
+        with self.history_csv.open("w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(rows)
+
+        self.assertEqual(self._export("football_elo_history", self.history_csv), 7)
+
+    def test_import_watermark_limits_next_export(self) -> None:
+        self._export("football_elo_history", self.history_csv)
+        fresh = self.root / "fresh.db"
+
+        with sqlite3.connect(fresh) as conn:
+            _create_tables(conn)
+            with self.history_csv.open("r", encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+            conn.executemany(
+                "INSERT INTO football_elo_history (id, team, rating) VALUES (?, ?, ?)",
+                [(row["id"], row["team"], row["rating"]) for row in rows],
+            )
+            mark_history_imported(conn, "football_elo_history", self.history_csv)
+            self.assertTrue(csv_matches_export(conn, "football_elo_history", self.history_csv))
+
+            conn.execute(
+                "INSERT INTO football_elo_history (team, rating) VALUES ('New', 1600)"
+            )
+            self.assertEqual(
+                export_history_table(conn, "football_elo_history", self.history_csv),
+                1,
+            )
+
+        self.assertEqual(len(_read_csv(self.history_csv)), 7)
+
+    def test_streaming_import_stores_typed_values(self) -> None:
+        source = self.root / "typed.csv"
+        with source.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "team", "rating", "games", "retired_column"])
+            for index in range(23):
+                writer.writerow([
+                    index + 1,
+                    f"Team {index}",
+                    "" if index % 5 == 0 else f"{1500 + index}.5",
+                    "" if index % 7 == 0 else str(index),
+                    "dropped",
+                ])
+            writer.writerow([1, "Duplicate", "1.0", "1", "dropped"])
+
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute(
+                "CREATE TABLE football_xg_history ("
+                "id INTEGER PRIMARY KEY, team TEXT NOT NULL, rating REAL, "
+                "games INTEGER NOT NULL DEFAULT 0)"
+            )
+            stats = import_history_csv(conn, "football_xg_history", source, chunk_rows=4)
+
+            self.assertEqual((stats.rows_read, stats.rows_inserted), (24, 23))
+            self.assertGreater(stats.rows_per_second, 0)
+            self.assertEqual(
+                dict(conn.execute(
+                    "SELECT typeof(rating), COUNT(*) FROM football_xg_history "
+                    "GROUP BY typeof(rating)"
+                ).fetchall()),
+                {"null": 5, "real": 18},
+            )
+            self.assertEqual(
+                conn.execute(
+                    "SELECT COUNT(*) FROM football_xg_history "
+                    "WHERE typeof(games)='integer'"
+                ).fetchone()[0],
+                23,
+            )
+            self.assertEqual(
+                conn.execute(
+                    "SELECT COUNT(*) FROM football_xg_history WHERE rating > 1510"
+                ).fetchone()[0],
+                10,
+            )
+            self.assertTrue(csv_matches_export(conn, "football_xg_history", source))
+
+            # Re-importing into a populated table changes nothing.
+            again = import_history_csv(conn, "football_xg_history", source)
+            self.assertEqual(again.rows_inserted, 0)
+
+            bets = self.root / "bets.csv"
+            bets.write_text("event,result,source_hash\nLate,,x1\n", encoding="utf-8")
+            import_history_csv(conn, "sport_bets", bets)
+            self.assertEqual(
+                conn.execute("SELECT result FROM sport_bets WHERE source_hash='x1'").fetchone()[0],
+                "",
+            )
+
+    def test_snapshot_restores_by_copy_or_merge(self) -> None:
+        snapshot = self.root / "exports" / "history.sqlite.gz"
+        self._export("football_elo_history", self.history_csv)
+
+        self.assertEqual(save_history_snapshot(self.db_file, TABLES, snapshot), 3)
+
+        # Fresh database: the snapshot becomes the file.
+        fresh = self.root / "runner" / "bets.db"
+        self.assertEqual(restore_history_snapshot(fresh, TABLES, snapshot), 8)
+
+        with sqlite3.connect(fresh) as conn:
+            names = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            self.assertNotIn("football_market_snapshots", names)
+            self.assertTrue(csv_matches_export(conn, "football_elo_history", self.history_csv))
+            conn.execute(
+                "INSERT INTO sport_bets (event, result, source_hash) VALUES ('Local', 'OPEN', 'local')"
+            )
+            conn.execute("DELETE FROM football_elo_history WHERE id > 3")
+
+        # Database with rows: only what is missing is merged in.
+        self.assertEqual(restore_history_snapshot(fresh, TABLES, snapshot), 2)
+
+        with sqlite3.connect(fresh) as conn:
+            self.assertEqual(
+                conn.execute("SELECT COUNT(*) FROM football_elo_history").fetchone()[0],
+                5,
+            )
+            self.assertEqual(
+                conn.execute("SELECT COUNT(*) FROM sport_bets").fetchone()[0],
+                4,
+            )
+
+        self.assertEqual(
+            restore_history_snapshot(fresh, TABLES, self.root / "missing.gz"),
+            0,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+from core import monte_carlo
+from core.monte_carlo import (
+    _percentile,
+    _result_from_wins,
+    simulate_bankroll_paths,
+    simulate_single_bet,
+    simulate_slate,
+)
+
+
+BACKENDS = ["python"] + (["numpy"] if monte_carlo.np is not None else [])
+
+
+class MonteCarloTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.numpy = monte_carlo.np
+
+    def tearDown(self) -> None:
+        monte_carlo.np = self.numpy
+
+    def _use(self, backend: str) -> None:
+        monte_carlo.np = self.numpy if backend == "numpy" else None
+
+    def test_closed_form_matches_simulated_profits(self) -> None:
+        for odds in (1.25, 1.9, 3.4):
+            for wins in (0, 1, 24, 500, 975, 999, 1000):
+                profits = [odds - 1.0] * wins + [-1.0] * (1000 - wins)
+                mean = sum(profits) / 1000
+                deviation = math.sqrt(
+                    sum((profit - mean) ** 2 for profit in profits) / 1000
+                )
+
+                result = _result_from_wins(0.5, odds, 1000, wins)
+
+                self.assertAlmostEqual(result.expected_profit_per_unit, mean, places=6)
+                self.assertAlmostEqual(result.standard_deviation, deviation, places=6)
+                self.assertEqual(result.profit_ci_low, round(_percentile(profits, 0.025), 4))
+                self.assertEqual(result.profit_ci_high, round(_percentile(profits, 0.975), 4))
+                self.assertEqual(result.probability_of_loss, (1000 - wins) / 1000)
+
+    def test_single_bet_is_reproducible_per_seed(self) -> None:
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self._use(backend)
+                first = simulate_single_bet(0.55, 1.95, simulations=50_000, seed=11)
+
+                self.assertEqual(
+                    first,
+                    simulate_single_bet(0.55, 1.95, simulations=50_000, seed=11),
+                )
+                self.assertAlmostEqual(first.simulated_win_probability, 0.55, delta=0.01)
+                self.assertEqual(first.simulations, 50_000)
+
+        with self.assertRaises(ValueError):
+            simulate_single_bet(0.5, 1.0)
+
+    def test_slate_keeps_marginals_and_widens_with_correlation(self) -> None:
+        probabilities = [0.55, 0.45, 0.6, 0.5]
+        odds = [1.9, 2.4, 1.75, 2.05]
+
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self._use(backend)
+                independent = simulate_slate(
+                    probabilities, odds, simulations=40_000, seed=5,
+                )
+                correlated = simulate_slate(
+                    probabilities, odds, correlation=0.6, simulations=40_000, seed=5,
+                )
+
+                self.assertEqual(
+                    correlated,
+                    simulate_slate(
+                        probabilities, odds, correlation=0.6, simulations=40_000, seed=5,
+                    ),
+                )
+                for probability, result in zip(probabilities, correlated.bets):
+                    self.assertAlmostEqual(
+                        result.simulated_win_probability, probability, delta=0.015,
+                    )
+
+                self.assertEqual(independent.total_stake, 4.0)
+                self.assertGreater(
+                    correlated.standard_deviation,
+                    independent.standard_deviation * 1.3,
+                )
+
+        with self.assertRaises(ValueError):
+            simulate_slate([0.5, 0.5], [2.0])
+
+    def test_bankroll_paths_compound_the_stake(self) -> None:
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self._use(backend)
+                flat = simulate_bankroll_paths(
+                    [0.5] * 50, [2.0] * 50, stake_pct=0.0, paths=1_000, seed=1,
+                )
+                self.assertEqual(
+                    (flat.median_final, flat.p05_final, flat.probability_of_ruin),
+                    (100.0, 100.0, 0.0),
+                )
+
+                losing = simulate_bankroll_paths(
+                    [0.4] * 200, [1.9] * 200, stake_pct=0.05, paths=2_000, seed=3,
+                )
+                winning = simulate_bankroll_paths(
+                    [0.6] * 200, [1.9] * 200, stake_pct=0.05, paths=2_000, seed=3,
+                )
+
+                self.assertEqual(
+                    losing,
+                    simulate_bankroll_paths(
+                        [0.4] * 200, [1.9] * 200, stake_pct=0.05, paths=2_000, seed=3,
+                    ),
+                )
+                self.assertGreater(losing.probability_of_ruin, 0.9)
+                self.assertLess(winning.probability_of_ruin, 0.05)
+                self.assertGreater(winning.median_final, 100.0)
+                self.assertGreater(losing.median_max_drawdown, 50.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
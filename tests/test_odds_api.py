@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import core.odds_api as odds_api
+from core.config import Settings
+from core.football_settlement import FootballSettlementEngine
+from core.odds_api import (
+    OddsApiError,
+    clear_odds_api_cache,
+    close_odds_api_client,
+    fetch_odds_many,
+    odds_api_client,
+    odds_api_counters,
+)
+from core.sport_quant import discover_active_sport_keys
+from core.sport_settlement import fetch_scores
+
+
+SPORTS = [
+    {"key": "soccer_epl", "group": "Soccer", "active": True},
+    {"key": "soccer_spain_la_liga", "group": "Soccer", "active": True},
+    {"key": "icehockey_nhl", "group": "Ice Hockey", "active": True},
+    {"key": "soccer_old", "group": "Soccer", "active": False},
+]
+SCORES = [{
+    "id": "e1", "completed": True, "home_team": "Arsenal", "away_team": "Chelsea",
+    "commence_time": "2026-10-16T19:00:00Z",
+    "scores": [{"name": "Arsenal", "score": "2"}, {"name": "Chelsea", "score": "1"}],
+}]
+
+
+class StubOddsApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubOddsApiHandler)
+        self.requests: list[tuple[str, dict]] = []
+        self.failures: dict[str, list[int]] = {}
+        self.lock = threading.Lock()
+
+
+class StubOddsApiHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server: StubOddsApiServer = self.server  # type: ignore[assignment]
+        url = urllib.parse.urlsplit(self.path)
+        path = url.path.removeprefix("/v4/")
+        with server.lock:
+            server.requests.append((path, dict(urllib.parse.parse_qsl(url.query))))
+            queued = server.failures.get(path) or []
+            status = queued.pop(0) if queued else 200
+        time.sleep(.05)
+
+        if status != 200:
+            body = {"message": f"stub status {status}"}
+        elif path == "sports/":
+            body = SPORTS
+        elif path.endswith("/scores/"):
+            body = SCORES
+        else:
+            body = [{"id": path, "home_team": "A", "away_team": "B"}]
+
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("x-requests-last", "1" if status == 200 else "0")
+        self.send_header("x-requests-remaining", "499")
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class OddsApiClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubOddsApiServer()
+        thread = threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": .05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.base_url = odds_api.ODDS_API_BASE_URL
+        self.backoff = odds_api.RETRY_BACKOFF_SECONDS
+        odds_api.ODDS_API_BASE_URL = f"http://127.0.0.1:{self.server.server_address[1]}/v4"
+        odds_api.RETRY_BACKOFF_SECONDS = 0.0
+        self.ttl = os.environ.pop("ODDS_API_CACHE_TTL_SECONDS", None)
+        clear_odds_api_cache()
+
+    def tearDown(self) -> None:
+        odds_api.ODDS_API_BASE_URL = self.base_url
+        odds_api.RETRY_BACKOFF_SECONDS = self.backoff
+        if self.ttl is not None:
+            os.environ["ODDS_API_CACHE_TTL_SECONDS"] = self.ttl
+        clear_odds_api_cache()
+
+    @staticmethod
+    def _run(coroutine):
+        async def run_and_close():
+            try:
+                return await coroutine
+            finally:
+                await close_odds_api_client()
+
+        return asyncio.run(run_and_close())
+
+    def test_sports_and_scores_are_fetched_once_for_every_module(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as folder:
+            engine = FootballSettlementEngine(
+                Settings(odds_api_key="secret", db_file=str(Path(folder) / "bets.db"))
+            )
+
+            async def modules():
+                discovered = await asyncio.gather(
+                    discover_active_sport_keys("secret", ["Soccer"]),
+                    discover_active_sport_keys("secret", ["Soccer"]),
+                    discover_active_sport_keys("secret", ["Ice Hockey"]),
+                )
+                scores = await asyncio.gather(
+                    fetch_scores("secret", "soccer_epl"),
+                    engine.fetch_scores("soccer_epl"),
+                )
+                later = await discover_active_sport_keys("secret", ["Soccer"])
+                return discovered, scores, later
+
+            discovered, (raw_scores, games), later = self._run(modules())
+
+        self.assertEqual(discovered[0], {"soccer_epl", "soccer_spain_la_liga"})
+        self.assertEqual(discovered[2], {"icehockey_nhl"})
+        self.assertEqual(later, discovered[0])
+        self.assertEqual(raw_scores, SCORES)
+        self.assertEqual(len(games), 1)
+        self.assertEqual(
+            sorted(path for path, _ in self.server.requests),
+            ["sports/", "sports/soccer_epl/scores/"],
+        )
+        counters = odds_api_counters()
+        self.assertEqual(counters["requests"], 2)
+        self.assertEqual(counters["requests_saved"], 4)
+        self.assertEqual((counters["quota_used"], counters["quota_remaining"]), (2, 499))
+
+    def test_identical_odds_requests_are_joined_but_not_cached(self) -> None:
+        async def scan():
+            first = [key async for key, _ in fetch_odds_many("secret", ["soccer_epl", "icehockey_nhl"])]
+            joined = await asyncio.gather(
+                odds_api.fetch_odds("secret", "soccer_epl"),
+                odds_api.fetch_odds("secret", "soccer_epl"),
+            )
+            return first, joined
+
+        first, joined = self._run(scan())
+
+        self.assertEqual(sorted(first), ["icehockey_nhl", "soccer_epl"])
+        self.assertEqual(joined[0], joined[1])
+        self.assertIsNot(joined[0], joined[1])
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(odds_api_counters()["coalesced"], 1)
+        self.assertEqual(self.server.requests[0][1]["oddsFormat"], "decimal")
+
+    def test_transient_failures_are_retried_and_client_errors_are_not(self) -> None:
+        self.server.failures = {
+            "sports/": [503, 429],
+            "sports/soccer_epl/scores/": [401],
+        }
+
+        async def calls():
+            sports = await odds_api.fetch_sports("secret")
+            with self.assertRaises(OddsApiError) as raised:
+                await odds_api.fetch_scores("secret", "soccer_epl")
+            return sports, raised.exception
+
+        sports, error = self._run(calls())
+
+        self.assertEqual(sports, SPORTS)
+        self.assertEqual(error.status, 401)
+        self.assertIn("stub status 401", error.body)
+        self.assertNotIn("secret", str(error))
+        counters = odds_api_counters()
+        self.assertEqual((counters["requests"], counters["retries"], counters["failures"]), (4, 2, 1))
+
+        # Failures are not cached: the next run asks again and succeeds.
+        self.assertEqual(self._run(odds_api.fetch_scores("secret", "soccer_epl")), SCORES)
+
+    def test_cancelled_owner_fails_joiners_with_an_api_error(self) -> None:
+        async def calls():
+            owner = asyncio.ensure_future(odds_api.fetch_sports("secret"))
+            await asyncio.sleep(0)
+            joiner = asyncio.ensure_future(odds_api.fetch_sports("secret"))
+            await asyncio.sleep(0)
+            owner.cancel()
+            results = await asyncio.gather(owner, joiner, return_exceptions=True)
+            return results, await odds_api.fetch_sports("secret")
+
+        (owner, joiner), retried = self._run(calls())
+
+        self.assertIsInstance(owner, asyncio.CancelledError)
+        self.assertIsInstance(joiner, OddsApiError)
+        self.assertIn("cancelled", str(joiner))
+        self.assertEqual(retried, SPORTS)
+        self.assertEqual(odds_api_counters()["coalesced"], 1)
+
+    def test_client_is_shared_per_event_loop(self) -> None:
+        async def clients():
+            return odds_api_client(), odds_api_client()
+
+        first, same = self._run(clients())
+        second, _ = self._run(clients())
+        self.assertIs(first, same)
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from core.config import Settings
+from core.football_market import FootballMarketDatabase
+from core.football_scan_session import FootballScanSession
+from core.odds_delta_store import clear_odds_delta_stores
+
+
+def _event(home_price: float, draw_price: float = 3.3) -> dict:
+    return {
+        "id": "event-1",
+        "home_team": "Home",
+        "away_team": "Away",
+        "commence_time": "2026-08-20T20:00:00+00:00",
+        "bookmakers": [
+            {
+                "title": title,
+                "markets": [{
+                    "key": "h2h",
+                    "outcomes": [
+                        {"name": "Home", "price": home_price + offset},
+                        {"name": "Draw", "price": draw_price},
+                        {"name": "Away", "price": 3.8},
+                    ],
+                }],
+            }
+            for title, offset in (("Book A", 0.0), ("Book B", 0.05))
+        ],
+    }
+
+
+class OddsDeltaStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        self.market = FootballMarketDatabase(Settings(db_file=str(self.db_path)))
+        self.market.init_db()
+        clear_odds_delta_stores()
+        now = datetime.now(timezone.utc)
+        self.day_1 = (now - timedelta(days=2)).isoformat(timespec="seconds")
+        self.day_2 = (now - timedelta(days=1)).isoformat(timespec="seconds")
+
+    def tearDown(self) -> None:
+        clear_odds_delta_stores()
+        os.environ.pop("SNAPSHOT_CHANGES_ONLY", None)
+        self.temp_dir.cleanup()
+
+    def _save(self, event: dict) -> int:
+        return self.market.save_event_snapshot(
+            sport_key="soccer_test",
+            league="Test",
+            event=event,
+        )
+
+    def _backdate_new_rows(self, captured_at: str) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE football_market_snapshots SET captured_at=? "
+                "WHERE captured_at > ?",
+                (captured_at, self.day_2),
+            )
+
+    def test_only_moved_prices_are_appended(self) -> None:
+        self.assertEqual(self._save(_event(2.0)), 6)
+        self._backdate_new_rows(self.day_1)
+
+        self.assertEqual(self._save(_event(2.0)), 0)
+
+        # Only the two home prices move.
+        self.assertEqual(self._save(_event(1.9)), 2)
+        self._backdate_new_rows(self.day_2)
+
+        # A new process re-seeds from the table and still skips repeats.
+        clear_odds_delta_stores()
+        self.assertEqual(self._save(_event(1.9)), 0)
+        self.assertEqual(self._save(_event(1.9, draw_price=3.5)), 2)
+
+        key = {"sport_key": "soccer_test", "event": "Home vs Away"}
+        self.assertEqual(
+            self.market.opening_odds(selection="Home", bookmaker="Book A", **key),
+            2.0,
+        )
+        self.assertEqual(
+            self.market.latest_odds(selection="Home", bookmaker="Book B", **key),
+            1.95,
+        )
+        self.assertEqual(
+            self.market.latest_odds(
+                selection="Home",
+                bookmaker="Book A",
+                at=self.day_1,
+                **key,
+            ),
+            2.0,
+        )
+        self.assertEqual(
+            self.market.latest_odds(selection="Draw", bookmaker="Book A", **key),
+            3.5,
+        )
+
+        movement = self.market.line_movement(
+            selection="Home",
+            bookmaker="Book A",
+            **key,
+        )
+        self.assertEqual(movement.direction, "SHORTENING")
+        self.assertTrue(movement.steam_move)
+
+    def test_latest_across_bookmakers_is_the_last_moved_price(self) -> None:
+        self._save(_event(2.0))
+        self._backdate_new_rows(self.day_1)
+
+        # Only Book A moves; Book B still offers 2.05 but writes no row.
+        moved = _event(2.0)
+        moved["bookmakers"][0]["markets"][0]["outcomes"][0]["price"] = 1.9
+        self.assertEqual(self._save(moved), 1)
+
+        key = {"sport_key": "soccer_test", "event": "Home vs Away", "selection": "Home"}
+        self.assertEqual(self.market.latest_odds(**key), 1.9)
+        self.assertEqual(self.market.latest_odds(bookmaker="Book B", **key), 2.05)
+
+    def _fail_inserts(self, failing: bool) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            if failing:
+                conn.execute(
+                    "CREATE TRIGGER fail_snapshots BEFORE INSERT "
+                    "ON football_market_snapshots "
+                    "BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+                )
+            else:
+                conn.execute("DROP TRIGGER fail_snapshots")
+
+    def test_failed_writes_do_not_hide_prices_from_the_next_scan(self) -> None:
+        self._fail_inserts(True)
+
+        with self.assertRaises(sqlite3.Error):
+            self._save(_event(2.0))
+
+        session = FootballScanSession(Settings(db_file=str(self.db_path)))
+        self.market.save_event_snapshot(
+            sport_key="soccer_test",
+            league="Test",
+            event=_event(2.0),
+            session=session,
+        )
+        with self.assertRaises(sqlite3.Error):
+            session.close()
+
+        self._fail_inserts(False)
+
+        with FootballScanSession(Settings(db_file=str(self.db_path))) as session:
+            self.market.save_event_snapshot(
+                sport_key="soccer_test",
+                league="Test",
+                event=_event(2.0),
+                session=session,
+            )
+        self.assertEqual(session.inserted("football_market_snapshots"), 6)
+
+    def test_full_snapshots_when_disabled(self) -> None:
+        os.environ["SNAPSHOT_CHANGES_ONLY"] = "0"
+
+        self.assertEqual(self._save(_event(2.0)), 6)
+
+        # Stand-in for an earlier scan: a fresh source hash per row.
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE football_market_snapshots "
+                "SET captured_at=?, source_hash='earlier-' || id",
+                (self.day_1,),
+            )
+
+        self.assertEqual(self._save(_event(2.0)), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
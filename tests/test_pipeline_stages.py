@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from core.pipeline_stages import Stage, StageScheduler, stage_dependencies
+
+
+class PipelineStagesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        root = Path(self.temp_dir.name)
+        self.db_path = root / "bets.db"
+        self.state_file = root / "pipeline_stages.json"
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE source (id INTEGER PRIMARY KEY, value INTEGER)")
+            conn.execute("CREATE TABLE target (id INTEGER PRIMARY KEY, value INTEGER)")
+            conn.execute("INSERT INTO source (value) VALUES (1), (2)")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _scheduler(self) -> StageScheduler:
+        return StageScheduler(
+            self.db_path,
+            max_workers=4,
+            state_file=self.state_file,
+            skip_unchanged=True,
+        )
+
+    def _copy(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM target")
+            conn.execute("INSERT INTO target (value) SELECT value FROM source")
+            return int(conn.execute("SELECT COUNT(*) FROM target").fetchone()[0])
+
+    def test_dependencies_follow_reads_and_writes(self) -> None:
+        stages = [
+            Stage("build", lambda: None, reads=("source",), writes=("target",)),
+            Stage("report_a", lambda: None, reads=("target",)),
+            Stage("report_b", lambda: None, reads=("target",)),
+            Stage("rewrite_source", lambda: None, writes=("source",)),
+        ]
+
+        self.assertEqual(
+            stage_dependencies(stages),
+            {
+                "build": [],
+                "report_a": ["build"],
+                "report_b": ["build"],
+                "rewrite_source": ["build"],
+            },
+        )
+
+    def test_independent_readers_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        order: list[str] = []
+
+        def reader(name: str):
+            def run() -> str:
+                barrier.wait()
+                order.append(name)
+                return name
+            return run
+
+        outcomes = self._scheduler().run([
+            Stage("build", self._copy, reads=("source",), writes=("target",)),
+            Stage("report_a", reader("a"), reads=("target",)),
+            Stage("report_b", reader("b"), reads=("target",)),
+        ])
+
+        self.assertEqual(outcomes["build"].result, 2)
+        self.assertEqual(sorted(order), ["a", "b"])
+        self.assertTrue(all(outcome.ok for outcome in outcomes.values()))
+
+    def test_failure_is_isolated_and_unchanged_inputs_are_skipped(self) -> None:
+        calls: list[str] = []
+
+        def build() -> int:
+            calls.append("build")
+            return self._copy()
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        stages = [
+            Stage("build", build, reads=("source",), writes=("target",)),
+            Stage("broken", broken, reads=("target",)),
+        ]
+
+        first = self._scheduler().run(stages)
+        second = self._scheduler().run(stages)
+
+        self.assertEqual(first["broken"].status, "failed")
+        self.assertEqual(second["build"].status, "unchanged")
+        self.assertEqual(second["build"].result, 2)
+        self.assertEqual(calls, ["build"])
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("INSERT INTO source (value) VALUES (3)")
+
+        third = self._scheduler().run(stages)
+
+        self.assertEqual(third["build"].status, "ok")
+        self.assertEqual(third["build"].result, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.config import Settings
+from core.football_market import FootballMarketDatabase
+from core.schema_registry import (
+    clear_schema_registry,
+    schema_registry_counters,
+    table_columns,
+    table_exists,
+)
+from core.sport_quant import init_sport_db
+
+
+class SchemaRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.db_path = Path(self.temp_dir.name) / "bets.db"
+        self.settings = Settings(db_file=str(self.db_path))
+        clear_schema_registry()
+
+    def tearDown(self) -> None:
+        clear_schema_registry()
+        self.temp_dir.cleanup()
+
+    def test_ddl_runs_once_per_database_file(self) -> None:
+        market = FootballMarketDatabase(self.settings)
+
+        for _ in range(5):
+            market.init_db()
+            FootballMarketDatabase(self.settings).init_db()
+            init_sport_db(self.settings)
+
+        counters = schema_registry_counters()
+        self.assertEqual(counters["ddl_runs"], 2)
+        self.assertEqual(counters["ddl_skipped"], 13)
+
+        # A database file removed in the meantime is initialized again.
+        self.db_path.unlink()
+        Path(f"{self.db_path}-wal").unlink(missing_ok=True)
+        Path(f"{self.db_path}-shm").unlink(missing_ok=True)
+        market.init_db()
+
+        self.assertEqual(schema_registry_counters()["ddl_runs"], 3)
+        self.assertIsNone(market.latest_odds(
+            sport_key="soccer_test",
+            event="Home vs Away",
+            selection="Home",
+        ))
+
+    def test_catalog_is_cached_until_the_schema_changes(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertFalse(table_exists(conn, "sport_bets"))
+            conn.execute("CREATE TABLE sport_bets (id INTEGER PRIMARY KEY, odds REAL)")
+
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(table_columns(conn, "sport_bets"), {"id", "odds"})
+
+            for _ in range(10):
+                self.assertTrue(table_exists(conn, "sport_bets"))
+
+        counters = schema_registry_counters()
+        self.assertEqual((counters["catalog_misses"], counters["catalog_hits"]), (2, 10))
+
+        # Migrations from any connection bump the file's schema version.
+        with sqlite3.connect(self.db_path) as other:
+            other.execute("ALTER TABLE sport_bets ADD COLUMN clv_pct REAL")
+
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertIn("clv_pct", table_columns(conn, "sport_bets"))
+
+        memory = sqlite3.connect(":memory:")
+        memory.execute("CREATE TABLE t (a INTEGER)")
+        self.assertEqual(table_columns(memory, "t"), {"a"})
+        memory.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from core.config import Settings
+from core.sport_quant import init_sport_db, update_closing_lines
+
+
+BOOKMAKERS = ["Pinnacle", "Bet365", "Unibet", "Tipsport"]
+
+
+def row_by_row_closing_lines(conn: sqlite3.Connection, sport: str) -> dict[int, tuple]:
+    """Reference: the per-bet queries used before the set-based backfill."""
+    rows = conn.execute("""
+        SELECT id, league, event, selection, bookmaker, odds, start_time
+        FROM sport_bets
+        WHERE sport=?
+          AND odds > 1.01
+          AND (closing_odds IS NULL OR clv_pct IS NULL)
+    """, (sport,)).fetchall()
+
+    expected = {}
+
+    for bet_id, league, event, selection, bookmaker, taken_odds, start_time in rows:
+        same_book = conn.execute("""
+            SELECT odds
+            FROM sport_odds_snapshots
+            WHERE sport=? AND league=? AND event=? AND selection=? AND bookmaker=?
+              AND odds > 1.01
+              AND captured_at <= COALESCE(?, captured_at)
+            ORDER BY captured_at DESC
+            LIMIT 1
+        """, (sport, league, event, selection, bookmaker, start_time)).fetchone()
+
+        if same_book:
+            closing_odds = float(same_book[0])
+        else:
+            market_avg = conn.execute("""
+                SELECT AVG(odds)
+                FROM (
+                    SELECT bookmaker, odds, MAX(captured_at)
+                    FROM sport_odds_snapshots
+                    WHERE sport=? AND league=? AND event=? AND selection=?
+                      AND odds > 1.01
+                      AND captured_at <= COALESCE(?, captured_at)
+                    GROUP BY bookmaker
+                )
+            """, (sport, league, event, selection, start_time)).fetchone()
+            closing_odds = float(market_avg[0]) if market_avg and market_avg[0] else None
+
+        if closing_odds and closing_odds > 1.01:
+            expected[bet_id] = (
+                round(closing_odds, 4),
+                round(float(taken_odds) / closing_odds - 1.0, 5),
+            )
+
+    return expected
+
+
+class SportClosingLinesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.settings = Settings(db_file=str(Path(self.temp_dir.name) / "bets.db"))
+        init_sport_db(self.settings)
+        rng = random.Random(3)
+
+        # Distinct capture times: timestamp ties are broken arbitrarily
+        # by SQLite in both the old and the set-based queries.
+        start = datetime(2026, 8, 1)
+        minutes = rng.sample(range(9 * 24 * 60), 3000)
+
+        snapshots = []
+        for index, minute in enumerate(minutes):
+            event = f"Event {rng.randint(0, 39)}"
+            snapshots.append((
+                (start + timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "football",
+                "League",
+                event,
+                rng.choice(BOOKMAKERS),
+                rng.choice(["Home", "Away"]),
+                round(rng.choice([1.0, rng.uniform(1.2, 4.0)]), 3),
+                f"s{index}",
+            ))
+
+        bets = []
+        for index in range(120):
+            bets.append((
+                "football",
+                "League" if index % 17 else "Other",
+                f"Event {rng.randint(0, 45)}",
+                rng.choice(["Home", "Away"]),
+                rng.choice(BOOKMAKERS + ["Betfair"]),
+                round(rng.uniform(1.0, 4.0), 3),
+                None if index % 9 == 0 else f"2026-08-{rng.randint(1, 9):02d}T12:00:00Z",
+                f"b{index}",
+            ))
+
+        with sqlite3.connect(self.settings.db_file) as conn:
+            conn.executemany("""
+                INSERT INTO sport_odds_snapshots (
+                    captured_at, sport, league, event, bookmaker, selection,
+                    odds, source_hash
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, snapshots)
+            conn.executemany("""
+                INSERT INTO sport_bets (
+                    sport, league, event, selection, bookmaker, odds,
+                    start_time, source_hash
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, bets)
+            conn.execute("UPDATE sport_bets SET closing_odds=2.0, clv_pct=0.1 WHERE id=5")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_set_based_backfill_matches_row_by_row_queries(self) -> None:
+        with sqlite3.connect(self.settings.db_file) as conn:
+            expected = row_by_row_closing_lines(conn, "football")
+
+        self.assertGreater(len(expected), 50)
+        self.assertEqual(update_closing_lines(self.settings, "football"), len(expected))
+
+        with sqlite3.connect(self.settings.db_file) as conn:
+            actual = {
+                bet_id: (closing_odds, clv_pct)
+                for bet_id, closing_odds, clv_pct in conn.execute("""
+                    SELECT id, closing_odds, clv_pct
+                    FROM sport_bets
+                    WHERE closing_odds IS NOT NULL AND id != 5
+                """)
+            }
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(update_closing_lines(self.settings, "football"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
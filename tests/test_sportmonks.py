@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import json
 import sqlite3
 import tempfile
+import threading
+import time
 import unittest
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime, timezone
 from datetime import date
 from pathlib import Path
 
 from core.config import Settings
 from core.sport_context import SportContextDatabase
+from core.types import Bet
 from core.sportmonks import (
     SportmonksClient,
     SportmonksError,
+    SportmonksStats,
     _explicit_lineup_confirmation,
     sync_upcoming_context,
 )
@@ -41,6 +48,160 @@ class FakeSportmonksClient(SportmonksClient):
         }]
 
 
+class StubSportmonksServer(ThreadingHTTPServer):
+    """Local stand-in for the fixtures/date endpoint with pages and ETags."""
+
+    daemon_threads = True
+
+    def __init__(self, pages: dict[str, int], *, deny_xg: bool = False, fail: set[str] = frozenset()):
+        super().__init__(("127.0.0.1", 0), StubSportmonksHandler)
+        self.pages = pages
+        self.deny_xg = deny_xg
+        self.fail = fail
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubSportmonksHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: dict | None = None, etag: str = "") -> None:
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        server: StubSportmonksServer = self.server  # type: ignore[assignment]
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        day = url.path.rsplit("/", 1)[-1]
+        page = int(params.get("page", 1))
+        with server.lock:
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+            server.requests.append({
+                "day": day, "page": page, "include": params.get("include", ""),
+                "token": params.get("api_token"),
+                "if_none_match": self.headers.get("If-None-Match"),
+            })
+        try:
+            time.sleep(.05)
+            etag = f'"{day}-{page}"'
+            if day in server.fail:
+                self._send(500, {"message": "upstream failure"})
+            elif server.deny_xg and "xGFixture" in params.get("include", ""):
+                self._send(403, {"message": "You do not have access to the 'xgfixture' include"})
+            elif page > server.pages.get(day, 1):
+                self._send(404, {"message": "page not found"})
+            elif self.headers.get("If-None-Match") == etag:
+                self._send(304)
+            else:
+                self._send(200, {
+                    "data": [
+                        {"id": f"{day}-{page}-{index}", "name": f"Home {index} vs Away {index}"}
+                        for index in range(2)
+                    ],
+                    "pagination": {"current_page": page, "has_more": page < server.pages.get(day, 1)},
+                }, etag)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class SportmonksHttpTests(unittest.TestCase):
+    def _serve(self, pages: dict[str, int], **options) -> StubSportmonksServer:
+        server = StubSportmonksServer(pages, **options)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": .05}, daemon=True
+        )
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        folder = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.addCleanup(folder.cleanup)
+        self.cache_dir = Path(folder.name) / "cache"
+        return server
+
+    def _client(self, server: StubSportmonksServer, **options) -> SportmonksClient:
+        options = {
+            "base_url": server.base_url, "concurrency": 4,
+            "requests_per_second": 0, "page_lookahead": 3,
+            "cache_dir": self.cache_dir, "cache_ttl": 3600,
+            "matchday_cache_ttl": 3600, **options,
+        }
+        return SportmonksClient("secret-token", timeout=5, **options)
+
+    def test_days_and_pages_are_fetched_concurrently_in_order(self) -> None:
+        server = self._serve({"2026-08-20": 4, "2026-08-21": 1, "2026-08-22": 2})
+        client = self._client(server)
+        days = [date(2026, 8, 20), date(2026, 8, 21), date(2026, 8, 22)]
+
+        fixtures = client.fixtures_by_dates(days)
+
+        expected = [
+            f"{day}-{page}-{index}"
+            for day, pages in (("2026-08-20", 4), ("2026-08-21", 1), ("2026-08-22", 2))
+            for page in range(1, pages + 1)
+            for index in range(2)
+        ]
+        self.assertEqual([fixture["id"] for fixture in fixtures], expected)
+        self.assertGreater(server.peak, 1)
+        self.assertLessEqual(server.peak, 4)
+        # Speculative pages past the end (404 here) are dropped, not raised.
+        self.assertEqual(client.stats.pages, 7)
+        self.assertGreaterEqual(client.stats.requests, 7)
+
+    def test_rerun_is_served_from_cache_and_revalidated_by_etag(self) -> None:
+        server = self._serve({"2026-08-20": 2})
+        first = self._client(server, page_lookahead=1).fixtures_by_date(date(2026, 8, 20))
+        self.assertEqual(len(server.requests), 2)
+
+        cached = self._client(server)
+        self.assertEqual(cached.fixtures_by_date(date(2026, 8, 20)), first)
+        self.assertEqual(len(server.requests), 2)
+        self.assertEqual(cached.stats, SportmonksStats(cache_hits=2, pages=2))
+
+        stale = self._client(server, cache_ttl=0, page_lookahead=1)
+        self.assertEqual(stale.fixtures_by_date(date(2026, 8, 20)), first)
+        self.assertEqual(
+            [request["if_none_match"] for request in server.requests[2:]],
+            ['"2026-08-20-1"', '"2026-08-20-2"'],
+        )
+        self.assertEqual(stale.stats.not_modified, 2)
+
+        cache_files = list(self.cache_dir.glob("*.json"))
+        self.assertEqual(len(cache_files), 2)
+        for path in cache_files:
+            self.assertNotIn("secret-token", path.read_text(encoding="utf-8"))
+
+    def test_xg_denial_and_provider_errors_keep_their_semantics(self) -> None:
+        server = self._serve({"2026-08-20": 2, "2026-08-21": 1}, deny_xg=True, fail={"2026-08-22"})
+        client = self._client(server, include_xg=True, cache_dir="")
+
+        fixtures = client.fixtures_by_dates([date(2026, 8, 20), date(2026, 8, 21)])
+        self.assertEqual(len(fixtures), 6)
+        self.assertFalse(client.include_xg)
+        self.assertTrue(all(request["token"] == "secret-token" for request in server.requests))
+        self.assertNotIn("xGFixture", server.requests[-1]["include"])
+
+        with self.assertRaises(SportmonksError) as raised:
+            client.fixtures_by_dates([date(2026, 8, 21), date(2026, 8, 22)])
+        self.assertEqual(raised.exception.status, 500)
+        self.assertIn("upstream failure", raised.exception.detail)
+
+
 class SportmonksTests(unittest.TestCase):
     def test_paid_xg_denial_falls_back_to_free_plan_fields(self) -> None:
         class FallbackClient(SportmonksClient):
@@ -131,6 +292,64 @@ class SportmonksTests(unittest.TestCase):
                 ).fetchone()
             self.assertEqual(link[0], "sm-10")
 
+    def test_latest_many_matches_per_bet_lookups_in_one_batch(self) -> None:
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as folder:
+            database = SportContextDatabase(Settings(db_file=str(Path(folder) / "bets.db")))
+            database.init_db()
+            captured = datetime.now(timezone.utc).isoformat()
+            with database.connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO sport_context_features (
+                        sport, event, external_event_id, start_time,
+                        home_team, away_team, home_absence_impact,
+                        source, captured_at, source_hash
+                    ) VALUES ('football', ?, ?, '2026-08-22 18:00:00', ?, ?, ?,
+                              'sportmonks-v3', ?, ?)
+                    """,
+                    [
+                        ("Malmö FF vs Viking", "sm-1", "Malmö FF", "Viking", .01, captured, "a"),
+                        ("Hearts vs Aberdeen", "sm-2", "Hearts", "Aberdeen", .02, captured, "b"),
+                    ],
+                )
+
+            def bet(event: str, external_event_id: str, selection: str) -> Bet:
+                return Bet(
+                    sport="football", league="L", event=event, market="h2h",
+                    selection=selection, odds=2.0, prob_model=.5, prob_market=.5,
+                    prob_final=.5, edge=0, stake=1, bookmaker="Book",
+                    start_time="2026-08-22T18:00:00Z", score=80,
+                    external_event_id=external_event_id,
+                )
+
+            bets = [
+                bet("Malmo vs Viking FK", "odds-1", "Malmo"),
+                bet("Malmo vs Viking FK", "odds-1", "Viking FK"),
+                bet("Heart of Midlothian vs Aberdeen", "", "Aberdeen"),
+                bet("Hearts vs Aberdeen", "sm-2", "Hearts"),
+                bet("Unknown vs Nobody", "odds-3", "Unknown"),
+            ]
+            contexts = database.latest_many("football", bets)
+
+            self.assertEqual(
+                [context.home_absence_impact for context in contexts],
+                [.01, .01, .02, .02, 0.0],
+            )
+            self.assertEqual([context.verified for context in contexts], [True] * 4 + [False])
+            self.assertEqual(
+                contexts,
+                [
+                    database.latest("football", item.event, item.external_event_id, item.start_time)
+                    for item in bets
+                ],
+            )
+            with database.connect() as conn:
+                links = conn.execute(
+                    "SELECT consumer_event_id, provider_event_id FROM sport_event_identity_links"
+                ).fetchall()
+            self.assertEqual([tuple(link) for link in links], [("odds-1", "sm-1")])
+            self.assertEqual(database.latest_many("football", []), [])
+
 
 if __name__ == "__main__":
     unittest.main()
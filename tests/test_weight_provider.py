@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from core import model_stats
+from core.adaptive_weights import bookmaker_weight, league_weight, sport_weight
+from core.config import Settings
+from core.sport_quant import bookmaker_grade, init_sport_db, refresh_bookmaker_stats
+from core.weight_provider import clear_weight_cache, weight_cache_counters
+
+
+class WeightProviderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        root = Path(self.temp_dir.name)
+        self.original_stats_file = model_stats.MODEL_STATS_FILE
+        model_stats.MODEL_STATS_FILE = root / "model_stats.json"
+        self.settings = Settings(db_file=str(root / "bets.db"))
+        init_sport_db(self.settings)
+        clear_weight_cache()
+
+    def tearDown(self) -> None:
+        model_stats.MODEL_STATS_FILE = self.original_stats_file
+        clear_weight_cache()
+        self.temp_dir.cleanup()
+
+    def _save_stats(self, wins: int, losses: int) -> None:
+        item = {
+            "wins": wins,
+            "losses": losses,
+            "total": wins + losses,
+            "yield": 4.0,
+        }
+        model_stats.save_model_stats(
+            total_bets=wins + losses,
+            wins=wins,
+            losses=losses,
+            profit=10.0,
+            yield_pct=4.0,
+            by_sport={"football": item},
+            by_bookmaker={"Pinnacle": item},
+            by_league={"EPL": item},
+        )
+
+    def _settle(self, bookmaker: str, results: list[str], clv_pct: float) -> None:
+        with sqlite3.connect(self.settings.db_file) as conn:
+            conn.executemany(
+                """
+                INSERT INTO sport_bets (
+                    sport, bookmaker, odds, stake, result, clv_pct, source_hash
+                )
+                VALUES ('football', ?, 2.0, 10.0, ?, ?, ?)
+                """,
+                [
+                    (bookmaker, result, clv_pct, f"{bookmaker}-{clv_pct}-{index}")
+                    for index, result in enumerate(results)
+                ],
+            )
+
+    def test_model_stats_are_parsed_once_until_the_file_changes(self) -> None:
+        self._save_stats(wins=40, losses=20)
+        first = [sport_weight("football"), league_weight("EPL"), bookmaker_weight("Pinnacle")]
+
+        for _ in range(50):
+            self.assertEqual(
+                [sport_weight("football"), league_weight("EPL"), bookmaker_weight("Pinnacle")],
+                first,
+            )
+
+        counters = weight_cache_counters()["model_stats"]
+        self.assertEqual(counters["misses"], 1)
+        self.assertEqual(counters["hits"], 152)
+        self.assertGreater(first[0], 1.0)
+
+        self._save_stats(wins=10, losses=50)
+        stamp = model_stats.MODEL_STATS_FILE.stat().st_mtime + 5
+        os.utime(model_stats.MODEL_STATS_FILE, (stamp, stamp))
+
+        self.assertLess(sport_weight("football"), first[0])
+        self.assertEqual(weight_cache_counters()["model_stats"]["reloads"], 1)
+        self.assertEqual(sport_weight("tennis"), 1.0)
+
+    def test_bookmaker_grades_reload_after_refresh(self) -> None:
+        self._settle("Pinnacle", ["V"] * 15 + ["P"] * 10, clv_pct=0.02)
+        refresh_bookmaker_stats(self.settings, "football")
+
+        grade = bookmaker_grade(self.settings, "football", "Pinnacle")
+        self.assertGreater(grade, 1.0)
+        self.assertEqual(bookmaker_grade(self.settings, "football", "Unknown"), 1.0)
+        self.assertEqual(bookmaker_grade(self.settings, "football", "Pinnacle"), grade)
+
+        counters = weight_cache_counters()["bookmaker_stats"]
+        self.assertEqual((counters["misses"], counters["hits"]), (1, 2))
+
+        self._settle("Pinnacle", ["P"] * 30, clv_pct=-0.03)
+        # Without a refresh the cached grade is served.
+        self.assertEqual(bookmaker_grade(self.settings, "football", "Pinnacle"), grade)
+
+        refresh_bookmaker_stats(self.settings, "football")
+        self.assertLess(bookmaker_grade(self.settings, "football", "Pinnacle"), grade)
+        self.assertEqual(weight_cache_counters()["bookmaker_stats"]["reloads"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()